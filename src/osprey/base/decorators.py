@@ -47,6 +47,8 @@ from typing import TYPE_CHECKING, Any
 
 from osprey.base.errors import ErrorSeverity
 from osprey.utils.logger import get_logger
+from osprey.utils.metrics import NODE_ERRORS, timed_node
+from osprey.utils.spans import traced_node
 
 try:
     from langgraph.config import get_config, get_stream_writer
@@ -238,6 +240,8 @@ def capability_node(cls):
                 logger.info(f"GraphInterrupt detected in {capability_name} - re-raising for LangGraph to handle")
                 raise exc
 
+            NODE_ERRORS.inc(node=capability_name, node_type="capability")
+
             # Classify the error using domain-specific or default logic
             error_context = {
                 "capability": capability_name,
@@ -291,6 +295,11 @@ def capability_node(cls):
                 }
             }
 
+    # Time each execution as a per-request span (no-op unless span recording is enabled)
+    # and in the node latency histogram
+    langgraph_node = traced_node(timed_node(langgraph_node, "capability", capability_name),
+                                 "capability", capability_name)
+
     # Attach metadata to the function for LangGraph integration
     langgraph_node.name = capability_name
     langgraph_node.capability_name = capability_name
@@ -610,6 +619,8 @@ def _create_infrastructure_node(cls, quiet=False):
                 logger.info(f"GraphInterrupt detected in {node_name} - re-raising for LangGraph to handle")
                 raise exc
 
+            NODE_ERRORS.inc(node=node_name, node_type="infrastructure")
+
             # Handle actual errors
             context = {
                 "infrastructure_node": node_name,
@@ -674,6 +685,9 @@ def _create_infrastructure_node(cls, quiet=False):
                 }
             }
 
+    langgraph_node = traced_node(timed_node(langgraph_node, "infrastructure", node_name),
+                                 "infrastructure", node_name)
+
     # Attach metadata to the function for LangGraph integration
     langgraph_node.name = node_name
     langgraph_node.node_name = node_name
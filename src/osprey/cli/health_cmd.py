@@ -152,6 +152,9 @@ class HealthChecker:
             # Check environment variables
             self._check_environment_variables(config)
 
+            # Report the last hot reload, if enabled
+            self._check_config_reload(config)
+
         except yaml.YAMLError as e:
             self.add_result("yaml_valid", "error", f"YAML parsing error: {e}")
             console.print(f"  {Messages.error(f'YAML parsing error: {e}')}")
@@ -286,6 +289,39 @@ class HealthChecker:
                 )
                 console.print(f"  {Messages.success(f'All {len(env_vars)} environment variables set')}")
 
+    def _check_config_reload(self, config: dict):
+        """Report the last configuration hot reload recorded by a running pipeline."""
+        if not (config.get('system') or {}).get('config_reload', {}).get('enabled', False):
+            return
+
+        from osprey.utils.config_reload import STATUS_FILE_NAME, read_reload_status
+
+        agent_data_dir = (config.get('file_paths') or {}).get('agent_data_dir', '_agent_data')
+        status = read_reload_status(self.cwd / agent_data_dir / STATUS_FILE_NAME)
+
+        if status is None:
+            self.add_result("config_reload", "ok", "Hot reload enabled, no reloads yet")
+            console.print(f"  {Messages.success('Config hot reload enabled (no reloads yet)')}")
+        elif status.get('status') == 'ok':
+            changed = ', '.join(status.get('changed_keys') or []) or 'nothing'
+            self.add_result(
+                "config_reload",
+                "ok",
+                f"Reloaded at {status.get('timestamp')} (generation {status.get('generation')})",
+                f"Changed: {changed}"
+            )
+            reloaded_at = status.get('timestamp')
+            console.print(f"  {Messages.success(f'Config reloaded at {reloaded_at}')}")
+        else:
+            self.add_result(
+                "config_reload",
+                "warning",
+                f"Last reload at {status.get('timestamp')} failed; previous configuration still active",
+                status.get('error') or ""
+            )
+            reload_error = status.get('error')
+            console.print(f"  {Messages.warning(f' Last config reload failed: {reload_error}')}")
+
     def _check_project_paths(self):
         """Check if project_root and agent data directory paths are valid and accessible."""
 
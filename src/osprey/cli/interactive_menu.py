@@ -672,6 +672,10 @@ def select_provider(providers: dict[str, dict[str, Any]]) -> str | None:
                     console.print(f"[dim]Warning: Provider {key} missing required metadata[/dim]")
                 continue
 
+            # Providers without selectable models (e.g. replay) cannot be a project default
+            if not p.get('models'):
+                continue
+
             # Description comes directly from provider class attribute
             key_info = " [requires API key]" if p.get('requires_key', True) else " [no API key]"
             display = f"{p['name']:12} - {p['description']}{key_info}"
@@ -0,0 +1,186 @@
+"""Load test command.
+
+This module provides the 'osprey loadtest' command which runs concurrent
+simulated chat sessions through the gateway and the compiled graph of a
+project, fully offline, and reports throughput, per-node latency, event-loop
+lag, memory growth and checkpoint size (see :mod:`osprey.utils.load_testing`).
+"""
+
+import asyncio
+import logging
+import os
+
+import click
+from rich.table import Table
+
+from osprey.cli.styles import Styles, console
+
+
+def _seconds(value: float | None) -> str:
+    return f"{value * 1000:,.0f} ms" if value is not None else "-"
+
+
+def _megabytes(value: int | None) -> str:
+    return f"{value / 1_048_576:,.1f} MB" if value is not None else "-"
+
+
+def print_report(report) -> None:
+    """Print a load test report as summary, node latency and resource tables."""
+    turn = report.turn_percentiles()
+    lag = report.loop_lag_percentiles()
+    console.print()
+    console.print(
+        f"  Users: {report.users}   Turns: {report.turns_completed}/{report.users * report.turns_per_user}   "
+        f"Errors: {report.errors}   Interrupted: {report.interrupts}   "
+        f"Duration: {report.duration_seconds:,.1f} s"
+    )
+    console.print(
+        f"  Throughput: {report.throughput:,.2f} turns/s   "
+        f"Turn latency p50/p95/p99: {_seconds(turn[0.5])} / {_seconds(turn[0.95])} / {_seconds(turn[0.99])}"
+    )
+    lag_text = " / ".join(f"{lag[q]:,.1f}" if lag[q] is not None else "-" for q in (0.5, 0.99, 1.0))
+    console.print(
+        f"  Event-loop lag p50/p99/max: {lag_text} ms   "
+        f"Memory growth: {_megabytes(report.memory_growth_bytes)}   "
+        f"Checkpoints: {_megabytes(report.checkpoint_bytes)}"
+    )
+
+    if report.nodes:
+        table = Table(title="Node Latency (estimated from histogram buckets)", header_style=Styles.HEADER,
+                      border_style=Styles.DIM, expand=False)
+        table.add_column("Node", style=Styles.ACCENT, no_wrap=True)
+        table.add_column("Type", style=Styles.DIM)
+        table.add_column("Runs", justify="right")
+        for name in ("p50", "p95", "p99"):
+            table.add_column(name, justify="right")
+        for node in report.nodes:
+            table.add_row(node.node, node.node_type, str(node.count),
+                          _seconds(node.p50), _seconds(node.p95), _seconds(node.p99))
+        console.print()
+        console.print(table)
+
+    table = Table(title="Resources Over Time", header_style=Styles.HEADER, border_style=Styles.DIM, expand=False)
+    table.add_column("Elapsed", justify="right")
+    table.add_column("Turns", justify="right")
+    table.add_column("RSS", justify="right")
+    table.add_column("Checkpoints", justify="right")
+    table.add_column("Max loop lag", justify="right")
+    for sample in report.samples:
+        table.add_row(f"{sample.elapsed_seconds:,.1f} s", str(sample.turns_completed),
+                      _megabytes(sample.rss_bytes), _megabytes(sample.checkpoint_bytes),
+                      f"{sample.max_loop_lag_ms:,.1f} ms")
+    console.print()
+    console.print(table)
+    console.print()
+
+
+@click.command()
+@click.option(
+    "--project", "-p",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True),
+    help="Project directory (default: current directory or OSPREY_PROJECT env var)"
+)
+@click.option(
+    "--config", "-c",
+    default="config.yml",
+    help="Configuration file (default: config.yml in project directory)"
+)
+@click.option("--users", "-u", type=click.IntRange(min=1), default=10, show_default=True,
+              help="Concurrent simulated users")
+@click.option("--turns", "-t", type=click.IntRange(min=1), default=3, show_default=True,
+              help="Queries per user")
+@click.option("--corpus", type=click.Path(exists=True, dir_okay=False),
+              help="Query corpus: text file with one query per line, or a YAML/JSON list")
+@click.option("--latency", type=float, default=0.5, show_default=True,
+              help="Median simulated LLM latency in seconds")
+@click.option("--latency-distribution",
+              type=click.Choice(["none", "constant", "uniform", "lognormal"]),
+              default="lognormal", show_default=True, help="Distribution of simulated LLM latency")
+@click.option("--seed", type=int, default=0, show_default=True, help="Seed for simulated latency")
+@click.option("--ramp-up", type=float, default=0.0, show_default=True,
+              help="Seconds over which user start times are spread")
+@click.option("--checkpointer", type=click.Choice(["memory", "sqlite"]), default="memory", show_default=True,
+              help="Checkpointer backend (sqlite uses a temporary database)")
+@click.option("--sample-interval", type=float, default=1.0, show_default=True,
+              help="Seconds between memory, checkpoint and lag samples")
+@click.option("--configured-models", is_flag=True,
+              help="Use the model providers from the configuration (e.g. replay) instead of the fake provider")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), help="Also write the report as JSON")
+@click.option("--verbose", "-v", is_flag=True, help="Show framework log output")
+def loadtest(project: str | None, config: str, users: int, turns: int, corpus: str | None,
+             latency: float, latency_distribution: str, seed: int, ramp_up: float,
+             checkpointer: str, sample_interval: float, configured_models: bool,
+             output: str | None, verbose: bool):
+    """Run concurrent simulated chat sessions offline and report scaling metrics.
+
+    Each user is a separate conversation that sends its queries through the
+    gateway and the agent graph like 'osprey chat'. By default every model
+    role answers from a local fake provider after a simulated latency, so no
+    network or API key is required.
+
+    Examples:
+
+    \b
+      # 10 users with 3 turns each
+      $ osprey loadtest
+
+      # 100 users, slower models, persistent checkpoints, JSON report
+      $ osprey loadtest -u 100 --latency 2 --checkpointer sqlite -o report.json
+
+      # Replay a recorded session (models with provider: replay)
+      $ osprey loadtest --configured-models --corpus queries.txt
+    """
+    from osprey.utils.config import ConfigBuilder, swap_default_config
+    from osprey.utils.load_testing import (
+        load_corpus,
+        run_load_test,
+        use_simulated_models,
+        write_report,
+    )
+
+    from .project_utils import resolve_config_path
+
+    config_path = resolve_config_path(project, config)
+    os.environ['CONFIG_FILE'] = str(config_path)
+    queries = load_corpus(corpus)
+
+    if not verbose:
+        logging.disable(logging.INFO)
+    config_builder = ConfigBuilder(str(config_path))
+    if not configured_models:
+        latency_settings = {
+            "distribution": latency_distribution,
+            "seconds": latency,
+            "median_seconds": latency,
+            "min_seconds": latency / 2,
+            "max_seconds": latency * 1.5,
+        }
+        use_simulated_models(config_builder, {"latency": latency_settings, "seed": seed})
+    swap_default_config(config_builder)
+
+    model_text = "configured models" if configured_models else f"fake models ({latency_distribution}, {latency:g} s)"
+    console.print(f"Load test: {users} users x {turns} turns, {len(queries)} queries, {model_text}, "
+                  f"{checkpointer} checkpoints", style=Styles.INFO)
+
+    try:
+        report = asyncio.run(run_load_test(
+            config_path, queries,
+            users=users, turns=turns, ramp_up_seconds=ramp_up,
+            sample_interval=sample_interval, checkpointer_backend=checkpointer,
+        ))
+    except KeyboardInterrupt:
+        console.print("\nLoad test interrupted", style=Styles.WARNING)
+        raise click.Abort() from None
+    except ImportError as e:
+        # Optional dependencies, e.g. aiosqlite for --checkpointer sqlite
+        console.print(f"❌ {e}", style=Styles.ERROR)
+        raise click.Abort() from None
+    finally:
+        logging.disable(logging.NOTSET)
+
+    print_report(report)
+    if output:
+        write_report(report, output)
+        console.print(f"Report written to {output}", style=Styles.DIM)
+    if report.errors:
+        console.print(f"{report.errors} turns failed; rerun with --verbose for details", style=Styles.WARNING)
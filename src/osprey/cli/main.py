@@ -37,6 +37,10 @@ class LazyGroup(click.Group):
             'chat': 'osprey.cli.chat_cmd',
             'export-config': 'osprey.cli.export_config_cmd',
             'health': 'osprey.cli.health_cmd',
+            'trace': 'osprey.cli.trace_cmd',
+            'metrics': 'osprey.cli.metrics_cmd',
+            'registry': 'osprey.cli.registry_cmd',
+            'loadtest': 'osprey.cli.loadtest_cmd',
         }
 
         if cmd_name not in commands:
@@ -57,7 +61,7 @@ class LazyGroup(click.Group):
 
     def list_commands(self, ctx):
         """Return list of available commands (for --help)."""
-        return ['init', 'deploy', 'chat', 'export-config', 'health']
+        return ['init', 'deploy', 'chat', 'export-config', 'health', 'trace', 'metrics', 'registry', 'loadtest']
 
 
 @click.group(cls=LazyGroup, invoke_without_command=True)
@@ -79,6 +83,11 @@ def cli(ctx):
       osprey deploy up                Start services
       osprey chat                     Interactive conversation
       osprey health                   Check system health
+      osprey trace calls              Dump recorded LLM calls
+      osprey trace spans <thread-id>  Show a request's span timeline
+      osprey metrics                  Show latency, retry and cache metrics
+      osprey registry profile         Profile component import time
+      osprey loadtest -u 50           Offline load test with 50 simulated users
       osprey export-config            View osprey defaults
     """
     # Initialize theme from config if available (best-effort, silent failure)
@@ -0,0 +1,130 @@
+"""Metrics command.
+
+This module provides the 'osprey metrics' command which reads the Prometheus
+metrics of a running pipelines server (``services.pipelines.metrics_port``) or
+the snapshot written by the last ``osprey chat`` session, and prints them as a
+summary table or as raw Prometheus text.
+"""
+
+import os
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import click
+from rich.table import Table
+
+from osprey.cli.styles import Styles, console
+
+
+def _fetch(url: str, timeout: float = 5.0) -> str:
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return response.read().decode()
+
+
+def summarize(samples: list[tuple[str, dict[str, str], float]]) -> list[tuple[str, str, str]]:
+    """Reduce parsed samples to ``(metric, labels, value)`` rows.
+
+    Histograms are shown as their count and mean (in milliseconds for
+    ``*_seconds`` metrics); bucket samples are dropped.
+    """
+    histograms: dict[tuple[str, str], dict[str, float]] = {}
+    rows = []
+    for name, labels, value in samples:
+        label_text = ", ".join(f"{k}={v}" for k, v in labels.items() if k != "le")
+        for suffix in ("_bucket", "_sum", "_count"):
+            if name.endswith(suffix):
+                base = name[:-len(suffix)]
+                if suffix != "_bucket":
+                    histograms.setdefault((base, label_text), {})[suffix] = value
+                break
+        else:
+            rows.append((name, label_text, f"{value:g}"))
+
+    for (name, label_text), values in histograms.items():
+        count = values.get("_count", 0)
+        mean = values.get("_sum", 0) / count if count else 0
+        mean_text = f"{mean * 1000:.1f} ms" if name.endswith("_seconds") else f"{mean:.3g}"
+        rows.append((name, label_text, f"{count:g} obs, mean {mean_text}"))
+    return sorted(rows)
+
+
+@click.command()
+@click.option(
+    "--project", "-p",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True),
+    help="Project directory (default: current directory or OSPREY_PROJECT env var)"
+)
+@click.option(
+    "--config", "-c",
+    default="config.yml",
+    help="Configuration file (default: config.yml in project directory)"
+)
+@click.option("--url", help="Metrics endpoint (default: localhost at services.pipelines.metrics_port)")
+@click.option(
+    "--file", "snapshot_file",
+    type=click.Path(dir_okay=False),
+    help="Read a metrics snapshot file instead of the endpoint"
+)
+@click.option("--raw", is_flag=True, help="Print Prometheus text instead of a summary table")
+def metrics(project: str, config: str, url: str | None, snapshot_file: str | None, raw: bool):
+    """Show framework metrics in Prometheus format.
+
+    Reads the pipelines server's /metrics endpoint when one is configured and
+    reachable, otherwise the _agent_data/metrics.prom snapshot written when an
+    'osprey chat' session exits.
+
+    Examples:
+
+    \b
+      # Summary of node and LLM latencies, retries and cache hits
+      $ osprey metrics
+
+      # Prometheus text from a specific endpoint
+      $ osprey metrics --url http://localhost:9102/metrics --raw
+    """
+    from osprey.utils.metrics import SNAPSHOT_FILE_NAME, parse_metrics
+
+    text = None
+    source = None
+    if snapshot_file is None:
+        from osprey.utils.config import get_agent_dir, get_config_value
+
+        from .project_utils import resolve_config_path
+
+        os.environ['CONFIG_FILE'] = str(resolve_config_path(project, config))
+        if url is None:
+            port = get_config_value("services.pipelines.metrics_port", None)
+            url = f"http://localhost:{port}/metrics" if port else None
+        snapshot_file = get_agent_dir(SNAPSHOT_FILE_NAME)
+
+        if url:
+            try:
+                text, source = _fetch(url), url
+            except (urllib.error.URLError, OSError) as e:
+                console.print(f"Metrics endpoint {url} not reachable ({e}); using snapshot", style=Styles.DIM)
+
+    if text is None:
+        path = Path(snapshot_file)
+        if not path.exists():
+            console.print(f"No metrics available: no endpoint configured or reachable and no {path}",
+                          style=Styles.WARNING)
+            return
+        text, source = path.read_text(), str(path)
+
+    if raw:
+        click.echo(text, nl=False)
+        return
+
+    rows = summarize(parse_metrics(text))
+    if not rows:
+        console.print(f"No metrics recorded in {source}", style=Styles.WARNING)
+        return
+
+    table = Table(title=f"Metrics ({source})")
+    table.add_column("Metric", style=Styles.INFO)
+    table.add_column("Labels")
+    table.add_column("Value", justify="right")
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
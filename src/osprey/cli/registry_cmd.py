@@ -10,6 +10,7 @@ Key Features:
     - Show component metadata (descriptions, requirements, etc.)
     - Rich formatted output with sections and tables
     - Support for verbose and compact display modes
+    - Per-component import time and memory profile (``osprey registry profile``)
 
 Architecture:
     - Uses RegistryManager to access component data
@@ -19,6 +20,7 @@ Architecture:
 
 from pathlib import Path
 
+import click
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
@@ -312,3 +314,121 @@ def handle_registry_action(project_path: Path | None = None, verbose: bool = Fal
 
     input("\nPress ENTER to continue...")
 
+
+
+def profile_registry_loading(top: int | None = None, trace_memory: bool = True) -> list:
+    """Load every registry component and report its import cost.
+
+    Initializes the registry (if needed), loads all components still pending from
+    lazy initialization and prints per-component import time, newly imported
+    modules and retained memory, most expensive first.
+
+    Args:
+        top: Only show the N most expensive components
+        trace_memory: Measure retained memory with tracemalloc (slower imports)
+
+    Returns:
+        List of ComponentLoadRecord, most expensive first
+    """
+    import sys
+    import time
+    import tracemalloc
+
+    from osprey.utils.log_filter import quiet_logger
+
+    if trace_memory:
+        tracemalloc.start()
+    modules_before = len(sys.modules)
+    start = time.perf_counter()
+    try:
+        with quiet_logger(['REGISTRY', 'CONFIG']):
+            registry = get_registry()
+            registry.initialize()
+            registry.load_all_components()
+    finally:
+        total_seconds = time.perf_counter() - start
+        if trace_memory:
+            tracemalloc.stop()
+
+    records = sorted(registry.load_profile, key=lambda r: r.seconds, reverse=True)
+    shown = records[:top] if top else records
+
+    table = Table(
+        title="Registry Component Load Profile",
+        show_header=True,
+        header_style=Styles.HEADER,
+        border_style=Styles.DIM,
+        expand=False
+    )
+    table.add_column("Component", style=Styles.ACCENT, no_wrap=True)
+    table.add_column("Type", style=Styles.VALUE)
+    table.add_column("Module", style=Styles.DIM)
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("Modules", justify="right")
+    table.add_column("Memory (KB)", justify="right")
+
+    for record in shown:
+        memory = f"{record.memory_kb:,.0f}" if record.memory_kb is not None else "-"
+        table.add_row(record.name, record.component_type, record.module_path,
+                      f"{record.seconds * 1000:,.1f}", str(record.modules_imported), memory)
+
+    console.print()
+    console.print(table)
+    console.print(
+        f"\n  Components: {len(records)}   "
+        f"Total load time: {total_seconds * 1000:,.0f} ms   "
+        f"Modules imported: {len(sys.modules) - modules_before}"
+    )
+    console.print(
+        f"  [{Styles.DIM}]Import cost is charged to the first component that imports a dependency.[/{Styles.DIM}]\n"
+    )
+    return records
+
+
+def _use_project_config(project: str | None) -> None:
+    if project is None:
+        return
+
+    import os
+
+    from .project_utils import resolve_config_path
+
+    os.environ['CONFIG_FILE'] = str(resolve_config_path(project))
+
+
+@click.group(invoke_without_command=True)
+@click.option(
+    "--project", "-p",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True),
+    help="Project directory (default: current directory or OSPREY_PROJECT env var)"
+)
+@click.option("--verbose", "-v", is_flag=True, help="Show component descriptions")
+@click.pass_context
+def registry(ctx, project: str | None, verbose: bool):
+    """Show registered components or profile their import cost.
+
+    Examples:
+
+    \b
+      # Show registry contents
+      $ osprey registry
+
+      # Per-component import time and memory
+      $ osprey registry profile
+    """
+    _use_project_config(project)
+    if ctx.invoked_subcommand is None:
+        if not display_registry_contents(verbose=verbose):
+            raise click.Abort()
+
+
+@registry.command()
+@click.option("--top", "-n", type=int, default=None, help="Only show the N most expensive components")
+@click.option("--no-memory", is_flag=True, help="Skip tracemalloc memory measurement")
+def profile(top: int | None, no_memory: bool):
+    """Report per-component import time and memory.
+
+    Loads every capability, node, context class, data source, service,
+    provider and analyzer in a fresh process and lists what drives startup.
+    """
+    profile_registry_loading(top=top, trace_memory=not no_memory)
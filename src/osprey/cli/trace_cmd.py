@@ -0,0 +1,255 @@
+"""LLM trace and request span commands.
+
+This module provides the 'osprey trace' command group, which reads the files
+written by the trace recorder:
+
+- ``osprey trace calls`` prints the recorded LLM calls of a session, either as
+  a summary table or as raw JSONL for further processing
+- ``osprey trace spans`` renders each request of a conversation thread as a
+  timeline tree (graph nodes, LLM calls, data source retrievals and Python
+  executor stages), or exports the spans in Chrome trace format for
+  chrome://tracing and Perfetto
+"""
+
+import json
+import os
+from pathlib import Path
+
+import click
+from rich.table import Table
+from rich.text import Text
+from rich.tree import Tree
+
+from osprey.cli.styles import Styles, console
+
+# Width of the timeline bar column
+BAR_WIDTH = 40
+
+CATEGORY_STYLES = {
+    "infrastructure": "cyan",
+    "capability": "green",
+    "llm": "magenta",
+    "data_source": "yellow",
+    "python_executor": "blue",
+}
+
+
+def group_by_request(spans: list[dict]) -> dict[str, list[dict]]:
+    """Group span records by request id, in order of first appearance."""
+    requests: dict[str, list[dict]] = {}
+    for record in spans:
+        requests.setdefault(record.get("request_id") or "unknown", []).append(record)
+    return requests
+
+
+def build_timeline(spans: list[dict], title: str) -> Tree:
+    """Build a Rich tree with one timeline bar per span, children under their parents."""
+    start = min(s["start"] for s in spans)
+    end = max(s["start"] + (s.get("duration_ms") or 0) / 1000 for s in spans)
+    total = max(end - start, 1e-6)
+
+    ids = {s["span_id"] for s in spans}
+    children: dict[str | None, list[dict]] = {}
+    for record in sorted(spans, key=lambda s: s["start"]):
+        parent = record.get("parent_id") if record.get("parent_id") in ids else None
+        children.setdefault(parent, []).append(record)
+
+    tree = Tree(Text(f"{title}  ({total:.2f}s)", style="bold"))
+
+    def add(node: Tree, parent_id: str | None) -> None:
+        for record in children.get(parent_id, []):
+            offset = record["start"] - start
+            duration = (record.get("duration_ms") or 0) / 1000
+            first = int(offset / total * BAR_WIDTH)
+            width = max(1, round(duration / total * BAR_WIDTH))
+            bar = " " * first + "█" * min(width, BAR_WIDTH - first)
+
+            style = CATEGORY_STYLES.get(record.get("category"), "white")
+            label = Text()
+            label.append(f"{bar:<{BAR_WIDTH}} ", style=style)
+            label.append(f"{duration * 1000:9.1f} ms ", style="bold")
+            label.append(f"+{offset:6.2f}s  ", style=Styles.DIM)
+            label.append(record["name"], style=style)
+            if record.get("status") not in (None, "ok"):
+                label.append(f"  [{record['status']}]", style=Styles.ERROR)
+            add(node.add(label), record["span_id"])
+
+    add(tree, None)
+    return tree
+
+
+def source_options(func):
+    """Options selecting the project and trace directory, shared by the subcommands."""
+    func = click.option(
+        "--traces-dir",
+        type=click.Path(file_okay=False, dir_okay=True),
+        help="Read from this directory instead of the configured one"
+    )(func)
+    func = click.option(
+        "--config", "-c",
+        default="config.yml",
+        help="Configuration file (default: config.yml in project directory)"
+    )(func)
+    return click.option(
+        "--project", "-p",
+        type=click.Path(exists=True, file_okay=False, dir_okay=True),
+        help="Project directory (default: current directory or OSPREY_PROJECT env var)"
+    )(func)
+
+
+def resolve_traces_dir(project: str | None, config: str, traces_dir: str | None) -> Path:
+    """The explicit ``--traces-dir`` or the project's configured ``file_paths.traces_dir``."""
+    if traces_dir is None:
+        from osprey.utils.config import get_agent_dir
+
+        from .project_utils import resolve_config_path
+
+        os.environ['CONFIG_FILE'] = str(resolve_config_path(project, config))
+        traces_dir = get_agent_dir("traces_dir")
+    return Path(traces_dir)
+
+
+@click.group()
+def trace():
+    """Inspect recorded LLM calls and request timing spans.
+
+    Both are recorded when development.tracing.enabled is true (spans also
+    need development.tracing.spans).
+
+    Examples:
+
+    \b
+      # Summary of all recorded LLM calls
+      $ osprey trace calls
+
+    \b
+      # Timeline of the latest request of a thread
+      $ osprey trace spans 3f2a...
+    """
+
+
+@trace.command()
+@source_options
+@click.option("--session", "-s", help="Session (thread) ID to dump (default: all sessions)")
+@click.option("--limit", "-n", type=int, default=None, help="Only show the last N traces")
+@click.option("--full", is_flag=True, help="Output complete traces as JSONL instead of a summary table")
+def calls(project: str | None, config: str, traces_dir: str | None, session: str | None,
+          limit: int | None, full: bool):
+    """Dump recorded LLM call traces.
+
+    Traces contain the prompt, response, model, latency and estimated token
+    counts of every LLM call.
+
+    Examples:
+
+    \b
+      # Summary of all recorded calls
+      $ osprey trace calls
+
+    \b
+      # Last 20 calls of one session
+      $ osprey trace calls --session 3f2a... --limit 20
+
+    \b
+      # Complete traces as JSONL
+      $ osprey trace calls --session 3f2a... --full > session.jsonl
+    """
+    from osprey.utils.trace_recorder import iter_traces
+
+    traces_dir = resolve_traces_dir(project, config, traces_dir)
+    records = list(iter_traces(traces_dir, session_id=session))
+    if limit:
+        records = records[-limit:]
+
+    if full:
+        for record in records:
+            click.echo(json.dumps(record, default=str))
+        return
+
+    if not records:
+        console.print(f"No traces found in {traces_dir}", style=Styles.WARNING)
+        return
+
+    table = Table(title=f"LLM traces ({len(records)})")
+    table.add_column("Time", style=Styles.DIM)
+    table.add_column("Session")
+    table.add_column("Model")
+    table.add_column("Latency (s)", justify="right")
+    table.add_column("Tokens in/out", justify="right")
+    table.add_column("Status")
+
+    for record in records:
+        model = "/".join(filter(None, [record.get("provider"), record.get("model_id")]))
+        latency = record.get("latency_sec")
+        table.add_row(
+            record.get("timestamp", ""),
+            (record.get("session_id") or "-")[:12],
+            model,
+            f"{latency:.2f}" if latency is not None else "-",
+            f"{record.get('input_tokens', 0)}/{record.get('output_tokens', 0)}",
+            f"[{Styles.ERROR}]error[/{Styles.ERROR}]" if record.get("error") else "ok",
+        )
+
+    console.print(table)
+
+
+
+@trace.command()
+@click.argument("thread_id")
+@source_options
+@click.option("--request", "-r", "request_id", help="Request ID to show (default: latest request)")
+@click.option("--all", "show_all", is_flag=True, help="Show every request of the thread")
+@click.option(
+    "--chrome",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the selected spans as a Chrome trace JSON file"
+)
+def spans(thread_id: str, project: str | None, config: str, traces_dir: str | None,
+          request_id: str | None, show_all: bool, chrome: str | None):
+    """Show where a request spent its time.
+
+    THREAD_ID is the conversation thread (as shown by 'osprey trace calls').
+
+    Examples:
+
+    \b
+      # Timeline of the latest request of a thread
+      $ osprey trace spans 3f2a...
+
+    \b
+      # All requests, exported for chrome://tracing or ui.perfetto.dev
+      $ osprey trace spans 3f2a... --all --chrome trace.json
+    """
+    from osprey.utils.spans import iter_spans, to_chrome_trace
+
+    traces_dir = resolve_traces_dir(project, config, traces_dir)
+    requests = group_by_request(list(iter_spans(Path(traces_dir), session_id=thread_id)))
+    if not requests:
+        console.print(f"No spans found for thread {thread_id} in {traces_dir}", style=Styles.WARNING)
+        return
+
+    if request_id is not None:
+        if request_id not in requests:
+            raise click.ClickException(
+                f"Request {request_id} not found. Available: {', '.join(requests)}"
+            )
+        selected = {request_id: requests[request_id]}
+    elif show_all:
+        selected = requests
+    else:
+        latest = list(requests)[-1]
+        selected = {latest: requests[latest]}
+
+    if chrome:
+        exported = [record for records in selected.values() for record in records]
+        Path(chrome).write_text(json.dumps(to_chrome_trace(exported)))
+        console.print(f"Wrote {len(exported)} spans to {chrome}", style=Styles.SUCCESS)
+        return
+
+    for request, records in selected.items():
+        console.print(build_timeline(records, f"Request {request}"))
+
+
+
+if __name__ == "__main__":
+    trace()
@@ -9,11 +9,15 @@ import asyncio
 import logging
 import time
 import warnings
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any
 
+from osprey.utils.metrics import CACHE_REQUESTS
+from osprey.utils.spans import span, traced
+
 from .providers import DataSourceContext, DataSourceProvider
 from .request import DataSourceRequest
+from .resilience import CircuitBreaker, ProviderResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +27,12 @@ class DataRetrievalResult:
     context_data: dict[str, DataSourceContext] = field(default_factory=dict)
     successful_sources: list[str] = field(default_factory=list)
     failed_sources: list[str] = field(default_factory=list)
+    timed_out_sources: list[str] = field(default_factory=list)
+    late_sources: list[str] = field(default_factory=list)
+    cached_sources: list[str] = field(default_factory=list)
+    circuit_open_sources: list[str] = field(default_factory=list)
+    breaker_states: dict[str, str] = field(default_factory=dict)
+    cache_hit_rate: float = 0.0
     total_sources_attempted: int = 0
     retrieval_time_sec: float | None = None
 
@@ -57,6 +67,12 @@ class DataRetrievalResult:
             'sources_attempted': self.total_sources_attempted,
             'sources_successful': len(self.successful_sources),
             'sources_failed': len(self.failed_sources),
+            'sources_timed_out': list(self.timed_out_sources),
+            'late_results_attached': list(self.late_sources),
+            'sources_cached': list(self.cached_sources),
+            'cache_hit_rate': self.cache_hit_rate,
+            'sources_skipped_circuit_open': list(self.circuit_open_sources),
+            'breaker_states': dict(self.breaker_states),
             'success_rate': self.success_rate,
             'context_types_retrieved': list(set(ctx.context_type for ctx in self.context_data.values())),
             'retrieval_time_sec': self.retrieval_time_sec
@@ -70,9 +86,42 @@ class DataSourceManager:
     cleaner architecture that supports core and application-specific data sources.
     """
 
-    def __init__(self):
+    def __init__(self, default_timeout_seconds: float = 30.0,
+                 soft_deadline_seconds: float | None = None,
+                 provider_timeouts: dict[str, float] | None = None,
+                 attach_late_results: bool = False,
+                 provider_cache_ttls: dict[str, float] | None = None,
+                 failure_threshold: int = 3,
+                 recovery_seconds: float = 60.0,
+                 late_result_ttl_seconds: float = 300.0):
+        """
+        Args:
+            default_timeout_seconds: Hard deadline for the whole retrieval
+            soft_deadline_seconds: Time after which retrieval returns with the
+                results that have arrived (None waits up to the hard deadline)
+            provider_timeouts: Per-provider timeout overrides by provider name
+            attach_late_results: Keep providers that miss the soft deadline running
+                and attach their results to the next request from the same user
+                and requester
+            provider_cache_ttls: Per-provider result cache TTL overrides by provider name
+            failure_threshold: Consecutive failures or timeouts before a provider is skipped
+            recovery_seconds: Time before a skipped provider is probed via health_check()
+            late_result_ttl_seconds: Time after which late results nobody picked up
+                are cancelled and dropped
+        """
         self._providers: dict[str, DataSourceProvider] = {}
         self._initialized = False
+        self.default_timeout_seconds = default_timeout_seconds
+        self.soft_deadline_seconds = soft_deadline_seconds
+        self.provider_timeouts = dict(provider_timeouts or {})
+        self.attach_late_results = attach_late_results
+        self.late_result_ttl_seconds = late_result_ttl_seconds
+        self.provider_cache_ttls = dict(provider_cache_ttls or {})
+        self.cache = ProviderResultCache()
+        self.circuit_breaker = CircuitBreaker(failure_threshold, recovery_seconds)
+
+        # (user_id, requester name) -> (parked at, {provider name: task still running after the soft deadline})
+        self._late_tasks: dict[tuple, tuple[float, dict[str, asyncio.Task]]] = {}
 
     def register_provider(self, provider: DataSourceProvider) -> None:
         """
@@ -97,19 +146,95 @@ class DataSourceManager:
         """
         return [p for p in self._providers.values() if p.should_respond(request)]
 
+    def get_provider_timeout(self, provider: DataSourceProvider, hard_timeout: float) -> float:
+        """
+        Get the retrieval timeout for a provider.
+
+        Configured overrides take precedence over the provider's own
+        ``timeout_seconds``; the result never exceeds the hard deadline.
+        """
+        timeout = self.provider_timeouts.get(provider.name)
+        if timeout is None:
+            try:
+                timeout = provider.timeout_seconds
+            except Exception:
+                timeout = None
+        if timeout is None:
+            return hard_timeout
+        return min(float(timeout), hard_timeout)
+
+    def get_cache_ttl(self, provider: DataSourceProvider) -> float | None:
+        """Get the result cache TTL for a provider (None or 0 disables caching)."""
+        ttl = self.provider_cache_ttls.get(provider.name)
+        if ttl is None:
+            try:
+                ttl = provider.cache_ttl_seconds
+            except Exception:
+                ttl = None
+        return float(ttl) if ttl else None
+
+    def _expire_late_tasks(self) -> None:
+        """Cancel and drop late retrievals whose user has not come back within the TTL."""
+        cutoff = time.monotonic() - self.late_result_ttl_seconds
+        expired = [key for key, (parked_at, _) in self._late_tasks.items() if parked_at <= cutoff]
+        for key in expired:
+            _, tasks = self._late_tasks.pop(key)
+            for task in tasks.values():
+                # Tasks of a previous, closed event loop cannot be cancelled from here
+                if not task.done() and task.get_loop() is asyncio.get_running_loop():
+                    task.cancel()
+        if expired:
+            logger.debug(f"Dropped late data source results of {len(expired)} inactive requesters")
+
+    async def _probe_open_providers(self, providers: list[DataSourceProvider], hard_timeout: float) -> None:
+        """Run health checks for open breakers whose recovery time has elapsed."""
+        due = [p for p in providers if self.circuit_breaker.needs_probe(p.name)]
+        if not due:
+            return
+
+        async def probe(provider: DataSourceProvider) -> None:
+            try:
+                healthy = await asyncio.wait_for(
+                    provider.health_check(), timeout=self.get_provider_timeout(provider, hard_timeout)
+                )
+            except Exception:
+                healthy = False
+            self.circuit_breaker.record_probe(provider.name, bool(healthy))
+            logger.info(f"Health probe for data source {provider.name}: {'healthy' if healthy else 'unhealthy'}")
+
+        await asyncio.gather(*(probe(p) for p in due))
+
+    @traced("data_source", "data_sources")
     async def retrieve_all_context(self, request: DataSourceRequest,
-                                  timeout_seconds: float = 30.0) -> DataRetrievalResult:
+                                  timeout_seconds: float | None = None,
+                                  soft_deadline_seconds: float | None = None) -> DataRetrievalResult:
         """
         Retrieve context from all responding data sources.
 
+        Providers run concurrently, each bounded by its own timeout. Results are
+        collected as they complete, so a slow provider never discards results
+        that already arrived. After the soft deadline the call returns with
+        whatever has arrived; remaining providers are cancelled, or kept running
+        for the next request when ``attach_late_results`` is enabled.
+
+        Providers with a cache TTL reuse results for identical request
+        fingerprints, and providers whose circuit breaker is open are skipped
+        until a health check succeeds.
+
         Args:
             request: Data source request with requester information
             timeout_seconds: Maximum time to wait for all data sources
+                (defaults to the manager's ``default_timeout_seconds``)
+            soft_deadline_seconds: Return with partial results after this time
+                (defaults to the manager's ``soft_deadline_seconds``)
 
         Returns:
             DataRetrievalResult containing all successfully retrieved data
         """
         start_time = time.time()
+        hard_timeout = timeout_seconds if timeout_seconds is not None else self.default_timeout_seconds
+        soft_deadline = soft_deadline_seconds if soft_deadline_seconds is not None else self.soft_deadline_seconds
+        wait_budget = min(soft_deadline, hard_timeout) if soft_deadline is not None else hard_timeout
 
         # Get responding providers in registration order
         providers = self.get_responding_providers(request)
@@ -120,28 +245,93 @@ class DataSourceManager:
 
         logger.info(f"Retrieving context from {len(providers)} data sources")
 
-        # Create retrieval tasks for all providers
+        self._expire_late_tasks()
+        late_key = (request.user_id, request.requester.component_name)
+        _, late_tasks = self._late_tasks.pop(late_key, (0.0, {}))
+
+        await self._probe_open_providers(providers, hard_timeout)
+
+        # Create retrieval tasks for all providers, reusing tasks still running from the last request
         tasks = []
+        carried_over = set()
+        cached_results: dict[str, DataSourceContext] = {}
+        circuit_open_sources = []
+        cache_lookups = 0
         for provider in providers:
+            task = late_tasks.pop(provider.name, None)
+            # Tasks from a previous event loop cannot be awaited here
+            if task is not None and not task.cancelled() and task.get_loop() is asyncio.get_running_loop():
+                carried_over.add(provider.name)
+                tasks.append((provider.name, task))
+                continue
+
+            if not self.circuit_breaker.allows(provider.name):
+                circuit_open_sources.append(provider.name)
+                continue
+
+            cache_ttl = self.get_cache_ttl(provider)
+            fingerprint = None
+            if cache_ttl:
+                fingerprint = provider.cache_fingerprint(request)
+                cache_lookups += 1
+                cached = self.cache.get(provider.name, fingerprint)
+                CACHE_REQUESTS.inc(cache=f"data_source:{provider.name}",
+                                   result="miss" if cached is None else "hit")
+                if cached is not None:
+                    cached_results[provider.name] = cached
+                    # A cached answer is not a trial of a half-open provider
+                    self.circuit_breaker.release(provider.name)
+                    continue
+
             task = asyncio.create_task(
-                self._retrieve_from_provider(provider, request),
+                self._retrieve_with_timeout(
+                    provider, request, self.get_provider_timeout(provider, hard_timeout),
+                    cache_ttl=cache_ttl, fingerprint=fingerprint
+                ),
                 name=f"retrieve_{provider.name}"
             )
             tasks.append((provider.name, task))
 
-        # Wait for all tasks with timeout
-        try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*[task for _, task in tasks], return_exceptions=True),
-                timeout=timeout_seconds
+        for task in late_tasks.values():
+            if not task.done() and task.get_loop() is asyncio.get_running_loop():
+                task.cancel()
+
+        if circuit_open_sources:
+            logger.info(f"Skipping data sources with open circuit breaker: {', '.join(circuit_open_sources)}")
+
+        # Collect results as they complete until everything is done or the deadline passes
+        pending = {task for _, task in tasks if not task.done()}
+        if pending:
+            _, pending = await asyncio.wait(pending, timeout=wait_budget)
+
+        timed_out_sources = [name for name, task in tasks if task in pending]
+        late_sources = []
+        if pending:
+            logger.warning(
+                f"Data source retrieval deadline ({wait_budget:.1f}s) reached; "
+                f"proceeding without: {', '.join(timed_out_sources)}"
             )
-        except TimeoutError:
-            logger.warning(f"Data source retrieval timed out after {timeout_seconds}s")
-            # Cancel remaining tasks
-            for _, task in tasks:
-                if not task.done():
-                    task.cancel()
-            results = [None] * len(tasks)  # Treat all as failed
+            if self.attach_late_results:
+                self._late_tasks[late_key] = (
+                    time.monotonic(), {name: task for name, task in tasks if task in pending})
+            else:
+                for name, task in tasks:
+                    if task in pending:
+                        task.cancel()
+                        self._record_failure(self._providers[name])
+
+        # Gather outcomes in registration order
+        task_by_name = dict(tasks)
+        outcomes = []
+        for provider in providers:
+            if provider.name in cached_results:
+                outcomes.append((provider.name, cached_results[provider.name]))
+                continue
+            task = task_by_name.get(provider.name)
+            if task is None or task in pending or task.cancelled():
+                outcomes.append((provider.name, None))
+            else:
+                outcomes.append((provider.name, task.exception() or task.result()))
 
         # Process results
         context_data = {}
@@ -149,11 +339,16 @@ class DataSourceManager:
         failed_sources = []
         empty_sources = []
 
-        for (provider_name, _), result in zip(tasks, results):
+        for provider_name, result in outcomes:
             if isinstance(result, Exception):
                 logger.warning(f"Data retrieval failed for {provider_name}: {result}")
                 failed_sources.append(provider_name)
             elif result is not None:
+                if provider_name in carried_over:
+                    # Result of a retrieval that missed the previous request's deadline. The
+                    # cache may hand the same context to other requests, so annotate a copy
+                    result = replace(result, metadata={**result.metadata, 'late_result': True})
+                    late_sources.append(provider_name)
                 context_data[provider_name] = result
                 successful_sources.append(provider_name)
 
@@ -175,7 +370,7 @@ class DataSourceManager:
                 else:
                     logger.debug(f"Retrieved empty result from {provider_name} (no data available)")
                     empty_sources.append(provider_name)
-            else:
+            elif provider_name not in timed_out_sources and provider_name not in circuit_open_sources:
                 failed_sources.append(provider_name)
 
         retrieval_time_sec = time.time() - start_time
@@ -184,6 +379,12 @@ class DataSourceManager:
             context_data=context_data,
             successful_sources=successful_sources,
             failed_sources=failed_sources,
+            timed_out_sources=timed_out_sources,
+            late_sources=late_sources,
+            cached_sources=list(cached_results),
+            circuit_open_sources=circuit_open_sources,
+            breaker_states=self.circuit_breaker.states(),
+            cache_hit_rate=len(cached_results) / cache_lookups if cache_lookups else 0.0,
             total_sources_attempted=len(providers),
             retrieval_time_sec=retrieval_time_sec
         )
@@ -191,7 +392,7 @@ class DataSourceManager:
         # Log human-readable summary with better clarity
         sources_with_data = len([s for s in successful_sources if s not in empty_sources])
 
-        if failed_sources or empty_sources:
+        if failed_sources or empty_sources or timed_out_sources or circuit_open_sources:
             details = []
             if sources_with_data > 0:
                 details.append(f"{sources_with_data} with data")
@@ -199,10 +400,15 @@ class DataSourceManager:
                 details.append(f"{len(empty_sources)} empty")
             if failed_sources:
                 details.append(f"{len(failed_sources)} failed")
+            if timed_out_sources:
+                details.append(f"{len(timed_out_sources)} timed out")
+            if circuit_open_sources:
+                details.append(f"{len(circuit_open_sources)} skipped")
 
             logger.info(f"Data sources checked: {len(providers)} ({', '.join(details)}) in {retrieval_time_sec:.2f}s")
         else:
-            logger.info(f"Retrieved data from {sources_with_data} source{'s' if sources_with_data != 1 else ''} in {retrieval_time_sec:.2f}s")
+            cached_note = f", {len(cached_results)} cached" if cached_results else ""
+            logger.info(f"Retrieved data from {sources_with_data} source{'s' if sources_with_data != 1 else ''}{cached_note} in {retrieval_time_sec:.2f}s")
 
         return retrieval_result
 
@@ -240,6 +446,43 @@ class DataSourceManager:
 
         return await self._retrieve_from_provider(provider, request)
 
+    async def _retrieve_with_timeout(self, provider: DataSourceProvider, request: DataSourceRequest,
+                                     timeout: float, cache_ttl: float | None = None,
+                                     fingerprint: tuple | None = None) -> DataSourceContext | None:
+        """
+        Retrieve from a provider bounded by its own timeout.
+
+        Records the outcome with the circuit breaker and caches successful
+        results when the provider has a cache TTL.
+        """
+        try:
+            logger.debug(f"Retrieving data from {provider.name}")
+            with span(provider.name, "data_source", timeout_seconds=timeout):
+                result = await asyncio.wait_for(provider.retrieve_data(request), timeout=timeout)
+        except asyncio.CancelledError:
+            self.circuit_breaker.release(provider.name)
+            raise
+        except TimeoutError:
+            logger.warning(f"Data source {provider.name} timed out after {timeout:.1f}s")
+            self._record_failure(provider)
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to retrieve data from {provider.name}: {e}")
+            self._record_failure(provider)
+            return None
+
+        self.circuit_breaker.record_success(provider.name)
+        if cache_ttl and fingerprint is not None and result is not None:
+            self.cache.put(provider.name, fingerprint, result, cache_ttl)
+        return result
+
+    def _record_failure(self, provider: DataSourceProvider) -> None:
+        if self.circuit_breaker.record_failure(provider.name):
+            logger.warning(
+                f"Circuit breaker opened for data source {provider.name}; "
+                f"skipping it for {self.circuit_breaker.recovery_seconds:.0f}s"
+            )
+
     async def _retrieve_from_provider(self, provider: DataSourceProvider,
                                      request: DataSourceRequest) -> DataSourceContext | None:
         """
@@ -275,7 +518,7 @@ def get_data_source_manager() -> DataSourceManager:
     """
     global _data_source_manager
     if _data_source_manager is None:
-        _data_source_manager = DataSourceManager()
+        _data_source_manager = DataSourceManager(**_load_manager_settings())
 
         # Load all data sources from registry
         try:
@@ -294,3 +537,33 @@ def get_data_source_manager() -> DataSourceManager:
             logger.warning(f"Failed to load data sources from registry: {e}")
 
     return _data_source_manager
+
+
+def _load_manager_settings() -> dict[str, Any]:
+    """Read retrieval deadlines from the ``data_sources`` configuration section."""
+    try:
+        from osprey.utils.config import get_config_value
+        config = get_config_value("data_sources", {}) or {}
+    except Exception as e:
+        logger.debug(f"Using default data source settings: {e}")
+        return {}
+
+    provider_settings = {
+        name: settings for name, settings in (config.get("providers") or {}).items()
+        if isinstance(settings, dict)
+    }
+    breaker = config.get("circuit_breaker") or {}
+    return {
+        "default_timeout_seconds": config.get("timeout_seconds", 30.0),
+        "soft_deadline_seconds": config.get("soft_deadline_seconds"),
+        "provider_timeouts": _per_provider(provider_settings, "timeout_seconds"),
+        "attach_late_results": config.get("attach_late_results", False),
+        "provider_cache_ttls": _per_provider(provider_settings, "cache_ttl_seconds"),
+        "failure_threshold": breaker.get("failure_threshold", 3),
+        "recovery_seconds": breaker.get("recovery_seconds", 60.0),
+        "late_result_ttl_seconds": config.get("late_result_ttl_seconds", 300.0),
+    }
+
+
+def _per_provider(provider_settings: dict[str, dict], key: str) -> dict[str, Any]:
+    return {name: settings[key] for name, settings in provider_settings.items() if settings.get(key) is not None}
@@ -134,6 +134,58 @@ class DataSourceProvider(ABC):
         """
         return {}
 
+    @property
+    def timeout_seconds(self) -> float | None:
+        """
+        Maximum time allowed for a single retrieve_data() call.
+
+        Providers backed by slow external systems can override this to get a
+        tighter (or looser) deadline than the manager default. The value can
+        also be overridden per provider via ``data_sources.providers.<name>.timeout_seconds``
+        in the configuration.
+
+        Returns:
+            Timeout in seconds, or None to use the manager default
+        """
+        return None
+
+    @property
+    def cache_ttl_seconds(self) -> float | None:
+        """
+        How long a successful retrieve_data() result may be reused.
+
+        Results are cached per request fingerprint (see :meth:`cache_fingerprint`),
+        so consecutive turns with the same context skip the retrieval. Override
+        for sources whose data changes slowly, or set
+        ``data_sources.providers.<name>.cache_ttl_seconds`` in the configuration.
+
+        Returns:
+            Time-to-live in seconds, or None to disable caching
+        """
+        return None
+
+    def cache_fingerprint(self, request: 'DataSourceRequest') -> tuple:
+        """
+        Build the cache key for a request.
+
+        The default key covers the requester, user, query and the recent message
+        window. Providers whose results depend on other request details should
+        extend it.
+
+        Args:
+            request: Data source request
+
+        Returns:
+            Hashable fingerprint; equal fingerprints may share a cached result
+        """
+        return (
+            request.requester.component_type,
+            request.requester.component_name,
+            request.user_id,
+            request.query,
+            tuple(request.metadata.get('message_window') or ()),
+        )
+
     async def health_check(self) -> bool:
         """
         Perform a health check for this data source.
@@ -10,6 +10,9 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from osprey.state import AgentState
 
+# Number of recent user messages exposed to providers as ``metadata["message_window"]``
+MESSAGE_WINDOW_SIZE = 3
+
 @dataclass
 class DataSourceRequester:
     """
@@ -50,7 +53,9 @@ def create_data_source_request(
         metadata: Optional metadata for provider-specific context
 
     Returns:
-        DataSourceRequest with user context and query information
+        DataSourceRequest with user context and query information. The request
+        metadata includes ``message_window``: the text of the most recent user
+        messages, oldest first.
     """
     # Extract user ID from session context
     user_id = None
@@ -62,9 +67,32 @@ def create_data_source_request(
         # Log but don't fail - some contexts might not have session info
         pass
 
+    request_metadata = dict(metadata or {})
+    request_metadata.setdefault("message_window", _get_message_window(state))
+
     return DataSourceRequest(
         user_id=user_id,
         requester=requester,
         query=query,
-        metadata=metadata or {}
+        metadata=request_metadata
     )
+
+
+def _get_message_window(state: 'AgentState', size: int = MESSAGE_WINDOW_SIZE) -> list[str]:
+    """Get the text of the most recent user messages, oldest first.
+
+    Providers use this window for relevance ranking (e.g. memory search)
+    without having to understand LangGraph message types.
+    """
+    window = []
+    try:
+        for message in reversed(state.get("messages", []) or []):
+            if getattr(message, "type", None) != "human":
+                continue
+            content = message.content if isinstance(message.content, str) else str(message.content)
+            window.append(content)
+            if len(window) >= size:
+                break
+    except Exception:
+        return []
+    return list(reversed(window))
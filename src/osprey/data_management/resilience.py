@@ -0,0 +1,181 @@
+"""
+Data Source Result Cache and Circuit Breaker
+
+Support classes for :class:`DataSourceManager`:
+
+- :class:`ProviderResultCache` reuses recent provider results for identical
+  request fingerprints within the provider's TTL, so consecutive turns do not
+  re-query sources whose inputs have not changed.
+- :class:`CircuitBreaker` stops calling a provider after consecutive failures or
+  timeouts and probes it through ``health_check()`` before letting traffic back.
+"""
+
+import dataclasses
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from .providers import DataSourceContext
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ProviderResultCache:
+    """
+    TTL cache of provider results keyed by provider name and request fingerprint.
+
+    Args:
+        max_entries: Maximum number of cached results (least recently used are evicted)
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[float, DataSourceContext]] = OrderedDict()
+        self.hits: dict[str, int] = {}
+        self.misses: dict[str, int] = {}
+
+    def get(self, provider_name: str, fingerprint: tuple, now: float | None = None) -> DataSourceContext | None:
+        """Return a copy of the cached result, or None if missing or expired."""
+        now = now if now is not None else time.monotonic()
+        key = (provider_name, fingerprint)
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] <= now:
+            if entry is not None:
+                del self._entries[key]
+            self.misses[provider_name] = self.misses.get(provider_name, 0) + 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits[provider_name] = self.hits.get(provider_name, 0) + 1
+        context = entry[1]
+        return dataclasses.replace(context, metadata={**context.metadata, 'cached': True})
+
+    def put(self, provider_name: str, fingerprint: tuple, context: DataSourceContext,
+            ttl_seconds: float, now: float | None = None) -> None:
+        """Store a result for ``ttl_seconds``."""
+        now = now if now is not None else time.monotonic()
+        key = (provider_name, fingerprint)
+        self._entries[key] = (now + ttl_seconds, context)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, provider_name: str | None = None) -> None:
+        """Drop cached results for one provider, or all of them."""
+        if provider_name is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0] == provider_name]:
+            del self._entries[key]
+
+    def hit_rate(self, provider_name: str | None = None) -> float:
+        """Cumulative hit rate for one provider or across all providers."""
+        if provider_name is None:
+            hits, misses = sum(self.hits.values()), sum(self.misses.values())
+        else:
+            hits, misses = self.hits.get(provider_name, 0), self.misses.get(provider_name, 0)
+        return hits / (hits + misses) if hits + misses else 0.0
+
+
+@dataclass
+class _BreakerState:
+    state: str = CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    trial_in_flight: bool = False
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker.
+
+    A provider is opened after ``failure_threshold`` consecutive failures and
+    skipped for ``recovery_seconds``. After that the manager probes it with
+    ``health_check()``; a healthy probe lets one retrieval through (half-open),
+    whose outcome closes or re-opens the breaker.
+
+    Args:
+        failure_threshold: Consecutive failures or timeouts before opening
+        recovery_seconds: Time to wait before probing an open provider
+    """
+
+    def __init__(self, failure_threshold: int = 3, recovery_seconds: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self._states: dict[str, _BreakerState] = {}
+
+    def _get(self, provider_name: str) -> _BreakerState:
+        return self._states.setdefault(provider_name, _BreakerState())
+
+    def state(self, provider_name: str) -> str:
+        """Current state of a provider's breaker."""
+        return self._get(provider_name).state
+
+    def states(self) -> dict[str, str]:
+        """States of all providers seen so far."""
+        return {name: entry.state for name, entry in self._states.items()}
+
+    def needs_probe(self, provider_name: str, now: float | None = None) -> bool:
+        """Check whether an open breaker has waited long enough to be probed."""
+        now = now if now is not None else time.monotonic()
+        entry = self._get(provider_name)
+        return entry.state == OPEN and now - entry.opened_at >= self.recovery_seconds
+
+    def allows(self, provider_name: str) -> bool:
+        """
+        Check whether a retrieval may be attempted.
+
+        A half-open breaker admits one trial retrieval at a time; the caller
+        that is admitted must report its outcome with ``record_success`` or
+        ``record_failure``, or hand the slot back with ``release``.
+        """
+        entry = self._get(provider_name)
+        if entry.state == OPEN:
+            return False
+        if entry.state == HALF_OPEN:
+            if entry.trial_in_flight:
+                return False
+            entry.trial_in_flight = True
+        return True
+
+    def release(self, provider_name: str) -> None:
+        """Give back a half-open trial slot whose retrieval did not run to an outcome."""
+        self._get(provider_name).trial_in_flight = False
+
+    def record_probe(self, provider_name: str, healthy: bool, now: float | None = None) -> None:
+        """Record a health check result for an open provider."""
+        entry = self._get(provider_name)
+        if healthy:
+            entry.state = HALF_OPEN
+            entry.trial_in_flight = False
+        else:
+            entry.opened_at = now if now is not None else time.monotonic()
+
+    def record_success(self, provider_name: str) -> None:
+        """Record a successful retrieval."""
+        entry = self._get(provider_name)
+        entry.state = CLOSED
+        entry.consecutive_failures = 0
+        entry.trial_in_flight = False
+
+    def record_failure(self, provider_name: str, now: float | None = None) -> bool:
+        """
+        Record a failed or timed out retrieval.
+
+        Returns:
+            True if this failure opened the breaker
+        """
+        entry = self._get(provider_name)
+        entry.consecutive_failures += 1
+        entry.trial_in_flight = False
+        if entry.state == HALF_OPEN or (
+            entry.state == CLOSED and entry.consecutive_failures >= self.failure_threshold
+        ):
+            entry.state = OPEN
+            entry.opened_at = now if now is not None else time.monotonic()
+            return True
+        return False
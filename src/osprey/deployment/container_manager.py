@@ -515,6 +515,7 @@ def _ensure_agent_data_structure(config):
         'user_memory_dir',
         'registry_exports_dir',
         'prompts_dir',
+        'traces_dir',
         'checkpoints'
     ]
 
@@ -0,0 +1,426 @@
+"""Multi-process worker mode for the pipelines server.
+
+One pipelines process is limited by a single GIL for prompt building,
+validation and serialization between LLM calls. Worker mode runs N copies of
+the pipelines server on consecutive local ports behind a small front process:
+
+- The front process listens on the public pipelines port and forwards each
+  request to a worker. Requests carrying a ``chat_id`` always go to the same
+  worker (rendezvous hashing). If that worker is down, they go to the next one
+  in that chat's ranking, so a chat only moves while its worker is unavailable.
+- Configuration requests (valve updates, adding, deleting or reloading
+  pipelines; see :func:`is_broadcast_path`) are sent to every worker. Every
+  other request goes to exactly one worker, ranked by the user ID in the body
+  or by a random key, so a completion without a chat ID never runs the agent
+  graph more than once.
+- Workers share a durable SQLite checkpointer in ``_agent_data``. A restarted
+  worker, or the next worker during a failover, continues conversations from
+  their last checkpoint.
+- The front process restarts workers that exit. ``SIGHUP`` restarts them one
+  at a time, so one host can be redeployed without dropping sessions.
+
+Enabled with ``services.pipelines.workers`` greater than 1; the pipelines
+container's ``start.sh`` then runs::
+
+    python -m osprey.deployment.worker_router --workers 4 --port 9099 -- bash start.sh
+
+Examples:
+    Ranking workers for a chat::
+
+        from osprey.deployment.worker_router import rank_workers
+
+        rank_workers("chat-42", [0, 1, 2, 3])
+        # Returns e.g. [2, 0, 3, 1]; worker 2 serves chat-42 while it is up
+"""
+
+import argparse
+import hashlib
+import http.client
+import json
+import logging
+import os
+import re
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger("osprey.worker_router")
+
+# Headers that describe a single connection and must not be forwarded
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailers", "transfer-encoding", "upgrade", "host", "content-length",
+}
+
+# LLM-backed requests can legitimately run for minutes
+UPSTREAM_TIMEOUT_SECONDS = 900
+
+# Pipelines server endpoints that change per-process configuration (with or without /v1)
+BROADCAST_PATH_PATTERN = re.compile(r"^(?:/v1)?(?:/[^/]+/valves/update|/pipelines/(?:add|delete|reload))/?$")
+
+
+def rank_workers(key: str, workers: Sequence[int]) -> list[int]:
+    """Order workers by preference for ``key`` (rendezvous hashing).
+
+    Every key gets a stable ranking, and removing or adding a worker only moves
+    the keys whose first choice changed.
+
+    Args:
+        key: Routing key, typically the chat ID
+        workers: Worker indices
+
+    Returns:
+        Worker indices, most preferred first
+    """
+    def score(worker: int) -> int:
+        return int.from_bytes(hashlib.sha256(f"{worker}:{key}".encode()).digest()[:8], "big")
+
+    return sorted(workers, key=score, reverse=True)
+
+
+def _json_body(body: bytes) -> dict:
+    if not body:
+        return {}
+    try:
+        payload = json.loads(body)
+    except (ValueError, UnicodeDecodeError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def extract_chat_id(body: bytes) -> str | None:
+    """Extract the chat ID from an OpenWebUI pipelines request body.
+
+    Args:
+        body: Raw request body
+
+    Returns:
+        The chat ID, or None if the body is not JSON or carries none
+    """
+    payload = _json_body(body)
+    metadata = payload.get("metadata") if isinstance(payload.get("metadata"), dict) else {}
+    chat_id = payload.get("chat_id") or metadata.get("chat_id")
+    return str(chat_id) if chat_id else None
+
+
+def extract_user_id(body: bytes) -> str | None:
+    """Extract the user ID from an OpenWebUI pipelines request body.
+
+    Args:
+        body: Raw request body
+
+    Returns:
+        The user ID, or None if the body is not JSON or carries none
+    """
+    payload = _json_body(body)
+    user = payload.get("user") if isinstance(payload.get("user"), dict) else {}
+    metadata = payload.get("metadata") if isinstance(payload.get("metadata"), dict) else {}
+    user_id = user.get("id") or metadata.get("user_id")
+    return str(user_id) if user_id else None
+
+
+def is_broadcast_path(method: str, path: str) -> bool:
+    """Whether a request changes configuration that every worker holds in memory.
+
+    Args:
+        method: HTTP method
+        path: Request path, optionally with a query string
+
+    Returns:
+        True for valve updates and adding, deleting or reloading pipelines
+    """
+    return method != "GET" and BROADCAST_PATH_PATTERN.match(path.split("?", 1)[0]) is not None
+
+
+class WorkerSupervisor:
+    """Run and restart N worker processes on consecutive ports.
+
+    Args:
+        command: Command starting one pipelines server; it must honour the
+            ``PORT`` and ``HOST`` environment variables
+        count: Number of workers
+        base_port: Port of worker 0; worker i listens on ``base_port + i``
+        host: Interface the workers bind to
+        cwd: Working directory of the workers
+    """
+
+    def __init__(self, command: Sequence[str], count: int, base_port: int,
+                 host: str = "127.0.0.1", cwd: str | None = None):
+        self.command = list(command)
+        self.count = count
+        self.base_port = base_port
+        self.host = host
+        self.cwd = cwd
+
+        self._processes: dict[int, subprocess.Popen] = {}
+        self._restarts: dict[int, int] = dict.fromkeys(range(count), 0)
+        self._restarting: set[int] = set()
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._monitor: threading.Thread | None = None
+
+    @property
+    def workers(self) -> list[int]:
+        return list(range(self.count))
+
+    def port(self, worker: int) -> int:
+        return self.base_port + worker
+
+    def start(self) -> None:
+        """Start all workers and the thread that restarts exited ones."""
+        for worker in self.workers:
+            self._spawn(worker)
+        self._monitor = threading.Thread(target=self._watch, name="osprey-worker-monitor", daemon=True)
+        self._monitor.start()
+
+    def _spawn(self, worker: int) -> None:
+        env = {
+            **os.environ,
+            "PORT": str(self.port(worker)),
+            "HOST": self.host,
+            "OSPREY_WORKER_INDEX": str(worker),
+        }
+        self._processes[worker] = subprocess.Popen(self.command, cwd=self.cwd, env=env)
+        logger.info(f"Started worker {worker} (pid {self._processes[worker].pid}) on port {self.port(worker)}")
+
+    def _watch(self) -> None:
+        while not self._stopping.wait(1.0):
+            for worker, process in list(self._processes.items()):
+                with self._lock:
+                    if (worker in self._restarting or self._processes.get(worker) is not process
+                            or process.poll() is None or self._stopping.is_set()):
+                        continue
+                    self._restarts[worker] += 1
+                    # Back off when a worker keeps crashing on startup
+                    delay = min(30, 2 ** min(self._restarts[worker], 5))
+                    logger.warning(f"Worker {worker} exited with code {process.returncode}; "
+                                   f"restarting in {delay}s")
+                    self._restarting.add(worker)
+                threading.Thread(target=self._respawn_after, args=(worker, delay), daemon=True).start()
+
+    def _respawn_after(self, worker: int, delay: float) -> None:
+        if self._stopping.wait(delay):
+            return
+        with self._lock:
+            self._spawn(worker)
+            self._restarting.discard(worker)
+
+    def is_ready(self, worker: int) -> bool:
+        """Whether the worker accepts connections."""
+        try:
+            with socket.create_connection((self.host, self.port(worker)), timeout=0.5):
+                return True
+        except OSError:
+            return False
+
+    def wait_ready(self, worker: int, timeout: float = 300.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and not self._stopping.is_set():
+            if self.is_ready(worker):
+                return True
+            time.sleep(0.5)
+        return False
+
+    def restart(self, worker: int, grace_seconds: float = 30.0) -> None:
+        """Stop a worker gracefully and start a fresh one in its place."""
+        with self._lock:
+            self._restarting.add(worker)
+        try:
+            self._terminate(self._processes.get(worker), grace_seconds)
+            with self._lock:
+                self._spawn(worker)
+                self._restarts[worker] = 0
+        finally:
+            with self._lock:
+                self._restarting.discard(worker)
+
+    def rolling_restart(self) -> None:
+        """Restart workers one at a time, waiting for each to accept connections."""
+        for worker in self.workers:
+            logger.info(f"Rolling restart: worker {worker}")
+            self.restart(worker)
+            if not self.wait_ready(worker):
+                logger.error(f"Worker {worker} did not become ready; stopping rolling restart")
+                return
+        logger.info("Rolling restart completed")
+
+    def stop(self, grace_seconds: float = 10.0) -> None:
+        """Stop all workers."""
+        self._stopping.set()
+        for process in self._processes.values():
+            self._terminate(process, grace_seconds)
+
+    @staticmethod
+    def _terminate(process: subprocess.Popen | None, grace_seconds: float) -> None:
+        if process is None or process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(grace_seconds)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    """Forward requests to workers; attributes are set by :func:`create_router`."""
+
+    protocol_version = "HTTP/1.1"
+    host: str = "127.0.0.1"
+    ports: dict[int, int] = {}
+
+    def do_GET(self):
+        self._forward()
+
+    def do_POST(self):
+        self._forward()
+
+    def do_DELETE(self):
+        self._forward()
+
+    def do_PUT(self):
+        self._forward()
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _targets(self, body: bytes) -> tuple[list[int], bool]:
+        """Return candidate workers in order and whether to send to all of them."""
+        workers = sorted(self.ports)
+        if is_broadcast_path(self.command, self.path):
+            return workers, True
+        key = extract_chat_id(body) or extract_user_id(body) or uuid.uuid4().hex
+        return rank_workers(key, workers), False
+
+    def _forward(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        headers = {k: v for k, v in self.headers.items() if k.lower() not in HOP_BY_HOP_HEADERS}
+        headers["Content-Length"] = str(len(body))
+        candidates, broadcast = self._targets(body)
+
+        if broadcast:
+            # Configuration changes must reach every worker; the first response is returned
+            responses = [self._request(worker, body, headers) for worker in candidates]
+            available = [(conn, resp) for conn, resp in responses if resp is not None]
+            for conn, resp in available[1:]:
+                resp.read()
+                conn.close()
+            if available:
+                self._relay(*available[0])
+                return
+        else:
+            for worker in candidates:
+                conn, response = self._request(worker, body, headers)
+                if response is not None:
+                    self._relay(conn, response)
+                    return
+
+        self.send_error(503, "No pipelines worker available")
+
+    def _request(self, worker: int, body: bytes, headers: dict[str, str]):
+        conn = http.client.HTTPConnection(self.host, self.ports[worker], timeout=UPSTREAM_TIMEOUT_SECONDS)
+        try:
+            conn.request(self.command, self.path, body=body, headers=headers)
+            return conn, conn.getresponse()
+        except OSError as e:
+            logger.warning(f"Worker {worker} unavailable for {self.command} {self.path}: {e}")
+            conn.close()
+            return conn, None
+
+    def _relay(self, conn: http.client.HTTPConnection, response: http.client.HTTPResponse) -> None:
+        try:
+            self.send_response(response.status, response.reason)
+            for key, value in response.getheaders():
+                if key.lower() not in HOP_BY_HOP_HEADERS:
+                    self.send_header(key, value)
+
+            length = response.getheader("Content-Length")
+            if length is not None:
+                self.send_header("Content-Length", length)
+                self.end_headers()
+                self.wfile.write(response.read())
+                return
+
+            # Streaming (SSE) response: relay chunks as they arrive
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            while chunk := response.read1(65536):
+                self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away; closing the upstream connection lets the worker notice
+            self.close_connection = True
+        finally:
+            conn.close()
+
+
+def create_router(port: int, worker_ports: dict[int, int], host: str = "0.0.0.0",
+                  worker_host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Create the front HTTP server forwarding to workers.
+
+    Args:
+        port: Public port to listen on
+        worker_ports: Worker index to local port
+        host: Interface to listen on
+        worker_host: Host the workers listen on
+
+    Returns:
+        The (not yet serving) server
+    """
+    handler = type("WorkerProxyHandler", (_ProxyHandler,), {"host": worker_host, "ports": dict(worker_ports)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m osprey.deployment.worker_router",
+        description="Run N pipelines workers behind a sticky-session front process.",
+    )
+    parser.add_argument("--workers", type=int, default=int(os.getenv("PIPELINES_WORKERS", "2")))
+    parser.add_argument("--host", default="0.0.0.0", help="Public interface (default: 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "9099")), help="Public port")
+    parser.add_argument("--worker-base-port", type=int, default=9100, help="Port of worker 0")
+    parser.add_argument("--cwd", default=None, help="Working directory of the workers")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="Worker command (after --)")
+    args = parser.parse_args(argv)
+
+    command = [c for c in args.command if c != "--"] or ["bash", "start.sh"]
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    supervisor = WorkerSupervisor(command, args.workers, args.worker_base_port, cwd=args.cwd)
+    server = create_router(args.port, {w: supervisor.port(w) for w in supervisor.workers}, host=args.host)
+
+    def shutdown(signum, frame):
+        logger.info("Stopping workers")
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    def rolling_restart(signum, frame):
+        threading.Thread(target=supervisor.rolling_restart, name="osprey-rolling-restart", daemon=True).start()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGHUP, rolling_restart)
+
+    supervisor.start()
+    logger.info(f"Routing http://{args.host}:{args.port} to {args.workers} workers "
+                f"on ports {args.worker_base_port}-{args.worker_base_port + args.workers - 1}")
+    try:
+        server.serve_forever()
+    finally:
+        supervisor.stop()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
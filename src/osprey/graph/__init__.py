@@ -8,6 +8,7 @@ agentic framework, with modern async PostgreSQL checkpointing by default.
 from .graph_builder import (
     GraphBuildError,
     create_async_postgres_checkpointer,
+    create_async_sqlite_checkpointer,
     create_graph,
     create_memory_checkpointer,
     setup_postgres_checkpointer,
@@ -16,6 +17,7 @@ from .graph_builder import (
 __all__ = [
     "create_graph",
     "create_async_postgres_checkpointer",
+    "create_async_sqlite_checkpointer",
     "create_memory_checkpointer",
     "setup_postgres_checkpointer",
     "GraphBuildError",
@@ -204,7 +204,7 @@ def create_async_postgres_checkpointer(db_uri: str | None = None) -> BaseCheckpo
         raise ImportError(
             f"Required PostgreSQL dependencies not installed: {e}. "
             "Install with: pip install langgraph-checkpoint-postgres psycopg[pool]"
-        )
+        ) from e
 
     # Create sync connection pool for PostgresSaver
     try:
@@ -234,6 +234,44 @@ def create_async_postgres_checkpointer(db_uri: str | None = None) -> BaseCheckpo
         raise
 
 
+async def create_async_sqlite_checkpointer(db_path: str) -> BaseCheckpointSaver:
+    """
+    Create async SQLite checkpointer for durable single-host persistence.
+
+    Checkpoints survive process restarts, and several worker processes on one
+    host can share the database file (WAL mode). The checkpointer is bound to
+    the event loop it is created on; create it on the loop that runs the graph.
+
+    Args:
+        db_path: Path of the SQLite database file (created if missing)
+
+    Returns:
+        BaseCheckpointSaver: Configured async SQLite checkpointer
+
+    Raises:
+        ImportError: If required dependencies are not installed
+    """
+    try:
+        import aiosqlite
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    except ImportError as e:
+        raise ImportError(
+            f"Required SQLite checkpointer dependencies not installed: {e}. "
+            "Install with: pip install langgraph-checkpoint-sqlite aiosqlite"
+        ) from e
+
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    conn = await aiosqlite.connect(db_path)
+    # Concurrent readers and one writer across processes; wait instead of failing on locks
+    await conn.execute("PRAGMA journal_mode=WAL")
+    await conn.execute("PRAGMA busy_timeout=10000")
+
+    checkpointer = AsyncSqliteSaver(conn)
+    await checkpointer.setup()
+    logger.info(f"Created SQLite checkpointer at {db_path}")
+    return checkpointer
+
+
 def create_memory_checkpointer() -> BaseCheckpointSaver:
     """Create in-memory checkpointer for testing and development."""
     from langgraph.checkpoint.memory import MemorySaver
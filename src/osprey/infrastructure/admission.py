@@ -0,0 +1,177 @@
+"""
+Admission Control for Concurrent Sessions
+
+Schedules requests from many operators in front of
+:meth:`~osprey.infrastructure.gateway.Gateway.process_message`, so a burst of
+messages does not start every graph at once and degrade everyone's latency on
+shared LLM rate limits and Jupyter kernels:
+
+- At most ``max_concurrent`` requests execute at a time; the rest wait.
+- Requests of the same conversation thread run one after another, so two
+  messages in one chat never race on the same checkpoint.
+- When a slot frees up, the waiting request whose user has the fewest running
+  requests goes first (ties: the user served longest ago, then arrival order),
+  so one user with many chats cannot starve the others.
+- Waiting requests receive their queue position whenever it changes.
+- With ``max_queued`` set, requests beyond that many waiting are rejected.
+
+All methods must be called on the event loop that owns the controller (the
+pipeline's background loop); :meth:`AdmissionController.release` can be
+scheduled there with ``loop.call_soon_threadsafe``.
+
+Examples:
+    Wrapping a request::
+
+        >>> ticket = controller.ticket(user_id, thread_id)
+        >>> try:
+        ...     async for position in controller.wait(ticket):
+        ...         notify(f"Queued at position {position}")
+        ...     await run_request()
+        ... finally:
+        ...     controller.release(ticket)
+"""
+
+import asyncio
+import itertools
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+from osprey.base.errors import FrameworkError
+from osprey.utils.logger import get_logger
+
+logger = get_logger("gateway")
+
+
+class AdmissionRejectedError(FrameworkError):
+    """Raised when the admission queue is full."""
+
+
+@dataclass(eq=False)
+class AdmissionTicket:
+    """A request's place in the admission queue."""
+
+    user_id: str
+    thread_id: str
+    sequence: int
+    enqueued_at: float = field(default_factory=time.monotonic)
+    admitted_at: float | None = None
+    released: bool = False
+    _changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def admitted(self) -> bool:
+        return self.admitted_at is not None
+
+    @property
+    def wait_seconds(self) -> float | None:
+        return None if self.admitted_at is None else self.admitted_at - self.enqueued_at
+
+
+class AdmissionController:
+    """Bounded, per-user fair scheduler with per-thread serialization.
+
+    :param max_concurrent: Maximum number of requests executing at once
+    :param max_queued: Maximum number of waiting requests (None for unbounded)
+    """
+
+    def __init__(self, max_concurrent: int = 4, max_queued: int | None = None):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+
+        self._sequence = itertools.count()
+        self._waiting: list[AdmissionTicket] = []
+        self._running: set[AdmissionTicket] = set()
+        self._running_per_user: Counter[str] = Counter()
+        self._active_threads: set[str] = set()
+        self._last_served: dict[str, int] = {}
+
+    @property
+    def running(self) -> int:
+        return len(self._running)
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiting)
+
+    def ticket(self, user_id: str, thread_id: str) -> AdmissionTicket:
+        """Create a ticket for a request; it joins the queue in :meth:`wait`."""
+        return AdmissionTicket(user_id=user_id, thread_id=thread_id, sequence=next(self._sequence))
+
+    async def wait(self, ticket: AdmissionTicket) -> AsyncIterator[int]:
+        """Queue ``ticket`` and yield its 1-based queue position until it is admitted.
+
+        Nothing is yielded if the request can start immediately. Cancelling the
+        wait removes the ticket from the queue.
+
+        :raises AdmissionRejectedError: If ``max_queued`` requests are already waiting
+        """
+        if self.max_queued is not None and len(self._waiting) >= self.max_queued:
+            raise AdmissionRejectedError(
+                f"{len(self._waiting)} requests are already waiting; please retry shortly")
+
+        self._waiting.append(ticket)
+        self._dispatch()
+        last_position = None
+        try:
+            while not ticket.admitted:
+                position = self.position(ticket)
+                if position != last_position:
+                    last_position = position
+                    yield position
+                ticket._changed.clear()
+                if not ticket.admitted:
+                    await ticket._changed.wait()
+        finally:
+            if not ticket.admitted:
+                self.release(ticket)
+
+    def position(self, ticket: AdmissionTicket) -> int:
+        """Current 1-based position of a waiting ticket in the scheduling order (0 if admitted)."""
+        if ticket.admitted:
+            return 0
+        return self._schedule_order().index(ticket) + 1
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Finish (or abandon) a request and admit the next ones. Safe to call twice."""
+        if ticket.released:
+            return
+        ticket.released = True
+        if ticket in self._running:
+            self._running.discard(ticket)
+            self._running_per_user[ticket.user_id] -= 1
+            self._active_threads.discard(ticket.thread_id)
+        elif ticket in self._waiting:
+            self._waiting.remove(ticket)
+        self._dispatch()
+
+    def _schedule_order(self) -> list[AdmissionTicket]:
+        return sorted(self._waiting, key=lambda t: (
+            self._running_per_user[t.user_id],
+            self._last_served.get(t.user_id, -1),
+            t.sequence,
+        ))
+
+    def _dispatch(self) -> None:
+        while len(self._running) < self.max_concurrent:
+            candidate = next((t for t in self._schedule_order()
+                              if t.thread_id not in self._active_threads), None)
+            if candidate is None:
+                break
+            self._waiting.remove(candidate)
+            self._running.add(candidate)
+            self._running_per_user[candidate.user_id] += 1
+            self._active_threads.add(candidate.thread_id)
+            self._last_served[candidate.user_id] = candidate.sequence
+            candidate.admitted_at = time.monotonic()
+            if candidate.wait_seconds and candidate.wait_seconds > 0.5:
+                logger.info(f"Admitted request for thread {candidate.thread_id} "
+                            f"after {candidate.wait_seconds:.1f}s in queue")
+            candidate._changed.set()
+
+        # Positions may have shifted for everyone still waiting
+        for ticket in self._waiting:
+            ticket._changed.set()
@@ -11,6 +11,7 @@ Convention-based LangGraph-native implementation with built-in error handling an
 from __future__ import annotations
 
 import asyncio
+import logging
 from typing import Any
 
 from osprey.base import BaseCapability, CapabilityMatch, ClassifierExample
@@ -22,7 +23,7 @@ from osprey.prompts.loader import get_framework_prompts
 from osprey.registry import get_registry
 from osprey.state import AgentState
 from osprey.state.state import create_status_update
-from osprey.utils.config import get_classification_config, get_model_config
+from osprey.utils.config import get_classification_config, get_config_value, get_model_config
 from osprey.utils.logger import get_logger
 from osprey.utils.streaming import get_streamer
 
@@ -380,8 +381,13 @@ class CapabilityClassifier:
             return False
 
         # Build classification prompt
-        message = self._build_classification_prompt(classifier)
-        self.logger.debug(f"\n\nTask Analyzer System Prompt for capability '{capability.name}':\n{message}\n\n")
+        if get_config_value("prompt_caching.enabled", False):
+            system_prompt, message = self._build_cacheable_classification_prompt(classifier, capability.name)
+        else:
+            system_prompt, message = None, self._build_classification_prompt(classifier)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            full_prompt = f"{system_prompt}\n\n{message}" if system_prompt else message
+            self.logger.debug(f"\n\nTask Analyzer System Prompt for capability '{capability.name}':\n{full_prompt}\n\n")
 
         # Execute classification
         try:
@@ -390,6 +396,8 @@ class CapabilityClassifier:
                 model_config=get_model_config("classifier"),
                 message=message,
                 output_model=CapabilityMatch,
+                system_prompt=system_prompt,
+                cache_system_prompt=system_prompt is not None,
             )
 
             result = self._process_classification_response(capability, response_data)
@@ -432,6 +440,29 @@ class CapabilityClassifier:
         )
         return f"{system_prompt}\n\nUser request:\n{self.task}"
 
+    def _build_cacheable_classification_prompt(self, classifier, capability_name: str) -> tuple[str, str]:
+        """Build a (system prompt, user message) pair with a stable per-capability prefix.
+
+        Examples are shuffled with the capability name as seed, so each capability
+        keeps the same order (and prompt prefix) across requests while different
+        capabilities still see differently ordered examples.
+        """
+        examples_string = ClassifierExample.join(classifier.examples, randomize=True, seed=capability_name)
+
+        prompt_provider = get_framework_prompts()
+        classification_builder = prompt_provider.get_classification_prompt_builder()
+        system_prompt, request_context = classification_builder.get_prompt_parts(
+            capability_instructions=classifier.instructions,
+            classifier_examples=examples_string,
+            context=None,
+            previous_failure=self.previous_failure
+        )
+
+        user_message = f"User request:\n{self.task}"
+        if request_context:
+            user_message = f"{request_context}\n\n{user_message}"
+        return system_prompt, user_message
+
     def _process_classification_response(self, capability: BaseCapability, response_data) -> bool:
         """Process and validate classification response."""
         if isinstance(response_data, CapabilityMatch):
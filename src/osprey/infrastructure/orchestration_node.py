@@ -10,6 +10,7 @@ from __future__ import annotations
 import asyncio
 import datetime
 import json
+import logging
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -33,7 +34,7 @@ from osprey.registry import get_registry
 from osprey.state import AgentState
 from osprey.state.state import create_status_update
 from osprey.state.state_manager import StateManager
-from osprey.utils.config import get_agent_dir, get_model_config
+from osprey.utils.config import get_agent_dir, get_config_value, get_model_config
 
 # Factory code consolidated inline as helper function
 from osprey.utils.logger import get_logger
@@ -345,8 +346,14 @@ class OrchestrationNode(BaseInfrastructureNode):
         # HELPER FUNCTION: CREATE SYSTEM PROMPT
         # =====================================================================
 
-        async def create_system_prompt() -> str:
-            """Create orchestrator system prompt from capabilities and context."""
+        async def create_system_prompt() -> tuple[str, str]:
+            """Create orchestrator prompt from capabilities and context.
+
+            Returns the system prompt and request-specific context. With prompt
+            caching enabled the system prompt holds only the static prefix and the
+            request context goes into the user message; otherwise the request
+            context is part of the system prompt and the second item is empty.
+            """
             logger.info(f"Creating orchestrator prompt for task: \"{current_task[:100]}...\"")
 
             # Extract capability names from active capabilities
@@ -372,13 +379,18 @@ class OrchestrationNode(BaseInfrastructureNode):
             prompt_provider = get_framework_prompts()
             orchestrator_builder = prompt_provider.get_orchestrator_prompt_builder()
 
-            system_instructions = orchestrator_builder.get_system_instructions(
-                active_capabilities=active_capabilities,
-                context_manager=context_manager,
-                task_depends_on_chat_history=state.get('task_depends_on_chat_history', False),
-                task_depends_on_user_memory=state.get('task_depends_on_user_memory', False),
-                error_context=error_context
-            )
+            prompt_kwargs = {
+                "active_capabilities": active_capabilities,
+                "context_manager": context_manager,
+                "task_depends_on_chat_history": state.get('task_depends_on_chat_history', False),
+                "task_depends_on_user_memory": state.get('task_depends_on_user_memory', False),
+                "error_context": error_context,
+            }
+            if prompt_caching:
+                system_instructions, request_context = orchestrator_builder.get_prompt_parts(**prompt_kwargs)
+            else:
+                system_instructions = orchestrator_builder.get_system_instructions(**prompt_kwargs)
+                request_context = ""
 
             if not system_instructions:
                 logger.error("No prompt text generated. The instructions will be empty.")
@@ -399,16 +411,18 @@ class OrchestrationNode(BaseInfrastructureNode):
             if error_context:
                 logger.info(" - Error context for replanning (previous failure analysis)")
 
-            logger.debug(f"\n\n\n------------Orchestrator System Prompt:\n{system_instructions}\n------------\n\n\n")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"\n\n\n------------Orchestrator System Prompt:\n{system_instructions}\n------------\n\n\n")
 
-            return system_instructions
+            return system_instructions, request_context
 
         # =====================================================================
         # GENERATE EXECUTION PLAN
         # =====================================================================
 
         # Create system prompt
-        system_prompt = await create_system_prompt()
+        prompt_caching = get_config_value("prompt_caching.enabled", False)
+        system_prompt, request_context = await create_system_prompt()
 
         streamer.status("Generating execution plan...")
 
@@ -418,14 +432,23 @@ class OrchestrationNode(BaseInfrastructureNode):
 
         # Get model configuration and call LLM
         model_config = get_model_config("orchestrator")
-        message = f"{system_prompt}\n\nTASK TO PLAN: {current_task}"
+        if prompt_caching:
+            # Static prefix as cacheable system prompt, request-specific parts in the user message
+            message = f"TASK TO PLAN: {current_task}"
+            if request_context:
+                message = f"{request_context}\n\n{message}"
+            completion_kwargs = {"system_prompt": system_prompt, "cache_system_prompt": True}
+        else:
+            message = f"{system_prompt}\n\nTASK TO PLAN: {current_task}"
+            completion_kwargs = {}
 
         # Run sync LLM call in thread pool to avoid blocking event loop for streaming
         execution_plan = await asyncio.to_thread(
             get_chat_completion,
             message=message,
             model_config=model_config,
-            output_model=ExecutionPlan
+            output_model=ExecutionPlan,
+            **completion_kwargs
         )
 
         execution_time = time.time() - plan_start_time
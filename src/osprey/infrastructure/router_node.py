@@ -24,6 +24,7 @@ from osprey.registry import get_registry
 from osprey.state import AgentState, StateManager
 from osprey.utils.config import get_execution_limits
 from osprey.utils.logger import get_logger
+from osprey.utils.metrics import RECLASSIFICATIONS, REPLANS, RETRIES
 
 
 @infrastructure_node(quiet=True)
@@ -121,6 +122,7 @@ def router_conditional_edge(state: AgentState) -> str:
 
                     # Retry available - route back to same capability
                     logger.error(f"Router: Retrying {capability_name} (attempt {new_retry_count}/{max_retries})")
+                    RETRIES.inc(capability=capability_name)
                     return capability_name
                 else:
                     # Retries exhausted - route to error node
@@ -139,6 +141,7 @@ def router_conditional_edge(state: AgentState) -> str:
                     # Orchestrator will increment counter when it creates new plan
                     logger.error(f"Router: Replanning error in {capability_name}, routing to orchestrator "
                                f"(plan #{current_plans_created + 1}/{max_planning_attempts})")
+                    REPLANS.inc(capability=capability_name)
                     return "orchestrator"
                 else:
                     # Planning attempts exhausted - route to error node
@@ -158,6 +161,7 @@ def router_conditional_edge(state: AgentState) -> str:
                     # Route to classifier for reclassification (state will be updated by classifier)
                     logger.error(f"Router: Reclassification error in {capability_name}, routing to classifier "
                                f"(attempt #{current_reclassifications + 1}/{max_reclassifications})")
+                    RECLASSIFICATIONS.inc(capability=capability_name)
                     return "classifier"
                 else:
                     # Reclassification attempts exhausted - route to error node
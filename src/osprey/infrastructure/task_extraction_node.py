@@ -55,7 +55,7 @@ def _format_task_context(messages: list[BaseMessage], retrieval_result, logger)
     from osprey.state.messages import ChatHistoryFormatter
 
     if retrieval_result and retrieval_result.has_data:
-        logger.debug(f"Bypass mode: including data sources: {retrieval_result.get_summary()}")
+        logger.debug(lambda: f"Bypass mode: including data sources: {retrieval_result.get_summary()}")
 
     logger.info("Bypass mode: skipping LLM, using formatted context as task")
 
@@ -129,7 +129,7 @@ def _extract_task(messages: list[BaseMessage], retrieval_result, logger) -> Extr
     :rtype: ExtractedTask
     """
     if retrieval_result and retrieval_result.has_data:
-        logger.debug(f"Injecting data sources into task extraction: {retrieval_result.get_summary()}")
+        logger.debug(lambda: f"Injecting data sources into task extraction: {retrieval_result.get_summary()}")
 
     prompt = _build_task_extraction_prompt(messages, retrieval_result)
 
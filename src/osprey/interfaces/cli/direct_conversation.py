@@ -41,8 +41,10 @@ from osprey.commands.completer import UnifiedCommandCompleter
 from osprey.graph import create_graph
 from osprey.infrastructure.gateway import Gateway
 from osprey.registry import get_registry, initialize_registry
+from osprey.services.python_executor.services import FileManager
 from osprey.utils.config import get_full_configuration
 from osprey.utils.logger import get_logger
+from osprey.utils.metrics import snapshot_metrics_at_exit
 
 logger = get_logger("cli")
 
@@ -319,6 +321,9 @@ class CLI:
         self.graph = create_graph(registry, checkpointer=checkpointer)
         self.gateway = Gateway()
 
+        # Leave this session's metrics in _agent_data/metrics.prom for `osprey metrics`
+        snapshot_metrics_at_exit()
+
         # Initialize modern prompt session
         self.prompt_session = self._create_prompt_session()
 
@@ -782,7 +787,8 @@ class CLI:
             self.console.print()  # Add spacing
             self.console.print(f"[{Styles.COMMAND}]{commands_output}[/{Styles.COMMAND}]")
 
-        notebooks_output = self._extract_notebooks_for_cli(result)
+        # May restore archived runs from their tarballs - keep it off the event loop
+        notebooks_output = await asyncio.to_thread(self._extract_notebooks_for_cli, result)
         if notebooks_output:
             self.console.print()  # Add spacing
             self.console.print(f"[{Styles.INFO}]{notebooks_output}[/{Styles.INFO}]")
@@ -996,7 +1002,10 @@ class CLI:
             logger.info(f"Processing {len(ui_notebooks)} notebook links from centralized registry for CLI display")
             notebook_lines = ["📓 Generated Notebooks:"]
 
+            file_manager = FileManager(get_full_configuration())
             for i, notebook_link in enumerate(ui_notebooks, 1):
+                # Restore the run first if retention archived it in the meantime
+                file_manager.resolve_execution_folder(notebook_link)
                 # Create CLI-friendly display
                 notebook_line = f"• Jupyter Notebook {i}: {notebook_link}"
                 notebook_lines.append(notebook_line)
@@ -0,0 +1,110 @@
+"""Model Cascade with Confidence-Gated Escalation.
+
+Simple structured decisions (capability classification, memory operation
+classification) do not need the large model of their role. A model role can
+name a small, fast model to try first::
+
+    models:
+      classifier:
+        provider: cborg
+        model_id: anthropic/claude-haiku
+        cascade:
+          provider: ollama
+          model_id: mistral:7b
+          min_confidence: 0.8
+
+With a ``cascade`` entry, :func:`~osprey.models.completion.get_chat_completion`
+asks the small model for the requested ``output_model`` extended by a
+``confidence`` field. The answer is used when its confidence reaches
+``min_confidence`` (default 0.7). Otherwise, and whenever the small model fails
+or returns output that does not validate, the request escalates to the role's
+own model.
+
+Outcomes per output model (``accepted``, ``low_confidence``, ``error``) are
+counted in ``osprey_cascade_requests_total`` and reported confidences in
+``osprey_cascade_confidence``, so thresholds can be tuned from the ratio of
+escalations. Calls without ``output_model`` ignore the cascade.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel, Field, create_model
+
+from osprey.utils.logger import get_logger
+from osprey.utils.metrics import CASCADE_CONFIDENCE, CASCADE_REQUESTS
+
+logger = get_logger("osprey")
+
+DEFAULT_MIN_CONFIDENCE = 0.7
+
+CONFIDENCE_INSTRUCTION = (
+    "\n\nAlso rate how confident you are in this answer in the `confidence` field, "
+    "from 0.0 (guessing) to 1.0 (certain)."
+)
+
+_confidence_models: dict[type[BaseModel], type[BaseModel]] = {}
+
+
+def with_confidence(output_model: type[BaseModel]) -> type[BaseModel]:
+    """Extend ``output_model`` with a required ``confidence`` field (cached per model)."""
+    extended = _confidence_models.get(output_model)
+    if extended is None:
+        extended = create_model(
+            f"{output_model.__name__}WithConfidence",
+            __base__=output_model,
+            confidence=(float, Field(ge=0.0, le=1.0,
+                                     description="Confidence in this answer from 0.0 to 1.0")),
+        )
+        _confidence_models[output_model] = extended
+    return extended
+
+
+def run_cascade(
+    complete: Callable[..., Any],
+    model_config: dict,
+    output_model: type,
+    message: str,
+    response_model: type[BaseModel] | None = None,
+    **kwargs,
+) -> Any:
+    """Try the cascade model of ``model_config`` and escalate to the role's model when unsure.
+
+    :param complete: Completion function, called once per attempt with ``model_config``
+    :param model_config: Model role configuration containing a ``cascade`` entry
+    :param output_model: Output model requested by the caller (Pydantic model or TypedDict)
+    :param message: User message of the request
+    :param response_model: Pydantic form of ``output_model`` if that is a TypedDict;
+        an accepted answer is then returned as a dict
+    :param kwargs: Remaining completion arguments. ``provider_config`` and
+        ``base_url`` belong to the role's model and only reach the escalation
+    :return: The small model's answer without ``confidence``, or the escalated answer
+    """
+    cascade = dict(model_config["cascade"])
+    min_confidence = float(cascade.pop("min_confidence", DEFAULT_MIN_CONFIDENCE))
+    primary_config = {key: value for key, value in model_config.items() if key != "cascade"}
+    pydantic_model = response_model or output_model
+    draft_kwargs = {key: value for key, value in kwargs.items() if key not in ("provider_config", "base_url")}
+    task = pydantic_model.__name__
+
+    try:
+        draft = complete(
+            model_config=cascade,
+            message=message + CONFIDENCE_INSTRUCTION,
+            output_model=with_confidence(pydantic_model),
+            **draft_kwargs,
+        )
+        confidence = draft.confidence
+    except Exception as e:
+        CASCADE_REQUESTS.inc(task=task, outcome="error")
+        logger.info(f"Cascade model {cascade.get('model_id')} failed for {task}, escalating: {e}")
+    else:
+        CASCADE_CONFIDENCE.observe(confidence, task=task)
+        if confidence >= min_confidence:
+            CASCADE_REQUESTS.inc(task=task, outcome="accepted")
+            answer = pydantic_model.model_validate(draft.model_dump(exclude={"confidence"}))
+            return answer.model_dump() if response_model is not None else answer
+        CASCADE_REQUESTS.inc(task=task, outcome="low_confidence")
+        logger.debug(f"Cascade confidence {confidence:.2f} below {min_confidence} for {task}, escalating")
+
+    return complete(model_config=primary_config, message=message, output_model=output_model, **kwargs)
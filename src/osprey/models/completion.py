@@ -12,6 +12,10 @@ Key capabilities include:
 - Automatic TypedDict to Pydantic conversion for seamless integration
 - HTTP proxy support for enterprise environments
 - Provider-specific optimization and error handling
+- Process-wide rate limiting and adaptive concurrency per provider and model
+- Multi-endpoint failover and latency-based request hedging
+- Model cascades that try a small model first and escalate when it is unsure
+- Local repair of almost-valid structured output before raising
 
 .. note::
    This module is optimized for direct inference and simple integration scenarios.
@@ -26,12 +30,20 @@ Key capabilities include:
 
 import logging
 import os
+import time
 from urllib.parse import urlparse
 
 import httpx
 from pydantic import BaseModel, Field, create_model
 
+from osprey.models.cascade import run_cascade
+from osprey.models.hedging import get_endpoint_router
+from osprey.models.rate_limit import get_rate_limiter
+from osprey.models.structured_output import parse_structured_output
 from osprey.utils.config import get_provider_config
+from osprey.utils.metrics import record_llm_metrics
+from osprey.utils.spans import span
+from osprey.utils.trace_recorder import estimate_tokens, record_llm_call
 
 
 def _is_typed_dict(cls) -> bool:
@@ -169,6 +181,8 @@ def get_chat_completion(
     base_url: str | None = None,
     provider_config: dict | None = None,
     temperature: float = 0.0,
+    system_prompt: str | None = None,
+    cache_system_prompt: bool = False,
 ) -> str | BaseModel | list:
     """Execute direct chat completion requests across multiple AI providers.
 
@@ -210,6 +224,12 @@ def get_chat_completion(
     :type base_url: str, optional
     :param provider_config: Optional provider configuration dict with api_key, base_url, etc.
     :type provider_config: dict, optional
+    :param system_prompt: Static instructions sent as a separate system message, so
+        that ``message`` only carries the request-specific content
+    :type system_prompt: str, optional
+    :param cache_system_prompt: Mark the system prompt as a cacheable prefix for
+        providers with explicit prompt caching (Anthropic ``cache_control``)
+    :type cache_system_prompt: bool
     :raises ValueError: If required provider, model_id, api_key, or base_url are missing
     :raises ValueError: If budget_tokens >= max_tokens or other invalid parameter combinations
     :raises pydantic.ValidationError: If output_model validation fails for structured outputs
@@ -269,6 +289,15 @@ def get_chat_completion(
             ... )
             >>> print(f"Confidence: {result.confidence}")
 
+        Cacheable system prompt with a short user message::
+
+            >>> result = get_chat_completion(
+            ...     system_prompt=static_instructions,
+            ...     message="User request: plot the beam current",
+            ...     model_config=get_model_config("classifier"),
+            ...     cache_system_prompt=True
+            ... )
+
         Using configuration dictionary::
 
             >>> config = {
@@ -297,6 +326,26 @@ def get_chat_completion(
         is_typed_dict_output = True
         output_model = _convert_typed_dict_to_pydantic(output_model)
 
+    # Model cascade: answer with the role's small model when it is confident enough
+    if model_config is not None and model_config.get("cascade") and output_model is not None:
+        return run_cascade(
+            get_chat_completion,
+            model_config,
+            original_output_model,
+            message,
+            response_model=output_model if is_typed_dict_output else None,
+            max_tokens=max_tokens,
+            provider=provider,
+            model_id=model_id,
+            budget_tokens=budget_tokens,
+            enable_thinking=enable_thinking,
+            base_url=base_url,
+            provider_config=provider_config,
+            temperature=temperature,
+            system_prompt=system_prompt,
+            cache_system_prompt=cache_system_prompt,
+        )
+
     # Configuration setup - handle both model_config set and not set cases
     if model_config is not None:
         provider = model_config.get("provider", provider)
@@ -353,21 +402,70 @@ def get_chat_completion(
     completion_kwargs = {
         "enable_thinking": enable_thinking,
         "budget_tokens": budget_tokens,
-        "system_prompt": None,  # Not used in current implementation
+        "system_prompt": system_prompt,
+        "cache_system_prompt": cache_system_prompt,
         "output_format": output_model,  # Pydantic model (already converted from TypedDict if needed)
         "http_client": http_client,
         "is_typed_dict_output": is_typed_dict_output,
     }
 
-    result = provider_instance.execute_completion(
-        message=message,
-        model_id=model_id,
-        api_key=api_key,
-        base_url=base_url,
-        max_tokens=max_tokens,
-        temperature=temperature,
-        **completion_kwargs
-    )
+    # Shared per-model limiter: queues the call for a concurrency slot and
+    # request/token budget, and retries 429 responses after backing off
+    limiter = get_rate_limiter(provider, model_id, provider_config)
+    estimated_tokens = estimate_tokens(system_prompt) + estimate_tokens(message) + max_tokens
+
+    start_time = time.perf_counter()
+
+    # Ordered endpoints of the provider with health scoring, failover and
+    # optional hedging of calls slower than the model's latency percentile
+    router = get_endpoint_router(provider, base_url, provider_config,
+                                 provider_instance.fallback_base_urls(base_url))
+
+    def execute_on(endpoint):
+        with span(f"{provider}/{model_id}", "llm", max_tokens=max_tokens, endpoint=endpoint):
+            return provider_instance.execute_completion(
+                message=message,
+                model_id=model_id,
+                api_key=api_key,
+                base_url=endpoint,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **completion_kwargs
+            )
+
+    def execute():
+        nonlocal start_time
+        start_time = time.perf_counter()
+        # Hedges and failovers are extra requests: they reserve their own budget
+        return router.execute(
+            execute_on, model_id,
+            reserve_attempt=lambda hedge: limiter.reserve_extra(estimated_tokens, wait=not hedge))
+
+    try:
+        result = limiter.call(execute, tokens=estimated_tokens)
+    except Exception as e:
+        latency_sec = time.perf_counter() - start_time
+        record_llm_metrics(provider=provider, model_id=model_id, message=message,
+                           system_prompt=system_prompt, response=None,
+                           latency_sec=latency_sec, error=True)
+        record_llm_call(provider=provider, model_id=model_id, message=message,
+                        system_prompt=system_prompt, response=None,
+                        latency_sec=latency_sec, error=str(e))
+        raise
+
+    latency_sec = time.perf_counter() - start_time
+    limiter.refund_tokens(max_tokens - estimate_tokens(str(result)))
+    record_llm_metrics(provider=provider, model_id=model_id, message=message,
+                       system_prompt=system_prompt, response=result, latency_sec=latency_sec)
+    record_llm_call(provider=provider, model_id=model_id, message=message,
+                    system_prompt=system_prompt, response=result, latency_sec=latency_sec)
+
+    # Providers without native structured output, and OpenAI-compatible adapters whose
+    # SDK parse rejected the answer, return text; parse and repair it here instead of
+    # failing validation and retrying through the router
+    if output_model is not None and isinstance(result, str):
+        return _handle_output_conversion(parse_structured_output(result, output_model),
+                                         is_typed_dict_output)
 
     # Result is already handled by provider (TypedDict conversion if needed)
     return result
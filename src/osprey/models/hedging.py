@@ -0,0 +1,424 @@
+"""Hedged, Deadline-Aware LLM Requests with Multi-Endpoint Failover.
+
+Slow outliers from LLM gateways dominate the tail of a conversation turn. The
+:class:`EndpointRouter` of a provider runs each
+:func:`~osprey.models.completion.get_chat_completion` call against an ordered
+list of endpoints:
+
+- **Failover**: when an endpoint fails with a connection error, a timeout, a
+  5xx or a 429, the call moves on to the next endpoint. Errors that would fail
+  everywhere (4xx, validation errors) are raised at once.
+- **Health scoring**: every endpoint keeps a success score (which recovers
+  while the endpoint is idle) and a cooldown that grows with consecutive
+  failures. Healthy endpoints are tried first, in configured order.
+- **Hedging**: once enough calls have been observed for a model, a call that
+  runs longer than that model's latency percentile (p90 by default) gets a
+  duplicate on the next endpoint (or the same one if there is only one). The
+  first answer wins; the slower call finishes in the background and is
+  discarded. The percentile is computed from original attempts only (losers
+  included, once they finish), never from the duplicates that beat them.
+- **Deadline**: ``deadline_seconds`` bounds a call including its hedges and
+  failovers, counted from the moment its first attempt starts running; a call
+  that misses it raises :class:`TimeoutError`.
+
+The endpoint list is ``base_url``, then the provider's ``endpoints``, then the
+built-in alternates of the provider class
+(:meth:`~osprey.models.providers.base.BaseProvider.fallback_base_urls`, e.g.
+Ollama's host/container addresses). Each attempt hands its endpoint to the
+adapter's ``execute_completion`` as ``base_url``, which every network provider
+passes to its SDK client (``None`` means the SDK's default host, so a provider
+without ``base_url`` or ``endpoints`` has a single endpoint)::
+
+    api:
+      providers:
+        cborg:
+          base_url: https://api.cborg.lbl.gov/v1
+          endpoints:
+            - https://api-backup.cborg.lbl.gov/v1
+          hedging:
+            enabled: true
+            percentile: 90
+            deadline_seconds: 120
+
+Hedges and failovers run inside the concurrency slot of the call's rate
+limiter (see :mod:`osprey.models.rate_limit`), but each one reserves its own
+request and token budget through the ``reserve_attempt`` hook: a hedge is
+skipped when the budget is exhausted, a failover waits for it. Hedges
+therefore add load only while a call is already slower than usual and never
+push a model past ``requests_per_minute`` or ``tokens_per_minute``.
+"""
+
+import concurrent.futures
+import contextvars
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, fields
+from typing import Any, TypeVar
+
+from pydantic import ValidationError
+
+from osprey.models.rate_limit import error_status_code
+from osprey.utils.event_loop import DEFAULT_MAX_WORKERS
+from osprey.utils.logger import get_logger
+from osprey.utils.metrics import LLM_FAILOVERS, LLM_HEDGES
+
+logger = get_logger("osprey")
+
+T = TypeVar("T")
+
+LATENCY_WINDOW = 200
+SCORE_ALPHA = 0.3
+SCORE_HALF_LIFE_SECONDS = 120.0
+HEALTHY_SCORE = 0.5
+BASE_COOLDOWN_SECONDS = 5.0
+MAX_COOLDOWN_SECONDS = 300.0
+# Room for an original attempt and one hedge of every call the background
+# event loop's executor can run at once
+HEDGE_WORKERS = 2 * DEFAULT_MAX_WORKERS
+
+_executor: concurrent.futures.ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=HEDGE_WORKERS, thread_name_prefix="osprey-hedge")
+        return _executor
+
+
+@dataclass(frozen=True)
+class HedgingSettings:
+    """Hedging and deadline settings, read from ``api.providers.<name>.hedging``."""
+
+    enabled: bool = False
+    percentile: float = 90.0
+    min_samples: int = 20
+    min_delay_seconds: float = 0.5
+    max_hedges: int = 1
+    deadline_seconds: float | None = None
+
+    @classmethod
+    def from_provider_config(cls, provider_config: dict | None) -> "HedgingSettings":
+        """Build settings from a provider configuration.
+
+        :param provider_config: Provider configuration (``api.providers.<name>``)
+        :return: Settings with defaults for anything not configured
+        """
+        section = dict((provider_config or {}).get("hedging") or {})
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(section) - known)
+        if unknown:
+            logger.warning(f"Ignoring unknown hedging settings: {', '.join(unknown)}")
+        settings = cls(**{key: value for key, value in section.items() if key in known})
+        if not 0 < settings.percentile < 100:
+            raise ValueError("hedging.percentile must be between 0 and 100")
+        return settings
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies for one model.
+
+    :param window: Number of recent latencies kept
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, percent: float) -> float | None:
+        """Nearest-rank percentile of the window (None while empty)."""
+        with self._lock:
+            ordered = sorted(self._samples)
+        if not ordered:
+            return None
+        rank = max(1, math.ceil(percent / 100.0 * len(ordered)))
+        return ordered[rank - 1]
+
+
+@dataclass
+class EndpointHealth:
+    """Health score of one endpoint."""
+
+    url: str | None
+    index: int
+    score: float = 1.0
+    updated_at: float = 0.0
+    consecutive_failures: int = 0
+    cooldown_until: float = 0.0
+
+    def current_score(self, now: float) -> float:
+        """Success score, recovering towards 1.0 while the endpoint is not used."""
+        idle = max(0.0, now - self.updated_at)
+        return 1.0 - (1.0 - self.score) * 0.5 ** (idle / SCORE_HALF_LIFE_SECONDS)
+
+    def update(self, success: bool, now: float) -> None:
+        self.score = (1 - SCORE_ALPHA) * self.current_score(now) + (SCORE_ALPHA if success else 0.0)
+        self.updated_at = now
+
+    def available(self, now: float) -> bool:
+        return now >= self.cooldown_until and self.current_score(now) >= HEALTHY_SCORE
+
+
+def is_endpoint_error(exc: BaseException) -> bool:
+    """Whether another endpoint might succeed where this error occurred."""
+    if isinstance(exc, (ValidationError, ValueError, TypeError)):
+        return False
+    status = error_status_code(exc)
+    return status is None or status >= 500 or status in (408, 429)
+
+
+class EndpointRouter:
+    """Ordered endpoints with health scoring, hedging and failover for one provider.
+
+    :param provider: Provider name
+    :param endpoints: Endpoints in configured order (``None`` for the SDK default)
+    :param settings: Hedging and deadline settings
+    :param clock: Monotonic clock, replaceable in tests
+    """
+
+    def __init__(self, provider: str, endpoints: Sequence[str | None], settings: HedgingSettings,
+                 clock: Callable[[], float] = time.monotonic):
+        if not endpoints:
+            raise ValueError("EndpointRouter needs at least one endpoint")
+        self.provider = provider
+        self.settings = settings
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._health = [EndpointHealth(url=url, index=i) for i, url in enumerate(endpoints)]
+        self._latency: dict[str, LatencyTracker] = {}
+
+    @property
+    def endpoints(self) -> list[str | None]:
+        return [health.url for health in self._health]
+
+    def ordered_endpoints(self) -> list[str | None]:
+        """Endpoints in the order a call tries them: available ones first, in configured order."""
+        now = self._clock()
+        with self._lock:
+            ranked = sorted(self._health, key=lambda h: (not h.available(now), h.index))
+        return [health.url for health in ranked]
+
+    def hedge_delay(self, model_id: str) -> float | None:
+        """Seconds after which a call to ``model_id`` is hedged (None if not hedging)."""
+        if not self.settings.enabled or self.settings.max_hedges < 1:
+            return None
+        tracker = self._latency.get(model_id)
+        if tracker is None or len(tracker) < self.settings.min_samples:
+            return None
+        return max(self.settings.min_delay_seconds, tracker.percentile(self.settings.percentile))
+
+    def record_success(self, endpoint: str | None, model_id: str, latency: float | None) -> None:
+        """Mark the endpoint healthy and, unless ``latency`` is None, observe the latency."""
+        with self._lock:
+            health = self._find(endpoint)
+            health.update(True, self._clock())
+            health.consecutive_failures = 0
+            health.cooldown_until = 0.0
+        if latency is not None:
+            self._observe_latency(model_id, latency)
+
+    def _observe_latency(self, model_id: str, latency: float) -> None:
+        with self._lock:
+            tracker = self._latency.setdefault(model_id, LatencyTracker())
+        tracker.observe(latency)
+
+    def record_failure(self, endpoint: str | None, exc: BaseException) -> None:
+        with self._lock:
+            health = self._find(endpoint)
+            health.update(False, self._clock())
+            health.consecutive_failures += 1
+            cooldown = min(MAX_COOLDOWN_SECONDS,
+                           BASE_COOLDOWN_SECONDS * 2 ** (health.consecutive_failures - 1))
+            health.cooldown_until = self._clock() + cooldown
+        logger.debug(f"{self.provider} endpoint {endpoint} failed "
+                     f"({health.consecutive_failures} in a row): {exc}")
+
+    def execute(self, call: Callable[[str | None], T], model_id: str,
+                reserve_attempt: Callable[[bool], bool] | None = None) -> T:
+        """Run ``call(endpoint)`` with failover, hedging and the configured deadline.
+
+        :param call: Performs the request against the given endpoint
+        :param model_id: Model of the request, for its latency percentile
+        :param reserve_attempt: Called before every attempt after the first with
+            ``True`` for a hedge and ``False`` for a failover; returning False
+            skips the hedge (e.g. ``ProviderRateLimiter.reserve_extra``)
+        :return: The first successful result
+        :raises TimeoutError: If ``deadline_seconds`` passes without a result
+        """
+        endpoints = self.ordered_endpoints()
+        hedge_delay = self.hedge_delay(model_id)
+        reserve_attempt = reserve_attempt or (lambda hedge: True)
+        if hedge_delay is None and self.settings.deadline_seconds is None:
+            return self._execute_sequential(call, endpoints, model_id, reserve_attempt)
+        return self._execute_concurrent(call, endpoints, model_id, hedge_delay, reserve_attempt)
+
+    def _execute_sequential(self, call: Callable[[str | None], T], endpoints: list[str | None],
+                            model_id: str, reserve_attempt: Callable[[bool], bool]) -> T:
+        for position, endpoint in enumerate(endpoints):
+            if position:
+                reserve_attempt(False)
+            started = self._clock()
+            try:
+                result = call(endpoint)
+            except Exception as exc:
+                if not is_endpoint_error(exc):
+                    raise
+                self.record_failure(endpoint, exc)
+                if position == len(endpoints) - 1:
+                    raise
+                self._log_failover(endpoint, endpoints[position + 1], exc)
+                continue
+            self.record_success(endpoint, model_id, self._clock() - started)
+            return result
+
+    def _execute_concurrent(self, call: Callable[[str | None], T], endpoints: list[str | None],
+                            model_id: str, hedge_delay: float | None,
+                            reserve_attempt: Callable[[bool], bool]) -> T:
+        executor = _get_executor()
+        remaining = list(endpoints)
+        pending: dict[concurrent.futures.Future, str | None] = {}
+        first_started = threading.Event()
+        hedges = 0
+        last_launch = 0.0
+        last_error: BaseException | None = None
+
+        def attempt(endpoint: str | None, hedge: bool) -> T:
+            first_started.set()
+            started = self._clock()
+            result = call(endpoint)
+            if not hedge:
+                # Observed even when a hedge already won, so the percentile is not
+                # biased towards the shortened latencies of hedged calls
+                self._observe_latency(model_id, self._clock() - started)
+            return result
+
+        def launch(endpoint: str | None, hedge: bool = False) -> None:
+            nonlocal last_launch
+            # Each attempt runs in a copy of the caller's context so spans nest correctly
+            context = contextvars.copy_context()
+            last_launch = self._clock()
+            pending[executor.submit(context.run, attempt, endpoint, hedge)] = endpoint
+
+        launch(remaining.pop(0))
+        # Time spent queued for a pool thread does not count against the deadline
+        first_started.wait()
+        last_launch = self._clock()
+        deadline = (last_launch + self.settings.deadline_seconds
+                    if self.settings.deadline_seconds is not None else None)
+
+        while pending:
+            now = self._clock()
+            timeout = None if deadline is None else deadline - now
+            if timeout is not None and timeout <= 0:
+                break
+            can_hedge = hedge_delay is not None and hedges < self.settings.max_hedges
+            if can_hedge:
+                until_hedge = max(0.0, last_launch + hedge_delay - now)
+                timeout = until_hedge if timeout is None else min(timeout, until_hedge)
+
+            done, _ = concurrent.futures.wait(
+                pending, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED)
+            if not done:
+                if can_hedge and self._clock() >= last_launch + hedge_delay:
+                    hedges += 1
+                    if not reserve_attempt(True):
+                        logger.debug(f"Not hedging {self.provider}/{model_id} call: "
+                                     f"rate limit budget exhausted")
+                        hedges = self.settings.max_hedges
+                        continue
+                    running = next(iter(pending.values()))
+                    target = remaining.pop(0) if remaining else running
+                    LLM_HEDGES.inc(provider=self.provider, model=model_id)
+                    logger.debug(f"Hedging {self.provider}/{model_id} call after "
+                                 f"{hedge_delay:.2f}s on endpoint {target}")
+                    launch(target, hedge=True)
+                continue
+
+            for future in done:
+                endpoint = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    last_error = exc
+                    if not is_endpoint_error(exc):
+                        raise
+                    self.record_failure(endpoint, exc)
+                    if not pending and remaining:
+                        self._log_failover(endpoint, remaining[0], exc)
+                        reserve_attempt(False)
+                        launch(remaining.pop(0))
+                    continue
+                self.record_success(endpoint, model_id, None)
+                return result
+
+        if pending or last_error is None:
+            raise TimeoutError(f"{self.provider}/{model_id} call exceeded its "
+                               f"{self.settings.deadline_seconds}s deadline")
+        raise last_error
+
+    def _log_failover(self, failed: str | None, target: str | None, exc: BaseException) -> None:
+        LLM_FAILOVERS.inc(provider=self.provider)
+        logger.warning(f"{self.provider} endpoint {failed} failed ({type(exc).__name__}); "
+                       f"failing over to {target}")
+
+    def _find(self, endpoint: str | None) -> EndpointHealth:
+        return next(h for h in self._health if h.url == endpoint)
+
+
+def configured_endpoints(base_url: str | None, provider_config: dict[str, Any] | None,
+                         fallback_urls: Sequence[str] = ()) -> list[str | None]:
+    """Endpoint list of a provider: ``base_url``, configured ``endpoints``, then fallbacks.
+
+    :param base_url: Primary endpoint (``None`` for the SDK default)
+    :param provider_config: Provider configuration with optional ``endpoints``
+    :param fallback_urls: Built-in alternates of the provider class
+    :return: Endpoints without duplicates, in order
+    """
+    candidates = [base_url, *((provider_config or {}).get("endpoints") or []), *fallback_urls]
+    endpoints: list[str | None] = []
+    for url in candidates:
+        key = url.rstrip("/") if url else url
+        if key not in [e.rstrip("/") if e else e for e in endpoints]:
+            endpoints.append(url)
+    return endpoints
+
+
+_routers: dict[tuple[str, tuple[str | None, ...]], EndpointRouter] = {}
+_routers_lock = threading.Lock()
+
+
+def get_endpoint_router(provider: str, base_url: str | None,
+                        provider_config: dict[str, Any] | None,
+                        fallback_urls: Sequence[str] = ()) -> EndpointRouter:
+    """Get the process-wide endpoint router for a provider.
+
+    Routers are shared per provider and endpoint list; a router with fresh
+    health scores replaces the old one when the hedging settings change.
+
+    :param provider: Provider name
+    :param base_url: Primary endpoint of the call
+    :param provider_config: Provider configuration
+    :param fallback_urls: Built-in alternates of the provider class
+    :return: Shared router for the provider and endpoint list
+    """
+    endpoints = configured_endpoints(base_url, provider_config, fallback_urls)
+    settings = HedgingSettings.from_provider_config(provider_config)
+    key = (provider, tuple(endpoints))
+    with _routers_lock:
+        router = _routers.get(key)
+        if router is None or router.settings != settings:
+            router = _routers[key] = EndpointRouter(provider, endpoints, settings)
+        return router
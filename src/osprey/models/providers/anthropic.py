@@ -74,8 +74,10 @@ class AnthropicProviderAdapter(BaseProvider):
         # Get http_client if provided (for proxy support)
         http_client = kwargs.get("http_client")
 
+        # base_url is the endpoint chosen by the router (None for the SDK default)
         client = anthropic.Anthropic(
             api_key=api_key,
+            base_url=base_url,
             http_client=http_client,
         )
 
@@ -86,6 +88,17 @@ class AnthropicProviderAdapter(BaseProvider):
             "temperature": temperature
         }
 
+        if system_prompt:
+            if kwargs.get("cache_system_prompt", False):
+                # Mark the static prefix for prompt caching (reused across requests for ~5 minutes)
+                request_params["system"] = [{
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }]
+            else:
+                request_params["system"] = system_prompt
+
         # Add extended thinking if enabled
         enable_thinking = kwargs.get("enable_thinking", False)
         budget_tokens = kwargs.get("budget_tokens")
@@ -133,7 +146,7 @@ class AnthropicProviderAdapter(BaseProvider):
         test_model = model_id or self.health_check_model_id
 
         try:
-            client = anthropic.Anthropic(api_key=api_key)
+            client = anthropic.Anthropic(api_key=api_key, base_url=base_url)
 
             # Minimal test: 1 token in, 1 token out (~$0.0001 cost)
             response = client.messages.create(
@@ -100,13 +100,67 @@ class BaseProvider(ABC):
         :param max_tokens: Maximum tokens to generate
         :param temperature: Sampling temperature
         :param thinking: Extended thinking configuration (if supported)
-        :param system_prompt: System prompt (if supported)
+        :param system_prompt: System prompt sent separately from the user message
         :param output_format: Structured output format (Pydantic model or TypedDict)
-        :param kwargs: Additional provider-specific arguments
+        :param kwargs: Additional provider-specific arguments. ``cache_system_prompt=True``
+            asks providers with explicit prompt caching to mark the system prompt as a
+            cacheable prefix; providers with automatic prefix caching ignore it
         :return: Model response text or structured output
         """
         pass
 
+    def fallback_base_urls(self, base_url: str | None) -> list[str]:
+        """Alternate endpoints to fail over to when ``base_url`` is unreachable.
+
+        Appended after the configured ``endpoints`` of the provider. Providers
+        whose service is commonly reachable under several addresses (such as a
+        local server seen from the host or from a container) override this.
+
+        :param base_url: Configured endpoint URL
+        :return: Alternate endpoint URLs (none by default)
+        """
+        return []
+
+    @staticmethod
+    def build_chat_messages(message: str, system_prompt: str | None = None) -> list[dict[str, str]]:
+        """Build chat messages with an optional leading system message.
+
+        :param message: User message
+        :param system_prompt: Optional system prompt
+        :return: List of role/content message dictionaries
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": message})
+        return messages
+
+    @staticmethod
+    def parse_structured_completion(client: Any, **kwargs: Any) -> Any:
+        """Request structured output through an OpenAI-compatible client.
+
+        The SDK's ``parse`` raises on JSON that is almost valid or cut off at
+        ``max_tokens``. In that case the raw message content is returned
+        instead, and ``get_chat_completion`` repairs it locally with
+        :func:`~osprey.models.structured_output.parse_structured_output`.
+
+        :param client: ``openai.OpenAI`` client
+        :param kwargs: Arguments for ``client.beta.chat.completions.parse``
+        :return: Parsed chat completion, or the raw content if the SDK could not validate it
+        """
+        import openai
+        from pydantic import ValidationError
+
+        raw_response = client.beta.chat.completions.with_raw_response.parse(**kwargs)
+        try:
+            return raw_response.parse()
+        except (ValidationError, openai.LengthFinishReasonError):
+            choices = raw_response.http_response.json().get("choices") or [{}]
+            content = (choices[0].get("message") or {}).get("content")
+            if not content:
+                raise
+            return content
+
     @abstractmethod
     def check_health(
         self,
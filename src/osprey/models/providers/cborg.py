@@ -109,14 +109,20 @@ class CBorgProviderAdapter(BaseProvider):
         # Handle typed dict output flag
         is_typed_dict_output = kwargs.get("is_typed_dict_output", False)
 
+        messages = self.build_chat_messages(message, system_prompt)
+
         if output_format is not None:
             # Use structured outputs with Pydantic model
-            response = client.beta.chat.completions.parse(
+            response = self.parse_structured_completion(
+                client,
                 model=model_id,
-                messages=[{"role": "user", "content": message}],
+                messages=messages,
                 max_tokens=max_tokens,
                 response_format=output_format,
             )
+            if isinstance(response, str):
+                # Structured output the SDK could not validate; repaired by get_chat_completion
+                return response
             if not response.choices:
                 raise ValueError("CBORG API returned empty choices list")
             result = response.choices[0].message.parsed
@@ -129,7 +135,7 @@ class CBorgProviderAdapter(BaseProvider):
             # Regular text completion
             response = client.chat.completions.create(
                 model=model_id,
-                messages=[{"role": "user", "content": message}],
+                messages=messages,
                 max_tokens=max_tokens,
             )
             if not response.choices:
@@ -0,0 +1,181 @@
+"""Fake Provider Adapter for Offline Load Tests.
+
+The ``fake`` provider answers every completion locally after a synthetic
+delay, so the framework can be exercised at scale without network access or
+API costs (``osprey loadtest`` points all model roles at it):
+
+- Text completions return ``text``.
+- Structured completions return the smallest valid instance of the requested
+  output model: ``False`` for booleans, empty lists, the first ``Literal`` or
+  enum value, ``text`` for strings. With these defaults no capability
+  classifies as a match and the orchestrator's empty plan becomes a single
+  respond step, so every turn runs the classifier, orchestrator and respond
+  path of the graph.
+- ``responses`` overrides fields per output model name.
+
+::
+
+    api:
+      providers:
+        fake:
+          text: "Simulated answer."
+          latency:
+            distribution: lognormal    # none | constant | uniform | lognormal
+            median_seconds: 0.8
+            sigma: 0.4
+          seed: 1
+          responses:
+            CapabilityMatch: {is_match: true}
+
+:func:`~osprey.models.get_model` returns PydanticAI's ``TestModel``.
+"""
+
+import datetime
+import enum
+import logging
+import time
+import types
+import typing
+from typing import Any, Literal, Union
+
+import httpx
+from pydantic import BaseModel
+
+from .base import BaseProvider
+from .replay import get_latency_model
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEXT = "This is a simulated response."
+
+
+def placeholder_value(annotation: Any, text: str = DEFAULT_TEXT, constraints: list | tuple = ()) -> Any:
+    """Smallest valid value for ``annotation`` (``None`` where optional).
+
+    :param constraints: Field metadata such as ``min_length`` and ``ge`` bounds
+    """
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    min_length = max((getattr(c, "min_length", None) or 0 for c in constraints), default=0)
+
+    if origin in (Union, types.UnionType):
+        if type(None) in args:
+            return None
+        return placeholder_value(args[0], text)
+    if origin is Literal:
+        return args[0]
+    if origin is typing.Annotated:
+        return placeholder_value(args[0], text, (*constraints, *args[1:]))
+    if origin in (list, set, tuple, frozenset) or annotation in (list, set, tuple, frozenset):
+        item_type = args[0] if args else str
+        return [placeholder_value(item_type, text) for _ in range(min_length)]
+    if origin is dict or annotation is dict:
+        return {}
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return placeholder_data(annotation, text)
+        if issubclass(annotation, enum.Enum):
+            return next(iter(annotation)).value
+        if issubclass(annotation, bool):
+            return False
+        if issubclass(annotation, (int, float)):
+            minimum = 0
+            for c in constraints:
+                if getattr(c, "ge", None) is not None:
+                    minimum = c.ge
+                elif getattr(c, "gt", None) is not None:
+                    minimum = c.gt + 1
+            return annotation(minimum)
+        if issubclass(annotation, str):
+            return text
+        if issubclass(annotation, datetime.datetime):
+            return datetime.datetime.now().isoformat()
+        if issubclass(annotation, datetime.date):
+            return datetime.date.today().isoformat()
+    return None
+
+
+def placeholder_data(model: type[BaseModel], text: str = DEFAULT_TEXT) -> dict[str, Any]:
+    """Field values for the smallest valid instance of ``model``."""
+    return {
+        name: placeholder_value(field.annotation, text, field.metadata)
+        for name, field in model.model_fields.items()
+        if field.is_required()
+    }
+
+
+class FakeProviderAdapter(BaseProvider):
+    """Answers completions locally with placeholder output after a synthetic delay."""
+
+    # Metadata (single source of truth)
+    name = "fake"
+    description = "Simulated responses (offline load testing)"
+    requires_api_key = False
+    requires_base_url = False
+    requires_model_id = False
+    supports_proxy = False
+    default_base_url = None
+    default_model_id = "fake"
+    health_check_model_id = "fake"
+    available_models = []
+
+    # API key acquisition information
+    api_key_url = None
+    api_key_instructions = []
+    api_key_note = "No API key needed; responses are generated locally"
+
+    @staticmethod
+    def _settings() -> dict:
+        from osprey.utils.config import get_provider_config
+        return get_provider_config("fake") or {}
+
+    def create_model(
+        self,
+        model_id: str,
+        api_key: str | None,
+        base_url: str | None,
+        timeout: float | None,
+        http_client: httpx.AsyncClient | None
+    ) -> Any:
+        """Create PydanticAI's ``TestModel``, which answers without a network."""
+        from pydantic_ai.models.test import TestModel
+        return TestModel(custom_output_text=self._settings().get("text", DEFAULT_TEXT))
+
+    def execute_completion(
+        self,
+        message: str,
+        model_id: str,
+        api_key: str | None,
+        base_url: str | None,
+        max_tokens: int = 1024,
+        temperature: float = 0.0,
+        thinking: dict | None = None,
+        system_prompt: str | None = None,
+        output_format: Any | None = None,
+        **kwargs
+    ) -> str | Any:
+        """Wait for the configured latency and return placeholder output."""
+        settings = self._settings()
+        delay = get_latency_model(settings.get("latency"), settings.get("seed")).sample()
+        if delay > 0:
+            time.sleep(delay)
+
+        text = settings.get("text", DEFAULT_TEXT)
+        if output_format is None:
+            return text
+
+        name = output_format.__name__
+        responses = settings.get("responses") or {}
+        overrides = responses.get(name) or responses.get(name.removesuffix("Pydantic")) or {}
+        result = output_format.model_validate({**placeholder_data(output_format, text), **overrides})
+        return result.model_dump() if kwargs.get("is_typed_dict_output") else result
+
+    def check_health(
+        self,
+        api_key: str | None,
+        base_url: str | None,
+        timeout: float = 5.0,
+        model_id: str | None = None
+    ) -> tuple[bool, str]:
+        """Always healthy: nothing to reach."""
+        return True, "Simulated provider (no network)"
@@ -1,5 +1,6 @@
 """Google Provider Adapter Implementation."""
 
+import re
 from typing import Any
 
 import httpx
@@ -11,6 +12,22 @@ from pydantic_ai.providers.google_gla import GoogleGLAProvider
 from .base import BaseProvider
 
 
+def _create_client(api_key: str | None, base_url: str | None) -> genai.Client:
+    """Create a genai client for ``base_url`` (None for the SDK default endpoint).
+
+    The SDK appends the API version itself, so a trailing version segment of
+    the configured URL (``.../v1beta``) becomes ``api_version``.
+    """
+    if not base_url:
+        return genai.Client(api_key=api_key)
+    root, _, last = base_url.rstrip("/").rpartition("/")
+    if re.fullmatch(r"v\d+(?:alpha|beta)?\d*", last):
+        http_options = genai_types.HttpOptions(base_url=f"{root}/", api_version=last)
+    else:
+        http_options = genai_types.HttpOptions(base_url=f"{base_url.rstrip('/')}/")
+    return genai.Client(api_key=api_key, http_options=http_options)
+
+
 class GoogleProviderAdapter(BaseProvider):
     """Google AI (Gemini) provider implementation."""
 
@@ -76,7 +93,7 @@ class GoogleProviderAdapter(BaseProvider):
         google_logger.setLevel(logging.WARNING)
 
         try:
-            client = genai.Client(api_key=api_key)
+            client = _create_client(api_key, base_url)
         finally:
             # Restore original log level
             google_logger.setLevel(original_level)
@@ -96,6 +113,7 @@ class GoogleProviderAdapter(BaseProvider):
             contents=[message],
             config=genai_types.GenerateContentConfig(
                 **({"thinking_config": genai_types.ThinkingConfig(thinking_budget=budget_tokens)}),
+                **({"system_instruction": system_prompt} if system_prompt else {}),
                 max_output_tokens=max_tokens
             )
         )
@@ -132,7 +150,7 @@ class GoogleProviderAdapter(BaseProvider):
             google_logger.setLevel(logging.WARNING)
 
             try:
-                client = genai.Client(api_key=api_key)
+                client = _create_client(api_key, base_url)
             finally:
                 # Restore original log level
                 google_logger.setLevel(original_level)
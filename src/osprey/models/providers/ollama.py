@@ -1,6 +1,8 @@
 """Ollama Provider Adapter Implementation."""
 
 import logging
+import threading
+import time
 from typing import Any
 
 import httpx
@@ -9,10 +11,81 @@ import openai
 from pydantic_ai.models.openai import OpenAIModel
 from pydantic_ai.providers.openai import OpenAIProvider as PydanticOpenAIProvider
 
+from osprey.models.structured_output import parse_structured_output
+
 from .base import BaseProvider
 
 logger = logging.getLogger(__name__)
 
+# Seconds a verified client or resolved endpoint is reused before it is probed again
+ENDPOINT_CACHE_TTL_SECONDS = 300.0
+
+
+class _EndpointCache:
+    """Verified Ollama clients and resolved endpoints shared by all adapter instances.
+
+    Connectivity probes run once per endpoint and TTL instead of before every
+    request; an entry is dropped as soon as a request through it fails, so
+    the next request re-resolves. Cached clients keep their HTTP connection
+    pool across calls.
+    """
+
+    def __init__(self, ttl: float = ENDPOINT_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._clients: dict[str, tuple[ollama.Client, float]] = {}
+        self._resolved: dict[str, tuple[str, float]] = {}
+
+    def _fresh(self, verified_at: float) -> bool:
+        return time.monotonic() - verified_at < self.ttl
+
+    def client(self, base_url: str) -> ollama.Client:
+        """Return a verified client for ``base_url``, probing it only when not cached.
+
+        :raises ConnectionError: If Ollama is not reachable at ``base_url``
+        """
+        with self._lock:
+            cached = self._clients.get(base_url)
+            if cached is not None and self._fresh(cached[1]):
+                return cached[0]
+
+        client = ollama.Client(host=base_url)
+        try:
+            client.list()  # Test connection
+        except Exception as e:
+            raise ConnectionError(f"Failed to connect to Ollama at '{base_url}': {e}") from e
+        logger.debug(f"Connected to Ollama at {base_url}")
+        with self._lock:
+            self._clients[base_url] = (client, time.monotonic())
+        return client
+
+    def resolve(self, base_url: str, candidates: list[str], probe) -> str | None:
+        """Return the first reachable URL of ``candidates``, cached per ``base_url``."""
+        with self._lock:
+            cached = self._resolved.get(base_url)
+            if cached is not None and self._fresh(cached[1]):
+                return cached[0]
+
+        working_url = next((url for url in candidates if probe(url)), None)
+        if working_url is not None:
+            with self._lock:
+                self._resolved[base_url] = (working_url, time.monotonic())
+        return working_url
+
+    def invalidate(self, base_url: str) -> None:
+        """Forget the client and resolution of ``base_url`` after a failure."""
+        with self._lock:
+            self._clients.pop(base_url, None)
+            self._resolved.pop(base_url, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+            self._resolved.clear()
+
+
+_endpoint_cache = _EndpointCache()
+
 
 class OllamaProviderAdapter(BaseProvider):
     """Ollama local model provider implementation."""
@@ -64,6 +137,10 @@ class OllamaProviderAdapter(BaseProvider):
 
         return fallback_urls
 
+    def fallback_base_urls(self, base_url: str | None) -> list[str]:
+        """Try the host and container addresses of the local Ollama server."""
+        return self._get_fallback_urls(base_url or self.default_base_url)
+
     @staticmethod
     def _test_connection(base_url: str) -> bool:
         """Test if Ollama is accessible at the given URL."""
@@ -84,42 +161,26 @@ class OllamaProviderAdapter(BaseProvider):
         http_client: httpx.AsyncClient | None
     ) -> OpenAIModel:
         """Create Ollama model instance with fallback support."""
-        effective_base_url = base_url
-        if not base_url.endswith('/v1'):
-            effective_base_url = base_url.rstrip('/') + '/v1'
+        # Resolved once per TTL; every agent creation used to probe all URLs
+        fallback_urls = self._get_fallback_urls(base_url)
+        working_url = _endpoint_cache.resolve(base_url, [base_url, *fallback_urls], self._test_connection)
+        if working_url is None:
+            # All connection attempts failed
+            raise ValueError(
+                f"Failed to connect to Ollama at configured URL '{base_url}' "
+                f"and all fallback URLs {fallback_urls}. Please ensure Ollama is running "
+                f"and accessible, or update your configuration."
+            )
+        if working_url != base_url:
+            logger.warning(
+                f"⚠️  Ollama connection fallback: configured URL '{base_url}' failed, "
+                f"using fallback '{working_url}'. Consider updating your configuration "
+                f"for your current execution environment."
+            )
 
-        # Test primary URL first
-        if self._test_connection(base_url):
-            logger.debug(f"Successfully connected to Ollama at {base_url}")
-        else:
-            logger.debug(f"Failed to connect to Ollama at {base_url}")
-
-            # Try fallback URLs
-            fallback_urls = self._get_fallback_urls(base_url)
-            working_url = None
-
-            for fallback_url in fallback_urls:
-                logger.debug(f"Attempting fallback connection to Ollama at {fallback_url}")
-                if self._test_connection(fallback_url):
-                    working_url = fallback_url
-                    logger.warning(
-                        f"⚠️  Ollama connection fallback: configured URL '{base_url}' failed, "
-                        f"using fallback '{fallback_url}'. Consider updating your configuration "
-                        f"for your current execution environment."
-                    )
-                    break
-
-            if working_url:
-                effective_base_url = working_url
-                if not working_url.endswith('/v1'):
-                    effective_base_url = working_url.rstrip('/') + '/v1'
-            else:
-                # All connection attempts failed
-                raise ValueError(
-                    f"Failed to connect to Ollama at configured URL '{base_url}' "
-                    f"and all fallback URLs {fallback_urls}. Please ensure Ollama is running "
-                    f"and accessible, or update your configuration."
-                )
+        effective_base_url = working_url
+        if not working_url.endswith('/v1'):
+            effective_base_url = working_url.rstrip('/') + '/v1'
 
         # Create OpenAI-compatible model
         if http_client:
@@ -158,49 +219,17 @@ class OllamaProviderAdapter(BaseProvider):
         output_format: Any | None = None,
         **kwargs
     ) -> str | Any:
-        """Execute Ollama chat completion with fallback support."""
-        # Ollama connection with graceful fallback for development workflows
-        client = None
-        used_fallback = False
+        """Execute Ollama chat completion against ``base_url``.
 
-        try:
-            # First attempt: Use configured base_url
-            client = ollama.Client(host=base_url)
-            client.list()  # Test connection
-            logger.debug(f"Successfully connected to Ollama at {base_url}")
-        except Exception as e:
-            logger.debug(f"Failed to connect to Ollama at {base_url}: {e}")
-
-            # Determine fallback URLs based on current base_url
-            fallback_urls = self._get_fallback_urls(base_url)
-
-            # Try fallback URLs
-            for fallback_url in fallback_urls:
-                try:
-                    logger.debug(f"Attempting fallback connection to Ollama at {fallback_url}")
-                    client = ollama.Client(host=fallback_url)
-                    client.list()  # Test connection
-                    used_fallback = True
-                    logger.warning(
-                        f"⚠️  Ollama connection fallback: configured URL '{base_url}' failed, "
-                        f"using fallback '{fallback_url}'. Consider updating your configuration "
-                        f"for your current execution environment."
-                    )
-                    break
-                except Exception as fallback_e:
-                    logger.debug(f"Fallback attempt failed for {fallback_url}: {fallback_e}")
-                    continue
-
-            if client is None:
-                # All connection attempts failed
-                raise ValueError(
-                    f"Failed to connect to Ollama at configured URL '{base_url}' "
-                    f"and all fallback URLs {fallback_urls}. Please ensure Ollama is running "
-                    f"and accessible, or update your configuration."
-                )
+        Fallback to the alternate addresses from :meth:`fallback_base_urls` is
+        handled by the endpoint router of :func:`~osprey.models.get_chat_completion`.
+        The client for ``base_url`` is cached and verified at most once per
+        :data:`ENDPOINT_CACHE_TTL_SECONDS`.
+        """
+        client = _endpoint_cache.client(base_url)
 
         # Build request
-        chat_messages = [{'role': 'user', 'content': message}]
+        chat_messages = self.build_chat_messages(message, system_prompt)
 
         options = {}
         if max_tokens is not None:
@@ -219,10 +248,12 @@ class OllamaProviderAdapter(BaseProvider):
 
         try:
             response = client.chat(**request_args)
+        except (ConnectionError, httpx.TransportError) as e:
+            _endpoint_cache.invalidate(base_url)
+            raise ConnectionError(f"Lost connection to Ollama at '{base_url}': {e}") from e
         except Exception as e:
-            current_url = fallback_urls[0] if used_fallback else base_url
             raise ValueError(
-                f"Ollama chat request failed using {current_url}. "
+                f"Ollama chat request failed using {base_url}. "
                 f"Error: {e}. Please verify the model '{model_id}' is available."
             )
 
@@ -233,8 +264,9 @@ class OllamaProviderAdapter(BaseProvider):
         is_typed_dict_output = kwargs.get("is_typed_dict_output", False)
 
         if output_format is not None:
-            # Validate the JSON string from Ollama against the Pydantic model
-            result = output_format.model_validate_json(ollama_content_str.strip())
+            # Validate the JSON string from Ollama against the Pydantic model,
+            # repairing fences, truncation and enum casing locally
+            result = parse_structured_output(ollama_content_str, output_format)
             if is_typed_dict_output and hasattr(result, 'model_dump'):
                 return result.model_dump()
             return result
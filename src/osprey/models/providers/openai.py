@@ -109,14 +109,18 @@ class OpenAIProviderAdapter(BaseProvider):
         # Handle typed dict output flag
         is_typed_dict_output = kwargs.get("is_typed_dict_output", False)
 
+        # OpenAI caches repeated prompt prefixes automatically, so only the message split matters
+        messages = self.build_chat_messages(message, system_prompt)
+
         # Try new API (max_completion_tokens) first, fall back to old API (max_tokens)
         # This handles GPT-5, o1-series, and future models automatically
         try:
             if output_format is not None:
                 # Use structured outputs with Pydantic model
-                response = client.beta.chat.completions.parse(
+                response = self.parse_structured_completion(
+                    client,
                     model=model_id,
-                    messages=[{"role": "user", "content": message}],
+                    messages=messages,
                     max_completion_tokens=max_tokens,
                     response_format=output_format,
                 )
@@ -124,7 +128,7 @@ class OpenAIProviderAdapter(BaseProvider):
                 # Regular text completion
                 response = client.chat.completions.create(
                     model=model_id,
-                    messages=[{"role": "user", "content": message}],
+                    messages=messages,
                     max_completion_tokens=max_tokens,
                 )
         except openai.BadRequestError as e:
@@ -132,21 +136,26 @@ class OpenAIProviderAdapter(BaseProvider):
             error_str = str(e).lower()
             if "max_tokens" in error_str or "unsupported parameter" in error_str or "max_completion_tokens" in error_str:
                 if output_format is not None:
-                    response = client.beta.chat.completions.parse(
+                    response = self.parse_structured_completion(
+                        client,
                         model=model_id,
-                        messages=[{"role": "user", "content": message}],
+                        messages=messages,
                         max_tokens=max_tokens,
                         response_format=output_format,
                     )
                 else:
                     response = client.chat.completions.create(
                         model=model_id,
-                        messages=[{"role": "user", "content": message}],
+                        messages=messages,
                         max_tokens=max_tokens,
                     )
             else:
                 raise
 
+        if isinstance(response, str):
+            # Structured output the SDK could not validate; repaired by get_chat_completion
+            return response
+
         if not response.choices:
             raise ValueError("OpenAI API returned empty choices list")
 
@@ -0,0 +1,339 @@
+"""Record/Replay Provider Adapter for Offline, Deterministic Runs.
+
+The ``replay`` provider stands in for any real provider so that a whole chat
+session (classifier, orchestrator, respond, Python generator and every other
+:func:`~osprey.models.get_chat_completion` call) can be re-run for profiling
+without network access or API costs:
+
+- ``mode: record`` forwards each completion to the ``upstream`` provider and
+  appends the request hash, the response and the observed latency to a JSONL
+  cassette.
+- ``mode: replay`` serves responses from the cassette. A request is matched by
+  the hash of its model, prompts and output model; prompts that changed since
+  recording (timestamps, shuffled examples) fall back to the next recorded
+  response of the same model and output model. Responses repeat once a
+  cassette runs out, so replays can run longer than the recording.
+  Synthetic latency is drawn from a configurable distribution.
+
+Point model roles at the provider and keep their model ids::
+
+    api:
+      providers:
+        replay:
+          mode: replay                 # record | replay
+          upstream: cborg              # provider wrapped in record mode
+          cassette: session.jsonl      # relative to _agent_data/cassettes
+          latency:
+            distribution: lognormal    # none | constant | uniform | lognormal | recorded
+            median_seconds: 1.5
+            sigma: 0.5
+          seed: 42
+
+    models:
+      orchestrator:
+        provider: replay
+        model_id: anthropic/claude-sonnet
+
+Only direct completions are recorded; PydanticAI models from
+:func:`~osprey.models.get_model` are not supported.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+import httpx
+from pydantic import BaseModel
+
+from .base import BaseProvider
+
+logger = logging.getLogger(__name__)
+
+LATENCY_DISTRIBUTIONS = ("none", "constant", "uniform", "lognormal", "recorded")
+
+
+class ReplayMissError(LookupError):
+    """Raised when a cassette holds no response for a replayed request."""
+
+
+def request_key(model_id: str, message: str, system_prompt: str | None,
+                output_format: Any | None, max_tokens: int, temperature: float) -> str:
+    """Stable hash identifying a completion request in a cassette."""
+    payload = {
+        "model_id": model_id,
+        "system_prompt": system_prompt,
+        "message": message,
+        "output_format": getattr(output_format, "__name__", None),
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _lane(model_id: str, output_format: Any | None) -> str:
+    return f"{model_id}|{getattr(output_format, '__name__', '')}"
+
+
+class Cassette:
+    """JSONL file of recorded completions with per-request playback positions.
+
+    :param path: Cassette file
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._by_key: dict[str, list[dict]] = defaultdict(list)
+        self._by_lane: dict[str, list[dict]] = defaultdict(list)
+        self._positions: dict[str, int] = defaultdict(int)
+        if path.exists():
+            with path.open(encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        self._index(json.loads(line))
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._by_lane.values())
+
+    def _index(self, entry: dict) -> None:
+        self._by_key[entry["key"]].append(entry)
+        self._by_lane[entry["lane"]].append(entry)
+
+    def append(self, entry: dict) -> None:
+        """Record an entry and write it to the file immediately."""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, default=str) + "\n")
+            self._index(entry)
+
+    def next(self, key: str, lane: str) -> dict:
+        """Next response for ``key``, else for its lane (model and output model).
+
+        :raises ReplayMissError: If neither has been recorded
+        """
+        with self._lock:
+            for name, entries in ((f"key:{key}", self._by_key.get(key)),
+                                  (f"lane:{lane}", self._by_lane.get(lane))):
+                if entries:
+                    position = self._positions[name]
+                    self._positions[name] += 1
+                    return entries[position % len(entries)]
+        raise ReplayMissError(f"No recorded response for {lane.replace('|', ' ')} in {self.path}")
+
+
+_cassettes: dict[Path, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(path: Path) -> Cassette:
+    """Get the process-wide cassette for ``path``, loading it on first use."""
+    path = path.resolve()
+    with _cassettes_lock:
+        if path not in _cassettes:
+            _cassettes[path] = Cassette(path)
+        return _cassettes[path]
+
+
+class LatencyModel:
+    """Synthetic latency drawn from a configured distribution.
+
+    :param settings: ``latency`` section of the provider configuration
+    :param seed: Seed for reproducible draws
+    """
+
+    def __init__(self, settings: dict | None = None, seed: int | None = None):
+        self.settings = dict(settings or {})
+        self.distribution = self.settings.get("distribution", "none")
+        if self.distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{self.distribution}', "
+                             f"expected one of {', '.join(LATENCY_DISTRIBUTIONS)}")
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self, recorded: float | None = None) -> float:
+        """Seconds to wait for one response."""
+        s = self.settings
+        with self._lock:
+            if self.distribution == "constant":
+                return float(s.get("seconds", 1.0))
+            if self.distribution == "uniform":
+                return self._random.uniform(float(s.get("min_seconds", 0.5)), float(s.get("max_seconds", 2.0)))
+            if self.distribution == "lognormal":
+                median = float(s.get("median_seconds", 1.0))
+                return self._random.lognormvariate(math.log(median), float(s.get("sigma", 0.5)))
+            if self.distribution == "recorded":
+                return (recorded or 0.0) * float(s.get("scale", 1.0))
+        return 0.0
+
+
+_latency_models: dict[str, LatencyModel] = {}
+
+
+def get_latency_model(settings: dict | None, seed: int | None) -> LatencyModel:
+    """Get the process-wide latency model for ``settings`` and ``seed``."""
+    key = json.dumps([settings, seed], sort_keys=True, default=str)
+    with _cassettes_lock:
+        if key not in _latency_models:
+            _latency_models[key] = LatencyModel(settings, seed)
+        return _latency_models[key]
+
+
+def _encode_response(result: Any) -> dict:
+    if isinstance(result, BaseModel):
+        return {"type": "model", "data": result.model_dump(mode="json")}
+    if isinstance(result, dict):
+        return {"type": "dict", "data": result}
+    if isinstance(result, list):
+        # Thinking content blocks; keep their text
+        text = "\n".join(str(getattr(block, "text", None) or getattr(block, "thinking", "") or block)
+                         for block in result)
+        return {"type": "text", "data": text}
+    return {"type": "text", "data": result}
+
+
+def _decode_response(response: dict, output_format: Any | None, is_typed_dict_output: bool) -> Any:
+    data = response["data"]
+    if output_format is None or response["type"] == "text":
+        return data
+    result = output_format.model_validate(data)
+    return result.model_dump() if is_typed_dict_output else result
+
+
+class ReplayProviderAdapter(BaseProvider):
+    """Records completions of another provider and replays them offline."""
+
+    # Metadata (single source of truth)
+    name = "replay"
+    description = "Record/replay (offline benchmarking)"
+    requires_api_key = False
+    requires_base_url = False
+    requires_model_id = True
+    supports_proxy = False
+    default_base_url = None
+    default_model_id = None
+    health_check_model_id = None
+    available_models = []
+
+    # API key acquisition information
+    api_key_url = None
+    api_key_instructions = []
+    api_key_note = "Replays recorded responses; record mode uses the upstream provider's key"
+
+    @staticmethod
+    def _settings() -> dict:
+        from osprey.utils.config import get_provider_config
+        return get_provider_config("replay") or {}
+
+    @staticmethod
+    def _cassette_path(settings: dict) -> Path:
+        path = Path(settings.get("cassette", "session.jsonl"))
+        if not path.is_absolute():
+            from osprey.utils.config import get_agent_dir
+            path = Path(get_agent_dir("cassettes_dir")) / path
+        return path
+
+    @staticmethod
+    def _upstream(settings: dict) -> tuple[BaseProvider, dict]:
+        upstream = settings.get("upstream")
+        if not upstream or upstream == "replay":
+            raise ValueError("Replay provider in record mode needs an 'upstream' provider")
+        from osprey.registry import get_registry
+        from osprey.utils.config import get_provider_config
+        provider_class = get_registry().get_provider(upstream)
+        if provider_class is None:
+            raise ValueError(f"Unknown upstream provider for replay: {upstream}")
+        return provider_class(), get_provider_config(upstream) or {}
+
+    def create_model(
+        self,
+        model_id: str,
+        api_key: str | None,
+        base_url: str | None,
+        timeout: float | None,
+        http_client: httpx.AsyncClient | None
+    ) -> Any:
+        """Not supported: only direct chat completions can be recorded and replayed."""
+        raise ValueError("The replay provider only supports get_chat_completion(), not get_model()")
+
+    def execute_completion(
+        self,
+        message: str,
+        model_id: str,
+        api_key: str | None,
+        base_url: str | None,
+        max_tokens: int = 1024,
+        temperature: float = 0.0,
+        thinking: dict | None = None,
+        system_prompt: str | None = None,
+        output_format: Any | None = None,
+        **kwargs
+    ) -> str | Any:
+        """Record the upstream completion or replay it from the cassette."""
+        settings = self._settings()
+        mode = settings.get("mode", "replay")
+        cassette = get_cassette(self._cassette_path(settings))
+        key = request_key(model_id, message, system_prompt, output_format, max_tokens, temperature)
+        lane = _lane(model_id, output_format)
+
+        if mode == "record":
+            provider, provider_config = self._upstream(settings)
+            started = time.perf_counter()
+            result = provider.execute_completion(
+                message=message,
+                model_id=model_id,
+                api_key=provider_config.get("api_key"),
+                base_url=provider_config.get("base_url"),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                thinking=thinking,
+                system_prompt=system_prompt,
+                output_format=output_format,
+                **kwargs
+            )
+            cassette.append({
+                "key": key,
+                "lane": lane,
+                "provider": provider.name,
+                "latency_sec": round(time.perf_counter() - started, 4),
+                "message_preview": message[:200],
+                "response": _encode_response(result),
+            })
+            return result
+
+        if mode != "replay":
+            raise ValueError(f"Unknown replay mode '{mode}', expected 'record' or 'replay'")
+
+        entry = cassette.next(key, lane)
+        delay = get_latency_model(settings.get("latency"), settings.get("seed")).sample(entry.get("latency_sec"))
+        if delay > 0:
+            time.sleep(delay)
+        return _decode_response(entry["response"], output_format, kwargs.get("is_typed_dict_output", False))
+
+    def check_health(
+        self,
+        api_key: str | None,
+        base_url: str | None,
+        timeout: float = 5.0,
+        model_id: str | None = None
+    ) -> tuple[bool, str]:
+        """Check that the cassette is readable (replay) or the upstream is healthy (record)."""
+        try:
+            settings = self._settings()
+            if settings.get("mode", "replay") == "record":
+                provider, provider_config = self._upstream(settings)
+                return provider.check_health(provider_config.get("api_key"),
+                                             provider_config.get("base_url"), timeout, model_id)
+            path = self._cassette_path(settings)
+            if not path.exists():
+                return False, f"Cassette not found: {path}"
+            return True, f"{len(get_cassette(path))} recorded responses in {path.name}"
+        except Exception as e:
+            return False, f"Replay check failed: {str(e)[:50]}"
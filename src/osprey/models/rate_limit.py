@@ -0,0 +1,390 @@
+"""Process-wide Rate Limiting and Adaptive Concurrency for LLM Providers.
+
+Every :func:`~osprey.models.completion.get_chat_completion` call, whichever node
+or session it comes from, passes through one :class:`ProviderRateLimiter` per
+provider and model. The limiter coordinates calls that previously fired
+independently (orchestrator, respond, task extraction, memory, Python
+generator, classification across all sessions):
+
+- **Request and token buckets** enforce ``requests_per_minute`` and
+  ``tokens_per_minute`` from the provider configuration. A call reserves its
+  estimated prompt tokens plus ``max_tokens`` up front; the unused part of the
+  output reservation is refunded when the call returns.
+- **Adaptive concurrency (AIMD)** bounds calls in flight. The limit grows by
+  about one per round of successful calls up to ``max_concurrency``, halves
+  when the provider answers with HTTP 429, and shrinks by a tenth when latency
+  exceeds ``target_latency_seconds``.
+- **Queueing instead of failing**: calls wait in arrival order for a slot and
+  for bucket capacity. A 429 pauses all calls to that model for the provider's
+  ``Retry-After`` (or an exponential backoff) and is retried up to
+  ``max_rate_limit_retries`` times before the error reaches the caller.
+
+Configuration lives next to the credentials of each provider, with optional
+per-model overrides::
+
+    api:
+      providers:
+        anthropic:
+          api_key: ${ANTHROPIC_API_KEY}
+          rate_limits:
+            requests_per_minute: 50
+            tokens_per_minute: 40000
+            max_concurrency: 8
+            models:
+              claude-haiku-4-5:
+                requests_per_minute: 100
+
+Without ``rate_limits`` only the adaptive concurrency limit applies.
+
+.. note::
+   Limiters are thread-based because completions run in worker threads
+   (``asyncio.to_thread``). Model instances from :func:`~osprey.models.get_model`
+   used by PydanticAI agents are not covered.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, fields
+from typing import Any, TypeVar
+
+from osprey.utils.config import get_provider_config
+from osprey.utils.logger import get_logger
+from osprey.utils.metrics import LLM_CONCURRENCY_LIMIT, LLM_QUEUE_WAIT, LLM_RATE_LIMITED
+
+logger = get_logger("osprey")
+
+T = TypeVar("T")
+
+# Seconds of configured rate that a bucket may accumulate as burst
+BURST_SECONDS = 10.0
+# Further decreases within this window count as the same congestion event
+DECREASE_COOLDOWN_SECONDS = 2.0
+LATENCY_DECREASE_FACTOR = 0.9
+RATE_LIMIT_DECREASE_FACTOR = 0.5
+MAX_BACKOFF_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class RateLimitSettings:
+    """Limits for one provider and model, read from ``api.providers.<name>.rate_limits``."""
+
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+    max_concurrency: int = 16
+    min_concurrency: int = 1
+    target_latency_seconds: float | None = None
+    max_rate_limit_retries: int = 3
+
+    @classmethod
+    def from_provider_config(cls, provider_config: dict | None, model_id: str | None) -> "RateLimitSettings":
+        """Build settings from a provider configuration, applying per-model overrides.
+
+        :param provider_config: Provider configuration (``api.providers.<name>``)
+        :param model_id: Model whose ``rate_limits.models`` entry overrides the provider values
+        :return: Settings with defaults for anything not configured
+        """
+        section = dict((provider_config or {}).get("rate_limits") or {})
+        overrides = (section.pop("models", None) or {}).get(model_id) or {}
+        section.update(overrides)
+
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(section) - known)
+        if unknown:
+            logger.warning(f"Ignoring unknown rate_limits settings: {', '.join(unknown)}")
+        settings = cls(**{key: value for key, value in section.items() if key in known})
+        if settings.min_concurrency < 1 or settings.max_concurrency < settings.min_concurrency:
+            raise ValueError("rate_limits requires 1 <= min_concurrency <= max_concurrency")
+        return settings
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations and lets the level go negative.
+
+    A reservation larger than the available amount is granted immediately and
+    returns the time the caller has to wait for the bucket to refill, so
+    callers are served in the order they reserve and a single request larger
+    than the burst size cannot block forever.
+
+    :param rate_per_minute: Refill rate
+    :param burst: Maximum level (default: :data:`BURST_SECONDS` of the rate)
+    :param clock: Monotonic clock, replaceable in tests
+    """
+
+    def __init__(self, rate_per_minute: float, burst: float | None = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = burst if burst is not None else max(1.0, self.rate * BURST_SECONDS)
+        self.level = self.capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """Take ``amount`` and return the seconds to wait before using it."""
+        self._refill()
+        self.level -= amount
+        return 0.0 if self.level >= 0 else -self.level / self.rate
+
+    def refund(self, amount: float) -> None:
+        """Return an unused part of an earlier reservation."""
+        self._refill()
+        self.level = min(self.capacity, self.level + amount)
+
+
+def error_status_code(exc: BaseException) -> int | None:
+    """The HTTP status carried by an exception raised by a provider SDK, if any."""
+    response = getattr(exc, "response", None)
+    for status in (getattr(exc, "status_code", None), getattr(exc, "code", None),
+                   getattr(response, "status_code", None)):
+        if isinstance(status, int) and 100 <= status < 600:
+            return status
+    return None
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Whether an exception raised by a provider SDK means HTTP 429."""
+    if error_status_code(exc) == 429:
+        return True
+    name = type(exc).__name__
+    return "RateLimit" in name or name == "ResourceExhausted"
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """The ``Retry-After`` delay sent with a rate limit error, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        value = float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+    return value if value >= 0 else None
+
+
+class ProviderRateLimiter:
+    """Request/token buckets and an AIMD concurrency limit for one provider and model.
+
+    :param key: Label of the limited model, ``"<provider>/<model_id>"``
+    :param settings: Limits to enforce
+    :param clock: Monotonic clock, replaceable in tests
+    :param sleep: Sleep function, replaceable in tests
+    """
+
+    def __init__(self, key: str, settings: RateLimitSettings,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.key = key
+        self._provider, _, self._model = key.partition("/")
+        self._clock = clock
+        self._sleep = sleep
+        self._cond = threading.Condition()
+        self._queue: deque[object] = deque()
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._last_decrease = -math.inf
+        self.settings = settings
+        self._limit = float(settings.max_concurrency)
+        self._request_bucket: TokenBucket | None = None
+        self._token_bucket: TokenBucket | None = None
+        self.configure(settings)
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return max(self.settings.min_concurrency, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return len(self._queue)
+
+    def configure(self, settings: RateLimitSettings) -> None:
+        """Apply new settings, keeping bucket levels when rates are unchanged."""
+        with self._cond:
+            previous, self.settings = self.settings, settings
+            if self._request_bucket is None or settings.requests_per_minute != previous.requests_per_minute:
+                self._request_bucket = (TokenBucket(settings.requests_per_minute, clock=self._clock)
+                                        if settings.requests_per_minute else None)
+            if self._token_bucket is None or settings.tokens_per_minute != previous.tokens_per_minute:
+                self._token_bucket = (TokenBucket(settings.tokens_per_minute, clock=self._clock)
+                                      if settings.tokens_per_minute else None)
+            self._limit = min(max(self._limit, settings.min_concurrency), settings.max_concurrency)
+            self._publish_limit()
+            self._cond.notify_all()
+
+    def call(self, function: Callable[[], T], tokens: int = 0) -> T:
+        """Run ``function`` once a slot and bucket capacity are available.
+
+        Rate limit errors adjust the limit, pause the model and are retried up
+        to ``max_rate_limit_retries`` times; other errors are raised at once.
+
+        :param function: The provider call
+        :param tokens: Estimated tokens of the call (prompt plus ``max_tokens``)
+        :return: Result of ``function``
+        """
+        attempt, delay = 0, 0.0
+        while True:
+            if delay > 0:
+                self._sleep(delay)
+            self._acquire(tokens)
+            started = self._clock()
+            try:
+                result = function()
+            except Exception as exc:
+                if not is_rate_limit_error(exc):
+                    raise
+                delay = self._on_rate_limited(exc, attempt)
+                if attempt >= self.settings.max_rate_limit_retries:
+                    raise
+                attempt += 1
+                logger.warning(f"{self.key} is rate limited; retry {attempt} of "
+                               f"{self.settings.max_rate_limit_retries} in {delay:.1f}s "
+                               f"(concurrency limit {self.limit})")
+                continue
+            finally:
+                self._release()
+            self._on_success(self._clock() - started)
+            return result
+
+    def reserve_extra(self, tokens: int = 0, wait: bool = True) -> bool:
+        """Reserve request and token budget for an extra attempt of a running call.
+
+        Hedged duplicates and endpoint failovers run inside the concurrency
+        slot of the call they belong to, but each one is another request to
+        the provider and must count against ``requests_per_minute`` and
+        ``tokens_per_minute``.
+
+        :param tokens: Estimated tokens of the attempt
+        :param wait: Wait until the buckets allow the attempt; if False, give
+            the reservation back and return False instead of waiting
+        :return: Whether the attempt may be sent
+        """
+        with self._cond:
+            delay = self._reserve_buckets(tokens)
+            if delay > 0 and not wait:
+                if self._request_bucket is not None:
+                    self._request_bucket.refund(1)
+                if self._token_bucket is not None and tokens:
+                    self._token_bucket.refund(tokens)
+                return False
+        if delay > 0:
+            self._sleep(delay)
+        return True
+
+    def refund_tokens(self, tokens: int) -> None:
+        """Return unused tokens of a finished call's reservation."""
+        if tokens > 0 and self._token_bucket is not None:
+            with self._cond:
+                self._token_bucket.refund(tokens)
+
+    def _acquire(self, tokens: int) -> None:
+        enqueued = self._clock()
+        marker = object()
+        with self._cond:
+            self._queue.append(marker)
+            try:
+                while True:
+                    blocked = self._blocked_until - self._clock()
+                    if blocked <= 0 and self._queue[0] is marker and self._in_flight < self.limit:
+                        break
+                    self._cond.wait(timeout=blocked if blocked > 0 else None)
+            finally:
+                self._queue.remove(marker)
+                self._cond.notify_all()
+            self._in_flight += 1
+            delay = self._reserve_buckets(tokens)
+
+        # Bucket waits hold the slot so later callers queue behind this one
+        if delay > 0:
+            self._sleep(delay)
+        LLM_QUEUE_WAIT.observe(self._clock() - enqueued, provider=self._provider, model=self._model)
+
+    def _reserve_buckets(self, tokens: int) -> float:
+        """Reserve one request and ``tokens``; return the wait (caller holds the condition)."""
+        delay = 0.0
+        if self._request_bucket is not None:
+            delay = self._request_bucket.reserve(1)
+        if self._token_bucket is not None and tokens:
+            delay = max(delay, self._token_bucket.reserve(tokens))
+        return delay
+
+    def _release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def _on_success(self, latency: float) -> None:
+        with self._cond:
+            target = self.settings.target_latency_seconds
+            if target and latency > target:
+                self._decrease(LATENCY_DECREASE_FACTOR, f"latency {latency:.1f}s above {target}s")
+            else:
+                self._limit = min(self.settings.max_concurrency, self._limit + 1.0 / self._limit)
+                self._publish_limit()
+            self._cond.notify_all()
+
+    def _on_rate_limited(self, exc: BaseException, attempt: int) -> float:
+        LLM_RATE_LIMITED.inc(provider=self._provider, model=self._model)
+        delay = retry_after_seconds(exc)
+        if delay is None:
+            delay = min(MAX_BACKOFF_SECONDS, 2.0 ** attempt)
+        with self._cond:
+            self._decrease(RATE_LIMIT_DECREASE_FACTOR, "provider returned 429")
+            self._blocked_until = max(self._blocked_until, self._clock() + delay)
+        return delay
+
+    def _decrease(self, factor: float, reason: str) -> None:
+        now = self._clock()
+        if now - self._last_decrease < DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self._limit = max(float(self.settings.min_concurrency), self._limit * factor)
+        self._publish_limit()
+        if self.limit != previous:
+            logger.info(f"Reduced {self.key} concurrency limit to {self.limit} ({reason})")
+
+    def _publish_limit(self) -> None:
+        LLM_CONCURRENCY_LIMIT.set(self.limit, provider=self._provider, model=self._model)
+
+
+_limiters: dict[str, ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model_id: str | None,
+                     provider_config: dict[str, Any] | None = None) -> ProviderRateLimiter:
+    """Get the process-wide limiter for a provider and model.
+
+    The limiter is created on first use and reconfigured when the provider's
+    ``rate_limits`` change (for example after a configuration reload).
+
+    :param provider: Provider name
+    :param model_id: Model identifier
+    :param provider_config: Provider configuration (default: loaded from config)
+    :return: Shared limiter for ``provider/model_id``
+    """
+    if provider_config is None:
+        provider_config = get_provider_config(provider)
+    settings = RateLimitSettings.from_provider_config(provider_config, model_id)
+    key = f"{provider}/{model_id}"
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = ProviderRateLimiter(key, settings)
+            return limiter
+    if limiter.settings != settings:
+        limiter.configure(settings)
+    return limiter
@@ -0,0 +1,285 @@
+"""Local Repair of Almost-Valid Structured Output.
+
+Models asked for an ``output_model`` often return JSON that is nearly right:
+wrapped in a markdown fence, followed by an explanation, cut off before the
+last bracket, or with ``"Save"`` where the schema expects ``"save"``. Without
+repair, such an answer fails validation, goes through ``classify_error`` and
+costs a router retry with another full LLM call.
+
+:func:`parse_structured_output` validates the text strictly first. If that
+fails, it applies these repair strategies cumulatively before giving up:
+
+- ``strip_fences``: use the content of a markdown code fence
+- ``extract_json``: drop prose before the first ``{``/``[`` and after its match
+- ``balance_brackets``: close an unterminated string and missing brackets,
+  drop a dangling comma
+- ``lenient_parse``: accept trailing commas, single quotes, unquoted keys and
+  Python literals
+- ``schema_coercion``: coerce values against the model: enum and ``Literal``
+  values case-insensitively, numeric and boolean strings, single values for
+  lists, and field names that differ only in case
+
+Every strategy that was needed for a successful repair is counted in
+``osprey_structured_output_repairs_total{strategy=...}``; unrepairable output
+is counted as ``failed`` and raises the original validation error.
+"""
+
+import ast
+import enum
+import json
+import re
+import types
+import typing
+from typing import Any, Literal, Union
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from osprey.utils.logger import get_logger
+from osprey.utils.metrics import STRUCTURED_OUTPUT_REPAIRS
+
+logger = get_logger("osprey")
+
+_FENCE_PATTERN = re.compile(r"```[A-Za-z0-9_-]*[ \t]*\n?(.*?)(?:```|$)", re.DOTALL)
+_TRAILING_COMMA_PATTERN = re.compile(r",(\s*[}\]])")
+_UNQUOTED_KEY_PATTERN = re.compile(r"([{,]\s*)([A-Za-z_][A-Za-z0-9_]*)(\s*:)")
+_JSON_LITERALS = {"true": "True", "false": "False", "null": "None"}
+_JSON_LITERAL_PATTERN = re.compile(r"\b(true|false|null)\b")
+_CLOSERS = {"{": "}", "[": "]"}
+_TRUE_STRINGS = {"true", "yes", "y", "1"}
+_FALSE_STRINGS = {"false", "no", "n", "0"}
+
+
+def parse_structured_output(text: str, output_model: type[BaseModel]) -> BaseModel:
+    """Validate ``text`` as ``output_model``, repairing common defects locally.
+
+    :param text: Raw model output expected to contain JSON for ``output_model``
+    :param output_model: Pydantic model to validate against
+    :return: Validated model instance
+    :raises pydantic.ValidationError: If the text cannot be repaired
+    """
+    try:
+        return output_model.model_validate_json(text)
+    except ValidationError as strict_error:
+        result = repair_structured_output(text, output_model)
+        if result is None:
+            STRUCTURED_OUTPUT_REPAIRS.inc(strategy="failed")
+            raise strict_error
+        return result
+
+
+def repair_structured_output(text: str, output_model: type[BaseModel]) -> BaseModel | None:
+    """Apply the repair strategies to ``text`` and return the first valid result.
+
+    :param text: Raw model output
+    :param output_model: Pydantic model to validate against
+    :return: Validated model instance, or None if no strategy succeeds
+    """
+    candidates = [([], text.strip())]
+    for name, fix in (("strip_fences", _strip_fences),
+                      ("extract_json", _extract_json),
+                      ("balance_brackets", _balance_brackets)):
+        steps, current = candidates[-1]
+        fixed = fix(current)
+        if fixed != current:
+            candidates.append(([*steps, name], fixed))
+
+    for steps, candidate in candidates:
+        for parse_steps, loads in (([], json.loads), (["lenient_parse"], _lenient_loads)):
+            try:
+                data = loads(candidate)
+            except (ValueError, SyntaxError, RecursionError):
+                continue
+            applied = [*steps, *parse_steps]
+            try:
+                result = output_model.model_validate(data)
+            except ValidationError:
+                try:
+                    result = output_model.model_validate(_coerce(data, output_model))
+                except ValidationError:
+                    continue
+                applied.append("schema_coercion")
+            if not applied:
+                return result
+            for strategy in applied:
+                STRUCTURED_OUTPUT_REPAIRS.inc(strategy=strategy)
+            logger.debug(f"Repaired {output_model.__name__} output with {', '.join(applied)}")
+            return result
+    return None
+
+
+# ----------------------------------------------------------------------
+# Text strategies
+# ----------------------------------------------------------------------
+
+def _strip_fences(text: str) -> str:
+    match = _FENCE_PATTERN.search(text)
+    return match.group(1).strip() if match else text
+
+
+def _extract_json(text: str) -> str:
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if not starts:
+        return text
+    start = min(starts)
+    end = _matching_end(text, start)
+    return text[start:end].strip()
+
+
+def _matching_end(text: str, start: int) -> int:
+    """Index after the bracket closing ``text[start]`` (end of text if unterminated)."""
+    depth, in_string, escaped = 0, False, False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+    return len(text)
+
+
+def _balance_brackets(text: str) -> str:
+    stack, in_string, escaped = [], False, False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            stack.append(_CLOSERS[char])
+        elif char in "}]" and stack and stack[-1] == char:
+            stack.pop()
+    if not stack and not in_string:
+        return text
+    repaired = text + ('"' if in_string else "")
+    repaired = repaired.rstrip()
+    if repaired.endswith(","):
+        repaired = repaired[:-1]
+    elif repaired.endswith(":"):
+        repaired += " null"
+    return repaired + "".join(reversed(stack))
+
+
+def _lenient_loads(text: str) -> Any:
+    cleaned = _TRAILING_COMMA_PATTERN.sub(r"\1", text)
+    try:
+        return json.loads(cleaned)
+    except ValueError:
+        pass
+    quoted_keys = _UNQUOTED_KEY_PATTERN.sub(r'\1"\2"\3', cleaned)
+    try:
+        return json.loads(quoted_keys)
+    except ValueError:
+        pass
+    python_literal = _JSON_LITERAL_PATTERN.sub(lambda m: _JSON_LITERALS[m.group(1)], quoted_keys)
+    return ast.literal_eval(python_literal)
+
+
+# ----------------------------------------------------------------------
+# Schema-guided coercion
+# ----------------------------------------------------------------------
+
+def _coerce(value: Any, annotation: Any) -> Any:
+    """Best-effort conversion of parsed JSON ``value`` towards ``annotation``."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _coerce_model(value, annotation)
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin in (Union, types.UnionType):
+        options = [arg for arg in args if arg is not type(None)]
+        if value is None and len(options) < len(args):
+            return None
+        for option in options:
+            candidate = _coerce(value, option)
+            try:
+                TypeAdapter(option).validate_python(candidate)
+                return candidate
+            except ValidationError:
+                continue
+        return value
+    if origin is Literal:
+        return _match_choice(value, list(args))
+    if origin in (list, set, tuple, frozenset) or annotation in (list, set, tuple):
+        items = value if isinstance(value, list) else [value]
+        item_type = args[0] if args and origin is not tuple else Any
+        return [_coerce(item, item_type) for item in items]
+    if origin is dict and isinstance(value, dict) and len(args) == 2:
+        return {key: _coerce(item, args[1]) for key, item in value.items()}
+    if origin is typing.Annotated:
+        return _coerce(value, args[0])
+
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        members = list(annotation)
+        matched = _match_choice(value, [member.value for member in members])
+        if matched is value and isinstance(value, str):
+            by_name = {member.name.lower(): member.value for member in members}
+            return by_name.get(value.strip().lower(), value)
+        return matched
+    if annotation is bool and isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    if annotation in (int, float) and isinstance(value, str):
+        try:
+            number = float(value.strip().rstrip("%"))
+        except ValueError:
+            return value
+        return int(number) if annotation is int and number.is_integer() else number
+    if annotation is str and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+def _coerce_model(value: Any, model: type[BaseModel]) -> Any:
+    if not isinstance(value, dict):
+        # A bare value for a single-field model, e.g. "save" for {"operation": ...}
+        required = [name for name, field in model.model_fields.items() if field.is_required()]
+        if len(model.model_fields) == 1 or len(required) == 1:
+            name = required[0] if required else next(iter(model.model_fields))
+            value = {name: value}
+        else:
+            return value
+
+    names = {}
+    for name, field in model.model_fields.items():
+        names[name.lower()] = name
+        if field.alias:
+            names[field.alias.lower()] = field.alias
+    coerced = {}
+    for key, item in value.items():
+        target = names.get(str(key).lower().replace("-", "_").replace(" ", "_"), key)
+        field = model.model_fields.get(target)
+        coerced[target] = _coerce(item, field.annotation) if field is not None else item
+    return coerced
+
+
+def _match_choice(value: Any, choices: list) -> Any:
+    if value in choices:
+        return value
+    if isinstance(value, str):
+        normalized = value.strip().lower()
+        for choice in choices:
+            if isinstance(choice, str) and choice.lower() == normalized:
+                return choice
+            if not isinstance(choice, str) and str(choice).lower() == normalized:
+                return choice
+    return value
@@ -59,7 +59,7 @@ Examples:
    :class:`applications.als_assistant.framework_prompts.ALSPromptProvider` : Example application customization
 """
 
-from .base import FrameworkPromptBuilder
+from .base import FrameworkPromptBuilder, invalidate_prompt_cache
 from .loader import get_framework_prompts
 
-__all__ = ["FrameworkPromptBuilder", "get_framework_prompts"]
+__all__ = ["FrameworkPromptBuilder", "get_framework_prompts", "invalidate_prompt_cache"]
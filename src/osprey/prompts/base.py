@@ -12,19 +12,42 @@ contextually appropriate prompts.
 import os
 import textwrap
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from osprey.base import TaskClassifierGuide
-from osprey.utils.config import get_agent_dir, get_config_value
+from osprey.utils.config import get_agent_dir, get_config_generation, get_config_value
 from osprey.utils.logger import get_logger
+from osprey.utils.trace_recorder import get_trace_recorder
 
 if TYPE_CHECKING:
     from osprey.base import BaseExample, OrchestratorGuide
 logger = get_logger("osprey")
 
+# Bumped by invalidate_prompt_cache() (e.g. on registry initialization or reset)
+_prompt_cache_generation = 0
 
+# Maximum compiled sections kept per builder (e.g. distinct capability sets)
+_MAX_COMPILED_SECTIONS = 64
 
+# (cache token, development.prompts settings) for debug_print_prompt()
+_debug_settings_cache: tuple[tuple[int, int], dict[str, Any]] | None = None
+
+
+def invalidate_prompt_cache() -> None:
+    """Discard compiled prompt sections and cached prompt debug settings.
+
+    Called when the registry is (re)initialized so that capability guides and
+    prompt providers are recompiled. Configuration reloads are detected
+    automatically through :func:`~osprey.utils.config.get_config_generation`.
+    """
+    global _prompt_cache_generation
+    _prompt_cache_generation += 1
+
+
+def _prompt_cache_token() -> tuple[int, int]:
+    return (_prompt_cache_generation, get_config_generation())
 
 
 class FrameworkPromptBuilder(ABC):
@@ -223,6 +246,62 @@ class FrameworkPromptBuilder(ABC):
         """
         return None
 
+    def _get_examples_cache_key(self, **context) -> Hashable | None:
+        """Return a cache key for the formatted examples, or None if they must be rebuilt.
+
+        Examples may depend on the runtime context, so they are not cached by
+        default. Builders whose examples are static (or depend only on hashable
+        context values) can return a key to have the formatted examples compiled
+        once per key.
+
+        :param context: Runtime context passed to get_system_instructions()
+        :return: Hashable cache key or None to disable caching
+        """
+        return None
+
+    def _compiled_section(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Return a prompt section compiled once per key.
+
+        Compiled sections are kept per builder instance and discarded when the
+        registry or configuration changes (see :func:`invalidate_prompt_cache`).
+
+        :param key: Hashable identifier of the section and its static inputs
+        :param build: Callable producing the section on a cache miss
+        :return: Cached or freshly built section
+        """
+        token = _prompt_cache_token()
+        cache = self.__dict__.get('_compiled_sections')
+        if cache is None or cache[0] != token:
+            cache = (token, {})
+            self.__dict__['_compiled_sections'] = cache
+
+        sections = cache[1]
+        if key not in sections:
+            if len(sections) >= _MAX_COMPILED_SECTIONS:
+                sections.pop(next(iter(sections)))
+            sections[key] = build()
+        return sections[key]
+
+    def get_static_prompt(self) -> str:
+        """Return role, task and instructions joined, compiled once per builder.
+
+        This is the part of the system prompt that does not depend on the
+        request, so it is built once and reused until the registry or
+        configuration changes.
+
+        :return: Static prompt prefix
+        :rtype: str
+        """
+        def build() -> str:
+            sections = [self.get_role_definition()]
+            task = self.get_task_definition()
+            if task:
+                sections.append(task)
+            sections.append(self.get_instructions())
+            return "\n\n".join(sections)
+
+        return self._compiled_section("static", build)
+
     def get_system_instructions(self, **context) -> str:
         """Compose and return complete system instructions for agent/LLM configuration.
 
@@ -231,6 +310,10 @@ class FrameworkPromptBuilder(ABC):
         dynamic context. It handles optional components gracefully and automatically
         integrates with the framework's debug system for development visibility.
 
+        Role, task and instructions are compiled once per builder (see
+        :meth:`get_static_prompt`); examples are compiled too when
+        :meth:`_get_examples_cache_key` returns a key.
+
         The composition follows this structure:
         1. Role definition (always present)
         2. Task definition (optional)
@@ -268,25 +351,19 @@ class FrameworkPromptBuilder(ABC):
            :meth:`debug_print_prompt` : Debug output for prompt development
            :meth:`_format_examples` : Custom example formatting override
         """
-        sections = []
-
-        # Role (always present)
-        sections.append(self.get_role_definition())
-
-        # Task (optional)
-        task = self.get_task_definition()
-        if task:
-            sections.append(task)
-
-        # Instructions (always present)
-        instructions = self.get_instructions()
-        sections.append(instructions)
+        # Role, task and instructions (compiled once)
+        sections = [self.get_static_prompt()]
 
         # Examples (optional, can be static or dynamic)
-        examples = self._get_examples(**context)
-        if examples:
-            formatted_examples = self._format_examples(examples)
-            sections.append(f"EXAMPLES:\n{formatted_examples}")
+        examples_key = self._get_examples_cache_key(**context)
+        if examples_key is None:
+            examples_section = self._build_examples_section(**context)
+        else:
+            examples_section = self._compiled_section(
+                ("examples", examples_key), lambda: self._build_examples_section(**context)
+            )
+        if examples_section:
+            sections.append(examples_section)
 
         # Dynamic context (optional)
         dynamic_context = self._get_dynamic_context(**context)
@@ -300,6 +377,42 @@ class FrameworkPromptBuilder(ABC):
 
         return final_prompt
 
+    def _build_examples_section(self, **context) -> str | None:
+        examples = self._get_examples(**context)
+        if not examples:
+            return None
+        return f"EXAMPLES:\n{self._format_examples(examples)}"
+
+    def get_prompt_parts(self, **context) -> tuple[str, str]:
+        """Split the system prompt into a static prefix and a request-specific suffix.
+
+        The prefix holds everything that is identical across requests (role,
+        task, instructions, examples) so it can be sent as a cacheable system
+        prompt; the suffix holds the dynamic context and belongs in the user
+        message. Builders that assemble their prompt differently should
+        override this together with :meth:`get_system_instructions`.
+
+        :param context: Runtime context data passed to dynamic methods
+        :type context: dict
+        :return: Tuple of (static prefix, dynamic suffix); the suffix may be empty
+        :rtype: tuple[str, str]
+        """
+        prefix_sections = [self.get_static_prompt()]
+        examples_key = self._get_examples_cache_key(**context)
+        if examples_key is None:
+            examples_section = self._build_examples_section(**context)
+        else:
+            examples_section = self._compiled_section(
+                ("examples", examples_key), lambda: self._build_examples_section(**context)
+            )
+        if examples_section:
+            prefix_sections.append(examples_section)
+
+        prefix = "\n\n".join(prefix_sections)
+        suffix = self._get_dynamic_context(**context) or ""
+        self.debug_print_prompt(f"{prefix}\n\n{suffix}" if suffix else prefix)
+        return prefix, suffix
+
     def debug_print_prompt(self, prompt: str, name: str | None = None) -> None:
         """Output prompt content for debugging and development visibility.
 
@@ -556,8 +669,9 @@ def debug_print_prompt(prompt: str, name: str, builder_class: str | None = None)
        :func:`get_agent_dir` : Directory management for file output
     """
     try:
-        development_config = get_config_value("development", {})
-        prompts_config = development_config.get("prompts", {})
+        prompts_config = _get_prompt_debug_settings()
+        if not prompts_config.get("show_all", False) and not prompts_config.get("print_all", False):
+            return
 
         # Console output
         if prompts_config.get("show_all", False):
@@ -576,7 +690,6 @@ def debug_print_prompt(prompt: str, name: str, builder_class: str | None = None)
         # File output
         if prompts_config.get("print_all", False):
             prompts_dir = get_agent_dir('prompts_dir')
-            os.makedirs(prompts_dir, exist_ok=True)
 
             # Determine filename based on latest_only flag
             latest_only = prompts_config.get("latest_only", True)
@@ -599,12 +712,21 @@ def debug_print_prompt(prompt: str, name: str, builder_class: str | None = None)
                 # Latest Only: {latest_only}
                 """).strip()
 
-            with open(prompt_file_path, "w") as f:
-                f.write(header + "\n\n\n" + prompt)
-            logger.debug(f"Prompt written to {prompt_file_path}")
+            # Written by the trace recorder thread, off the request path
+            get_trace_recorder().write_file_async(prompt_file_path, header + "\n\n\n" + prompt)
 
     except Exception as e:
         # Silently continue if config is not available or there's an error
         # This ensures the debug function never breaks the main functionality
         logger.warning(f"Error displaying prompt: {e}")
         pass
+
+
+def _get_prompt_debug_settings() -> dict[str, Any]:
+    """Return ``development.prompts`` settings, re-read only after config changes."""
+    global _debug_settings_cache
+    token = _prompt_cache_token()
+    if _debug_settings_cache is None or _debug_settings_cache[0] != token:
+        development_config = get_config_value("development", {}) or {}
+        _debug_settings_cache = (token, development_config.get("prompts", {}) or {})
+    return _debug_settings_cache[1]
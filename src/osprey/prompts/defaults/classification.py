@@ -63,10 +63,8 @@ class DefaultClassificationPromptBuilder(FrameworkPromptBuilder):
         """Get system instructions for task classification agent configuration."""
         sections = []
 
-        # Role and instructions
-        sections.append(self.get_role_definition())
-        sections.append(self.get_task_definition())
-        sections.append(self.get_instructions())
+        # Role and instructions (compiled once)
+        sections.append(self.get_static_prompt())
 
         # Dynamic context
         dynamic_context = self._get_dynamic_context(
@@ -85,3 +83,25 @@ class DefaultClassificationPromptBuilder(FrameworkPromptBuilder):
         self.debug_print_prompt(final_prompt)
 
         return final_prompt
+
+    def get_prompt_parts(self,
+                         capability_instructions: str = "",
+                         classifier_examples: str = "",
+                         context: dict | None = None,
+                         previous_failure: str | None = None,
+                         **kwargs) -> tuple[str, str]:
+        """Split the classification prompt into a per-capability prefix and a per-request suffix."""
+        prefix_sections = [self.get_static_prompt()]
+        capability_section = self._get_dynamic_context(
+            capability_instructions=capability_instructions,
+            classifier_examples=classifier_examples,
+        )
+        if capability_section:
+            prefix_sections.append(capability_section)
+
+        prefix = "\n\n".join(prefix_sections)
+        suffix = self._get_dynamic_context(context=context, previous_failure=previous_failure, **kwargs)
+
+        self.debug_print_prompt(f"{prefix}\n\n{suffix}" if suffix else prefix)
+
+        return prefix, suffix
@@ -184,6 +184,10 @@ class DefaultMemoryExtractionPromptBuilder(FrameworkPromptBuilder):
         """Get generic memory extraction examples."""
         return self.examples
 
+    def _get_examples_cache_key(self, **kwargs):
+        """Examples are static, so they are formatted once."""
+        return ()
+
     def _format_examples(self, examples: list[MemoryExtractionExample]) -> str:
         """Format multiple MemoryExtractionExample objects for inclusion in prompts."""
         return MemoryExtractionExample.join(examples, add_numbering=True)
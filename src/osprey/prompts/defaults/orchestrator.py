@@ -80,21 +80,66 @@ class DefaultOrchestratorPromptBuilder(FrameworkPromptBuilder):
         Returns:
             Complete orchestrator prompt text
         """
+        base_prompt, request_sections, capability_sections = self._build_prompt_sections(
+            active_capabilities, context_manager, task_depends_on_chat_history,
+            task_depends_on_user_memory, error_context
+        )
+
+        # Combine all sections
+        final_prompt = "\n\n".join([base_prompt, *request_sections, *capability_sections])
+
+        # Debug: Print prompt if enabled (same as base class)
+        self.debug_print_prompt(final_prompt)
+
+        return final_prompt
+
+    def get_prompt_parts(
+        self,
+        active_capabilities: list[BaseCapability] = None,
+        context_manager: ContextManager = None,
+        task_depends_on_chat_history: bool = False,
+        task_depends_on_user_memory: bool = False,
+        error_context: str | None = None,
+        **kwargs
+    ) -> tuple[str, str]:
+        """
+        Split the orchestrator prompt into a static prefix and a per-request suffix.
+
+        The prefix (instructions and capability guidelines) only changes with the
+        set of active capabilities; context reuse guidance, replanning context and
+        available context keys go into the suffix.
+
+        Returns:
+            Tuple of (static prefix, request-specific suffix)
+        """
+        base_prompt, request_sections, capability_sections = self._build_prompt_sections(
+            active_capabilities, context_manager, task_depends_on_chat_history,
+            task_depends_on_user_memory, error_context
+        )
+
+        prefix = "\n\n".join([base_prompt, *capability_sections])
+        suffix = "\n\n".join(request_sections)
+
+        self.debug_print_prompt(f"{prefix}\n\n{suffix}" if suffix else prefix)
+
+        return prefix, suffix
+
+    def _build_prompt_sections(
+        self,
+        active_capabilities: list[BaseCapability] | None,
+        context_manager: ContextManager | None,
+        task_depends_on_chat_history: bool,
+        task_depends_on_user_memory: bool,
+        error_context: str | None
+    ) -> tuple[str, list[str], tuple[str, ...]]:
+        """Build the base prompt, request-specific sections and capability sections."""
         if not active_capabilities:
             active_capabilities = []
 
-        # Build the main prompt sections
-        prompt_sections = []
+        # 1. Base orchestrator prompt (role, task, instructions; compiled once)
+        base_prompt = self.get_static_prompt()
 
-        # 1. Add base orchestrator prompt (role, task, instructions)
-        # Build directly without textwrap.dedent to avoid indentation issues
-        base_prompt_parts = [
-            self.get_role_definition(),
-            self.get_task_definition(),
-            self.get_instructions()
-        ]
-        base_prompt = "\n\n".join(base_prompt_parts)
-        prompt_sections.append(base_prompt)
+        request_sections = []
 
         # 2. Add context reuse guidance if task builds on previous context
         context_guidance = self._build_context_reuse_guidance(
@@ -102,7 +147,7 @@ class DefaultOrchestratorPromptBuilder(FrameworkPromptBuilder):
             task_depends_on_user_memory
         )
         if context_guidance:
-            prompt_sections.append(context_guidance)
+            request_sections.append(context_guidance)
 
         # 3. Add error context for replanning if available
         if error_context:
@@ -120,25 +165,25 @@ class DefaultOrchestratorPromptBuilder(FrameworkPromptBuilder):
                 - Learn from the technical details and suggestions provided in the error context
                 - Adapt the execution strategy based on the specific failure mode identified""").strip()
 
-            prompt_sections.append(error_section)
+            request_sections.append(error_section)
 
         # 4. Add context information if available
         if context_manager and context_manager.get_raw_data():
             context_section = self._build_context_section(context_manager)
             if context_section:
-                prompt_sections.append(context_section)
-
-        # 5. Add capability-specific prompts with examples
-        capability_sections = self._build_capability_sections(active_capabilities)
-        prompt_sections.extend(capability_sections)
+                request_sections.append(context_section)
 
-        # Combine all sections
-        final_prompt = "\n\n".join(prompt_sections)
-
-        # Debug: Print prompt if enabled (same as base class)
-        self.debug_print_prompt(final_prompt)
+        # 5. Capability-specific prompts with examples (compiled once per capability set)
+        capability_key = tuple(
+            getattr(capability, 'name', None) or capability.__class__.__name__
+            for capability in active_capabilities
+        )
+        capability_sections = self._compiled_section(
+            ("capabilities", capability_key),
+            lambda: tuple(self._build_capability_sections(active_capabilities))
+        )
 
-        return final_prompt
+        return base_prompt, request_sections, capability_sections
 
     def _build_context_reuse_guidance(
         self,
@@ -253,10 +253,10 @@ Core requirements:
         :param retrieval_result: Optional data retrieval result
         :return: Complete prompt for task extraction
         """
-        examples_text = "\n\n".join([
+        examples_text = self._compiled_section("examples", lambda: "\n\n".join([
             f"## Example {i+1}:\n{example.format_for_prompt()}"
             for i, example in enumerate(self.examples)
-        ])
+        ]))
 
         # Format the actual chat history using native message formatter
         chat_formatted = ChatHistoryFormatter.format_for_llm(messages)
@@ -101,6 +101,7 @@ import importlib
 import inspect
 import json
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
@@ -110,6 +111,8 @@ from osprey.utils.config import get_agent_dir, get_config_value
 from osprey.utils.logger import get_logger
 
 from .base import RegistryConfig, RegistryConfigProvider
+from .manifest import RegistryManifestCache, compute_manifest_key
+from .profiling import ComponentLoadRecord, measure_component_load
 
 # Import for prompt loading
 try:
@@ -126,6 +129,19 @@ if TYPE_CHECKING:
 
 logger = get_logger(name='REGISTRY', color='sky_blue2')
 
+# Component types whose modules are imported on first access when lazy loading is enabled.
+# Framework prompt providers are always loaded eagerly.
+LAZY_COMPONENT_TYPES = (
+    'context_classes',
+    'data_sources',
+    'providers',
+    'core_nodes',
+    'services',
+    'capabilities',
+    'domain_analyzers',
+    'execution_policy_analyzers',
+)
+
 class RegistryManager:
     """Centralized registry for all Osprey Agentic Framework components.
 
@@ -154,7 +170,8 @@ class RegistryManager:
        can be accessed. Failed initialization will raise RegistryError.
     """
 
-    def __init__(self, registry_path: str | None = None):
+    def __init__(self, registry_path: str | None = None, lazy_loading: bool = False,
+                 manifest_cache_dir: str | None = None, manifest_config: Any = None):
         """Initialize registry manager with optional application registry.
 
         Creates a new registry manager instance that builds configuration from
@@ -189,6 +206,16 @@ class RegistryManager:
             relative (e.g., "./my_app/registry.py", "./src/app/registry.py").
             If None, only framework registry is loaded (framework-only mode).
         :type registry_path: str, optional
+        :param lazy_loading: Defer importing capabilities, nodes, providers, services,
+            data sources and analyzers until they are first accessed. :meth:`initialize`
+            then only registers them from their registration metadata.
+        :type lazy_loading: bool
+        :param manifest_cache_dir: Directory for the on-disk manifest cache. When set,
+            the merged configuration is reused from the cache as long as the registry
+            files, framework version and ``manifest_config`` are unchanged.
+        :type manifest_cache_dir: str, optional
+        :param manifest_config: Configuration data included in the manifest cache key
+        :type manifest_config: Any
         :raises RegistryError: If registry cannot be loaded or is invalid
         :raises ConfigurationError: If registry configuration is invalid
 
@@ -259,8 +286,66 @@ class RegistryManager:
         # Store provider exclusions for deferred checking (names are introspected after loading)
         self._excluded_provider_names = []
 
+        # Lazy loading: registrations not yet imported, by component type and name
+        self.lazy_loading = lazy_loading
+        self._pending: dict[str, dict[str, Any]] = {t: {} for t in LAZY_COMPONENT_TYPES}
+        self._registration_order: dict[str, list[str]] = {t: [] for t in LAZY_COMPONENT_TYPES}
+        self._load_lock = threading.RLock()
+
+        # Import time, new modules and memory per loaded component (osprey registry profile)
+        self.load_profile: list[ComponentLoadRecord] = []
+
         # Build complete configuration by merging framework + applications
-        self.config = self._build_merged_configuration()
+        self.manifest_cache = RegistryManifestCache(manifest_cache_dir) if manifest_cache_dir else None
+        self.manifest_key: str | None = None
+        self.config_from_cache = False
+        self.config = self._load_merged_configuration(manifest_config)
+
+    def _load_merged_configuration(self, manifest_config: Any = None) -> RegistryConfig:
+        """Return the merged configuration from the manifest cache, building it on a miss."""
+        if self.manifest_cache is None:
+            return self._build_merged_configuration()
+
+        try:
+            self.manifest_key = compute_manifest_key(self.registry_path, manifest_config)
+        except OSError as e:
+            # Missing registry file: let the regular build report it
+            logger.debug(f"Registry manifest cache unavailable: {e}")
+            return self._build_merged_configuration()
+
+        payload = self.manifest_cache.load(self.manifest_key)
+        if payload is not None:
+            if self.registry_path:
+                # Application modules must stay importable without executing registry.py
+                self._configure_application_path(Path(self.registry_path).resolve())
+            self._excluded_provider_names = list(payload['excluded_provider_names'])
+            self.config_from_cache = True
+            logger.info(f"Loaded merged registry configuration from {self.manifest_cache.path}")
+            return payload['config']
+
+        config = self._build_merged_configuration()
+        self.manifest_cache.save(
+            self.manifest_key,
+            config=config,
+            excluded_provider_names=list(self._excluded_provider_names),
+        )
+        return config
+
+    def export_is_current(self, output_dir: str) -> bool:
+        """Check whether ``output_dir`` already holds the export of this exact configuration.
+
+        :param output_dir: Registry export directory
+        :return: True if the manifest cache recorded an export of the current
+            configuration to ``output_dir`` and the export file still exists
+        """
+        if self.manifest_cache is None or self.manifest_key is None:
+            return False
+        payload = self.manifest_cache.load(self.manifest_key)
+        return (
+            payload is not None
+            and payload.get('export_dir') == str(output_dir)
+            and (Path(output_dir) / "registry_export.json").exists()
+        )
 
     def _build_merged_configuration(self) -> RegistryConfig:
         """Build configuration from framework and/or application registry.
@@ -473,52 +558,7 @@ class RegistryManager:
         # We detect the project structure and add the appropriate directory.
         # ============================================================================
 
-        # Detect project structure - most generated projects use src/ directory
-        # Example: ./src/app_name/registry.py → need to add ./src/ to sys.path
-        app_dir = path.parent  # Directory containing registry.py (e.g., ./src/app_name/)
-        project_root = app_dir.parent  # One level up (e.g., ./src/ or project root)
-
-        search_dir = None
-        detection_reason = None
-
-        # Pattern 1: Registry inside src/ directory (most common for generated projects)
-        # Path: ./src/app_name/registry.py → Add ./src/ to sys.path
-        if project_root.name == 'src':
-            search_dir = project_root
-            detection_reason = "registry is in src/ directory structure"
-
-        # Pattern 2: Registry elsewhere but src/ directory exists
-        # Path: ./app_name/registry.py but ./src/ exists → Add ./src/ to sys.path
-        elif (project_root / 'src').exists() and (project_root / 'src').is_dir():
-            search_dir = project_root / 'src'
-            detection_reason = "src/ directory exists in project root"
-
-        # Pattern 3: Flat structure - registry at app root
-        # Path: ./app_name/registry.py (no src/) → Add ./app_name/ to sys.path
-        else:
-            search_dir = app_dir
-            detection_reason = "flat project structure (no src/ directory)"
-
-        # Add to sys.path if not already present (deduplication)
-        search_dir_str = str(search_dir.resolve())
-        if search_dir_str not in sys.path:
-            sys.path.insert(0, search_dir_str)
-            logger.info(
-                f"Registry: Added {search_dir_str} to sys.path "
-                f"({detection_reason})"
-            )
-            logger.debug(
-                f"Registry: Path detection details:\n"
-                f"  - Registry file: {path}\n"
-                f"  - App directory: {app_dir}\n"
-                f"  - Project root: {project_root}\n"
-                f"  - Added to sys.path: {search_dir_str}"
-            )
-        else:
-            logger.debug(
-                f"Registry: {search_dir_str} already in sys.path "
-                f"({detection_reason})"
-            )
+        self._configure_application_path(path)
 
         # Load module from file using importlib.util
         try:
@@ -594,6 +634,60 @@ class RegistryManager:
             ) from e
 
 
+    def _configure_application_path(self, path: "Path") -> None:
+        """Add the directory containing the application's packages to sys.path.
+
+        :param path: Resolved path of the application registry file
+        """
+        import sys
+
+        # Detect project structure - most generated projects use src/ directory
+        # Example: ./src/app_name/registry.py → need to add ./src/ to sys.path
+        app_dir = path.parent  # Directory containing registry.py (e.g., ./src/app_name/)
+        project_root = app_dir.parent  # One level up (e.g., ./src/ or project root)
+
+        search_dir = None
+        detection_reason = None
+
+        # Pattern 1: Registry inside src/ directory (most common for generated projects)
+        # Path: ./src/app_name/registry.py → Add ./src/ to sys.path
+        if project_root.name == 'src':
+            search_dir = project_root
+            detection_reason = "registry is in src/ directory structure"
+
+        # Pattern 2: Registry elsewhere but src/ directory exists
+        # Path: ./app_name/registry.py but ./src/ exists → Add ./src/ to sys.path
+        elif (project_root / 'src').exists() and (project_root / 'src').is_dir():
+            search_dir = project_root / 'src'
+            detection_reason = "src/ directory exists in project root"
+
+        # Pattern 3: Flat structure - registry at app root
+        # Path: ./app_name/registry.py (no src/) → Add ./app_name/ to sys.path
+        else:
+            search_dir = app_dir
+            detection_reason = "flat project structure (no src/ directory)"
+
+        # Add to sys.path if not already present (deduplication)
+        search_dir_str = str(search_dir.resolve())
+        if search_dir_str not in sys.path:
+            sys.path.insert(0, search_dir_str)
+            logger.info(
+                f"Registry: Added {search_dir_str} to sys.path "
+                f"({detection_reason})"
+            )
+            logger.debug(
+                f"Registry: Path detection details:\n"
+                f"  - Registry file: {path}\n"
+                f"  - App directory: {app_dir}\n"
+                f"  - Project root: {project_root}\n"
+                f"  - Added to sys.path: {search_dir_str}"
+            )
+        else:
+            logger.debug(
+                f"Registry: {search_dir_str} already in sys.path "
+                f"({detection_reason})"
+            )
+
     def _apply_framework_exclusions(self, merged: RegistryConfig, exclusions: dict[str, list[str]], app_name: str) -> None:
         """Apply framework component exclusions to the merged registry configuration.
 
@@ -884,6 +978,10 @@ class RegistryManager:
             self._initialized = True
             logger.info(self._get_initialization_summary())
 
+            # Capability guides and prompt providers may have changed
+            from osprey.prompts.base import invalidate_prompt_cache
+            invalidate_prompt_cache()
+
         except (ImportError, AttributeError, ConfigurationError) as e:
             logger.error(f"Registry initialization failed: {e}")
             raise RegistryError(f"Failed to initialize registry: {e}") from e
@@ -920,6 +1018,102 @@ class RegistryManager:
         else:
             raise ValueError(f"Unknown component type: {component_type}")
 
+    # ------------------------------------------------------------------
+    # Lazy loading
+    # ------------------------------------------------------------------
+
+    def _register(self, component_type: str, name: str, reg: Any) -> None:
+        """Load a component now, or record it for loading on first access in lazy mode.
+
+        In lazy mode, capability and core nodes are represented in the node registry
+        by stubs that load the real node when LangGraph first executes them, so the
+        graph can be built without importing any node module.
+        """
+        if not self.lazy_loading:
+            self._load(component_type, name, reg)
+            return
+
+        self._pending[component_type][name] = reg
+        self._registration_order[component_type].append(name)
+        if component_type in ('core_nodes', 'capabilities'):
+            self._registries['nodes'][name] = self._make_lazy_node(name)
+
+    def _load(self, component_type: str, name: str, reg: Any, lazy: bool = False) -> None:
+        loaders = {
+            'context_classes': self._load_context_class,
+            'data_sources': self._load_data_source,
+            'providers': self._load_provider,
+            'core_nodes': self._load_core_node,
+            'services': self._load_service,
+            'capabilities': self._load_capability,
+            'domain_analyzers': self._load_domain_analyzer,
+            'execution_policy_analyzers': self._load_execution_policy_analyzer,
+        }
+        with measure_component_load(self.load_profile, component_type, name, reg.module_path, lazy=lazy):
+            loaders[component_type](reg)
+
+    def _ensure_loaded(self, component_type: str, name: str) -> None:
+        """Import a pending component if it has not been loaded yet."""
+        if name not in self._pending[component_type]:
+            return
+
+        with self._load_lock:
+            # The registration stays pending until loaded, so concurrent callers wait here
+            reg = self._pending[component_type].get(name)
+            if reg is None:
+                return
+            logger.debug(f"Lazy loading {component_type} '{name}' from {reg.module_path}")
+            try:
+                self._load(component_type, name, reg, lazy=True)
+            except RegistryError:
+                raise
+            except Exception as e:
+                raise RegistryError(f"Failed to load {component_type} '{name}': {e}") from e
+            finally:
+                del self._pending[component_type][name]
+                node = self._registries['nodes'].get(name)
+                if getattr(node, 'lazy_stub', False):
+                    # Loading failed; drop the stub like eager loading would skip the node
+                    del self._registries['nodes'][name]
+
+    def _ensure_all_loaded(self, component_type: str) -> None:
+        for name in list(self._pending[component_type]):
+            self._ensure_loaded(component_type, name)
+
+    def _in_registration_order(self, component_type: str, registry_key: str | None = None) -> dict[str, Any]:
+        """Loaded components in registration order, regardless of the order they were accessed."""
+        registry = self._registries[registry_key or component_type]
+        if not self.lazy_loading:
+            return dict(registry)
+        position = {name: i for i, name in enumerate(self._registration_order[component_type])}
+        return {name: registry[name] for name in sorted(registry, key=lambda n: position.get(n, len(position)))}
+
+    def _count(self, component_type: str) -> int:
+        """Number of loaded plus pending components of a type."""
+        return len(self._registries[component_type]) + len(self._pending[component_type])
+
+    def _make_lazy_node(self, name: str):
+        registry = self
+
+        async def langgraph_node(state, **kwargs):
+            node = registry.get_node(name)
+            if node is None:
+                raise RegistryError(f"Node '{name}' could not be loaded")
+            return await node(state, **kwargs)
+
+        langgraph_node.name = name
+        langgraph_node.lazy_stub = True
+        return langgraph_node
+
+    def load_all_components(self) -> None:
+        """Import every component still pending from lazy initialization.
+
+        Has no effect when lazy loading is disabled, since :meth:`initialize`
+        already loaded everything.
+        """
+        for component_type in LAZY_COMPONENT_TYPES:
+            self._ensure_all_loaded(component_type)
+
     def _initialize_context_classes(self) -> None:
         """Initialize context class registry with lazy loading.
 
@@ -932,21 +1126,24 @@ class RegistryManager:
         """
         logger.debug("Initializing context classes...")
         for reg in self.config.context_classes:
-            try:
-                # Dynamically import and get the context class
-                module = __import__(reg.module_path, fromlist=[reg.class_name])
-                context_class = getattr(module, reg.class_name)
-                self._registries['contexts'][reg.context_type] = context_class
-                logger.debug(f"Registered context class: {reg.context_type} -> {context_class.__name__}")
-            except ImportError as e:
-                logger.error(f"Failed to import module for context class {reg.context_type}: {reg.module_path}")
-                raise RegistryError(f"Cannot import module {reg.module_path} for context class {reg.context_type}: {e}") from e
-            except AttributeError as e:
-                logger.error(f"Context class {reg.class_name} not found in module {reg.module_path}")
-                raise RegistryError(f"Class {reg.class_name} not found in module {reg.module_path} for context {reg.context_type}: {e}") from e
+            self._register('context_classes', reg.context_type, reg)
 
         logger.info(f"Registered {len(self.config.context_classes)} context classes")
 
+    def _load_context_class(self, reg) -> None:
+        try:
+            # Dynamically import and get the context class
+            module = __import__(reg.module_path, fromlist=[reg.class_name])
+            context_class = getattr(module, reg.class_name)
+            self._registries['contexts'][reg.context_type] = context_class
+            logger.debug(f"Registered context class: {reg.context_type} -> {context_class.__name__}")
+        except ImportError as e:
+            logger.error(f"Failed to import module for context class {reg.context_type}: {reg.module_path}")
+            raise RegistryError(f"Cannot import module {reg.module_path} for context class {reg.context_type}: {e}") from e
+        except AttributeError as e:
+            logger.error(f"Context class {reg.class_name} not found in module {reg.module_path}")
+            raise RegistryError(f"Class {reg.class_name} not found in module {reg.module_path} for context {reg.context_type}: {e}") from e
+
     def _initialize_data_sources(self) -> None:
         """Initialize data source provider registry with instantiation.
 
@@ -961,17 +1158,20 @@ class RegistryManager:
         """
         logger.debug("Initializing data sources...")
         for reg in self.config.data_sources:
-            try:
-                # Dynamically import and instantiate the data source provider
-                module = __import__(reg.module_path, fromlist=[reg.class_name])
-                provider_class = getattr(module, reg.class_name)
-                provider_instance = provider_class()
-                self._registries['data_sources'][reg.name] = provider_instance
-                logger.debug(f"Registered data source: {reg.name}")
-            except Exception as e:
-                logger.warning(f"Failed to initialize data source {reg.name}: {e}")
+            self._register('data_sources', reg.name, reg)
 
-        logger.info(f"Registered {len(self._registries['data_sources'])} data sources")
+        logger.info(f"Registered {self._count('data_sources')} data sources")
+
+    def _load_data_source(self, reg) -> None:
+        try:
+            # Dynamically import and instantiate the data source provider
+            module = __import__(reg.module_path, fromlist=[reg.class_name])
+            provider_class = getattr(module, reg.class_name)
+            provider_instance = provider_class()
+            self._registries['data_sources'][reg.name] = provider_instance
+            logger.debug(f"Registered data source: {reg.name}")
+        except Exception as e:
+            logger.warning(f"Failed to initialize data source {reg.name}: {e}")
 
     def _initialize_providers(self) -> None:
         """Initialize AI model providers from registry configuration.
@@ -987,54 +1187,58 @@ class RegistryManager:
         logger.info(f"Initializing {len(self.config.providers)} provider(s)...")
 
         for registration in self.config.providers:
+            # Provider names are class attributes; until imported, key by module name
+            self._register('providers', registration.module_path.rsplit('.', 1)[-1], registration)
+
+        logger.info(f"Provider initialization complete: {self._count('providers')} providers loaded")
+
+    def _load_provider(self, registration) -> None:
+        try:
+            # Lazy load provider class
+            module = importlib.import_module(registration.module_path)
+            provider_class = getattr(module, registration.class_name)
+
+            # Validate it's a provider
             try:
-                # Lazy load provider class
-                module = importlib.import_module(registration.module_path)
-                provider_class = getattr(module, registration.class_name)
-
-                # Validate it's a provider
-                try:
-                    from osprey.models.providers.base import BaseProvider
-                    if not issubclass(provider_class, BaseProvider):
-                        raise RegistryError(
-                            f"Provider class {registration.class_name} "
-                            f"must inherit from BaseProvider"
-                        )
-                except ImportError:
-                    # BaseProvider not yet created, skip validation for now
-                    logger.warning(f"BaseProvider not found, skipping validation for {registration.class_name}")
-
-                # Introspect metadata from class attributes (single source of truth)
-                provider_name = getattr(provider_class, 'name', None)
-
-                # Validate required metadata is present
-                if provider_name is None or provider_name == NotImplemented:
+                from osprey.models.providers.base import BaseProvider
+                if not issubclass(provider_class, BaseProvider):
                     raise RegistryError(
-                        f"Provider {registration.class_name} must define 'name' class attribute"
+                        f"Provider class {registration.class_name} "
+                        f"must inherit from BaseProvider"
                     )
+            except ImportError:
+                # BaseProvider not yet created, skip validation for now
+                logger.warning(f"BaseProvider not found, skipping validation for {registration.class_name}")
 
-                # Check if this provider is excluded
-                if provider_name in self._excluded_provider_names:
-                    logger.info(f"  ⊘ Skipping excluded provider: {provider_name}")
-                    continue
+            # Introspect metadata from class attributes (single source of truth)
+            provider_name = getattr(provider_class, 'name', None)
 
-                # Store provider class (indexed by its name attribute)
-                self._registries['providers'][provider_name] = provider_class
+            # Validate required metadata is present
+            if provider_name is None or provider_name == NotImplemented:
+                raise RegistryError(
+                    f"Provider {registration.class_name} must define 'name' class attribute"
+                )
 
-                # Store registration for reference
-                self._provider_registrations[provider_name] = registration
+            # Check if this provider is excluded
+            if provider_name in self._excluded_provider_names:
+                logger.info(f"  ⊘ Skipping excluded provider: {provider_name}")
+                return
 
-                logger.info(f"  ✓ Registered provider: {provider_name}")
-                logger.debug(f"    - Module: {registration.module_path}")
-                logger.debug(f"    - Class: {registration.class_name}")
-                logger.debug(f"    - Requires API key: {getattr(provider_class, 'requires_api_key', 'N/A')}")
-                logger.debug(f"    - Supports proxy: {getattr(provider_class, 'supports_proxy', 'N/A')}")
+            # Store provider class (indexed by its name attribute)
+            self._registries['providers'][provider_name] = provider_class
 
-            except Exception as e:
-                logger.error(f"  ✗ Failed to register provider from {registration.module_path}: {e}")
-                raise RegistryError(f"Provider registration failed for {registration.class_name}") from e
+            # Store registration for reference
+            self._provider_registrations[provider_name] = registration
 
-        logger.info(f"Provider initialization complete: {len(self._registries['providers'])} providers loaded")
+            logger.info(f"  ✓ Registered provider: {provider_name}")
+            logger.debug(f"    - Module: {registration.module_path}")
+            logger.debug(f"    - Class: {registration.class_name}")
+            logger.debug(f"    - Requires API key: {getattr(provider_class, 'requires_api_key', 'N/A')}")
+            logger.debug(f"    - Supports proxy: {getattr(provider_class, 'supports_proxy', 'N/A')}")
+
+        except Exception as e:
+            logger.error(f"  ✗ Failed to register provider from {registration.module_path}: {e}")
+            raise RegistryError(f"Provider registration failed for {registration.class_name}") from e
 
     def _initialize_execution_policy_analyzers(self) -> None:
         """Initialize execution policy analyzer registry with instantiation.
@@ -1050,21 +1254,24 @@ class RegistryManager:
         """
         logger.debug("Initializing execution policy analyzers...")
         for reg in self.config.execution_policy_analyzers:
-            try:
-                # Dynamically import and instantiate the execution policy analyzer
-                module = __import__(reg.module_path, fromlist=[reg.class_name])
-                analyzer_class = getattr(module, reg.class_name)
-                # Note: analyzer instances need configurable, but we'll handle that in the manager
-                # For now, just register the class for lazy instantiation
-                self._registries['execution_policy_analyzers'][reg.name] = {
-                    'class': analyzer_class,
-                    'registration': reg
-                }
-                logger.debug(f"Registered execution policy analyzer: {reg.name}")
-            except Exception as e:
-                logger.warning(f"Failed to initialize execution policy analyzer {reg.name}: {e}")
+            self._register('execution_policy_analyzers', reg.name, reg)
+
+        logger.info(f"Registered {self._count('execution_policy_analyzers')} execution policy analyzers")
 
-        logger.info(f"Registered {len(self._registries['execution_policy_analyzers'])} execution policy analyzers")
+    def _load_execution_policy_analyzer(self, reg) -> None:
+        try:
+            # Dynamically import and instantiate the execution policy analyzer
+            module = __import__(reg.module_path, fromlist=[reg.class_name])
+            analyzer_class = getattr(module, reg.class_name)
+            # Note: analyzer instances need configurable, but we'll handle that in the manager
+            # For now, just register the class for lazy instantiation
+            self._registries['execution_policy_analyzers'][reg.name] = {
+                'class': analyzer_class,
+                'registration': reg
+            }
+            logger.debug(f"Registered execution policy analyzer: {reg.name}")
+        except Exception as e:
+            logger.warning(f"Failed to initialize execution policy analyzer {reg.name}: {e}")
 
     def _initialize_domain_analyzers(self) -> None:
         """Initialize domain analyzer registry with instantiation.
@@ -1080,21 +1287,24 @@ class RegistryManager:
         """
         logger.debug("Initializing domain analyzers...")
         for reg in self.config.domain_analyzers:
-            try:
-                # Dynamically import and instantiate the domain analyzer
-                module = __import__(reg.module_path, fromlist=[reg.class_name])
-                analyzer_class = getattr(module, reg.class_name)
-                # Note: analyzer instances need configurable, but we'll handle that in the manager
-                # For now, just register the class for lazy instantiation
-                self._registries['domain_analyzers'][reg.name] = {
-                    'class': analyzer_class,
-                    'registration': reg
-                }
-                logger.debug(f"Registered domain analyzer: {reg.name}")
-            except Exception as e:
-                logger.warning(f"Failed to initialize domain analyzer {reg.name}: {e}")
+            self._register('domain_analyzers', reg.name, reg)
+
+        logger.info(f"Registered {self._count('domain_analyzers')} domain analyzers")
 
-        logger.info(f"Registered {len(self._registries['domain_analyzers'])} domain analyzers")
+    def _load_domain_analyzer(self, reg) -> None:
+        try:
+            # Dynamically import and instantiate the domain analyzer
+            module = __import__(reg.module_path, fromlist=[reg.class_name])
+            analyzer_class = getattr(module, reg.class_name)
+            # Note: analyzer instances need configurable, but we'll handle that in the manager
+            # For now, just register the class for lazy instantiation
+            self._registries['domain_analyzers'][reg.name] = {
+                'class': analyzer_class,
+                'registration': reg
+            }
+            logger.debug(f"Registered domain analyzer: {reg.name}")
+        except Exception as e:
+            logger.warning(f"Failed to initialize domain analyzer {reg.name}: {e}")
 
     def _initialize_core_nodes(self) -> None:
         """Initialize core infrastructure nodes with LangGraph-native pattern.
@@ -1106,32 +1316,35 @@ class RegistryManager:
         """
         logger.debug("Initializing core nodes...")
         for reg in self.config.core_nodes:
-            try:
-                # Dynamically import the module
-                module = __import__(reg.module_path, fromlist=[reg.function_name])
-
-                # Get the node class
-                node_class = getattr(module, reg.function_name)
-
-                if inspect.isclass(node_class):
-                    # The @infrastructure_node decorator should create langgraph_node
-                    if hasattr(node_class, 'langgraph_node'):
-                        if callable(node_class.langgraph_node):
-                            # Register the LangGraph-native function directly
-                            self._registries['nodes'][reg.name] = node_class.langgraph_node
-                            logger.debug(f"Registered infrastructure node: {reg.name}")
-                        else:
-                            logger.error(f"Infrastructure node {reg.name} has invalid langgraph_node attribute - expected callable from @infrastructure_node decorator")
+            self._register('core_nodes', reg.name, reg)
+
+        logger.info(f"Registered {len(self.config.core_nodes)} core nodes")
+
+    def _load_core_node(self, reg) -> None:
+        try:
+            # Dynamically import the module
+            module = __import__(reg.module_path, fromlist=[reg.function_name])
+
+            # Get the node class
+            node_class = getattr(module, reg.function_name)
+
+            if inspect.isclass(node_class):
+                # The @infrastructure_node decorator should create langgraph_node
+                if hasattr(node_class, 'langgraph_node'):
+                    if callable(node_class.langgraph_node):
+                        # Register the LangGraph-native function directly
+                        self._registries['nodes'][reg.name] = node_class.langgraph_node
+                        logger.debug(f"Registered infrastructure node: {reg.name}")
                     else:
-                        logger.error(f"Infrastructure node {reg.name} missing langgraph_node attribute - ensure @infrastructure_node decorator is applied")
+                        logger.error(f"Infrastructure node {reg.name} has invalid langgraph_node attribute - expected callable from @infrastructure_node decorator")
                 else:
-                    logger.error(f"Infrastructure node {reg.name} is not a class - expected decorated class")
-
-            except Exception as e:
-                logger.error(f"Failed to load core node {reg.name} from {reg.module_path}.{reg.function_name}: {e}")
-                raise
+                    logger.error(f"Infrastructure node {reg.name} missing langgraph_node attribute - ensure @infrastructure_node decorator is applied")
+            else:
+                logger.error(f"Infrastructure node {reg.name} is not a class - expected decorated class")
 
-        logger.info(f"Registered {len(self.config.core_nodes)} core nodes")
+        except Exception as e:
+            logger.error(f"Failed to load core node {reg.name} from {reg.module_path}.{reg.function_name}: {e}")
+            raise
 
     def _initialize_services(self) -> None:
         """Initialize service registry with LangGraph service graphs.
@@ -1143,27 +1356,30 @@ class RegistryManager:
         """
         logger.debug("Initializing services...")
         for reg in self.config.services:
-            try:
-                # Dynamically import and instantiate the service
-                module = __import__(reg.module_path, fromlist=[reg.class_name])
-                service_class = getattr(module, reg.class_name)
-                service_instance = service_class()
-
-                # Store the service instance (not just the compiled graph)
-                # This preserves the service's ainvoke method for request handling
-                if hasattr(service_instance, 'get_compiled_graph'):
-                    # Verify the service can compile its graph
-                    self._registries['services'][reg.name] = service_instance
-                    logger.debug(f"Registered service instance: {reg.name} with compiled graph")
-                else:
-                    logger.error(f"Service {reg.name} missing get_compiled_graph method")
+            self._register('services', reg.name, reg)
 
-                logger.debug(f"Registered service: {reg.name}")
+        logger.info(f"Registered {self._count('services')} services")
 
-            except Exception as e:
-                logger.warning(f"Failed to initialize service {reg.name}: {e}")
+    def _load_service(self, reg) -> None:
+        try:
+            # Dynamically import and instantiate the service
+            module = __import__(reg.module_path, fromlist=[reg.class_name])
+            service_class = getattr(module, reg.class_name)
+            service_instance = service_class()
+
+            # Store the service instance (not just the compiled graph)
+            # This preserves the service's ainvoke method for request handling
+            if hasattr(service_instance, 'get_compiled_graph'):
+                # Verify the service can compile its graph
+                self._registries['services'][reg.name] = service_instance
+                logger.debug(f"Registered service instance: {reg.name} with compiled graph")
+            else:
+                logger.error(f"Service {reg.name} missing get_compiled_graph method")
+
+            logger.debug(f"Registered service: {reg.name}")
 
-        logger.info(f"Registered {len(self._registries['services'])} services")
+        except Exception as e:
+            logger.warning(f"Failed to initialize service {reg.name}: {e}")
 
     def _initialize_capabilities(self) -> None:
         """Initialize capability registry with LangGraph-native pattern.
@@ -1177,30 +1393,33 @@ class RegistryManager:
         """
         logger.debug("Initializing capabilities...")
         for reg in self.config.capabilities:
-            try:
-                # Dynamically import and instantiate the capability
-                module = __import__(reg.module_path, fromlist=[reg.class_name])
-                capability_class = getattr(module, reg.class_name)
-                capability_instance = capability_class()
-                self._registries['capabilities'][reg.name] = capability_instance
-
-                # All capabilities should have @capability_node decorator which creates langgraph_node
-                if hasattr(capability_class, 'langgraph_node'):
-                    if callable(capability_class.langgraph_node):
-                        # Register the decorator-created callable function directly
-                        self._registries['nodes'][reg.name] = capability_class.langgraph_node
-                        logger.debug(f"Registered capability node: {reg.name}")
-                    else:
-                        logger.error(f"Capability {reg.name} has invalid langgraph_node attribute - expected callable from @capability_node decorator")
-                else:
-                    logger.error(f"Capability {reg.name} missing langgraph_node attribute - ensure @capability_node decorator is applied")
+            self._register('capabilities', reg.name, reg)
 
-                logger.debug(f"Registered capability: {reg.name}")
+        logger.info(f"Registered {self._count('capabilities')} capabilities")
 
-            except Exception as e:
-                logger.warning(f"Failed to initialize capability {reg.name}: {e}")
+    def _load_capability(self, reg) -> None:
+        try:
+            # Dynamically import and instantiate the capability
+            module = __import__(reg.module_path, fromlist=[reg.class_name])
+            capability_class = getattr(module, reg.class_name)
+            capability_instance = capability_class()
+            self._registries['capabilities'][reg.name] = capability_instance
+
+            # All capabilities should have @capability_node decorator which creates langgraph_node
+            if hasattr(capability_class, 'langgraph_node'):
+                if callable(capability_class.langgraph_node):
+                    # Register the decorator-created callable function directly
+                    self._registries['nodes'][reg.name] = capability_class.langgraph_node
+                    logger.debug(f"Registered capability node: {reg.name}")
+                else:
+                    logger.error(f"Capability {reg.name} has invalid langgraph_node attribute - expected callable from @capability_node decorator")
+            else:
+                logger.error(f"Capability {reg.name} missing langgraph_node attribute - ensure @capability_node decorator is applied")
+
+            logger.debug(f"Registered capability: {reg.name}")
 
-        logger.info(f"Registered {len(self._registries['capabilities'])} capabilities")
+        except Exception as e:
+            logger.warning(f"Failed to initialize capability {reg.name}: {e}")
 
     def _initialize_framework_prompt_providers(self) -> None:
         """Initialize framework prompt providers with explicit mapping.
@@ -1384,6 +1603,8 @@ class RegistryManager:
 
         if output_dir:
             self._save_export_data(export_data, output_dir)
+            if self.manifest_cache is not None and self.manifest_key is not None:
+                self.manifest_cache.update(self.manifest_key, export_dir=str(output_dir))
 
         return export_data
 
@@ -1490,6 +1711,7 @@ class RegistryManager:
         :return: Capability instance if registered, None otherwise
         :rtype: framework.base.BaseCapability, optional
         """
+        self._ensure_loaded('capabilities', name)
         return self._registries['capabilities'].get(name)
 
     def get_always_active_capability_names(self) -> list[str]:
@@ -1506,7 +1728,8 @@ class RegistryManager:
         :return: List of all registered capability instances
         :rtype: list[framework.base.BaseCapability]
         """
-        return list(self._registries['capabilities'].values())
+        self._ensure_all_loaded('capabilities')
+        return list(self._in_registration_order('capabilities').values())
 
     def get_capabilities_overview(self) -> str:
         """Generate a text overview of all registered capabilities.
@@ -1534,11 +1757,16 @@ class RegistryManager:
         :return: Node instance if registered, None otherwise
         :rtype: framework.base.BaseCapabilityNode, optional
         """
+        self._ensure_loaded('core_nodes', name)
+        self._ensure_loaded('capabilities', name)
         return self._registries['nodes'].get(name)
 
     def get_all_nodes(self) -> dict[str, Any]:
         """Retrieve all registered nodes as (name, callable) pairs.
 
+        In lazy mode, nodes that have not been loaded yet are returned as stubs
+        that import the real node on first execution.
+
         :return: Dictionary mapping node names to their callable instances
         :rtype: Dict[str, Any]
         """
@@ -1552,6 +1780,7 @@ class RegistryManager:
         :return: Context class if registered, None otherwise
         :rtype: Type[framework.base.CapabilityContext], optional
         """
+        self._ensure_loaded('context_classes', context_type)
         return self._registries['contexts'].get(context_type)
 
     def get_context_class_by_name(self, class_name: str):
@@ -1575,7 +1804,7 @@ class RegistryManager:
         :return: True if context type is registered, False otherwise
         :rtype: bool
         """
-        return context_type in self._registries['contexts']
+        return context_type in self._registries['contexts'] or context_type in self._pending['context_classes']
 
     def get_all_context_types(self) -> list[str]:
         """Get list of all registered context types.
@@ -1583,7 +1812,7 @@ class RegistryManager:
         :return: List of all registered context type identifiers
         :rtype: list[str]
         """
-        return list(self._registries['contexts'].keys())
+        return list(self._in_registration_order('context_classes', 'contexts')) + list(self._pending['context_classes'])
 
     def get_all_context_classes(self) -> dict[str, type['CapabilityContext']]:
         """Get dictionary of all registered context classes by context type.
@@ -1604,7 +1833,8 @@ class RegistryManager:
                 >>> if pv_class:
                 ...     instance = pv_class(pvs=["test:pv"])
         """
-        return dict(self._registries['contexts'])
+        self._ensure_all_loaded('context_classes')
+        return self._in_registration_order('context_classes', 'contexts')
 
     def get_data_source(self, name: str) -> Any | None:
         """Retrieve data source provider instance by name.
@@ -1614,6 +1844,7 @@ class RegistryManager:
         :return: Data source provider instance if registered, None otherwise
         :rtype: Any, optional
         """
+        self._ensure_loaded('data_sources', name)
         return self._registries['data_sources'].get(name)
 
     def get_all_data_sources(self) -> list[Any]:
@@ -1622,7 +1853,8 @@ class RegistryManager:
         :return: List of all registered data source provider instances
         :rtype: list[Any]
         """
-        return list(self._registries['data_sources'].values())
+        self._ensure_all_loaded('data_sources')
+        return list(self._in_registration_order('data_sources').values())
 
     def get_provider(self, name: str) -> type[Any] | None:
         """Retrieve registered provider class by name.
@@ -1635,8 +1867,17 @@ class RegistryManager:
         if not self._initialized:
             raise RegistryError("Registry not initialized. Call initialize_registry() first.")
 
+        self._ensure_provider_loaded(name)
         return self._registries['providers'].get(name)
 
+    def _ensure_provider_loaded(self, name: str) -> None:
+        if name in self._registries['providers'] or not self._pending['providers']:
+            return
+        # Pending providers are keyed by module name, which normally matches the provider name
+        self._ensure_loaded('providers', name)
+        if name not in self._registries['providers']:
+            self._ensure_all_loaded('providers')
+
     def get_provider_registration(self, name: str) -> Any | None:
         """Get provider registration metadata.
 
@@ -1645,6 +1886,7 @@ class RegistryManager:
         :return: Provider registration if found, None otherwise
         :rtype: ProviderRegistration or None
         """
+        self._ensure_provider_loaded(name)
         return self._provider_registrations.get(name)
 
     def list_providers(self) -> list[str]:
@@ -1653,6 +1895,7 @@ class RegistryManager:
         :return: List of provider names
         :rtype: list[str]
         """
+        self._ensure_all_loaded('providers')
         return list(self._registries['providers'].keys())
 
     def get_service(self, name: str) -> Any | None:
@@ -1663,6 +1906,7 @@ class RegistryManager:
         :return: Compiled LangGraph service instance if registered, None otherwise
         :rtype: Any, optional
         """
+        self._ensure_loaded('services', name)
         return self._registries['services'].get(name)
 
     def get_all_services(self) -> list[Any]:
@@ -1671,7 +1915,8 @@ class RegistryManager:
         :return: List of all registered service graph instances
         :rtype: list[Any]
         """
-        return list(self._registries['services'].values())
+        self._ensure_all_loaded('services')
+        return list(self._in_registration_order('services').values())
 
     def get_execution_policy_analyzers(self) -> list[Any]:
         """Retrieve all registered execution policy analyzer instances.
@@ -1682,6 +1927,7 @@ class RegistryManager:
         :return: List of execution policy analyzer instances
         :rtype: list[Any]
         """
+        self._ensure_all_loaded('execution_policy_analyzers')
         analyzers = []
         for name, registry_entry in self._registries['execution_policy_analyzers'].items():
             try:
@@ -1702,6 +1948,7 @@ class RegistryManager:
         :return: List of domain analyzer instances
         :rtype: list[Any]
         """
+        self._ensure_all_loaded('domain_analyzers')
         analyzers = []
         for name, registry_entry in self._registries['domain_analyzers'].items():
             try:
@@ -1729,7 +1976,7 @@ class RegistryManager:
            Providers without is_available() method are assumed to be available.
         """
         available = []
-        for provider in self._registries['data_sources'].values():
+        for provider in self.get_all_data_sources():
             try:
                 if hasattr(provider, 'is_available') and provider.is_available(state):
                     available.append(provider)
@@ -1899,6 +2146,10 @@ class RegistryManager:
             f"      • {stats['data_sources']} data sources: {', '.join(stats['data_source_names'])}",
             f"      • {stats['services']} services: {', '.join(stats['service_names'])}"
         ]
+        if stats['pending_components']:
+            summary_lines.append(
+                f"   {stats['pending_components']} components will be imported on first use (lazy loading)"
+            )
 
         return "\n".join(summary_lines)
 
@@ -1916,18 +2167,23 @@ class RegistryManager:
                 >>> print(f"Loaded {stats['capabilities']} capabilities")
                 >>> print(f"Available: {stats['capability_names']}")
         """
+        # Components pending lazy loading are counted from their registrations
+        capability_names = list(self._registries['capabilities']) + list(self._pending['capabilities'])
+        data_source_names = list(self._registries['data_sources']) + list(self._pending['data_sources'])
+        service_names = list(self._registries['services']) + list(self._pending['services'])
         return {
             'initialized': self._initialized,
-            'capabilities': len(self._registries['capabilities']),
+            'capabilities': len(capability_names),
             'nodes': len(self._registries['nodes']),
-            'context_classes': len(self._registries['contexts']),
-            'data_sources': len(self._registries['data_sources']),
-            'services': len(self._registries['services']),
-            'capability_names': list(self._registries['capabilities'].keys()),
+            'context_classes': len(self.get_all_context_types()),
+            'data_sources': len(data_source_names),
+            'services': len(service_names),
+            'capability_names': capability_names,
             'node_names': list(self._registries['nodes'].keys()),
-            'context_types': list(self._registries['contexts'].keys()),
-            'data_source_names': list(self._registries['data_sources'].keys()),
-            'service_names': list(self._registries['services'].keys())
+            'context_types': self.get_all_context_types(),
+            'data_source_names': data_source_names,
+            'service_names': service_names,
+            'pending_components': sum(len(pending) for pending in self._pending.values()),
         }
 
 
@@ -1945,6 +2201,10 @@ class RegistryManager:
         logger.debug("Clearing registry")
         for registry in self._registries.values():
             registry.clear()
+        for pending in self._pending.values():
+            pending.clear()
+        for order in self._registration_order.values():
+            order.clear()
         self._initialized = False
 
 # ==============================================================================
@@ -2126,7 +2386,19 @@ def _create_registry_from_config(config_path: str | None = None) -> RegistryMana
         else:
             logger.info("No application registry configured - using framework-only registry")
 
-        return RegistryManager(registry_path=registry_path)
+        manifest_cache_dir = None
+        manifest_config = None
+        if get_config_value('registry_manifest_cache', False):
+            from osprey.utils.config import _get_config
+            manifest_cache_dir = get_agent_dir('registry_exports_dir')
+            manifest_config = _get_config().raw_config
+
+        return RegistryManager(
+            registry_path=registry_path,
+            lazy_loading=get_config_value('registry_lazy_loading', False),
+            manifest_cache_dir=manifest_cache_dir,
+            manifest_config=manifest_config,
+        )
 
     except Exception as e:
         logger.error(f"Failed to create registry from config: {e}")
@@ -2239,10 +2511,13 @@ def initialize_registry(auto_export: bool = True, config_path: str | None = None
             # Load app config to get proper paths
             # Build export directory path from config
             export_dir = Path(get_agent_dir('registry_exports_dir'))
-            export_dir.mkdir(parents=True, exist_ok=True)
 
-            # Export registry data
-            registry.export_registry_to_json(str(export_dir))
+            # Unchanged registry sources and config: the previous export is still valid
+            if registry.export_is_current(str(export_dir)):
+                logger.debug(f"Registry export in {export_dir} is up to date")
+            else:
+                export_dir.mkdir(parents=True, exist_ok=True)
+                registry.export_registry_to_json(str(export_dir))
 
 
 
@@ -2319,6 +2594,9 @@ def reset_registry() -> None:
         _registry.clear()
     _registry = None
 
+    from osprey.prompts.base import invalidate_prompt_cache
+    invalidate_prompt_cache()
+
 # ==============================================================================
 # GLOBAL REGISTRY INSTANCE EXPORT
 # ==============================================================================
@@ -0,0 +1,111 @@
+"""On-Disk Registry Manifest Cache.
+
+Building the merged registry configuration imports and executes the framework
+and application registry modules, applies exclusions and overrides and validates
+the result; :func:`~osprey.registry.manager.initialize_registry` then rewrites the
+JSON export. Neither changes unless a registry source file, the framework version
+or the configuration changes, so the merged :class:`RegistryConfig` is cached on
+disk under a key derived from exactly those inputs.
+
+The cache is a single pickle file in the registry exports directory. A changed key
+simply misses and the file is replaced; unreadable or incompatible cache files are
+ignored.
+
+.. note::
+   Only the registry files themselves are hashed. If an application registry builds
+   its registrations from other modules, changes there are not detected; disable
+   the cache (``registry_manifest_cache: false``) or delete the cache file.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from osprey.utils.logger import get_logger
+
+logger = get_logger(name='REGISTRY', color='sky_blue2')
+
+MANIFEST_FILE_NAME = "registry_manifest.pickle"
+FRAMEWORK_REGISTRY_MODULE = "osprey.registry.registry"
+
+# Bump when the payload layout changes
+_MANIFEST_FORMAT = 1
+
+
+def compute_manifest_key(registry_path: str | None, config_data: Any = None) -> str:
+    """Hash everything the merged registry configuration depends on.
+
+    :param registry_path: Application registry file, or None for framework-only mode
+    :param config_data: Configuration values to include in the key
+    :return: Hex digest identifying this registry build
+    """
+    from osprey import __version__
+
+    digest = hashlib.sha256()
+    digest.update(f"format={_MANIFEST_FORMAT};osprey={__version__};python={sys.version_info[:2]}".encode())
+
+    spec = importlib.util.find_spec(FRAMEWORK_REGISTRY_MODULE)
+    if spec is not None and spec.origin:
+        digest.update(Path(spec.origin).read_bytes())
+
+    if registry_path:
+        path = Path(registry_path).resolve()
+        digest.update(str(path).encode())
+        digest.update(path.read_bytes())
+
+    digest.update(json.dumps(config_data, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class RegistryManifestCache:
+    """Pickle-backed cache of the merged registry configuration.
+
+    :param cache_dir: Directory holding the manifest file
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self.path = Path(cache_dir) / MANIFEST_FILE_NAME
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Return the cached payload for ``key``, or None on a miss."""
+        try:
+            with open(self.path, 'rb') as f:
+                payload = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable registry manifest {self.path}: {e}")
+            return None
+
+        if not isinstance(payload, dict) or payload.get('key') != key:
+            return None
+        return payload
+
+    def save(self, key: str, **payload: Any) -> None:
+        """Store ``payload`` under ``key``, replacing any previous manifest."""
+        tmp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".registry_manifest.")
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({'key': key, **payload}, f)
+            # Atomic replace: concurrent readers see the old or the new manifest
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            # Unpicklable registrations or a read-only directory only cost the speedup
+            logger.debug(f"Could not write registry manifest {self.path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def update(self, key: str, **fields: Any) -> None:
+        """Add fields to the payload stored under ``key``."""
+        payload = self.load(key)
+        if payload is not None:
+            payload.pop('key')
+            self.save(key, **{**payload, **fields})
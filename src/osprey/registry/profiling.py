@@ -0,0 +1,65 @@
+"""Component Load Profiling for the Registry.
+
+Records how long each registry component takes to import and instantiate, how
+many modules it pulled into ``sys.modules`` and, when :mod:`tracemalloc` is
+tracing, how much memory it retained. The records are collected by
+:class:`~osprey.registry.manager.RegistryManager` for every component it loads
+(eagerly during :meth:`initialize` or lazily on first access) and are shown by
+``osprey registry profile``.
+
+.. note::
+   Import cost is attributed to the first component that imports a dependency.
+   A capability that is the first to import matplotlib is charged for matplotlib,
+   even if later components use it too.
+"""
+
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+
+@dataclass
+class ComponentLoadRecord:
+    """Timing and memory cost of loading one registry component.
+
+    :param component_type: Registry component type (e.g., 'capabilities', 'providers')
+    :param name: Component name from its registration
+    :param module_path: Module imported to load the component
+    :param seconds: Wall-clock time for import and instantiation
+    :param modules_imported: Number of modules newly added to ``sys.modules``
+    :param memory_kb: Memory retained after loading, if tracemalloc was tracing
+    :param lazy: Whether the component was loaded on first access rather than at initialization
+    """
+
+    component_type: str
+    name: str
+    module_path: str
+    seconds: float
+    modules_imported: int
+    memory_kb: float | None = None
+    lazy: bool = False
+
+
+@contextmanager
+def measure_component_load(records: list[ComponentLoadRecord], component_type: str, name: str,
+                           module_path: str, lazy: bool = False) -> Iterator[None]:
+    """Append a :class:`ComponentLoadRecord` for the enclosed load to ``records``."""
+    trace_memory = tracemalloc.is_tracing()
+    memory_before = tracemalloc.get_traced_memory()[0] if trace_memory else 0
+    modules_before = len(sys.modules)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        records.append(ComponentLoadRecord(
+            component_type=component_type,
+            name=name,
+            module_path=module_path,
+            seconds=time.perf_counter() - start,
+            modules_imported=len(sys.modules) - modules_before,
+            memory_kb=(tracemalloc.get_traced_memory()[0] - memory_before) / 1024 if trace_memory else None,
+            lazy=lazy,
+        ))
@@ -432,6 +432,14 @@ class FrameworkRegistryProvider(RegistryConfigProvider):
                     module_path="osprey.models.providers.cborg",
                     class_name="CBorgProviderAdapter"
                 ),
+                ProviderRegistration(
+                    module_path="osprey.models.providers.replay",
+                    class_name="ReplayProviderAdapter"
+                ),
+                ProviderRegistration(
+                    module_path="osprey.models.providers.fake",
+                    class_name="FakeProviderAdapter"
+                ),
             ],
 
             # Simplified initialization order - decorators and subgraphs are imported directly when needed
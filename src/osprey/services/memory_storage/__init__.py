@@ -15,6 +15,7 @@ memory operations:
 
 Key Features:
     - Persistent JSON-based file storage with per-user organization
+    - Optional SQLite FTS5 index for BM25-ranked top-k memory retrieval
     - Framework data source integration for universal memory access
     - Structured memory models with timestamp context and LLM formatting
     - Comprehensive error handling and graceful degradation
@@ -49,6 +50,7 @@ Architecture Overview:
 
 from .memory_provider import UserMemoryProvider
 from .models import MemoryContent
+from .search_index import SQLiteMemoryIndex
 from .storage_manager import MemoryStorageManager, get_memory_storage_manager
 
 __all__ = [
@@ -56,6 +58,7 @@ __all__ = [
     'MemoryStorageManager',
     'get_memory_storage_manager',
     'MemoryContent',
+    'SQLiteMemoryIndex',
 
     # Data source integration
     'UserMemoryProvider',
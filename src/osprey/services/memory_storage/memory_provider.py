@@ -29,9 +29,11 @@ Key Features:
 """
 
 import logging
+import time
 
 from osprey.data_management.providers import DataSourceContext, DataSourceProvider
 from osprey.data_management.request import DataSourceRequest
+from osprey.utils.config import get_config_value
 
 from .storage_manager import get_memory_storage_manager
 
@@ -173,8 +175,9 @@ class UserMemoryProvider(DataSourceProvider):
         :rtype: Optional[DataSourceContext]
 
         .. note::
-           Query-based memory retrieval is not currently supported. All memory entries
-           are returned regardless of query parameters.
+           With ``user_memory.backend: sqlite_fts`` only the ``user_memory.top_k`` entries
+           most relevant to ``request.query`` (or the recent message window) are returned,
+           within a ``user_memory.max_chars`` budget. Otherwise all entries are returned.
 
         .. warning::
            Returns None if user ID is unavailable or memory retrieval fails, allowing
@@ -202,13 +205,25 @@ class UserMemoryProvider(DataSourceProvider):
             logger.debug("No user ID available - core user memory unavailable")
             return None
 
+        start_time = time.perf_counter()
+        use_search = self._memory_manager.search_index is not None
+        search_text = request.query or " ".join(request.metadata.get("message_window", []))
+
         # Check if query-based retrieval is requested
-        if request.query is not None:
+        if request.query is not None and not use_search:
             logger.warning("Query-based memory retrieval is not supported. Will return all memory entries.")
 
         try:
             # Get memory entries from the storage manager
-            memory_entries = self._memory_manager.get_all_memory_entries(user_id)
+            if use_search:
+                memory_entries = self._memory_manager.search_memory_entries(
+                    user_id,
+                    search_text,
+                    top_k=get_config_value("user_memory.top_k", 10),
+                    max_chars=get_config_value("user_memory.max_chars", 2000)
+                )
+            else:
+                memory_entries = self._memory_manager.get_all_memory_entries(user_id)
 
             # Convert to UserMemories format for compatibility
             from osprey.state import UserMemories
@@ -230,6 +245,9 @@ class UserMemoryProvider(DataSourceProvider):
                 metadata={
                     "user_id": user_id,
                     "entry_count": len(memory_entries) if memory_entries else 0,
+                    "entries_returned": len(memory_entries) if memory_entries else 0,
+                    "retrieval_backend": "sqlite_fts" if use_search else "file",
+                    "retrieval_time_sec": time.perf_counter() - start_time,
                     "source_description": "Core user memory system",
                     "is_core_provider": True
                 },
@@ -0,0 +1,160 @@
+"""
+Memory Search Index
+
+SQLite FTS5 index over user memory entries for relevance-ranked retrieval.
+
+The JSON snapshot and JSONL log written by :class:`MemoryStorageManager` stay the
+source of truth (they are also edited by the Open WebUI memory button). The index
+mirrors them per user and is rebuilt only when a user's memory files change, so
+searches cost one indexed BM25 query instead of injecting every stored entry
+into the prompt.
+"""
+
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from osprey.utils.logger import get_logger
+
+logger = get_logger("memory_storage")
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# Tokens shorter than this carry little signal and blow up OR queries
+_MIN_TOKEN_LENGTH = 2
+
+
+@dataclass
+class MemorySearchHit:
+    """A single ranked memory search result."""
+    position: int
+    timestamp: str
+    content: str
+    score: float
+
+
+def fts5_available() -> bool:
+    """Check whether the linked SQLite library supports FTS5."""
+    try:
+        connection = sqlite3.connect(":memory:")
+        try:
+            connection.execute("CREATE VIRTUAL TABLE probe USING fts5(content)")
+        finally:
+            connection.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def build_match_query(text: str, max_terms: int = 32) -> str | None:
+    """Convert free text into an FTS5 OR query of quoted terms.
+
+    :param text: Free text such as the recent user messages
+    :param max_terms: Maximum number of distinct terms to include
+    :return: FTS5 MATCH expression, or None if the text has no usable terms
+    """
+    terms = []
+    seen = set()
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        if len(token) < _MIN_TOKEN_LENGTH or token in seen:
+            continue
+        seen.add(token)
+        terms.append(f'"{token}"')
+        if len(terms) >= max_terms:
+            break
+    return " OR ".join(terms) if terms else None
+
+
+class SQLiteMemoryIndex:
+    """BM25-ranked full-text index of user memory entries.
+
+    :param db_path: Path to the SQLite database file
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._initialize()
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection, commit on success and always close it."""
+        connection = sqlite3.connect(self.db_path, timeout=10.0)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _initialize(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS memory_fts USING fts5("
+                "content, user_id UNINDEXED, timestamp UNINDEXED, position UNINDEXED, "
+                "tokenize='porter unicode61')"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS memory_sync (user_id TEXT PRIMARY KEY, signature TEXT NOT NULL)"
+            )
+
+    def sync(self, user_id: str, signature: str, entries: list[dict]) -> bool:
+        """Mirror a user's entries into the index if their files changed.
+
+        :param user_id: User identifier
+        :param signature: Opaque signature of the user's memory files
+        :param entries: Current memory entries in chronological order
+        :return: True if the index was rebuilt for this user
+        """
+        with self._lock, self._connect() as connection:
+            row = connection.execute(
+                "SELECT signature FROM memory_sync WHERE user_id = ?", (user_id,)
+            ).fetchone()
+            if row is not None and row[0] == signature:
+                return False
+
+            connection.execute("DELETE FROM memory_fts WHERE user_id = ?", (user_id,))
+            connection.executemany(
+                "INSERT INTO memory_fts (content, user_id, timestamp, position) VALUES (?, ?, ?, ?)",
+                [
+                    (entry.get("content", ""), user_id, entry.get("timestamp", ""), position)
+                    for position, entry in enumerate(entries)
+                    if entry.get("content")
+                ],
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO memory_sync (user_id, signature) VALUES (?, ?)",
+                (user_id, signature),
+            )
+
+        logger.debug(f"Rebuilt memory search index for user {user_id} ({len(entries)} entries)")
+        return True
+
+    def search(self, user_id: str, query: str, limit: int = 10) -> list[MemorySearchHit]:
+        """Return the most relevant entries for a query, best match first.
+
+        :param user_id: User identifier
+        :param query: Free text to match against memory content
+        :param limit: Maximum number of hits
+        :return: Ranked hits (empty if the query has no usable terms)
+        """
+        match_query = build_match_query(query)
+        if match_query is None:
+            return []
+
+        with self._lock, self._connect() as connection:
+            rows = connection.execute(
+                "SELECT position, timestamp, content, bm25(memory_fts) AS score "
+                "FROM memory_fts WHERE memory_fts MATCH ? AND user_id = ? "
+                "ORDER BY score LIMIT ?",
+                (match_query, user_id, limit),
+            ).fetchall()
+
+        return [
+            MemorySearchHit(position=int(position), timestamp=timestamp, content=content, score=score)
+            for position, timestamp, content, score in rows
+        ]
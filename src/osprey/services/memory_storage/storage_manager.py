@@ -3,14 +3,30 @@ Memory Storage Manager
 
 Simple file-based memory manager for user memory storage.
 Extracted from services.als_assistant.utils.memory_manager
+
+Each user's memory is stored as two files in the memory directory:
+
+- ``{user_id}.json``: Compacted snapshot with all entries (also read and edited
+  by the Open WebUI memory button)
+- ``{user_id}.jsonl``: Append-only log of entries added since the last compaction
+
+New entries are appended as a single JSON line under an advisory file lock, so
+concurrent writers never lose data and appends cost O(1) regardless of history
+size. Once the log reaches :data:`COMPACTION_THRESHOLD` entries it is merged into
+the snapshot with an atomic rename. Loads are served from an in-process cache
+validated against the size and mtime of both files.
 """
 
 import json
+import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from osprey.state import UserMemories
-from osprey.utils.config import get_agent_dir, get_session_info
+from osprey.utils.config import get_agent_dir, get_config_value, get_session_info
 from osprey.utils.logger import get_logger
 
 try:
@@ -18,20 +34,33 @@ try:
 except ImportError:
     get_config = None
 
+try:
+    import fcntl
+except ImportError:  # Windows - fall back to in-process locking only
+    fcntl = None
+
 from .models import MemoryContent
 
+if TYPE_CHECKING:
+    from .search_index import SQLiteMemoryIndex
+
 logger = get_logger("memory_storage")
 
+# Number of appended log entries that triggers compaction into the snapshot
+COMPACTION_THRESHOLD = 50
+
 
 class MemoryStorageManager:
     """Simple file-based memory manager for user memory storage.
 
-    Provides persistent storage of user memory entries in JSON format with
-    thread-safe file operations and proper error handling. Each user's memory
-    is stored in a separate JSON file identified by sanitized user ID.
+    Provides persistent storage of user memory entries with append-only writes,
+    advisory file locking and proper error handling. Each user's memory is
+    stored in a JSON snapshot plus a JSONL append log identified by sanitized
+    user ID.
     """
 
-    def __init__(self, memory_directory: str):
+    def __init__(self, memory_directory: str, compaction_threshold: int = COMPACTION_THRESHOLD,
+                 search_index: "SQLiteMemoryIndex | None" = None):
         """Initialize memory manager with storage directory.
 
         Creates the memory directory if it doesn't exist and sets up
@@ -39,10 +68,20 @@ class MemoryStorageManager:
 
         :param memory_directory: Directory path for storing memory files
         :type memory_directory: str
+        :param compaction_threshold: Appended entries before the log is compacted
+        :type compaction_threshold: int
+        :param search_index: Optional full-text index enabling :meth:`search_memory_entries`
+        :type search_index: SQLiteMemoryIndex, optional
         :raises OSError: If directory cannot be created or accessed
         """
         self.memory_dir = Path(memory_directory).resolve()
         self.memory_dir.mkdir(exist_ok=True, parents=True)
+        self.compaction_threshold = compaction_threshold
+        self.search_index = search_index
+
+        # file path -> ((inode, mtime_ns, size), parsed entries)
+        self._cache: dict[Path, tuple[tuple, list[dict]]] = {}
+        self._thread_lock = threading.RLock()
         logger.debug(f"Memory manager initialized with directory: {self.memory_dir}")
 
     def _get_memory_file_path(self, user_id: str) -> Path:
@@ -61,8 +100,73 @@ class MemoryStorageManager:
         safe_user_id = "".join(c for c in user_id if c.isalnum() or c in "-_")
         return self.memory_dir / f"{safe_user_id}.json"
 
+    def _get_log_file_path(self, user_id: str) -> Path:
+        """Get path to user's append-only JSONL log."""
+        return self._get_memory_file_path(user_id).with_suffix(".jsonl")
+
+    @contextmanager
+    def _locked(self, user_id: str):
+        """Hold the in-process lock and an advisory lock on the user's lock file."""
+        lock_path = self._get_memory_file_path(user_id).with_suffix(".lock")
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _file_signature(path: Path) -> tuple:
+        try:
+            stat = path.stat()
+            return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
+
+    def _read_cached(self, path: Path, reader) -> list[dict]:
+        """Read a memory file through the mtime/size-validated cache."""
+        signature = self._file_signature(path)
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        entries = reader(path) if signature is not None else []
+        self._cache[path] = (signature, entries)
+        return entries
+
+    @staticmethod
+    def _read_snapshot(memory_file: Path) -> list[dict]:
+        with open(memory_file, encoding='utf-8') as f:
+            data = json.load(f)
+        return data.get("entries", [])
+
+    @staticmethod
+    def _read_log(log_file: Path) -> list[dict]:
+        entries = []
+        with open(log_file, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn final line from a crashed writer - skip it
+                    logger.warning(f"Skipping corrupt memory log line {line_number} in {log_file.name}")
+        return entries
+
+    def _load_memory_parts(self, user_id: str) -> tuple[list[dict], list[dict]]:
+        """Load snapshot and log entries, served from cache when files are unchanged."""
+        snapshot_entries = self._read_cached(self._get_memory_file_path(user_id), self._read_snapshot)
+        log_entries = self._read_cached(self._get_log_file_path(user_id), self._read_log)
+        return snapshot_entries, log_entries
+
     def _load_memory_data(self, user_id: str) -> list[dict]:
-        """Load memory entries from user's JSON file.
+        """Load memory entries from user's snapshot and append log.
 
         :param user_id: User identifier
         :type user_id: str
@@ -70,21 +174,18 @@ class MemoryStorageManager:
         :rtype: List[dict]
 
         .. note::
-           Returns empty list if file doesn't exist or on read errors.
+           Returns empty list if no memory exists or on read errors. Results are
+           cached in-process and re-read only when either file changes.
         """
         try:
-            memory_file = self._get_memory_file_path(user_id)
-            if memory_file.exists():
-                with open(memory_file, encoding='utf-8') as f:
-                    data = json.load(f)
-                return data.get("entries", [])
-            return []
+            snapshot_entries, log_entries = self._load_memory_parts(user_id)
+            return [dict(entry) for entry in snapshot_entries + log_entries]
         except Exception as e:
             logger.error(f"Error loading memory for user {user_id}: {e}")
             return []
 
     def _save_memory_data(self, user_id: str, entries: list[dict]) -> bool:
-        """Save memory entries to user's JSON file.
+        """Save memory entries to user's JSON snapshot.
 
         :param user_id: User identifier
         :type user_id: str
@@ -94,7 +195,8 @@ class MemoryStorageManager:
         :rtype: bool
 
         .. note::
-           File is written atomically with proper encoding and formatting.
+           File is written atomically (temporary file plus rename). Callers must
+           hold the user lock.
         """
         try:
             memory_file = self._get_memory_file_path(user_id)
@@ -104,14 +206,54 @@ class MemoryStorageManager:
                 "entries": entries
             }
 
-            with open(memory_file, 'w', encoding='utf-8') as f:
+            temp_file = memory_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, memory_file)
 
             return True
         except Exception as e:
             logger.error(f"Error saving memory for user {user_id}: {e}")
             return False
 
+    def _append_log_entry(self, user_id: str, entry: dict) -> None:
+        """Append a single entry to the user's JSONL log (caller holds the lock)."""
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with open(self._get_log_file_path(user_id), 'a', encoding='utf-8') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def compact(self, user_id: str) -> bool:
+        """Merge the user's append log into the JSON snapshot.
+
+        The snapshot is rewritten atomically and the log removed afterwards, so
+        a crash at any point leaves either the old or the new state readable
+        (at worst with log entries duplicated into the snapshot, never lost).
+
+        :param user_id: User identifier
+        :type user_id: str
+        :return: True if compaction succeeded or nothing needed compacting
+        :rtype: bool
+        """
+        try:
+            with self._locked(user_id):
+                snapshot_entries, log_entries = self._load_memory_parts(user_id)
+                if not log_entries:
+                    return True
+
+                if not self._save_memory_data(user_id, snapshot_entries + log_entries):
+                    return False
+                self._get_log_file_path(user_id).unlink(missing_ok=True)
+
+            logger.debug(f"Compacted {len(log_entries)} memory log entries for user {user_id}")
+            return True
+        except Exception as e:
+            logger.error(f"Error compacting memory for user {user_id}: {e}")
+            return False
+
     def get_user_memory(self, user_id: str) -> str:
         """Get user's memory content as formatted string.
 
@@ -161,29 +303,11 @@ class MemoryStorageManager:
         """
         try:
             entries = self._load_memory_data(user_id)
-            memory_contents = []
-
-            for entry in entries:
-                timestamp_str = entry.get("timestamp", "")
-                content = entry.get("content", "")
-
-                if content.strip():  # Only include non-empty content
-                    try:
-                        # Parse timestamp string back to datetime
-                        timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M")
-                        memory_content = MemoryContent(
-                            timestamp=timestamp,
-                            content=content.strip()
-                        )
-                        memory_contents.append(memory_content)
-                    except ValueError as e:
-                        logger.warning(f"Failed to parse timestamp '{timestamp_str}' for user {user_id}: {e}")
-                        # Use current time as fallback
-                        memory_content = MemoryContent(
-                            timestamp=datetime.now(),
-                            content=content.strip()
-                        )
-                        memory_contents.append(memory_content)
+            memory_contents = [
+                self._to_memory_content(user_id, entry)
+                for entry in entries
+                if entry.get("content", "").strip()  # Only include non-empty content
+            ]
 
             logger.debug(f"Retrieved {len(memory_contents)} memory entries for user {user_id}")
             return memory_contents
@@ -192,6 +316,75 @@ class MemoryStorageManager:
             logger.error(f"Error retrieving memory entries for user {user_id}: {e}")
             return []
 
+    @staticmethod
+    def _to_memory_content(user_id: str, entry: dict) -> MemoryContent:
+        """Convert a stored entry dict to MemoryContent, tolerating bad timestamps."""
+        timestamp_str = entry.get("timestamp", "")
+        try:
+            # Parse timestamp string back to datetime
+            timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M")
+        except ValueError as e:
+            logger.warning(f"Failed to parse timestamp '{timestamp_str}' for user {user_id}: {e}")
+            # Use current time as fallback
+            timestamp = datetime.now()
+        return MemoryContent(timestamp=timestamp, content=entry.get("content", "").strip())
+
+    def search_memory_entries(self, user_id: str, query: str, top_k: int = 10,
+                              max_chars: int | None = None) -> list[MemoryContent]:
+        """Get the user memory entries most relevant to a query.
+
+        Entries are ranked with BM25 through the search index, limited to
+        ``top_k`` and to a total content length of ``max_chars``, and returned
+        in chronological order. When no entry matches (or no search index is
+        configured) the most recent entries within the same limits are returned.
+
+        :param user_id: User identifier
+        :type user_id: str
+        :param query: Free text describing the current conversation
+        :type query: str
+        :param top_k: Maximum number of entries to return
+        :type top_k: int
+        :param max_chars: Optional budget for the combined content length
+        :type max_chars: int, optional
+        :return: Selected memory entries in chronological order
+        :rtype: List[MemoryContent]
+        """
+        try:
+            entries = self._load_memory_data(user_id)
+            if not entries:
+                return []
+
+            ranked_positions = []
+            if self.search_index is not None and query and query.strip():
+                signature = json.dumps([
+                    self._file_signature(self._get_memory_file_path(user_id)),
+                    self._file_signature(self._get_log_file_path(user_id)),
+                ])
+                self.search_index.sync(user_id, signature, entries)
+                hits = self.search_index.search(user_id, query, limit=top_k)
+                ranked_positions = [hit.position for hit in hits if hit.position < len(entries)]
+
+            if not ranked_positions:
+                # Fall back to the most recent entries
+                ranked_positions = [
+                    i for i in reversed(range(len(entries))) if entries[i].get("content", "").strip()
+                ][:top_k]
+
+            selected = []
+            used_chars = 0
+            for position in ranked_positions:
+                content = entries[position].get("content", "").strip()
+                if max_chars is not None and used_chars + len(content) > max_chars:
+                    continue
+                used_chars += len(content)
+                selected.append(position)
+
+            return [self._to_memory_content(user_id, entries[i]) for i in sorted(selected)]
+
+        except Exception as e:
+            logger.error(f"Error searching memory entries for user {user_id}: {e}")
+            return self.get_all_memory_entries(user_id)[-top_k:]
+
     def add_memory_entry(self, user_id: str, memory_content: MemoryContent) -> bool:
         """Add new memory entry for user.
 
@@ -215,20 +408,21 @@ class MemoryStorageManager:
                 >>> print(f"Entry added: {success}")
         """
         try:
-            entries = self._load_memory_data(user_id)
-
-            # Add new entry
             new_entry = {
                 "timestamp": memory_content.timestamp.strftime("%Y-%m-%d %H:%M"),
                 "content": memory_content.content.strip()
             }
 
-            entries.append(new_entry)
+            with self._locked(user_id):
+                self._append_log_entry(user_id, new_entry)
+                _, log_entries = self._load_memory_parts(user_id)
+                needs_compaction = len(log_entries) >= self.compaction_threshold
+
+            logger.info(f"Added memory entry for user {user_id}: {memory_content.content[:50]}...")
 
-            success = self._save_memory_data(user_id, entries)
-            if success:
-                logger.info(f"Added memory entry for user {user_id}: {memory_content.content[:50]}...")
-            return success
+            if needs_compaction:
+                self.compact(user_id)
+            return True
         except Exception as e:
             logger.error(f"Error adding memory entry for user {user_id}: {e}")
             return False
@@ -289,5 +483,13 @@ def get_memory_storage_manager() -> MemoryStorageManager:
         # Use get_agent_dir to properly construct the path
         memory_dir = get_agent_dir('user_memory_dir')
 
-        _memory_storage_manager = MemoryStorageManager(memory_dir)
+        search_index = None
+        if get_config_value("user_memory.backend", "file") == "sqlite_fts":
+            from .search_index import SQLiteMemoryIndex, fts5_available
+            if fts5_available():
+                search_index = SQLiteMemoryIndex(Path(memory_dir) / "memory_index.sqlite3")
+            else:
+                logger.warning("SQLite FTS5 not available - memory search falls back to recent entries")
+
+        _memory_storage_manager = MemoryStorageManager(memory_dir, search_index=search_index)
     return _memory_storage_manager
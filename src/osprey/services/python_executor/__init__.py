@@ -236,6 +236,7 @@ from .models import (
     PythonExecutionSuccess,
     PythonServiceResult,
 )
+from .retention import ExecutionRetentionManager, RetentionConfig, RetentionReport
 from .service import PythonExecutorService
 from .services import (
     FileManager,
@@ -261,6 +262,11 @@ __all__ = [
     "FileManager",
     "NotebookManager",
 
+    # Execution folder retention
+    "ExecutionRetentionManager",
+    "RetentionConfig",
+    "RetentionReport",
+
     # Configuration utilities
     "ExecutionModeConfig",
     "ContainerEndpointConfig",
@@ -12,6 +12,7 @@ from typing import Any
 from osprey.approval.approval_system import create_code_approval_interrupt
 from osprey.utils.config import get_full_configuration
 from osprey.utils.logger import get_logger
+from osprey.utils.spans import traced_node
 from osprey.utils.streaming import get_streamer
 
 from .exceptions import (
@@ -363,7 +364,7 @@ def create_analyzer_node():
                 "current_stage": "failed"
             }
 
-    return analyzer_node
+    return traced_node(analyzer_node, "python_executor", "python_analyzer")
 
 
 async def _create_analysis_failure_attempt_notebook(
@@ -7,12 +7,14 @@ Separated from service.py to avoid circular import issues.
 
 from typing import Any
 
+from .figure_processing import DEFAULT_MAX_LINE_POINTS, DOWNSAMPLE_METHODS
+
 
 class PythonExecutorConfig:
     """Configuration for Python Executor Service.
 
     Manages essential configuration settings for the Python executor service,
-    including retry limits and execution timeouts. Values can be overridden
+    including retry limits, execution timeouts and figure post-processing. Values can be overridden
     via framework configuration.
     """
 
@@ -26,3 +28,17 @@ class PythonExecutorConfig:
 
         # Timeout configuration - how long to wait for operations
         self.execution_timeout_seconds = executor_config.get("execution_timeout_seconds", 600)  # 10 minutes
+
+        # Figure post-processing - compressed thumbnails served to the UI
+        self.figure_thumbnails = executor_config.get("figure_thumbnails", True)
+        self.figure_thumbnail_max_size = executor_config.get("figure_thumbnail_max_size", 800)  # pixels
+        self.figure_thumbnail_format = executor_config.get("figure_thumbnail_format", "webp")
+
+        # Decimation of matplotlib line data in serialized results
+        self.figure_line_max_points = executor_config.get("figure_line_max_points", DEFAULT_MAX_LINE_POINTS)
+        self.figure_line_downsample_method = executor_config.get("figure_line_downsample_method", "lttb")
+        if self.figure_line_downsample_method not in DOWNSAMPLE_METHODS:
+            raise ValueError(
+                f"figure_line_downsample_method must be one of {', '.join(DOWNSAMPLE_METHODS)}, "
+                f"got {self.figure_line_downsample_method!r}"
+            )
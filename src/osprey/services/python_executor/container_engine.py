@@ -79,6 +79,7 @@ import asyncio
 import json
 import time
 import uuid
+import weakref
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -88,8 +89,10 @@ import requests
 import websocket
 
 from osprey.utils.logger import get_logger
+from osprey.utils.metrics import JUPYTER_KERNELS
 
 from .exceptions import CodeRuntimeError, ContainerConnectivityError, ExecutionTimeoutError
+from .figure_processing import DEFAULT_MAX_LINE_POINTS, is_thumbnail
 from .models import PythonExecutionEngineResult
 
 logger = get_logger("python_executor")
@@ -237,6 +240,10 @@ class JupyterSessionManager:
 
         logger.info("Creating new Jupyter session")
         session_info = await self._create_new_session()
+        if self._current_session is None:
+            # A replaced session does not change the number held; release on garbage collection
+            JUPYTER_KERNELS.inc()
+            weakref.finalize(self, JUPYTER_KERNELS.dec)
         self._current_session = session_info
         await self._wait_for_kernel_ready(session_info)
         return session_info
@@ -697,7 +704,7 @@ class FileBasedResultCollector:
                                                        if d.is_dir() and d.name != 'attempts']:
                 for extension in image_extensions:
                     for figure_file in sorted(root_path.glob(extension)):
-                        if figure_file.is_file():
+                        if figure_file.is_file() and not is_thumbnail(figure_file):
                             figure_paths.append(figure_file)
 
             if figure_paths:
@@ -790,12 +797,16 @@ class ContainerExecutor:
         self,
         endpoint: ContainerEndpoint,
         execution_folder: Path | None = None,
-        timeout: int = 300
+        timeout: int = 300,
+        max_line_points: int = DEFAULT_MAX_LINE_POINTS,
+        line_downsample_method: str = "lttb"
     ):
         """Initialize with endpoint and execution parameters."""
         self.endpoint = endpoint
         self.execution_folder = execution_folder
         self.timeout = timeout
+        self.max_line_points = max_line_points
+        self.line_downsample_method = line_downsample_method
 
         # Initialize components directly
         self.session_manager = JupyterSessionManager(endpoint)
@@ -816,7 +827,11 @@ class ContainerExecutor:
 
             # 2. Execute the wrapped code using unified wrapper
             from .execution_wrapper import ExecutionWrapper
-            wrapper = ExecutionWrapper(execution_mode="container")
+            wrapper = ExecutionWrapper(
+                execution_mode="container",
+                max_line_points=self.max_line_points,
+                line_downsample_method=self.line_downsample_method
+            )
             wrapped_code = wrapper.create_wrapper(code, self.execution_folder)
 
             # 3. Execute the wrapped code using the execution engine
@@ -854,7 +869,9 @@ async def execute_python_code_in_container(
     endpoint: ContainerEndpoint,
     figures_dir: Path | None = None,  # Legacy parameter, not used
     timeout: int = 300,
-    execution_folder: Path | None = None
+    execution_folder: Path | None = None,
+    max_line_points: int = DEFAULT_MAX_LINE_POINTS,
+    line_downsample_method: str = "lttb"
 ) -> PythonExecutionEngineResult:
     """
     Execute Python code in container using file-based result communication.
@@ -868,6 +885,8 @@ async def execute_python_code_in_container(
         figures_dir: Legacy parameter, not used
         timeout: Execution timeout in seconds
         execution_folder: Host execution folder that maps to container workspace
+        max_line_points: Maximum points kept per matplotlib line in results.json
+        line_downsample_method: Decimation method for longer lines ("lttb" or "minmax")
 
     Returns:
         PythonExecutionEngineResult with all captured data from files
@@ -880,6 +899,8 @@ async def execute_python_code_in_container(
     executor = ContainerExecutor(
         endpoint=endpoint,
         execution_folder=execution_folder,
-        timeout=timeout
+        timeout=timeout,
+        max_line_points=max_line_points,
+        line_downsample_method=line_downsample_method
     )
     return await executor.execute_code(code)
@@ -11,6 +11,8 @@ from pathlib import Path
 
 from osprey.utils.logger import get_logger
 
+from .figure_processing import DEFAULT_MAX_LINE_POINTS
+
 logger = get_logger("execution_wrapper")
 
 
@@ -28,14 +30,20 @@ class ExecutionWrapper:
     Environment-specific adaptations handled via parameters.
     """
 
-    def __init__(self, execution_mode: str = "container"):
+    def __init__(self, execution_mode: str = "container",
+                 max_line_points: int = DEFAULT_MAX_LINE_POINTS,
+                 line_downsample_method: str = "lttb"):
         """
         Initialize wrapper for specific execution environment.
 
         Args:
             execution_mode: "container" or "local"
+            max_line_points: Maximum points kept per matplotlib line in results.json
+            line_downsample_method: Decimation method for longer lines ("lttb" or "minmax")
         """
         self.execution_mode = execution_mode
+        self.max_line_points = int(max_line_points)
+        self.line_downsample_method = line_downsample_method
 
     def create_wrapper(
         self,
@@ -343,7 +351,9 @@ print(f"Container working directory: {{Path.cwd()}}")
                 # Save results dictionary if it exists
                 if 'results' in globals() and results is not None:
                     # Use robust serialization function
-                    serialization_metadata = serialize_results_to_file(results, 'results.json')
+                    serialization_metadata = serialize_results_to_file(
+                        results, 'results.json', max_line_points=MAX_LINE_POINTS,
+                        line_downsample_method=LINE_DOWNSAMPLE_METHOD)
                     execution_metadata["results_saved"] = serialization_metadata["success"]
 
                     if not serialization_metadata["success"]:
@@ -383,7 +393,11 @@ print(f"Container working directory: {{Path.cwd()}}")
                     with open('execution_metadata.json', 'w', encoding='utf-8') as f:
                         json.dump(serializable_metadata, f, indent=2, ensure_ascii=False)
                 except Exception as e:
-        """).strip()
+        """).strip().replace(
+            "MAX_LINE_POINTS", repr(self.max_line_points)
+        ).replace(
+            "LINE_DOWNSAMPLE_METHOD", repr(self.line_downsample_method)
+        )
 
         # Combine all parts properly
         parts = [base_cleanup]
@@ -5,15 +5,18 @@ Executes validated Python code using clean exception handling.
 Transformed for LangGraph integration with TypedDict state management.
 """
 
+import asyncio
 import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from osprey.context.context_manager import ContextManager
 from osprey.utils.logger import get_logger
+from osprey.utils.spans import traced_node
 
 from .config import PythonExecutorConfig
 from .exceptions import CodeRuntimeError, ContainerConfigurationError, ContainerConnectivityError
+from .figure_processing import create_figure_thumbnails, is_thumbnail
 from .models import PythonExecutionState, PythonExecutionSuccess
 from .services import FileManager, NotebookManager
 
@@ -47,7 +50,11 @@ class LocalCodeExecutor:
 
         # Create unified wrapper for local execution
         from .execution_wrapper import ExecutionWrapper
-        wrapper = ExecutionWrapper(execution_mode="local")
+        wrapper = ExecutionWrapper(
+            execution_mode="local",
+            max_line_points=self.executor_config.figure_line_max_points,
+            line_downsample_method=self.executor_config.figure_line_downsample_method
+        )
         wrapped_code = wrapper.create_wrapper(code, execution_folder)
 
         # Execute with automatic Python environment detection
@@ -290,7 +297,7 @@ class LocalCodeExecutor:
                                                   if d.is_dir() and d.name != 'attempts']:
                 for extension in image_extensions:
                     for figure_file in sorted(root_path.glob(extension)):
-                        if figure_file.is_file():
+                        if figure_file.is_file() and not is_thumbnail(figure_file):
                             figure_paths.append(figure_file)
 
             if figure_paths:
@@ -337,7 +344,9 @@ class ContainerCodeExecutor:
                 code=code,
                 endpoint=endpoint,
                 execution_folder=execution_folder,
-                timeout=self.executor_config.execution_timeout_seconds
+                timeout=self.executor_config.execution_timeout_seconds,
+                max_line_points=self.executor_config.figure_line_max_points,
+                line_downsample_method=self.executor_config.figure_line_downsample_method
             )
 
             if not result.success:
@@ -527,6 +536,9 @@ def create_executor_node():
                 execution_folder=execution_folder.folder_path if execution_folder else None
             )
 
+            # Write compressed thumbnails next to the original figures
+            await _create_figure_thumbnails(configurable, execution_result)
+
             # Create final notebook and save results
             final_notebook = await _create_final_notebook(
                 notebook_manager,
@@ -591,7 +603,7 @@ def create_executor_node():
                 "current_stage": "generation"
             }
 
-    return executor_node
+    return traced_node(executor_node, "python_executor", "python_executor")
 
 
 # Helper functions for the executor node
@@ -630,6 +642,27 @@ def _get_execution_method(configurable: dict[str, Any]) -> str:
         logger.warning(f"Could not determine execution method: {e}, defaulting to 'container'")
         return 'container'
 
+async def _create_figure_thumbnails(configurable: dict[str, Any], execution_result) -> None:
+    """Create UI thumbnails for generated figures (originals are left untouched)."""
+    executor_config = PythonExecutorConfig(configurable)
+    if not executor_config.figure_thumbnails:
+        return
+
+    figure_paths = getattr(execution_result, 'figure_paths', None) or []
+    if not figure_paths:
+        return
+
+    try:
+        # Pillow decodes, resizes and encodes synchronously - keep it off the event loop
+        await asyncio.to_thread(
+            create_figure_thumbnails,
+            figure_paths,
+            max_size=executor_config.figure_thumbnail_max_size,
+            image_format=executor_config.figure_thumbnail_format
+        )
+    except Exception as e:
+        logger.warning(f"Failed to create figure thumbnails: {e}")
+
 async def _create_final_notebook(notebook_manager: NotebookManager, execution_folder, code: str, execution_result, state: PythonExecutionState):
     """Create final notebook with results."""
     try:
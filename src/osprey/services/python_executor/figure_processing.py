@@ -0,0 +1,287 @@
+"""
+Figure Post-Processing for the Python Executor
+
+Reduces the size of figure data and figure artifacts produced by executed code
+before they reach results files and the user interface.
+
+Two independent stages are provided:
+
+- **Line data decimation**: Largest-Triangle-Three-Buckets (LTTB) or min/max
+  decimation of serialized matplotlib line data, so figures built from large
+  archiver pulls do not produce multi-megabyte ``results.json`` files.
+- **Thumbnails**: Compressed thumbnails (WebP by default) written next to the
+  original raster figures. Interfaces serve the thumbnail inline and link the
+  original at full resolution.
+
+Thumbnail creation requires Pillow, which is installed alongside matplotlib in
+the scientific execution stack. When Pillow is unavailable, thumbnail creation
+is skipped and the original figures are used unchanged.
+"""
+
+import math
+from collections.abc import Sequence
+from pathlib import Path
+
+from osprey.utils.logger import get_logger
+
+logger = get_logger("python_executor")
+
+# Default maximum number of points kept per serialized line
+DEFAULT_MAX_LINE_POINTS = 2000
+
+# Supported decimation methods for serialized line data
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+# Marker in thumbnail file names (e.g. ``figure_01.thumb.webp``)
+THUMBNAIL_MARKER = ".thumb"
+
+# Raster formats that benefit from thumbnail generation (SVG is vector and small)
+_RASTER_SUFFIXES = {".png", ".jpg", ".jpeg"}
+
+
+# =============================================================================
+# LINE DATA DECIMATION
+# =============================================================================
+
+def lttb_indices(x: Sequence[float], y: Sequence[float], threshold: int) -> list[int]:
+    """Select point indices using the Largest-Triangle-Three-Buckets algorithm.
+
+    LTTB keeps the first and last point and, for each of ``threshold - 2``
+    equally sized buckets, the point forming the largest triangle with the
+    previously selected point and the average of the next bucket. This
+    preserves the visual shape of a line far better than uniform striding.
+
+    Args:
+        x: X coordinates (numeric, same length as ``y``)
+        y: Y coordinates
+        threshold: Maximum number of points to keep
+
+    Returns:
+        Sorted list of selected indices
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    selected = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        # Average point of the next bucket
+        next_start = int(math.floor((i + 1) * bucket_size)) + 1
+        next_end = min(int(math.floor((i + 2) * bucket_size)) + 1, n)
+        span = next_end - next_start
+        if span <= 0:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        else:
+            avg_x = sum(x[next_start:next_end]) / span
+            avg_y = sum(y[next_start:next_end]) / span
+
+        # Point in the current bucket with the largest triangle area
+        start = int(math.floor(i * bucket_size)) + 1
+        end = int(math.floor((i + 1) * bucket_size)) + 1
+        ax_, ay_ = x[a], y[a]
+        max_area = -1.0
+        max_index = start
+        for j in range(start, end):
+            area = abs((ax_ - avg_x) * (y[j] - ay_) - (ax_ - x[j]) * (avg_y - ay_))
+            if area > max_area:
+                max_area = area
+                max_index = j
+
+        selected.append(max_index)
+        a = max_index
+
+    selected.append(n - 1)
+    return selected
+
+
+def minmax_indices(y: Sequence[float], threshold: int) -> list[int]:
+    """Select point indices keeping the minimum and maximum of each bucket.
+
+    Cheaper than LTTB and guaranteed to preserve every peak and trough, which
+    matters for spiky signals such as beam loss or trip data.
+
+    Args:
+        y: Y coordinates
+        threshold: Maximum number of points to keep
+
+    Returns:
+        Sorted list of selected indices
+    """
+    n = len(y)
+    if threshold >= n or threshold < 4:
+        return list(range(n))
+
+    buckets = threshold // 2
+    bucket_size = n / buckets
+    selected = []
+
+    for i in range(buckets):
+        start = int(i * bucket_size)
+        end = min(int((i + 1) * bucket_size), n)
+        if start >= end:
+            continue
+        bucket = range(start, end)
+        lo = min(bucket, key=y.__getitem__)
+        hi = max(bucket, key=y.__getitem__)
+        selected.extend(sorted({lo, hi}))
+
+    return selected
+
+
+def downsample_line(
+    xdata: Sequence[float],
+    ydata: Sequence[float],
+    max_points: int = DEFAULT_MAX_LINE_POINTS,
+    method: str = "lttb"
+) -> tuple[list, list]:
+    """Downsample line data to at most ``max_points`` points.
+
+    Non-numeric data (e.g. categorical or datetime axes) and data containing
+    NaN values fall back to uniform striding, which is shape-agnostic but
+    always safe.
+
+    Args:
+        xdata: X coordinates
+        ydata: Y coordinates
+        max_points: Maximum number of points to keep
+        method: ``"lttb"`` or ``"minmax"``
+
+    Returns:
+        Tuple of downsampled ``(xdata, ydata)`` lists
+    """
+    x = list(xdata)
+    y = list(ydata)
+    n = min(len(x), len(y))
+    if n <= max_points:
+        return x, y
+
+    x, y = x[:n], y[:n]
+
+    try:
+        if any(math.isnan(v) for v in y):
+            raise ValueError("NaN values present")
+        if method == "minmax":
+            indices = minmax_indices(y, max_points)
+        else:
+            indices = lttb_indices(x, y, max_points)
+    except (TypeError, ValueError):
+        step = max(1, math.ceil(n / max_points))
+        indices = list(range(0, n, step))
+        if indices[-1] != n - 1:
+            indices.append(n - 1)
+
+    return [x[i] for i in indices], [y[i] for i in indices]
+
+
+# =============================================================================
+# THUMBNAILS
+# =============================================================================
+
+def is_thumbnail(path: Path) -> bool:
+    """Check whether a file is a thumbnail produced by :func:`create_thumbnail`."""
+    return Path(path).stem.endswith(THUMBNAIL_MARKER)
+
+
+def thumbnail_path_for(figure_path: Path, image_format: str = "webp") -> Path:
+    """Get the thumbnail path stored next to an original figure."""
+    figure_path = Path(figure_path)
+    return figure_path.with_name(f"{figure_path.stem}{THUMBNAIL_MARKER}.{image_format.lower()}")
+
+
+def find_thumbnail(figure_path: Path) -> Path | None:
+    """Find an existing thumbnail for a figure, regardless of its format."""
+    figure_path = Path(figure_path)
+    try:
+        for candidate in sorted(figure_path.parent.glob(f"{figure_path.stem}{THUMBNAIL_MARKER}.*")):
+            if candidate.is_file():
+                return candidate
+    except OSError:
+        pass
+    return None
+
+
+def create_thumbnail(
+    figure_path: Path,
+    max_size: int = 800,
+    image_format: str = "webp",
+    quality: int = 80
+) -> Path | None:
+    """Write a compressed thumbnail next to a raster figure.
+
+    Thumbnails are only written when they are actually smaller than the
+    original; small figures are served as-is.
+
+    Args:
+        figure_path: Path to the original figure
+        max_size: Maximum width/height of the thumbnail in pixels
+        image_format: Pillow format name (``webp``, ``png``, ``jpeg``)
+        quality: Encoder quality for lossy formats
+
+    Returns:
+        Path to the thumbnail, or None if no thumbnail was created
+    """
+    figure_path = Path(figure_path)
+    if figure_path.suffix.lower() not in _RASTER_SUFFIXES or is_thumbnail(figure_path):
+        return None
+
+    try:
+        from PIL import Image
+    except ImportError:
+        logger.debug("Pillow not available - skipping figure thumbnails")
+        return None
+
+    thumbnail_path = thumbnail_path_for(figure_path, image_format)
+
+    try:
+        with Image.open(figure_path) as image:
+            image.thumbnail((max_size, max_size))
+            if image_format.lower() in ("jpeg", "jpg") and image.mode in ("RGBA", "P"):
+                image = image.convert("RGB")
+            image.save(thumbnail_path, format=image_format.upper(), quality=quality, optimize=True)
+
+        if thumbnail_path.stat().st_size >= figure_path.stat().st_size:
+            thumbnail_path.unlink()
+            return None
+
+        return thumbnail_path
+
+    except Exception as e:
+        logger.warning(f"Failed to create thumbnail for {figure_path.name}: {e}")
+        try:
+            thumbnail_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return None
+
+
+def create_figure_thumbnails(
+    figure_paths: Sequence[Path],
+    max_size: int = 800,
+    image_format: str = "webp",
+    quality: int = 80
+) -> dict[Path, Path]:
+    """Create thumbnails for a batch of figures.
+
+    Args:
+        figure_paths: Original figure paths
+        max_size: Maximum width/height of the thumbnails in pixels
+        image_format: Pillow format name
+        quality: Encoder quality for lossy formats
+
+    Returns:
+        Mapping from original figure path to thumbnail path for every
+        figure that received a thumbnail
+    """
+    thumbnails = {}
+    for figure_path in figure_paths:
+        thumbnail = create_thumbnail(figure_path, max_size, image_format, quality)
+        if thumbnail is not None:
+            thumbnails[Path(figure_path)] = thumbnail
+
+    if thumbnails:
+        logger.info(f"Created {len(thumbnails)} figure thumbnails ({image_format})")
+
+    return thumbnails
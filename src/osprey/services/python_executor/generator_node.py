@@ -11,6 +11,7 @@ from typing import Any
 from osprey.models import get_chat_completion
 from osprey.utils.config import get_model_config
 from osprey.utils.logger import get_logger
+from osprey.utils.spans import traced_node
 from osprey.utils.streaming import get_streamer
 
 from .exceptions import CodeGenerationError
@@ -205,4 +206,4 @@ def create_generator_node():
                     "generation_attempt": state.get("generation_attempt", 0) + 1
                 }
 
-    return generator_node
+    return traced_node(generator_node, "python_executor", "python_generator")
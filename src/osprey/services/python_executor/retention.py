@@ -0,0 +1,446 @@
+"""
+Execution Folder Retention for the Python Executor
+
+Every Python execution attempt creates a folder of notebooks, results, figures
+and ``context.json`` under ``executed_scripts/YYYY-MM/``. Without cleanup these
+folders accumulate indefinitely and slow down directory scans and backups,
+especially on network file systems.
+
+:class:`ExecutionRetentionManager` keeps the executed scripts directory bounded:
+
+- **Archiving**: Completed folders older than ``archive_after_days`` are packed
+  into a single compressed tarball per day under ``executed_scripts/archive/``
+  and removed from the live tree.
+- **Disk budget**: When ``max_disk_mb`` is set, the oldest archives (then the
+  oldest live folders) are deleted until the directory fits the budget.
+- **Index**: ``archive/index.json`` maps every archived folder to its tarball so
+  notebook links to archived runs can be restored on demand with
+  :meth:`ExecutionRetentionManager.restore_execution_folder`. Interfaces call it
+  through :meth:`FileManager.resolve_execution_folder` before rendering figure
+  and notebook links. A restored folder is archived again by a later run and
+  replaces its earlier copy in the day's tarball.
+
+Retention runs are throttled by ``check_interval_hours`` and executed in a
+background thread when triggered from :class:`FileManager`, so they never delay
+code execution. Pipelines workers share one ``_agent_data``, so a run holds an
+advisory lock on ``archive/.retention.lock`` and writes tarballs and the index
+through unique temporary files.
+"""
+
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path, PurePosixPath
+from typing import Any
+from urllib.parse import unquote, urlparse
+
+from osprey.utils.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows - fall back to in-process locking only
+    fcntl = None
+
+logger = get_logger("python_services")
+
+ARCHIVE_DIR_NAME = "archive"
+INDEX_FILE_NAME = "index.json"
+LAST_RUN_FILE_NAME = ".last_retention_run"
+LOCK_FILE_NAME = ".retention.lock"
+
+# Files written by the execution wrapper once an execution has finished
+_COMPLETION_MARKERS = ("execution_metadata.json", "notebook.ipynb")
+
+_retention_lock = threading.Lock()
+
+
+@dataclass
+class RetentionConfig:
+    """Retention settings from ``python_executor.retention`` configuration."""
+
+    enabled: bool = False
+    archive_after_days: int = 14
+    max_disk_mb: float | None = None
+    check_interval_hours: float = 24.0
+
+    @classmethod
+    def from_configurable(cls, configurable: dict[str, Any]) -> "RetentionConfig":
+        """Create retention config from the framework configurable."""
+        executor_config = (configurable or {}).get("python_executor", {}) or {}
+        retention = executor_config.get("retention", {}) or {}
+        return cls(
+            enabled=retention.get("enabled", False),
+            archive_after_days=retention.get("archive_after_days", 14),
+            max_disk_mb=retention.get("max_disk_mb"),
+            check_interval_hours=retention.get("check_interval_hours", 24.0),
+        )
+
+
+@dataclass
+class RetentionReport:
+    """Summary of a retention run."""
+
+    archived_folders: int = 0
+    archives_written: list[Path] = field(default_factory=list)
+    deleted_archives: list[Path] = field(default_factory=list)
+    deleted_folders: list[Path] = field(default_factory=list)
+    total_bytes: int = 0
+
+
+class ExecutionRetentionManager:
+    """Archive, budget and restore execution folders.
+
+    :param base_dir: Executed scripts directory (``FileManager.base_dir``)
+    :param config: Retention settings
+
+    Examples:
+        Running retention manually::
+
+            >>> manager = ExecutionRetentionManager(file_manager.base_dir, RetentionConfig(enabled=True))
+            >>> report = manager.run()
+            >>> print(f"Archived {report.archived_folders} folders")
+
+        Restoring an archived run for a notebook link::
+
+            >>> folder = manager.restore_execution_folder(notebook_path.parent)
+    """
+
+    def __init__(self, base_dir: Path, config: RetentionConfig):
+        self.base_dir = Path(base_dir)
+        self.config = config
+        self.archive_dir = self.base_dir / ARCHIVE_DIR_NAME
+        self.index_path = self.archive_dir / INDEX_FILE_NAME
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def is_due(self, now: float | None = None) -> bool:
+        """Check whether the throttling interval has elapsed since the last run."""
+        now = now if now is not None else time.time()
+        try:
+            last_run = (self.archive_dir / LAST_RUN_FILE_NAME).stat().st_mtime
+        except OSError:
+            return True
+        return now - last_run >= self.config.check_interval_hours * 3600
+
+    def maybe_run_in_background(self) -> threading.Thread | None:
+        """Start a retention run in a daemon thread if enabled and due."""
+        if not self.config.enabled or not self.is_due():
+            return None
+
+        thread = threading.Thread(target=self._run_safely, name="execution-retention", daemon=True)
+        thread.start()
+        return thread
+
+    def _run_safely(self) -> None:
+        try:
+            self.run()
+        except Exception as e:
+            logger.warning(f"Execution folder retention failed: {e}")
+
+    def run(self, now: datetime | None = None) -> RetentionReport:
+        """Archive old folders and enforce the disk budget.
+
+        Concurrent runs, within one process or across processes sharing the
+        directory, are serialized; a run that finds another one in progress
+        returns an empty report.
+        """
+        with self._exclusive() as acquired:
+            if not acquired:
+                logger.debug("Execution folder retention already running - skipping")
+                return RetentionReport()
+
+            (self.archive_dir / LAST_RUN_FILE_NAME).touch()
+
+            report = RetentionReport()
+            self.archive_old_folders(now=now, report=report)
+            if self.config.max_disk_mb is not None:
+                self.enforce_disk_budget(report=report)
+            report.total_bytes = _tree_size(self.base_dir)
+
+            if report.archived_folders or report.deleted_archives or report.deleted_folders:
+                logger.info(
+                    f"Execution retention: archived {report.archived_folders} folders, "
+                    f"deleted {len(report.deleted_archives)} archives and "
+                    f"{len(report.deleted_folders)} folders"
+                )
+            return report
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[bool]:
+        """Try to hold the in-process lock and the advisory lock file without blocking."""
+        if not _retention_lock.acquire(blocking=False):
+            yield False
+            return
+        try:
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            if fcntl is None:
+                yield True
+                return
+            with open(self.archive_dir / LOCK_FILE_NAME, "a") as lock_file:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    yield False
+                    return
+                try:
+                    yield True
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+        finally:
+            _retention_lock.release()
+
+    # ------------------------------------------------------------------
+    # Archiving
+    # ------------------------------------------------------------------
+
+    def list_execution_folders(self) -> list[Path]:
+        """List live execution folders, oldest first."""
+        folders = []
+        if not self.base_dir.exists():
+            return folders
+
+        for month_dir in sorted(self.base_dir.iterdir()):
+            if not month_dir.is_dir() or month_dir.name == ARCHIVE_DIR_NAME:
+                continue
+            for folder in month_dir.iterdir():
+                if folder.is_dir() and folder.name.startswith("execution_"):
+                    folders.append(folder)
+
+        return sorted(folders, key=lambda f: f.name)
+
+    def archive_old_folders(self, now: datetime | None = None, report: RetentionReport | None = None) -> RetentionReport:
+        """Pack completed folders older than ``archive_after_days`` into daily tarballs."""
+        report = report or RetentionReport()
+        cutoff = (now or datetime.now()) - timedelta(days=self.config.archive_after_days)
+
+        by_day: dict[str, list[Path]] = {}
+        for folder in self.list_execution_folders():
+            created = _folder_date(folder)
+            if created is None or created >= cutoff:
+                continue
+            if not _is_completed(folder) and _latest_mtime(folder) >= cutoff.timestamp():
+                continue
+            by_day.setdefault(created.strftime("%Y-%m-%d"), []).append(folder)
+
+        if not by_day:
+            return report
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        index = self.load_index()
+
+        for day, folders in sorted(by_day.items()):
+            archive_path = self.archive_dir / f"{day}.tar.gz"
+            try:
+                self._write_day_archive(archive_path, folders)
+            except Exception as e:
+                logger.warning(f"Failed to archive execution folders for {day}: {e}")
+                continue
+
+            for folder in folders:
+                index[folder.relative_to(self.base_dir).as_posix()] = archive_path.name
+                shutil.rmtree(folder, ignore_errors=True)
+
+            report.archived_folders += len(folders)
+            report.archives_written.append(archive_path)
+
+        self._save_index(index)
+        return report
+
+    def _write_day_archive(self, archive_path: Path, folders: list[Path]) -> None:
+        """Write (or extend) the tarball for one day atomically.
+
+        Folders restored from this tarball and archived again replace their
+        earlier members instead of being stored twice.
+        """
+        arcnames = [folder.relative_to(self.base_dir).as_posix() for folder in folders]
+        replaced = set(arcnames)
+        fd, tmp_name = tempfile.mkstemp(dir=archive_path.parent, prefix=f".{archive_path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file, tarfile.open(fileobj=tmp_file, mode="w:gz") as archive:
+                # gzip streams cannot be appended to, so carry over existing members
+                if archive_path.exists():
+                    with tarfile.open(archive_path, "r:gz") as existing:
+                        for member in existing:
+                            if "/".join(member.name.split("/", 2)[:2]) in replaced:
+                                continue
+                            data = existing.extractfile(member) if member.isfile() else None
+                            archive.addfile(member, data)
+                for folder, arcname in zip(folders, arcnames, strict=True):
+                    archive.add(folder, arcname=arcname)
+            os.replace(tmp_name, archive_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    # ------------------------------------------------------------------
+    # Disk budget
+    # ------------------------------------------------------------------
+
+    def enforce_disk_budget(self, report: RetentionReport | None = None) -> RetentionReport:
+        """Delete oldest archives, then oldest completed folders, until within budget."""
+        report = report or RetentionReport()
+        if self.config.max_disk_mb is None:
+            return report
+
+        budget = int(self.config.max_disk_mb * 1024 * 1024)
+        total = _tree_size(self.base_dir)
+        if total <= budget:
+            return report
+
+        index = self.load_index()
+
+        for archive_path in sorted(self.archive_dir.glob("*.tar.gz")):
+            if total <= budget:
+                break
+            size = archive_path.stat().st_size
+            archive_path.unlink()
+            total -= size
+            index = {k: v for k, v in index.items() if v != archive_path.name}
+            report.deleted_archives.append(archive_path)
+
+        for folder in self.list_execution_folders():
+            if total <= budget:
+                break
+            if not _is_completed(folder):
+                continue
+            size = _tree_size(folder)
+            shutil.rmtree(folder, ignore_errors=True)
+            total -= size
+            report.deleted_folders.append(folder)
+
+        self._save_index(index)
+
+        if total > budget:
+            logger.warning(
+                f"Executed scripts directory still exceeds disk budget "
+                f"({total / 1024 / 1024:.1f} MB > {self.config.max_disk_mb} MB)"
+            )
+        return report
+
+    # ------------------------------------------------------------------
+    # Index and restore
+    # ------------------------------------------------------------------
+
+    def load_index(self) -> dict[str, str]:
+        """Load the archive index mapping relative folder paths to tarball names."""
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Failed to read execution archive index: {e}")
+            return {}
+
+    def _save_index(self, index: dict[str, str]) -> None:
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.archive_dir, prefix=f".{INDEX_FILE_NAME}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(index, f, indent=2, sort_keys=True)
+            os.replace(tmp_name, self.index_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def restore_execution_folder(self, folder_path: Path) -> Path | None:
+        """Restore an archived execution folder to its original location.
+
+        :param folder_path: Absolute folder path or path relative to the base directory
+        :return: Restored folder path, the existing folder if it is still live,
+            or None if the folder is unknown
+        """
+        folder_path = Path(folder_path)
+        absolute = folder_path if folder_path.is_absolute() else self.base_dir / folder_path
+        if absolute.is_dir():
+            return absolute
+
+        try:
+            relative = absolute.relative_to(self.base_dir).as_posix()
+        except ValueError:
+            return None
+
+        archive_name = self.load_index().get(relative)
+        if archive_name is None:
+            return None
+
+        archive_path = self.archive_dir / archive_name
+        if not archive_path.exists():
+            logger.warning(f"Archive {archive_name} for {relative} no longer exists")
+            return None
+
+        prefix = relative + "/"
+        with tarfile.open(archive_path, "r:gz") as archive:
+            members = [m for m in archive.getmembers() if m.name == relative or m.name.startswith(prefix)]
+            if hasattr(tarfile, "data_filter"):
+                archive.extractall(self.base_dir, members=members, filter="data")
+            else:
+                archive.extractall(self.base_dir, members=members)
+
+        logger.info(f"Restored archived execution folder: {relative}")
+        return absolute
+
+
+def execution_folder_of(path_or_link: str | Path) -> Path | None:
+    """Find the execution folder a file path or Jupyter link points into.
+
+    :param path_or_link: Path of a file inside an execution folder (host or
+        container layout) or a Jupyter URL such as
+        ``http://localhost:8088/lab/tree/executed_scripts/2025-01/execution_.../notebook.ipynb``
+    :return: Folder path relative to the executed scripts directory
+        (``YYYY-MM/execution_...``), or None if it is not inside an execution folder
+    """
+    text = str(path_or_link)
+    if "://" in text:
+        text = unquote(urlparse(text).path)
+    parts = PurePosixPath(text.replace("\\", "/")).parts
+    for i, part in enumerate(parts[1:], 1):
+        if part.startswith("execution_") and _folder_date(Path(part)) is not None:
+            return Path(parts[i - 1], part)
+    return None
+
+
+def _folder_date(folder: Path) -> datetime | None:
+    """Parse the creation timestamp from ``execution_YYYYMMDD_HHMMSS_...``."""
+    parts = folder.name.split("_")
+    if len(parts) < 3:
+        return None
+    try:
+        return datetime.strptime(f"{parts[1]}_{parts[2]}", "%Y%m%d_%H%M%S")
+    except ValueError:
+        return None
+
+
+def _is_completed(folder: Path) -> bool:
+    return any((folder / marker).exists() for marker in _COMPLETION_MARKERS)
+
+
+def _latest_mtime(folder: Path) -> float:
+    latest = 0.0
+    for path in [folder, *folder.rglob("*")]:
+        try:
+            latest = max(latest, path.stat().st_mtime)
+        except OSError:
+            continue
+    return latest
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
@@ -70,7 +70,10 @@ import nbformat
 
 from osprey.utils.logger import get_logger
 
+from .config import PythonExecutorConfig
+from .figure_processing import DEFAULT_MAX_LINE_POINTS, downsample_line
 from .models import NotebookAttempt, NotebookType, PythonExecutionContext
+from .retention import ExecutionRetentionManager, RetentionConfig, execution_folder_of
 
 logger = get_logger("osprey")
 
@@ -232,8 +235,43 @@ class FileManager:
         )
 
         logger.info(f"Created execution folder: {folder_path}")
+
+        # Archive/prune old execution folders in the background (throttled)
+        self._schedule_retention()
+
         return context
 
+    def _schedule_retention(self) -> None:
+        """Trigger a background retention run if enabled and due."""
+        try:
+            retention_config = RetentionConfig.from_configurable(self.configurable)
+            if retention_config.enabled:
+                ExecutionRetentionManager(self.base_dir, retention_config).maybe_run_in_background()
+        except Exception as e:
+            logger.warning(f"Failed to schedule execution folder retention: {e}")
+
+    def resolve_execution_folder(self, folder_path: Path | str) -> Path | None:
+        """Resolve an execution folder, restoring it from the archive if needed.
+
+        Notebook links keep pointing at the original folder location after a
+        run has been archived; calling this before opening the link restores
+        the folder on demand.
+
+        Restoring extracts a tarball, so async callers should run this with
+        ``asyncio.to_thread``.
+
+        :param folder_path: Folder path (absolute or relative to the base
+            directory), a file inside the folder, or a Jupyter link to it
+        :return: Live folder path, or None if retention is disabled or the
+            folder is unknown
+        """
+        retention_config = RetentionConfig.from_configurable(self.configurable)
+        if not retention_config.enabled:
+            return None
+        relative = execution_folder_of(folder_path)
+        manager = ExecutionRetentionManager(self.base_dir, retention_config)
+        return manager.restore_execution_folder(relative if relative is not None else Path(folder_path))
+
     def save_results(self, results: dict[str, Any], folder_path: Path) -> Path:
         """
         Save results dictionary to JSON file with service-level error handling.
@@ -254,7 +292,12 @@ class FileManager:
         results_file = folder_path / "results.json"
 
         # Delegate to the robust utility function
-        metadata = serialize_results_to_file(results, str(results_file))
+        executor_config = PythonExecutorConfig(self.configurable)
+        metadata = serialize_results_to_file(
+            results, str(results_file),
+            max_line_points=executor_config.figure_line_max_points,
+            line_downsample_method=executor_config.figure_line_downsample_method
+        )
 
         if not metadata["success"]:
             error_msg = f"Failed to save results: {metadata['error']}"
@@ -286,7 +329,8 @@ class FileManager:
 
 
 
-def make_json_serializable(obj: Any) -> Any:
+def make_json_serializable(obj: Any, max_line_points: int = DEFAULT_MAX_LINE_POINTS,
+                           line_downsample_method: str = "lttb") -> Any:
     """Convert complex objects to JSON-serializable format using modern Python patterns.
 
     This is a standalone function that can be imported and used by execution wrappers
@@ -294,6 +338,8 @@ def make_json_serializable(obj: Any) -> Any:
 
     Args:
         obj: Any Python object to make JSON-serializable
+        max_line_points: Maximum points kept per matplotlib line
+        line_downsample_method: Decimation method for longer lines ("lttb" or "minmax")
 
     Returns:
         JSON-serializable representation of the object
@@ -340,7 +386,7 @@ def make_json_serializable(obj: Any) -> Any:
 
         # Handle matplotlib figures
         elif _is_matplotlib_figure(obj):
-            return _serialize_matplotlib_figure(obj)
+            return _serialize_matplotlib_figure(obj, max_line_points, line_downsample_method)
 
         # Handle pandas DataFrames and Series
         elif hasattr(obj, 'to_dict') and hasattr(obj, 'index'):
@@ -392,8 +438,14 @@ def _is_matplotlib_figure(obj) -> bool:
             type(obj).__name__ == 'Figure')
 
 
-def _serialize_matplotlib_figure(fig) -> dict:
-    """Serialize matplotlib figure to JSON-compatible dict."""
+def _serialize_matplotlib_figure(fig, max_points: int = DEFAULT_MAX_LINE_POINTS,
+                                 method: str = "lttb") -> dict:
+    """Serialize matplotlib figure to JSON-compatible dict.
+
+    Line data longer than ``max_points`` is decimated with ``method`` (LTTB or
+    min/max) so that figures built from large datasets do not inflate the
+    serialized results.
+    """
     try:
         # Extract basic figure information
         axes_info = []
@@ -409,11 +461,19 @@ def _serialize_matplotlib_figure(fig) -> dict:
             # Extract line data if present
             lines_data = []
             for line in ax.get_lines():
+                xdata = line.get_xdata().tolist() if hasattr(line.get_xdata(), 'tolist') else list(line.get_xdata())
+                ydata = line.get_ydata().tolist() if hasattr(line.get_ydata(), 'tolist') else list(line.get_ydata())
+                original_points = len(ydata)
+                if original_points > max_points:
+                    xdata, ydata = downsample_line(xdata, ydata, max_points, method=method)
                 line_data = {
-                    "xdata": line.get_xdata().tolist() if hasattr(line.get_xdata(), 'tolist') else list(line.get_xdata()),
-                    "ydata": line.get_ydata().tolist() if hasattr(line.get_ydata(), 'tolist') else list(line.get_ydata()),
+                    "xdata": xdata,
+                    "ydata": ydata,
                     "label": line.get_label(),
                 }
+                if len(ydata) < original_points:
+                    line_data["original_points"] = original_points
+                    line_data["downsampled"] = True
                 lines_data.append(line_data)
             ax_info["lines"] = lines_data
             axes_info.append(ax_info)
@@ -433,7 +493,9 @@ def _serialize_matplotlib_figure(fig) -> dict:
         }
 
 
-def serialize_results_to_file(results: Any, file_path: str) -> dict:
+def serialize_results_to_file(results: Any, file_path: str,
+                              max_line_points: int = DEFAULT_MAX_LINE_POINTS,
+                              line_downsample_method: str = "lttb") -> dict:
     """Serialize results and save to JSON file with comprehensive error handling.
 
     This function is designed to be called from execution wrappers and provides
@@ -442,6 +504,8 @@ def serialize_results_to_file(results: Any, file_path: str) -> dict:
     Args:
         results: The results object to serialize
         file_path: Path where to save the JSON file
+        max_line_points: Maximum points kept per matplotlib line
+        line_downsample_method: Decimation method for longer lines ("lttb" or "minmax")
 
     Returns:
         dict: Metadata about the serialization operation
@@ -464,7 +528,7 @@ def serialize_results_to_file(results: Any, file_path: str) -> dict:
 
     try:
         # Convert to JSON-serializable format
-        serializable_results = make_json_serializable(results)
+        serializable_results = make_json_serializable(results, max_line_points, line_downsample_method)
 
         # Save to file
         with open(file_path, 'w', encoding='utf-8') as f:
@@ -11,6 +11,7 @@ import json
 import logging
 import os
 import shutil
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -63,6 +64,7 @@ class Action:
             logger.info(f"DEBUG: User ID received: '{user_id}'")
 
             memory_file = self._get_memory_file_path(user_id)
+            snapshot_signature = self._file_signature(memory_file)
             logger.info(f"DEBUG: Full memory file path: {memory_file}")
             logger.info(f"DEBUG: Memory file absolute path: {memory_file.absolute()}")
             logger.info(f"DEBUG: Memory file exists: {memory_file.exists()}")
@@ -85,21 +87,118 @@ class Action:
                 with open(memory_file, encoding='utf-8') as f:
                     data = json.load(f)
                 logger.info(f"DEBUG: Successfully loaded memory data with {len(data.get('entries', []))} entries")
-                return data
             else:
                 logger.info("DEBUG: Memory file does not exist, returning empty structure")
                 # Return empty structure if file doesn't exist
-                return {
+                data = {
                     "user_id": user_id,
                     "created": datetime.now().strftime("%Y-%m-%d %H:%M"),
                     "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M"),
                     "entries": []
                 }
+
+            # Include entries appended by the agent since the last compaction
+            log_entries = self._load_log_entries(user_id)
+            data["_snapshot_entries"] = list(data.get("entries", []))
+            data["_snapshot_signature"] = snapshot_signature
+            data["entries"] = data["_snapshot_entries"] + log_entries
+            data["_log_entries"] = log_entries
+            return data
         except Exception as e:
             logger.error(f"DEBUG: Exception in _load_memory_data: {type(e).__name__}: {e}")
             logger.error(f"Error loading memory for user {user_id}: {e}")
             raise
 
+    def _load_log_entries(self, user_id: str) -> list[dict]:
+        """Load entries from the append-only JSONL log written by the agent."""
+        log_file = self._get_memory_file_path(user_id).with_suffix('.jsonl')
+        entries = []
+        if log_file.exists():
+            with open(log_file, encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping corrupt memory log line in {log_file.name}")
+        return entries
+
+    @staticmethod
+    def _file_signature(path: Path) -> tuple | None:
+        """Identify a file version by inode, mtime and size (None if missing)."""
+        try:
+            stat = path.stat()
+            return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
+
+    @contextmanager
+    def _locked(self, user_id: str):
+        """Hold the same advisory lock as the agent's memory storage manager."""
+        import fcntl
+
+        lock_path = self._get_memory_file_path(user_id).with_suffix('.lock')
+        with open(lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _entries_added_since_load(self, user_id: str, seen_entries: list[dict]) -> list[dict]:
+        """Return snapshot entries the editor has not seen (caller holds the lock).
+
+        The agent compacts its append log into the snapshot, so entries it
+        appended while the editor was open may have moved there.
+        """
+        memory_file = self._get_memory_file_path(user_id)
+        with open(memory_file, encoding='utf-8') as f:
+            current_entries = json.load(f).get("entries", [])
+
+        seen = [json.dumps(entry, sort_keys=True) for entry in seen_entries]
+        added = []
+        for entry in current_entries:
+            key = json.dumps(entry, sort_keys=True)
+            if key in seen:
+                seen.remove(key)
+            else:
+                added.append(entry)
+        return added
+
+    def _truncate_log(self, user_id: str, merged_entries: list[dict]) -> None:
+        """Remove already-merged entries from the head of the JSONL log.
+
+        The caller holds the user lock. Only a leading run of lines matching
+        ``merged_entries`` is removed, so entries appended by the agent while
+        the editor was open survive.
+        """
+        log_file = self._get_memory_file_path(user_id).with_suffix('.jsonl')
+        if not merged_entries or not log_file.exists():
+            return
+
+        with open(log_file, encoding='utf-8') as f:
+            lines = [line for line in f if line.strip()]
+
+        merged = 0
+        for line, entry in zip(lines, merged_entries, strict=False):
+            try:
+                if json.loads(line) != entry:
+                    break
+            except json.JSONDecodeError:
+                break
+            merged += 1
+
+        remaining = lines[merged:]
+        if remaining:
+            temp_file = log_file.with_suffix('.jsonl.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.writelines(remaining)
+            temp_file.rename(log_file)
+        else:
+            log_file.unlink()
+
     def _validate_memory_data(self, data: dict) -> bool:
         """Validate memory data structure before saving."""
         try:
@@ -140,6 +239,9 @@ class Action:
 
             memory_file = self._get_memory_file_path(user_id)
             memory_file.parent.mkdir(exist_ok=True, parents=True)
+            merged_log_entries = data.pop("_log_entries", [])
+            loaded_snapshot_entries = data.pop("_snapshot_entries", [])
+            loaded_signature = data.pop("_snapshot_signature", None)
 
             # Update last_updated timestamp
             data["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M")
@@ -148,13 +250,26 @@ class Action:
             if "created" not in data:
                 data["created"] = data["last_updated"]
 
-            # Atomic write: write to temp file first, then rename
-            temp_file = memory_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with self._locked(user_id):
+                # The agent may have compacted new log entries into the snapshot since it was loaded
+                if self._file_signature(memory_file) not in (loaded_signature, None):
+                    added = self._entries_added_since_load(
+                        user_id, loaded_snapshot_entries + merged_log_entries
+                    )
+                    if added:
+                        logger.info(f"Re-merging {len(added)} memory entries added while editing")
+                        data["entries"] = data["entries"] + added
+
+                # Atomic write: write to temp file first, then rename
+                temp_file = memory_file.with_suffix('.tmp')
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
 
-            # Rename temp file to actual file (atomic operation on most filesystems)
-            temp_file.rename(memory_file)
+                # Rename temp file to actual file (atomic operation on most filesystems)
+                temp_file.rename(memory_file)
+
+                # Saved entries include the log entries seen at load time - drop them from the log
+                self._truncate_log(user_id, merged_log_entries)
 
             logger.info(f"Successfully saved memory for user {user_id} with {len(data.get('entries', []))} entries")
             return True
@@ -167,38 +282,66 @@ class Action:
             return False
 
     def _create_backup(self, user_id: str) -> bool:
-        """Create a backup of the user's memory file in the .backups folder."""
+        """Back up the user's snapshot and append log together in the .backups folder.
+
+        Both files are copied under the user lock so the backup is a consistent
+        view of the memory; a missing log also clears any stale backup log.
+        """
         try:
             memory_file = self._get_memory_file_path(user_id)
-            if memory_file.exists():
-                # Create .backups directory if it doesn't exist
-                backup_dir = memory_file.parent / ".backups"
+            log_file = memory_file.with_suffix('.jsonl')
+            backup_dir = memory_file.parent / ".backups"
+            if not memory_file.parent.exists():
+                return False
+
+            with self._locked(user_id):
+                if not memory_file.exists() and not log_file.exists():
+                    return False
                 backup_dir.mkdir(exist_ok=True)
 
-                # Single backup file per user (overwrites previous backup)
-                backup_file = backup_dir / f"{memory_file.stem}.json"
-                shutil.copy2(memory_file, backup_file)
-                logger.info(f"Created/updated backup: {backup_file}")
-                return True
-            return False
+                # Single backup per user (overwrites previous backup)
+                for source in (memory_file, log_file):
+                    backup_file = backup_dir / source.name
+                    if source.exists():
+                        shutil.copy2(source, backup_file)
+                    elif backup_file.exists():
+                        backup_file.unlink()
+
+            logger.info(f"Created/updated backup for user {user_id} in {backup_dir}")
+            return True
         except Exception as e:
             logger.error(f"Error creating backup for user {user_id}: {e}")
             return False
 
     def _restore_from_backup(self, user_id: str) -> bool:
-        """Restore user's memory from backup file."""
+        """Restore the user's snapshot and append log from the backup.
+
+        Runs under the user lock. A live log with no backed-up counterpart is
+        removed, so entries appended after the backup are not replayed on top
+        of the restored snapshot.
+        """
         try:
             memory_file = self._get_memory_file_path(user_id)
+            log_file = memory_file.with_suffix('.jsonl')
             backup_dir = memory_file.parent / ".backups"
-            backup_file = backup_dir / f"{memory_file.stem}.json"
 
-            if backup_file.exists():
-                shutil.copy2(backup_file, memory_file)
-                logger.info(f"Restored memory from backup: {backup_file}")
-                return True
-            else:
-                logger.warning(f"No backup file found for user {user_id}")
-                return False
+            with self._locked(user_id):
+                backups = [(backup_dir / target.name, target) for target in (memory_file, log_file)]
+                if not any(backup_file.exists() for backup_file, _ in backups):
+                    logger.warning(f"No backup file found for user {user_id}")
+                    return False
+
+                for backup_file, target in backups:
+                    if backup_file.exists():
+                        # Atomic replace so the agent never reads a half-copied file
+                        temp_file = target.with_suffix(target.suffix + '.tmp')
+                        shutil.copy2(backup_file, temp_file)
+                        temp_file.replace(target)
+                    elif target.exists():
+                        target.unlink()
+
+            logger.info(f"Restored memory from backup for user {user_id}")
+            return True
         except Exception as e:
             logger.error(f"Error restoring backup for user {user_id}: {e}")
             return False
@@ -13,8 +13,6 @@ The Pipeline handles OpenWebUI interaction and delegates all processing to the G
 import asyncio
 import logging
 import os
-import queue
-import threading
 import time
 from collections import deque
 from collections.abc import Generator, Iterator
@@ -23,14 +21,19 @@ from typing import Any
 from langgraph.checkpoint.memory import MemorySaver
 from pydantic import BaseModel, Field
 
-from osprey.graph import create_graph
+from osprey.graph import create_async_sqlite_checkpointer, create_graph
+from osprey.infrastructure.admission import AdmissionController
 from osprey.infrastructure.gateway import Gateway
 
 # NOTE: sys.path manipulation removed - osprey is pip-installed
 # In pip-installable architecture, osprey modules are directly importable
 from osprey.registry import get_registry, initialize_registry
+from osprey.services.python_executor.figure_processing import find_thumbnail
 from osprey.utils.config import get_current_application, get_full_configuration, get_pipeline_config
+from osprey.utils.config_reload import start_config_reloader
+from osprey.utils.event_loop import get_background_loop
 from osprey.utils.logger import get_logger
+from osprey.utils.metrics import start_configured_metrics_server, track_session
 
 logger = get_logger("pipeline")
 
@@ -396,6 +399,16 @@ class Pipeline:
         self._gateway = None
         self._initialized = False
 
+        # Long-lived loop that owns the graph, gateway and their clients across requests
+        self._event_loop = get_background_loop()
+
+        # Scheduler limiting how many requests execute at once (pipeline.admission)
+        admission_config = pipeline_config.get("admission", {})
+        self._admission = AdmissionController(
+            max_concurrent=admission_config.get("max_concurrent", 4),
+            max_queued=admission_config.get("max_queued"),
+        )
+
         logger.info(f"Pipeline '{self.name}' initialized with app: {self.valves.app_name}")
         # Initialize log buffer with startup entries
         _log_buffer.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] INFO     Pipeline initialized: {self.name}")
@@ -467,7 +480,7 @@ class Pipeline:
         1. Check initialization status to avoid duplicate initialization
         2. Execute application-specific startup hooks with error handling
         3. Initialize framework registry with all capabilities and services
-        4. Create LangGraph instance with memory checkpointer
+        4. Create LangGraph instance with the configured checkpointer
         5. Initialize Gateway for message processing
         6. Mark pipeline as initialized and log completion
 
@@ -499,6 +512,11 @@ class Pipeline:
            :meth:`_initialize_framework` : Core framework component setup
            :func:`osprey.registry.initialize_registry` : Registry initialization
         """
+        if not self._event_loop.in_loop():
+            # Called by OpenWebUI on its own loop: initialize on the pipeline loop instead
+            await asyncio.wrap_future(self._event_loop.submit(self.on_startup()))
+            return
+
         if not self._initialized:
             # Execute application-specific startup hooks
             logger.info(f"{self.name} pipeline starting up and initializing...")
@@ -549,7 +567,8 @@ class Pipeline:
 
         Initialization Steps:
         1. Initialize capability registry with all available capabilities
-        2. Create memory-based checkpointer for conversation persistence
+        2. Create checkpointer for conversation persistence (memory, or SQLite
+           shared by worker processes)
         3. Build LangGraph instance with registry and checkpointer
         4. Initialize Gateway for message preprocessing and routing
         5. Log successful completion of framework setup
@@ -584,18 +603,44 @@ class Pipeline:
             registry = get_registry()
 
             # Create checkpointer
-            checkpointer = MemorySaver()
+            checkpointer = await self._create_checkpointer()
 
             # Create graph and gateway
             self._graph = create_graph(registry, checkpointer=checkpointer)
             self._gateway = Gateway()
 
+            # Pick up config.yml edits for new requests without a container restart
+            start_config_reloader()
+
+            # Prometheus endpoint (services.pipelines.metrics_port)
+            start_configured_metrics_server()
+
             logger.info("Framework initialization completed")
 
         except Exception as e:
             logger.exception(f"Failed to initialize framework: {e}")
             raise
 
+    async def _create_checkpointer(self):
+        """Create the checkpointer selected by ``pipeline.checkpointer``.
+
+        Worker mode (``services.pipelines.workers`` > 1) requires the SQLite
+        checkpointer: chats fail over between worker processes, so their state
+        must outlive any one process.
+        """
+        from osprey.utils.config import get_agent_dir, get_config_value
+
+        workers = int(get_config_value("services.pipelines.workers", 1) or 1)
+        backend = get_config_value("pipeline.checkpointer", "sqlite" if workers > 1 else "memory")
+        if backend == "memory" and workers > 1:
+            logger.warning("In-memory checkpoints are not shared between pipeline workers; using SQLite")
+            backend = "sqlite"
+
+        if backend == "sqlite":
+            db_path = os.path.join(get_agent_dir("checkpoints"), "pipelines.sqlite")
+            return await create_async_sqlite_checkpointer(db_path)
+        return MemorySaver()
+
     def _build_config_for_session(self, user_id: str, chat_id: str, session_id: str) -> dict:
         """Build comprehensive configuration for a session using config with valve overrides"""
 
@@ -609,8 +654,8 @@ class Pipeline:
             "interface_context": "openwebui"
         })
 
-        # Apply valve overrides to agent control defaults
-        agent_control_defaults = configurable.get("agent_control_defaults", {})
+        # Apply valve overrides to agent control defaults (copied: the shared snapshot must not change)
+        agent_control_defaults = dict(configurable.get("agent_control_defaults", {}))
         agent_control_defaults.update({
             # Agent control overrides from valves
             "planning_mode_enabled": self.valves.planning_mode_enabled,
@@ -625,7 +670,7 @@ class Pipeline:
         configurable["agent_control_defaults"] = agent_control_defaults
 
         # Apply execution limits from valves
-        execution_limits = configurable.get("execution_limits", {})
+        execution_limits = dict(configurable.get("execution_limits", {}))
         execution_limits.update({
 
             "max_execution_time": self.valves.max_execution_time,
@@ -755,8 +800,9 @@ class Pipeline:
         :raises Exception: Processing errors are caught and yielded as error messages
 
         .. note::
-           This method manages async/sync bridging by creating new event loops
-           as needed to handle framework's asynchronous execution patterns.
+           Framework coroutines run on the process-wide background event loop
+           (:func:`osprey.utils.event_loop.get_background_loop`); this generator
+           only submits work and relays results.
 
         .. warning::
            Long-running operations may require user approval and will pause
@@ -779,15 +825,9 @@ class Pipeline:
         """
 
         try:
-            # Ensure framework is initialized synchronously
+            # Ensure framework is initialized (on the background loop, like all framework work)
             if not self._initialized:
-                # Initialize in sync context
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(self.on_startup())
-                finally:
-                    loop.close()
+                self._event_loop.run(self.on_startup())
 
             # Build configuration
             config = self._build_config_for_session(user_id, chat_id, session_id)
@@ -800,73 +840,75 @@ class Pipeline:
             # Send initial status update for regular message processing
             yield self._create_status_event("Processing message...", False)
 
-            # Execute async processing in sync context
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
+            # Wait for an execution slot: bounded concurrency, fair across users,
+            # one request at a time per chat thread
+            ticket = self._admission.ticket(user_id, f"{user_id}_{chat_id}")
             try:
+                for position in self._event_loop.iterate(self._admission.wait(ticket)):
+                    yield self._create_status_event(f"⏳ Waiting for a free slot (position {position} in queue)...", False)
+
+                # Execute on the pipeline's long-lived event loop
+                with track_session(f"{user_id}_{chat_id}"):
+                    # Gateway handles all preprocessing
+                    result = self._event_loop.run(
+                        self._gateway.process_message(user_message, self._graph, config)
+                    )
 
-                # Gateway handles all preprocessing
-                result = loop.run_until_complete(
-                    self._gateway.process_message(user_message, self._graph, config)
-                )
-
-                # Handle result
-                if result.error:
-                    # Clear status and show error
-                    yield self._create_status_event("", True)
-                    yield f"Error: {result.error}"
-                    return
+                    # Handle result
+                    if result.error:
+                        # Clear status and show error
+                        yield self._create_status_event("", True)
+                        yield f"Error: {result.error}"
+                        return
 
-                # Show slash command processing if any
-                if result.slash_commands_processed:
-                    yield self._create_status_event(f"✅ Processed commands: {result.slash_commands_processed}", False)
+                    # Show slash command processing if any
+                    if result.slash_commands_processed:
+                        yield self._create_status_event(f"✅ Processed commands: {result.slash_commands_processed}", False)
 
-                # Execute the result
-                if result.resume_command:
-                    yield self._create_status_event("🔄 Resuming from interrupt...", False)
-                    # Resume execution with streaming
-                    yield from self._execute_graph_with_streaming(result.resume_command, config, loop)
+                    # Execute the result
+                    if result.resume_command:
+                        yield self._create_status_event("🔄 Resuming from interrupt...", False)
+                        # Resume execution with streaming
+                        yield from self._execute_graph_with_streaming(result.resume_command, config)
 
-                elif result.agent_state:
-                    # Execute new conversation with streaming
-                    yield from self._execute_graph_with_streaming(result.agent_state, config, loop)
+                    elif result.agent_state:
+                        # Execute new conversation with streaming
+                        yield from self._execute_graph_with_streaming(result.agent_state, config)
 
-                else:
-                    # Clear status and show completion
-                    yield self._create_status_event("", True)
-                    yield "⚠️ No action required"
-                    return
+                    else:
+                        # Clear status and show completion
+                        yield self._create_status_event("", True)
+                        yield "⚠️ No action required"
+                        return
 
-                # After streaming, get final state and check for interrupts or final response
-                state = self._graph.get_state(config=config)
+                    # After streaming, get final state and check for interrupts or final response
+                    state = self._graph.get_state(config=config)
 
-                # Clear status before final output
-                yield self._create_status_event("", True)
+                    # Clear status before final output
+                    yield self._create_status_event("", True)
 
-                # Check for interrupts
-                if state.interrupts:
-                    interrupt = state.interrupts[0]
-                    user_msg = interrupt.value.get('user_message', 'Input required')
-                    yield f"{user_msg}\n"
-                else:
-                    # Normal completion - extract final response
-                    response = self._extract_response_from_state(state.values)
-                    if response:
-                        # Handle large responses by chunking them for streaming
-                        if len(response) > 50000:  # 50KB threshold for chunking
-                            logger.info(f"Large response detected ({len(response)} chars), chunking for streaming...")
-                            chunk_size = 50000
-                            for i in range(0, len(response), chunk_size):
-                                chunk = response[i:i + chunk_size]
-                                yield chunk
-                        else:
-                            yield response
+                    # Check for interrupts
+                    if state.interrupts:
+                        interrupt = state.interrupts[0]
+                        user_msg = interrupt.value.get('user_message', 'Input required')
+                        yield f"{user_msg}\n"
                     else:
-                        yield "✅ Execution completed"
-
+                        # Normal completion - extract final response
+                        response = self._extract_response_from_state(state.values)
+                        if response:
+                            # Handle large responses by chunking them for streaming
+                            if len(response) > 50000:  # 50KB threshold for chunking
+                                logger.info(f"Large response detected ({len(response)} chars), chunking for streaming...")
+                                chunk_size = 50000
+                                for i in range(0, len(response), chunk_size):
+                                    chunk = response[i:i + chunk_size]
+                                    yield chunk
+                            else:
+                                yield response
+                        else:
+                            yield "✅ Execution completed"
             finally:
-                loop.close()
+                self._event_loop.loop.call_soon_threadsafe(self._admission.release, ticket)
 
         except Exception as e:
             logger.exception(f"Error in pipeline execution: {e}")
@@ -874,74 +916,29 @@ class Pipeline:
             yield self._create_status_event("", True)
             yield f"Error: {str(e)}"
 
-    def _execute_graph_with_streaming(self, input_data: Any, config: dict, loop: asyncio.AbstractEventLoop):
+    def _execute_graph_with_streaming(self, input_data: Any, config: dict):
         """Execute graph with streaming in sync context and yield events"""
 
-        # Use a queue to bridge async streaming with sync generator
+        async def status_events():
+            async for chunk in self._graph.astream(input_data, config=config, stream_mode="custom"):
+                # Debug: Log all chunks to see what we're receiving
+                logger.debug(f"Received chunk: {chunk}")
 
-        stream_queue = queue.Queue()
-        exception_holder = [None]
-
-        def run_async_streaming():
-            """Run async streaming in a separate thread"""
-            try:
-                async def stream_execution():
-                    async for chunk in self._graph.astream(input_data, config=config, stream_mode="custom"):
-                        # Debug: Log all chunks to see what we're receiving
-                        logger.debug(f"Received chunk: {chunk}")
-
-                        # Handle custom streaming events from get_stream_writer()
-                        if chunk.get("event_type") == "status":
-                            status_event = self._format_streaming_event(chunk)
-                            stream_queue.put(("status_event", status_event))
-                        else:
-                            logger.debug(f"Non-status chunk: {type(chunk)} {list(chunk.keys()) if isinstance(chunk, dict) else str(chunk)[:100]}")
-
-                    # Signal completion
-                    stream_queue.put(("done", None))
-
-                # Run the async execution
-                loop.run_until_complete(stream_execution())
-
-            except Exception as e:
-                exception_holder[0] = e
-                stream_queue.put(("error", str(e)))
-
-        # Start streaming in background thread
-        thread = threading.Thread(target=run_async_streaming)
-        thread.daemon = True
-        thread.start()
-
-        # Yield streaming events as they arrive
-        while True:
-            try:
-                event_type, data = stream_queue.get(timeout=1.0)
-
-                if event_type == "status_event":
-                    yield data
-                elif event_type == "done":
-                    break
-                elif event_type == "error":
-                    # Clear status and show error
-                    yield self._create_status_event("", True)
-                    yield f"❌ Streaming error: {data}"
-                    break
-
-            except queue.Empty:
-                # Check if thread is still alive
-                if not thread.is_alive():
-                    break
-                continue
-
-        # Wait for thread to complete
-        thread.join(timeout=2.0)
+                # Handle custom streaming events from get_stream_writer()
+                if chunk.get("event_type") == "status":
+                    yield self._format_streaming_event(chunk)
+                else:
+                    logger.debug(f"Non-status chunk: {type(chunk)} {list(chunk.keys()) if isinstance(chunk, dict) else str(chunk)[:100]}")
 
-        # Check for exceptions
-        if exception_holder[0]:
-            logger.exception(f"Error during streaming: {exception_holder[0]}")
+        # Graph runs on the background loop; a bounded buffer applies backpressure
+        # when OpenWebUI reads events slower than the graph produces them
+        try:
+            yield from self._event_loop.iterate(status_events())
+        except Exception as e:
+            logger.exception(f"Error during streaming: {e}")
             # Clear status and show error
             yield self._create_status_event("", True)
-            yield f"❌ Execution error: {exception_holder[0]}"
+            yield f"❌ Execution error: {e}"
 
     def _extract_response_from_event(self, event: dict[str, Any]) -> str | None:
         """Extract response from a streaming event"""
@@ -1058,6 +1055,10 @@ class Pipeline:
         try:
             from pathlib import Path
 
+            # Figures of archived runs are restored before linking them
+            if not Path(figure_path).exists():
+                self._restore_execution_folder(figure_path)
+
             # Verify file exists
             if not Path(figure_path).exists():
                 logger.warning(f"Figure file not found: {figure_path}")
@@ -1103,10 +1104,21 @@ class Pipeline:
 
             # Create static URL (mounted at /static/agent_data/)
             static_url = f"/static/agent_data/{relative_path}"
+            created_at_str = str(created_at)[:19] if created_at else "unknown"
+
+            # Serve the compressed thumbnail inline when available, linking the original
+            thumbnail_path = find_thumbnail(Path(figure_path))
+            if thumbnail_path is not None:
+                thumbnail_relative = str(Path(relative_path).parent / thumbnail_path.name)
+                thumbnail_url = f"/static/agent_data/{thumbnail_relative}"
+                markdown_image = f"[![Figure {figure_number}]({thumbnail_url})]({static_url})"
+                return (
+                    f"{markdown_image}\n\n*Source: {capability} | Created: {created_at_str} | "
+                    f"File: [{Path(figure_path).name}]({static_url}) (full resolution)*"
+                )
 
             # Create clean markdown display
             markdown_image = f"![Figure {figure_number}]({static_url})"
-            created_at_str = str(created_at)[:19] if created_at else "unknown"
 
             return f"{markdown_image}\n\n*Source: {capability} | Created: {created_at_str} | File: {Path(figure_path).name}*"
 
@@ -1114,6 +1126,19 @@ class Pipeline:
             logger.error(f"Failed to convert figure to static URL: {e}")
             return None
 
+    def _restore_execution_folder(self, path_or_link: str) -> None:
+        """Restore the execution folder behind a figure path or notebook link if it was archived.
+
+        pipe() is synchronous and runs in a server worker thread, so the tarball
+        extraction does not block the graph's event loop.
+        """
+        try:
+            from osprey.services.python_executor.services import FileManager
+
+            FileManager(get_full_configuration()).resolve_execution_folder(path_or_link)
+        except Exception as e:
+            logger.warning(f"Failed to restore archived execution folder for {path_or_link}: {e}")
+
     def _extract_commands_from_state(self, state: dict[str, Any]) -> str | None:
         """
         Extract launchable commands from centralized registry and format for display.
@@ -1196,6 +1221,7 @@ class Pipeline:
             # Format notebook links for display
             notebook_links = []
             for i, notebook_link in enumerate(ui_notebooks, 1):
+                self._restore_execution_folder(notebook_link)
                 # Create a clickable link for the notebook
                 notebook_display = f"[📓 Jupyter Notebook {i}]({notebook_link})"
                 notebook_links.append(notebook_display)
@@ -43,7 +43,12 @@ else
 fi
 
 # Call the original pipelines start script
-echo "Starting pipelines server..."
 cd /app
+if [ "${PIPELINES_WORKERS:-1}" -gt 1 ]; then
+    # Worker mode: N pipelines servers behind a front process with sticky chat routing
+    echo "Starting pipelines server with $PIPELINES_WORKERS workers..."
+    exec python -m osprey.deployment.worker_router --workers "$PIPELINES_WORKERS" --port "${PORT:-9099}" -- bash start.sh
+fi
+echo "Starting pipelines server..."
 exec bash start.sh
 
@@ -15,6 +15,7 @@ import logging
 import os
 import re
 import sys
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -334,9 +335,15 @@ class ConfigBuilder:
 _default_config: ConfigBuilder | None = None
 _default_configurable: dict[str, Any] | None = None
 
+# Incremented whenever a configuration is loaded, so derived caches can detect changes
+_config_generation = 0
+
 # Per-path config cache for explicit config paths
 _config_cache: dict[str, ConfigBuilder] = {}
 
+# Serializes snapshot swaps from the reload thread against default initialization
+_config_lock = threading.Lock()
+
 
 def _get_config(config_path: str | None = None, set_as_default: bool = False) -> ConfigBuilder:
     """Get configuration instance (singleton pattern with optional explicit path).
@@ -364,7 +371,7 @@ def _get_config(config_path: str | None = None, set_as_default: bool = False) ->
         >>> # Explicit path that becomes the default
         >>> config = _get_config("/path/to/config.yml", set_as_default=True)
     """
-    global _default_config, _default_configurable
+    global _default_config, _default_configurable, _config_generation
 
     # If no explicit path, use default singleton behavior
     if config_path is None:
@@ -378,6 +385,7 @@ def _get_config(config_path: str | None = None, set_as_default: bool = False) ->
 
             # Cache configurable for efficient non-LangGraph contexts
             _default_configurable = _default_config.configurable.copy()
+            _config_generation += 1
 
             logger.info("Initialized default configuration system")
 
@@ -389,16 +397,54 @@ def _get_config(config_path: str | None = None, set_as_default: bool = False) ->
     if resolved_path not in _config_cache:
         logger.info(f"Loading configuration from explicit path: {resolved_path}")
         _config_cache[resolved_path] = ConfigBuilder(resolved_path)
+        _config_generation += 1
 
     # If requested, also set this as the default config
     if set_as_default:
         _default_config = _config_cache[resolved_path]
         _default_configurable = _default_config.configurable.copy()
+        _config_generation += 1
         logger.debug(f"Set explicit config as default: {resolved_path}")
 
     return _config_cache[resolved_path]
 
 
+def swap_default_config(config: ConfigBuilder) -> int:
+    """
+    Atomically replace the default configuration snapshot.
+
+    The new ConfigBuilder must be fully built (and validated) before calling
+    this. Callers that already hold the previous snapshot, such as requests
+    whose LangGraph config was built from it, keep using it; only subsequent
+    lookups see the new one.
+
+    Args:
+        config: Replacement configuration
+
+    Returns:
+        The new configuration generation
+    """
+    global _default_config, _default_configurable, _config_generation
+
+    configurable = config.configurable.copy()
+    with _config_lock:
+        _config_cache[str(config.config_path.resolve())] = config
+        _default_config = config
+        _default_configurable = configurable
+        _config_generation += 1
+        return _config_generation
+
+
+def get_config_generation() -> int:
+    """
+    Get a counter that changes whenever configuration is (re)loaded.
+
+    Components that derive cached data from configuration (e.g. compiled
+    prompts) compare this value to decide whether to rebuild.
+    """
+    return _config_generation
+
+
 def _get_configurable(config_path: str | None = None, set_as_default: bool = False) -> dict[str, Any]:
     """Get configurable dict with automatic context detection.
 
@@ -0,0 +1,285 @@
+"""
+Configuration Hot Reload
+
+Watches ``config.yml`` and swaps the default configuration snapshot when the
+file changes, so model ids, approval modes or execution limits can be changed
+without restarting the pipelines container (and losing warm kernels and
+in-memory checkpoints):
+
+- A daemon thread polls the file's modification time and size.
+- On a change, a new :class:`~osprey.utils.config.ConfigBuilder` is built and
+  validated on that thread (:func:`validate_reloaded_config`): model roles must
+  name registered providers, and the ``models``, ``execution_control`` and
+  ``file_paths`` keys of the running configuration must still exist with the
+  same types. Invalid files are logged and ignored; the current snapshot stays
+  active.
+- A valid configuration replaces the default snapshot atomically through
+  :func:`~osprey.utils.config.swap_default_config`. Requests already running
+  keep the configuration that was baked into their LangGraph config; new
+  requests see the new snapshot.
+- Every reload attempt is logged and written to
+  ``_agent_data/config_reload_status.json``, which ``osprey health`` reports.
+
+Enabled with ``system.config_reload.enabled``.
+
+.. note::
+   Settings consumed once at startup (registry contents, container and service
+   definitions, logging setup) still require a restart, and so does removing
+   or renaming a key in the structural sections.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from osprey.utils.config import (
+    ConfigBuilder,
+    _get_config,
+    get_agent_dir,
+    get_config_value,
+    swap_default_config,
+)
+
+logger = logging.getLogger('CONFIG')
+
+STATUS_FILE_NAME = "config_reload_status.json"
+
+# Sections read at startup whose keys a reload may change but not drop
+STRUCTURAL_SECTIONS = ("models", "execution_control", "file_paths")
+
+
+@dataclass
+class ConfigReloadEvent:
+    """Outcome of one reload attempt."""
+
+    config_path: str
+    status: str                            # "ok" or "error"
+    generation: int | None = None          # Config generation after a successful swap
+    changed_keys: list[str] = field(default_factory=list)
+    error: str | None = None
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+
+
+def _changed_keys(old: dict[str, Any], new: dict[str, Any], prefix: str = "", depth: int = 2) -> list[str]:
+    """List dot paths that differ between two config dicts, down to ``depth`` levels."""
+    changed = []
+    for key in sorted(set(old) | set(new), key=str):
+        path = f"{prefix}{key}"
+        old_value, new_value = old.get(key), new.get(key)
+        if old_value == new_value:
+            continue
+        if depth > 1 and isinstance(old_value, dict) and isinstance(new_value, dict):
+            changed.extend(_changed_keys(old_value, new_value, f"{path}.", depth - 1))
+        else:
+            changed.append(path)
+    return changed
+
+
+def _leaf_paths(value: Any, prefix: str) -> dict[str, Any]:
+    """Flatten nested dicts into ``{dot.path: leaf value}`` (empty dicts have no leaves)."""
+    if not isinstance(value, dict):
+        return {prefix: value}
+    leaves = {}
+    for key, child in value.items():
+        leaves.update(_leaf_paths(child, f"{prefix}.{key}"))
+    return leaves
+
+
+def _same_kind(old: Any, new: Any) -> bool:
+    if old is None or new is None:
+        return True
+    if isinstance(old, bool) or isinstance(new, bool):
+        return isinstance(old, bool) and isinstance(new, bool)
+    if isinstance(old, int | float) and isinstance(new, int | float):
+        return True
+    return type(old) is type(new)
+
+
+def _is_registered_provider(name: str) -> bool | None:
+    """Check a provider name against the registry (None if it is not initialized)."""
+    from osprey.registry import get_registry
+
+    registry = get_registry()
+    if not registry._initialized:
+        return None
+    return registry.get_provider_registration(name) is not None
+
+
+def validate_reloaded_config(new: ConfigBuilder, current: ConfigBuilder) -> list[str]:
+    """Run the structural checks startup relies on before a reload goes live.
+
+    :param new: Configuration built from the changed file
+    :param current: Configuration currently serving requests
+    :return: Problems found; empty if ``new`` may be swapped in
+    """
+    if not new.raw_config:
+        # Typically caught between an editor's truncate and write
+        return ["configuration file is empty"]
+
+    problems = []
+    for section in STRUCTURAL_SECTIONS:
+        old_value, new_value = current.get(section), new.get(section)
+        if old_value is None:
+            continue
+        if not isinstance(new_value, dict):
+            problems.append(f"'{section}' section is missing")
+        elif section == "models":
+            # Roles may change their settings freely, but not disappear
+            problems.extend(f"'models.{role}' was removed" for role in old_value if role not in new_value)
+        else:
+            new_leaves = _leaf_paths(new_value, section)
+            for path, old_leaf in _leaf_paths(old_value, section).items():
+                if path not in new_leaves:
+                    problems.append(f"'{path}' was removed")
+                elif not _same_kind(old_leaf, new_leaves[path]):
+                    problems.append(f"'{path}' changed type from {type(old_leaf).__name__} "
+                                    f"to {type(new_leaves[path]).__name__}")
+
+    for role, model in (new.get("models") or {}).items():
+        entries = {f"models.{role}": model}
+        if isinstance(model, dict) and model.get("cascade") is not None:
+            entries[f"models.{role}.cascade"] = model["cascade"]
+        for path, entry in entries.items():
+            if not isinstance(entry, dict) or not entry.get("provider"):
+                problems.append(f"'{path}' has no provider")
+            elif _is_registered_provider(entry["provider"]) is False:
+                problems.append(f"'{path}.provider' names unknown provider '{entry['provider']}'")
+
+    return problems
+
+
+class ConfigReloader:
+    """Poll a configuration file and swap in new snapshots when it changes.
+
+    :param config: Active configuration; its ``config_path`` is watched
+    :param poll_interval: Seconds between modification checks
+    :param status_path: File the latest reload event is written to, if any
+    """
+
+    def __init__(self, config: ConfigBuilder, poll_interval: float = 2.0,
+                 status_path: str | Path | None = None):
+        self.config_path = config.config_path.resolve()
+        self.poll_interval = poll_interval
+        self.status_path = Path(status_path) if status_path else None
+        self.events: deque[ConfigReloadEvent] = deque(maxlen=20)
+
+        self._current = config
+        self._signature = self._file_signature()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _file_signature(self) -> tuple[int, int] | None:
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def start(self) -> None:
+        """Start the watcher thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="osprey-config-reload", daemon=True)
+        self._thread.start()
+        logger.info(f"Watching {self.config_path} for configuration changes")
+
+    def stop(self) -> None:
+        """Stop the watcher thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.check_now()
+            except Exception as e:  # Never let the watcher thread die
+                logger.error(f"Configuration reload check failed: {e}")
+
+    def check_now(self) -> ConfigReloadEvent | None:
+        """Reload if the file changed since the last check.
+
+        :return: The reload event, or None if the file is unchanged or missing
+        """
+        signature = self._file_signature()
+        if signature is None or signature == self._signature:
+            return None
+        self._signature = signature
+
+        try:
+            new_config = ConfigBuilder(str(self.config_path))
+            problems = validate_reloaded_config(new_config, self._current)
+            if problems:
+                raise ValueError("; ".join(problems))
+        except Exception as e:
+            event = ConfigReloadEvent(config_path=str(self.config_path), status="error", error=str(e))
+            logger.error(f"Ignoring invalid configuration change in {self.config_path}: {e}")
+        else:
+            changed = _changed_keys(self._current.raw_config, new_config.raw_config)
+            generation = swap_default_config(new_config)
+            self._current = new_config
+            event = ConfigReloadEvent(config_path=str(self.config_path), status="ok",
+                                      generation=generation, changed_keys=changed)
+            logger.info(f"Configuration reloaded (generation {generation}); "
+                        f"changed: {', '.join(changed) or 'nothing'}")
+
+        self.events.append(event)
+        self._write_status(event)
+        return event
+
+    def _write_status(self, event: ConfigReloadEvent) -> None:
+        if self.status_path is None:
+            return
+        tmp_path = None
+        try:
+            self.status_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.status_path.parent, prefix=".config_reload.")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(asdict(event), f, indent=2)
+            os.replace(tmp_path, self.status_path)
+        except OSError as e:
+            logger.warning(f"Could not write config reload status {self.status_path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+def read_reload_status(status_path: str | Path) -> dict[str, Any] | None:
+    """Read the last reload event written by a :class:`ConfigReloader`, if any."""
+    try:
+        with open(status_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+_reloader: ConfigReloader | None = None
+_reloader_lock = threading.Lock()
+
+
+def start_config_reloader() -> ConfigReloader | None:
+    """Start the process-wide reloader if ``system.config_reload.enabled`` is set.
+
+    :return: The running reloader, or None if hot reload is disabled
+    """
+    global _reloader
+    if not get_config_value('system.config_reload.enabled', False):
+        return None
+
+    with _reloader_lock:
+        if _reloader is None:
+            _reloader = ConfigReloader(
+                _get_config(),
+                poll_interval=get_config_value('system.config_reload.poll_interval_seconds', 2.0),
+                status_path=Path(get_agent_dir(STATUS_FILE_NAME)),
+            )
+        _reloader.start()
+        return _reloader
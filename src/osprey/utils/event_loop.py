@@ -0,0 +1,185 @@
+"""
+Background Event Loop
+
+A long-lived asyncio event loop on a daemon thread, for synchronous hosts that
+drive the asynchronous framework (such as the OpenWebUI pipeline, whose
+``pipe()`` is a plain generator):
+
+- Coroutines are submitted with :func:`asyncio.run_coroutine_threadsafe`, so
+  the graph, gateway, HTTP clients and other loop-bound resources created on
+  the loop survive between requests, and concurrent requests share one loop
+  instead of each creating their own.
+- :meth:`BackgroundEventLoop.iterate` bridges an async iterator to a sync
+  iterator through a bounded queue. The producer runs ahead of the consumer by
+  at most ``buffer_size`` items and then waits, and closing the sync iterator
+  cancels the producer.
+
+Examples:
+    Driving async code from a sync generator::
+
+        >>> from osprey.utils.event_loop import get_background_loop
+        >>> loop = get_background_loop()
+        >>> result = loop.run(gateway.process_message(message, graph, config))
+        >>> for chunk in loop.iterate(graph.astream(state, config=config)):
+        ...     yield chunk
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+from collections.abc import AsyncIterable, Coroutine, Iterator
+from typing import Any, TypeVar
+
+from osprey.utils.logger import get_logger
+
+logger = get_logger("osprey")
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 64
+
+_END = object()
+
+
+class BackgroundEventLoop:
+    """Event loop running forever on a daemon thread.
+
+    :param name: Name of the loop thread
+    :param max_workers: Size of the loop's default executor, used by
+        ``asyncio.to_thread`` (blocking LLM calls) and sync graph functions of
+        every request on the loop (default: asyncio's CPU-based size)
+    """
+
+    def __init__(self, name: str = "osprey-event-loop", max_workers: int | None = None):
+        self.name = name
+        self.max_workers = max_workers
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop, started on first access."""
+        self.start()
+        return self._loop
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the loop thread (no-op if already running)."""
+        with self._lock:
+            if self.running:
+                return
+            loop = asyncio.new_event_loop()
+            if self.max_workers:
+                loop.set_default_executor(concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=f"{self.name}-worker"))
+            ready = threading.Event()
+
+            def run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+            self._thread.start()
+            ready.wait()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Cancel pending tasks, stop the loop and close it."""
+        with self._lock:
+            if not self.running:
+                return
+            loop, thread = self._loop, self._thread
+
+            async def cancel_tasks() -> None:
+                tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            try:
+                asyncio.run_coroutine_threadsafe(cancel_tasks(), loop).result(timeout)
+            except (concurrent.futures.TimeoutError, RuntimeError):
+                logger.warning(f"Event loop {self.name} did not cancel its tasks within {timeout}s")
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            if not thread.is_alive():
+                loop.close()
+            self._loop = self._thread = None
+
+    def in_loop(self) -> bool:
+        """Whether the caller runs on this loop."""
+        try:
+            return self._loop is not None and asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """Schedule ``coro`` on the loop and return a thread-safe future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Run ``coro`` on the loop and block until it finishes.
+
+        :raises RuntimeError: If called from the loop thread itself (it would deadlock)
+        """
+        if self.in_loop():
+            coro.close()
+            raise RuntimeError("BackgroundEventLoop.run() called from its own loop; await instead")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def iterate(self, source: AsyncIterable[T], buffer_size: int = 64) -> Iterator[T]:
+        """Consume an async iterable from synchronous code.
+
+        Items are produced on the loop into a queue of at most ``buffer_size``
+        items; exceptions raised by ``source`` are re-raised in the consumer.
+        Closing the returned generator early cancels the producer.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+
+        async def produce() -> None:
+            try:
+                async for item in source:
+                    await queue.put((item, None))
+            except Exception as exc:
+                await queue.put((_END, exc))
+                return
+            await queue.put((_END, None))
+
+        producer = self.submit(produce())
+        try:
+            while True:
+                item, error = self.run(queue.get())
+                if item is _END:
+                    if error is not None:
+                        raise error
+                    return
+                yield item
+        finally:
+            producer.cancel()
+
+
+_background_loop: BackgroundEventLoop | None = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> BackgroundEventLoop:
+    """Get the process-wide background event loop, starting it if needed."""
+    global _background_loop
+    if _background_loop is None:
+        with _background_loop_lock:
+            if _background_loop is None:
+                _background_loop = BackgroundEventLoop(max_workers=DEFAULT_MAX_WORKERS)
+                atexit.register(_background_loop.stop)
+    _background_loop.start()
+    return _background_loop
@@ -0,0 +1,482 @@
+"""Offline Load Testing of Concurrent Chat Sessions.
+
+Drives simulated users through the same path as ``osprey chat``
+(:meth:`Gateway.process_message <osprey.infrastructure.gateway.Gateway.process_message>`
+followed by streaming the compiled graph) to catch scaling regressions in the
+framework itself:
+
+- Every user is a separate conversation thread that sends ``turns`` queries
+  from a scripted corpus, one after another; users run concurrently on one
+  event loop, as sessions do in the pipelines server.
+- By default every model role is pointed at the ``fake`` provider
+  (:mod:`osprey.models.providers.fake`) with a configurable latency
+  distribution, so no network or API key is needed. A ``replay`` cassette can
+  be used instead for realistic answers.
+- Reported: turn throughput and latency percentiles, per-node latency
+  percentiles (estimated from ``osprey_node_duration_seconds`` buckets),
+  event-loop lag, and resident memory and checkpoint size sampled over time.
+
+Run it with ``osprey loadtest``.
+"""
+
+import asyncio
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from osprey.utils.config import ConfigBuilder
+from osprey.utils.logger import get_logger
+from osprey.utils.metrics import NODE_DURATION, histogram_quantile
+
+logger = get_logger("loadtest")
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+DEFAULT_QUERIES = (
+    "What can you help me with?",
+    "Summarize what we discussed so far.",
+    "What is the current status of the system?",
+    "Show me the readings from the last hour.",
+    "Thanks, that is all for now.",
+)
+
+LAG_PROBE_INTERVAL_SECONDS = 0.05
+
+# Scripted fake answers: a one-step respond plan, as the orchestrator would plan it
+SIMULATED_RESPONSES = {
+    "ExecutionPlan": {"steps": [{
+        "context_key": "user_response",
+        "capability": "respond",
+        "task_objective": "Respond to the user's request",
+        "expected_output": "user_response",
+        "success_criteria": "Provide a helpful response",
+        "inputs": [],
+    }]},
+}
+
+
+def load_corpus(path: str | Path | None) -> list[str]:
+    """Read the query corpus: one query per line of a text file, or a YAML/JSON list.
+
+    Blank lines and lines starting with ``#`` are skipped. Without a path the
+    built-in :data:`DEFAULT_QUERIES` are used.
+    """
+    if path is None:
+        return list(DEFAULT_QUERIES)
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+    if path.suffix in (".yml", ".yaml", ".json"):
+        import yaml
+        queries = yaml.safe_load(text) or []
+        if not isinstance(queries, list):
+            raise ValueError(f"Query corpus {path} must contain a list of queries")
+        queries = [str(query) for query in queries]
+    else:
+        queries = [line.strip() for line in text.splitlines()
+                   if line.strip() and not line.lstrip().startswith("#")]
+    if not queries:
+        raise ValueError(f"Query corpus {path} contains no queries")
+    return queries
+
+
+def use_simulated_models(config: ConfigBuilder, fake_settings: dict[str, Any] | None = None) -> ConfigBuilder:
+    """Point every model role of ``config`` at the fake provider, in place.
+
+    Model ids and ``max_tokens`` are kept so rate limits and token estimates
+    behave as configured; cascades are dropped. Unless the configuration sets
+    its own ``responses``, the orchestrator answers with :data:`SIMULATED_RESPONSES`.
+
+    :param config: Loaded configuration (not yet the active snapshot)
+    :param fake_settings: Settings merged over ``api.providers.fake``
+    :return: ``config``, ready for :func:`~osprey.utils.config.swap_default_config`
+    """
+    raw = config.raw_config
+    models = raw.get("models") or {}
+    for role, model_config in models.items():
+        model_config = model_config or {}
+        simulated = {"provider": "fake", "model_id": model_config.get("model_id", "fake")}
+        if "max_tokens" in model_config:
+            simulated["max_tokens"] = model_config["max_tokens"]
+        models[role] = simulated
+
+    api = raw.get("api") or {}
+    providers = api.get("providers") or {}
+    providers["fake"] = {"responses": SIMULATED_RESPONSES, **(providers.get("fake") or {}), **(fake_settings or {})}
+    api["providers"] = providers
+    raw["api"] = api
+
+    config.configurable = config._build_configurable()
+    return config
+
+
+# ----------------------------------------------------------------------
+# Resource probes
+# ----------------------------------------------------------------------
+
+def resident_memory_bytes() -> int | None:
+    """Current resident set size (peak RSS where the current value is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _payload_bytes(value: Any) -> int:
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_payload_bytes(item) for item in list(value.values()))
+    if isinstance(value, (list, tuple)):
+        return sum(_payload_bytes(item) for item in value)
+    return 0
+
+
+def checkpoint_size_bytes(checkpointer: Any, db_path: str | Path | None = None) -> int | None:
+    """Serialized size of all checkpoints.
+
+    :param checkpointer: In-memory checkpointer, measured by its stored payloads
+    :param db_path: SQLite database file, measured on disk including its WAL
+    :return: Size in bytes, or None for checkpointers that cannot be measured
+    """
+    if db_path is not None:
+        return sum(os.path.getsize(f"{db_path}{suffix}") for suffix in ("", "-wal")
+                   if os.path.exists(f"{db_path}{suffix}"))
+    if not hasattr(checkpointer, "storage"):
+        return None
+    return _payload_bytes([checkpointer.storage, checkpointer.writes, getattr(checkpointer, "blobs", {})])
+
+
+class EventLoopLagMonitor:
+    """Measures how late the event loop wakes a task that sleeps in short intervals.
+
+    Lag means some code blocked the loop (synchronous work in a node, a
+    blocking call outside ``asyncio.to_thread``) and delayed every session.
+    """
+
+    def __init__(self, interval: float = LAG_PROBE_INTERVAL_SECONDS):
+        self.interval = interval
+        self.lags_ms: list[float] = []
+        self._window_max = 0.0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._probe())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def take_window_max(self) -> float:
+        """Largest lag since the previous call, in milliseconds."""
+        window_max, self._window_max = self._window_max, 0.0
+        return window_max
+
+    async def _probe(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, loop.time() - expected) * 1000
+            self.lags_ms.append(lag_ms)
+            self._window_max = max(self._window_max, lag_ms)
+
+
+# ----------------------------------------------------------------------
+# Report
+# ----------------------------------------------------------------------
+
+def percentile(values: list[float], quantile: float) -> float | None:
+    """Nearest-rank percentile of ``values`` (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, round(quantile * len(ordered) + 0.5) - 1))]
+
+
+@dataclass
+class LoadTestSample:
+    """Resource usage at one point of the run."""
+
+    elapsed_seconds: float
+    turns_completed: int
+    rss_bytes: int | None
+    checkpoint_bytes: int | None
+    max_loop_lag_ms: float
+
+
+@dataclass
+class NodeLatency:
+    """Executions and estimated latency percentiles (seconds) of one graph node."""
+
+    node: str
+    node_type: str
+    count: int
+    p50: float | None
+    p95: float | None
+    p99: float | None
+
+
+@dataclass
+class LoadTestReport:
+    """Outcome of a load test run."""
+
+    users: int
+    turns_per_user: int
+    duration_seconds: float
+    turn_latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    interrupts: int = 0
+    nodes: list[NodeLatency] = field(default_factory=list)
+    loop_lag_ms: list[float] = field(default_factory=list)
+    samples: list[LoadTestSample] = field(default_factory=list)
+
+    @property
+    def turns_completed(self) -> int:
+        return len(self.turn_latencies)
+
+    @property
+    def throughput(self) -> float:
+        """Completed turns per second."""
+        return self.turns_completed / self.duration_seconds if self.duration_seconds else 0.0
+
+    @property
+    def memory_growth_bytes(self) -> int | None:
+        rss = [sample.rss_bytes for sample in self.samples if sample.rss_bytes is not None]
+        return rss[-1] - rss[0] if len(rss) >= 2 else None
+
+    @property
+    def checkpoint_bytes(self) -> int | None:
+        sizes = [sample.checkpoint_bytes for sample in self.samples if sample.checkpoint_bytes is not None]
+        return sizes[-1] if sizes else None
+
+    def turn_percentiles(self) -> dict[float, float | None]:
+        return {q: percentile(self.turn_latencies, q) for q in QUANTILES}
+
+    def loop_lag_percentiles(self) -> dict[float, float | None]:
+        return {q: percentile(self.loop_lag_ms, q) for q in (*QUANTILES, 1.0)}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary for JSON export (raw lag probes omitted)."""
+        return {
+            "users": self.users,
+            "turns_per_user": self.turns_per_user,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "turns_completed": self.turns_completed,
+            "errors": self.errors,
+            "interrupts": self.interrupts,
+            "throughput_turns_per_second": round(self.throughput, 3),
+            "turn_latency_seconds": {f"p{round(q * 100)}": v for q, v in self.turn_percentiles().items()},
+            "loop_lag_ms": {("max" if q == 1.0 else f"p{round(q * 100)}"): v
+                            for q, v in self.loop_lag_percentiles().items()},
+            "memory_growth_bytes": self.memory_growth_bytes,
+            "checkpoint_bytes": self.checkpoint_bytes,
+            "nodes": [asdict(node) for node in self.nodes],
+            "samples": [asdict(sample) for sample in self.samples],
+        }
+
+
+def node_latencies(before: dict, after: dict) -> list[NodeLatency]:
+    """Per-node latency percentiles from two snapshots of ``osprey_node_duration_seconds``."""
+    nodes = []
+    for key, (counts, _) in after.items():
+        previous = before.get(key, ([0] * len(counts), 0.0))[0]
+        delta = [now - then for now, then in zip(counts, previous, strict=True)]
+        if not any(delta):
+            continue
+        p50, p95, p99 = (histogram_quantile(q, NODE_DURATION.buckets, delta) for q in QUANTILES)
+        nodes.append(NodeLatency(node=key[0], node_type=key[1], count=sum(delta), p50=p50, p95=p95, p99=p99))
+    return sorted(nodes, key=lambda node: node.p95 or 0.0, reverse=True)
+
+
+# ----------------------------------------------------------------------
+# Running sessions
+# ----------------------------------------------------------------------
+
+async def _run_turn(graph: Any, gateway: Any, query: str, config: dict) -> str:
+    """Process one query like ``osprey chat``; returns ``ok``, ``error`` or ``interrupted``."""
+    result = await gateway.process_message(query, graph, config)
+    if result.error:
+        logger.warning(f"Load test turn failed in gateway: {result.error}")
+        return "error"
+    input_data = result.resume_command or result.agent_state
+    if input_data is None:
+        return "ok"
+    async for _ in graph.astream(input_data, config=config, stream_mode="custom"):
+        pass
+    state = await graph.aget_state(config)
+    return "interrupted" if state.interrupts else "ok"
+
+
+async def run_sessions(
+    graph: Any,
+    gateway: Any,
+    base_config: dict[str, Any],
+    queries: list[str],
+    *,
+    users: int,
+    turns: int,
+    ramp_up_seconds: float = 0.0,
+    sample_interval: float = 1.0,
+    checkpointer: Any = None,
+    checkpoint_path: str | Path | None = None,
+) -> LoadTestReport:
+    """Run ``users`` concurrent conversations of ``turns`` queries each.
+
+    User ``i`` sends ``queries[(i + j) % len(queries)]`` as turn ``j``, so
+    concurrent users do not all send the same query at once.
+
+    :param graph: Compiled agent graph
+    :param gateway: Gateway instance
+    :param base_config: LangGraph config (``configurable`` and ``recursion_limit``);
+        thread, user and session ids are set per user
+    :param queries: Query corpus
+    :param users: Number of concurrent simulated users
+    :param turns: Queries per user
+    :param ramp_up_seconds: Spread user start times over this period
+    :param sample_interval: Seconds between resource samples
+    :param checkpointer: Checkpointer of ``graph``, for checkpoint size samples
+    :param checkpoint_path: SQLite file of the checkpointer, if any
+    :return: Report of the run
+    """
+    run_id = uuid.uuid4().hex[:6]
+    report = LoadTestReport(users=users, turns_per_user=turns, duration_seconds=0.0)
+    monitor = EventLoopLagMonitor()
+    nodes_before = NODE_DURATION.snapshot()
+    start = time.perf_counter()
+
+    def sample() -> None:
+        report.samples.append(LoadTestSample(
+            elapsed_seconds=round(time.perf_counter() - start, 3),
+            turns_completed=report.turns_completed,
+            rss_bytes=resident_memory_bytes(),
+            checkpoint_bytes=checkpoint_size_bytes(checkpointer, checkpoint_path),
+            max_loop_lag_ms=round(monitor.take_window_max(), 3),
+        ))
+
+    async def sampler() -> None:
+        while True:
+            await asyncio.sleep(sample_interval)
+            sample()
+
+    async def simulate_user(index: int) -> None:
+        if ramp_up_seconds and users > 1:
+            await asyncio.sleep(ramp_up_seconds * index / users)
+        thread_id = f"loadtest_{run_id}_{index}"
+        configurable = dict(base_config.get("configurable", {}))
+        configurable.update({
+            "user_id": f"loadtest_user_{index}",
+            "thread_id": thread_id,
+            "chat_id": f"loadtest_chat_{index}",
+            "session_id": thread_id,
+            "interface_context": "cli",
+        })
+        config = {**base_config, "configurable": configurable}
+        for turn in range(turns):
+            query = queries[(index + turn) % len(queries)]
+            turn_start = time.perf_counter()
+            try:
+                outcome = await _run_turn(graph, gateway, query, config)
+            except Exception as e:
+                logger.warning(f"Load test turn of {thread_id} failed: {e}")
+                outcome = "error"
+            if outcome == "error":
+                report.errors += 1
+                continue
+            report.turn_latencies.append(time.perf_counter() - turn_start)
+            if outcome == "interrupted":
+                # Approvals are not simulated; the conversation cannot continue
+                report.interrupts += 1
+                return
+
+    gc.collect()
+    sample()
+    monitor.start()
+    sampler_task = asyncio.create_task(sampler())
+    try:
+        await asyncio.gather(*(simulate_user(index) for index in range(users)))
+    finally:
+        report.duration_seconds = time.perf_counter() - start
+        sampler_task.cancel()
+        await monitor.stop()
+        gc.collect()
+        sample()
+
+    report.loop_lag_ms = monitor.lags_ms
+    report.nodes = node_latencies(nodes_before, NODE_DURATION.snapshot())
+    return report
+
+
+async def run_load_test(
+    config_path: str | Path,
+    queries: list[str],
+    *,
+    users: int,
+    turns: int,
+    ramp_up_seconds: float = 0.0,
+    sample_interval: float = 1.0,
+    checkpointer_backend: str = "memory",
+) -> LoadTestReport:
+    """Build the registry, graph and gateway of a project and run :func:`run_sessions`.
+
+    The configuration snapshot to test (e.g. from :func:`use_simulated_models`)
+    must already be active.
+
+    :param config_path: Project configuration file
+    :param checkpointer_backend: ``memory`` or ``sqlite`` (in a temporary directory)
+    """
+    from langgraph.checkpoint.memory import MemorySaver
+
+    from osprey.graph import create_graph
+    from osprey.graph.graph_builder import create_async_sqlite_checkpointer
+    from osprey.infrastructure.gateway import Gateway
+    from osprey.registry import get_registry, initialize_registry
+    from osprey.utils.config import get_config_value, get_full_configuration
+
+    initialize_registry(config_path=str(config_path))
+    base_config = {
+        "configurable": get_full_configuration().copy(),
+        "recursion_limit": get_config_value("execution_limits.graph_recursion_limit"),
+    }
+
+    with tempfile.TemporaryDirectory(prefix="osprey-loadtest-") as temp_dir:
+        checkpoint_path = None
+        if checkpointer_backend == "sqlite":
+            checkpoint_path = os.path.join(temp_dir, "checkpoints.sqlite")
+            checkpointer = await create_async_sqlite_checkpointer(checkpoint_path)
+        else:
+            checkpointer = MemorySaver()
+
+        try:
+            graph = create_graph(get_registry(), checkpointer=checkpointer)
+            return await run_sessions(
+                graph, Gateway(), base_config, queries,
+                users=users, turns=turns, ramp_up_seconds=ramp_up_seconds,
+                sample_interval=sample_interval, checkpointer=checkpointer,
+                checkpoint_path=checkpoint_path,
+            )
+        finally:
+            if checkpoint_path is not None:
+                await checkpointer.conn.close()
+
+
+def write_report(report: LoadTestReport, path: str | Path) -> None:
+    """Write the report summary as JSON."""
+    Path(path).write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
@@ -61,9 +61,22 @@ Examples:
 import logging
 import re
 from contextlib import contextmanager
+from functools import lru_cache
 from re import Pattern
 
 
+@lru_cache(maxsize=128)
+def _compile_patterns(patterns: tuple[str, ...]) -> Pattern | None:
+    """Compile message patterns into one alternation, cached across filters.
+
+    ``suppress_logger`` creates a new filter on every entry, so the compiled
+    result is shared between filters with the same patterns.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
 class LoggerFilter(logging.Filter):
     """Flexible filter for selective log suppression based on multiple criteria.
 
@@ -78,7 +91,7 @@ class LoggerFilter(logging.Filter):
 
     Attributes:
         logger_names: Set of logger names this filter applies to
-        message_patterns: Compiled regex patterns to match against messages
+        message_patterns: Regex patterns to match against messages (compiled into one alternation)
         levels: Set of log levels this filter applies to
         invert: If True, inverts the filter logic (show only matches)
 
@@ -146,10 +159,9 @@ class LoggerFilter(logging.Filter):
         # Convert logger_names to set for O(1) lookup
         self.logger_names: set[str] = set(logger_names or [])
 
-        # Compile message patterns for efficient matching
-        self.message_patterns: list[Pattern] = [
-            re.compile(pattern) for pattern in (message_patterns or [])
-        ]
+        # Single combined pattern: one regex scan per record instead of one per pattern
+        self.message_patterns: tuple[str, ...] = tuple(message_patterns or ())
+        self._combined_pattern = _compile_patterns(self.message_patterns)
 
         # Convert levels to set for O(1) lookup
         self.levels: set[int] = set(levels or [])
@@ -189,9 +201,8 @@ class LoggerFilter(logging.Filter):
             return True  # Don't filter messages at other levels
 
         # Step 3: Check message patterns if specified
-        if self.message_patterns:
-            message = record.getMessage()
-            matches = any(pattern.search(message) for pattern in self.message_patterns)
+        if self._combined_pattern is not None:
+            matches = self._combined_pattern.search(record.getMessage()) is not None
 
             if self.invert:
                 # Inverted: show only matches, suppress non-matches
@@ -217,8 +228,7 @@ class LoggerFilter(logging.Filter):
             level_names = [logging.getLevelName(lvl) for lvl in self.levels]
             parts.append(f"levels={level_names}")
         if self.message_patterns:
-            patterns = [p.pattern for p in self.message_patterns]
-            parts.append(f"patterns={patterns}")
+            parts.append(f"patterns={list(self.message_patterns)}")
         if self.invert:
             parts.append("inverted=True")
 
@@ -23,15 +23,46 @@ Usage:
 
     # Custom loggers with explicit parameters
     logger = get_logger(name="custom_component", color="blue")
+
+    # Expensive messages: pass a callable or %-style arguments. Nothing is
+    # formatted (and the callable is not called) when the level is disabled.
+    logger.debug(lambda: f"Full state: {json.dumps(state, indent=2)}")
+    logger.info("Loaded %d capabilities", count)
+
+Output:
+    logging.format selects Rich console output (``rich``, default) or one JSON
+    object per line (``json``). With logging.async_output, records are handed
+    to a QueueHandler and written by a QueueListener thread, so slow terminals
+    or pipes never block the event loop.
 """
 
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import queue
+import sys
+from collections.abc import Callable
+from datetime import UTC, datetime
 
 from rich.console import Console
 from rich.logging import RichHandler
 
 from osprey.utils.config import get_config_value
 
+# A log message, or a callable producing it on demand
+LogMessage = str | Callable[[], str]
+
+# False in JSON mode: ComponentLogger then emits plain messages without Rich markup
+_rich_markup = True
+
+# Background sink for async output (see _setup_rich_logging)
+_queue_listener: logging.handlers.QueueListener | None = None
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
 
 class ComponentLogger:
     """
@@ -66,6 +97,9 @@ class ComponentLogger:
 
     def _format_message(self, message: str, style: str, emoji: str = '') -> str:
         """Format message with Rich markup and emoji prefix."""
+        if not _rich_markup:
+            # Structured output: the component is a separate field, no markup or emoji
+            return message
         try:
             prefix = f"{emoji}{self.component_name.title()}: "
             if style:
@@ -76,61 +110,69 @@ class ComponentLogger:
             # Graceful degradation for environments where Rich markup fails
             return f"{emoji}{self.component_name.title()}: {message}"
 
-    def key_info(self, message: str) -> None:
+    def _emit(self, level: int, message: LogMessage, args: tuple, style: str, emoji: str = '',
+              **kwargs) -> None:
+        """Format and log ``message`` only if ``level`` is enabled.
+
+        ``message`` may be a callable returning the text, and ``args`` are
+        applied %-style, so expensive messages cost nothing when disabled.
+        """
+        if not self.base_logger.isEnabledFor(level):
+            return
+        if callable(message):
+            message = message()
+        if args:
+            message = message % args
+        extra = kwargs.pop('extra', None) or {}
+        self.base_logger.log(level, self._format_message(str(message), style, emoji),
+                             extra={'component': self.component_name, **extra},
+                             stacklevel=3, **kwargs)
+
+    def key_info(self, message: LogMessage, *args) -> None:
         """Important operational information."""
         style = f"bold {self.color}" if self.color != "white" else "bold white"
-        formatted = self._format_message(message, style, '')
-        self.base_logger.info(formatted)
+        self._emit(logging.INFO, message, args, style)
 
-    def info(self, message: str) -> None:
+    def info(self, message: LogMessage, *args) -> None:
         """Normal operational information."""
-        formatted = self._format_message(message, self.color, '')
-        self.base_logger.info(formatted)
+        self._emit(logging.INFO, message, args, self.color)
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: LogMessage, *args) -> None:
         """Detailed tracing information."""
         style = f"dim {self.color}" if self.color != "white" else "dim white"
-        formatted = self._format_message(message, style, '🔍 ')
-        self.base_logger.debug(formatted)
+        self._emit(logging.DEBUG, message, args, style, '🔍 ')
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: LogMessage, *args) -> None:
         """Warning messages."""
-        formatted = self._format_message(message, "bold yellow", '⚠️  ')
-        self.base_logger.warning(formatted)
+        self._emit(logging.WARNING, message, args, "bold yellow", '⚠️  ')
 
-    def error(self, message: str, exc_info: bool = False) -> None:
+    def error(self, message: LogMessage, *args, exc_info: bool = False) -> None:
         """Error messages."""
-        formatted = self._format_message(message, "bold red", '❌ ')
-        self.base_logger.error(formatted, exc_info=exc_info)
+        self._emit(logging.ERROR, message, args, "bold red", '❌ ', exc_info=exc_info)
 
-    def success(self, message: str) -> None:
+    def success(self, message: LogMessage, *args) -> None:
         """Success messages."""
-        formatted = self._format_message(message, "bold green", '✅ ')
-        self.base_logger.info(formatted)
+        self._emit(logging.INFO, message, args, "bold green", '✅ ')
 
-    def timing(self, message: str) -> None:
+    def timing(self, message: LogMessage, *args) -> None:
         """Timing messages."""
-        formatted = self._format_message(message, "bold white", '🕒 ')
-        self.base_logger.info(formatted)
+        self._emit(logging.INFO, message, args, "bold white", '🕒 ')
 
-    def approval(self, message: str) -> None:
+    def approval(self, message: LogMessage, *args) -> None:
         """Approval messages."""
-        formatted = self._format_message(message, "bold yellow", '🔍⚠️ ')
-        self.base_logger.info(formatted)
+        self._emit(logging.INFO, message, args, "bold yellow", '🔍⚠️ ')
 
-    def resume(self, message: str) -> None:
+    def resume(self, message: LogMessage, *args) -> None:
         """Resume messages."""
-        formatted = self._format_message(message, "bold green", '🔄 ')
-        self.base_logger.info(formatted)
+        self._emit(logging.INFO, message, args, "bold green", '🔄 ')
 
     # Compatibility methods - delegate to base logger
-    def critical(self, message: str, *args, **kwargs) -> None:
-        formatted = self._format_message(message, "bold red", '❌ ')
-        self.base_logger.critical(formatted, *args, **kwargs)
+    def critical(self, message: LogMessage, *args, **kwargs) -> None:
+        self._emit(logging.CRITICAL, message, args, "bold red", '❌ ', **kwargs)
 
-    def exception(self, message: str, *args, **kwargs) -> None:
-        formatted = self._format_message(message, "bold red", '❌ ')
-        self.base_logger.exception(formatted, *args, **kwargs)
+    def exception(self, message: LogMessage, *args, **kwargs) -> None:
+        kwargs.setdefault('exc_info', True)
+        self._emit(logging.ERROR, message, args, "bold red", '❌ ', **kwargs)
 
     def log(self, level: int, message: str, *args, **kwargs) -> None:
         self.base_logger.log(level, message, *args, **kwargs)
@@ -153,20 +195,46 @@ class ComponentLogger:
 
 
 
-def _setup_rich_logging(level: int = logging.INFO) -> None:
-    """Configure Rich logging for the root logger (called once)."""
-    root_logger = logging.getLogger()
+class JSONFormatter(logging.Formatter):
+    """Format records as single-line JSON objects for log aggregation."""
 
-    # Prevent duplicate handler registration for consistent logging behavior
-    for handler in root_logger.handlers:
-        if isinstance(handler, RichHandler):
-            return
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        # Structured fields passed via ``extra`` (including the component name)
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
 
-    # Ensure clean handler state to prevent duplicate log messages
-    if root_logger.hasHandlers():
-        root_logger.handlers.clear()
 
-    root_logger.setLevel(level)
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that hands records to the listener unformatted.
+
+    The stock ``prepare`` pre-formats the message and drops ``exc_info``, which
+    would lose Rich tracebacks and JSON exception fields. The queue never leaves
+    the process, so the record only needs its message merged with its args.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _create_output_handler(log_format: str) -> logging.Handler:
+    """Create the handler that writes records to the terminal."""
+    if log_format == "json":
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(JSONFormatter())
+        return handler
 
     # Load user-configurable display preferences from config
     try:
@@ -188,7 +256,7 @@ def _setup_rich_logging(level: int = logging.INFO) -> None:
         color_system="truecolor",  # Enable full color spectrum for component identification
     )
 
-    handler = RichHandler(
+    return RichHandler(
         console=console,                    # Use our custom console
         rich_tracebacks=rich_tracebacks,    # Configurable rich tracebacks
         markup=True,                        # Enable [bold], [green], etc. in log messages
@@ -198,6 +266,49 @@ def _setup_rich_logging(level: int = logging.INFO) -> None:
         tracebacks_show_locals=show_traceback_locals,  # Configurable local variables
     )
 
+
+def _stop_queue_listener() -> None:
+    """Drain and stop the background log sink (registered with atexit)."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+def _setup_rich_logging(level: int = logging.INFO) -> None:
+    """Configure Rich or JSON logging for the root logger (called once)."""
+    global _rich_markup, _queue_listener
+    root_logger = logging.getLogger()
+
+    # Prevent duplicate handler registration for consistent logging behavior
+    for handler in root_logger.handlers:
+        if isinstance(handler, RichHandler) or getattr(handler, "_osprey_handler", False):
+            return
+
+    # Ensure clean handler state to prevent duplicate log messages
+    if root_logger.hasHandlers():
+        root_logger.handlers.clear()
+
+    root_logger.setLevel(level)
+
+    try:
+        log_format = get_config_value("logging.format", "rich")
+        async_output = get_config_value("logging.async_output", False)
+    except Exception:
+        log_format, async_output = "rich", False
+
+    _rich_markup = log_format != "json"
+    handler = _create_output_handler(log_format)
+
+    if async_output:
+        # Terminal writes happen on the listener thread; callers only enqueue
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+        _queue_listener.start()
+        atexit.register(_stop_queue_listener)
+        handler = _RecordQueueHandler(log_queue)
+
+    handler._osprey_handler = True
     root_logger.addHandler(handler)
 
     # Reduce third-party library noise to focus on application-specific issues
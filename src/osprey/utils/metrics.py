@@ -0,0 +1,483 @@
+"""
+In-Process Metrics Registry
+
+Counters, gauges and latency histograms for the values the framework already
+computes while running (node execution time, LLM latency, router decisions,
+cache lookups), exported in the Prometheus text exposition format:
+
+- The pipelines server exposes them on a small HTTP endpoint
+  (:func:`start_metrics_server`, ``services.pipelines.metrics_port``).
+- ``osprey chat`` writes a snapshot to ``_agent_data/metrics.prom`` at exit.
+- ``osprey metrics`` reads either source.
+
+The registry has no external dependencies; recording a value takes a lock and a
+dictionary update. Metric and label names follow Prometheus conventions.
+
+Examples:
+    Recording a custom metric::
+
+        >>> from osprey.utils.metrics import get_metrics_registry
+        >>> exports = get_metrics_registry().counter(
+        ...     "myapp_exports_total", "Exported files", ["format"])
+        >>> exports.inc(format="csv")
+"""
+
+import atexit
+import bisect
+import functools
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from osprey.utils.logger import get_logger
+from osprey.utils.trace_recorder import _serialize_response, estimate_tokens
+
+logger = get_logger("osprey")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+SNAPSHOT_FILE_NAME = "metrics.prom"
+
+# Seconds; covers fast infrastructure nodes up to long LLM and executor calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: list[str] | tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        yield from self._samples()
+
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be computed at collection time."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._function: Callable[[], float] | None = None
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the (unlabelled) value by calling ``function`` at collection time."""
+        self._function = function
+
+    def get(self, **labels: str) -> float:
+        if self._function is not None:
+            return float(self._function())
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> Iterator[str]:
+        if self._function is not None:
+            yield f"{self.name} {_format_value(self.get())}"
+            return
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts..., +Inf count], sum
+        self._values: dict[tuple[str, ...], tuple[list[int], float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def snapshot(self) -> dict[tuple[str, ...], tuple[list[int], float]]:
+        """Copy of the per-bucket counts (last: +Inf) and sum for every label set."""
+        with self._lock:
+            return {key: (list(counts), total) for key, (counts, total) in self._values.items()}
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}"
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type[_Metric], name: str, documentation: str, labelnames, **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered with a different type or labels")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = [line for metric in metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+def histogram_quantile(quantile: float, buckets: tuple[float, ...], counts: list[int]) -> float | None:
+    """Estimate a quantile from per-bucket counts like Prometheus' ``histogram_quantile``.
+
+    Interpolates linearly within the bucket containing the quantile; values in
+    the +Inf bucket are reported as the largest finite bound.
+
+    :param quantile: Quantile between 0 and 1
+    :param buckets: Finite upper bounds of the histogram
+    :param counts: Observations per bucket (not cumulative), +Inf bucket last
+    :return: Estimated value, or None without observations
+    """
+    total = sum(counts)
+    if not total:
+        return None
+    rank = quantile * total
+    cumulative = 0
+    for index, count in enumerate(counts):
+        if count and cumulative + count >= rank:
+            if index == len(buckets):
+                return buckets[-1]
+            lower = buckets[index - 1] if index else 0.0
+            return lower + (buckets[index] - lower) * (rank - cumulative) / count
+        cumulative += count
+    return buckets[-1]
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _registry
+
+
+# ----------------------------------------------------------------------
+# Framework metrics
+# ----------------------------------------------------------------------
+
+NODE_DURATION = _registry.histogram(
+    "osprey_node_duration_seconds", "Graph node execution time", ["node", "node_type"])
+NODE_ERRORS = _registry.counter(
+    "osprey_node_errors_total", "Graph node executions that raised", ["node", "node_type"])
+LLM_DURATION = _registry.histogram(
+    "osprey_llm_request_duration_seconds", "LLM completion latency", ["provider", "model"])
+LLM_ERRORS = _registry.counter(
+    "osprey_llm_errors_total", "Failed LLM completions", ["provider", "model"])
+LLM_TOKENS = _registry.counter(
+    "osprey_llm_tokens_total", "Estimated LLM tokens (about four characters per token)",
+    ["provider", "model", "direction"])
+LLM_RATE_LIMITED = _registry.counter(
+    "osprey_llm_rate_limited_total", "LLM calls answered with HTTP 429", ["provider", "model"])
+LLM_CONCURRENCY_LIMIT = _registry.gauge(
+    "osprey_llm_concurrency_limit", "Adaptive concurrency limit per model", ["provider", "model"])
+LLM_QUEUE_WAIT = _registry.histogram(
+    "osprey_llm_queue_wait_seconds", "Time LLM calls waited in the provider rate limiter",
+    ["provider", "model"])
+LLM_HEDGES = _registry.counter(
+    "osprey_llm_hedged_requests_total", "Duplicate LLM calls fired after the latency percentile",
+    ["provider", "model"])
+LLM_FAILOVERS = _registry.counter(
+    "osprey_llm_endpoint_failovers_total", "LLM calls moved to the next endpoint", ["provider"])
+STRUCTURED_OUTPUT_REPAIRS = _registry.counter(
+    "osprey_structured_output_repairs_total",
+    "Structured outputs repaired locally, by strategy (failed: not repairable)", ["strategy"])
+CASCADE_REQUESTS = _registry.counter(
+    "osprey_cascade_requests_total", "Model cascade attempts by outcome (escalated unless accepted)",
+    ["task", "outcome"])
+CASCADE_CONFIDENCE = _registry.histogram(
+    "osprey_cascade_confidence", "Confidence reported by cascade models", ["task"],
+    buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1.0))
+RETRIES = _registry.counter(
+    "osprey_retries_total", "Capability retries routed by the router", ["capability"])
+RECLASSIFICATIONS = _registry.counter(
+    "osprey_reclassifications_total", "Reclassifications routed by the router", ["capability"])
+REPLANS = _registry.counter(
+    "osprey_replans_total", "Replanning requests routed by the router", ["capability"])
+CACHE_REQUESTS = _registry.counter(
+    "osprey_cache_requests_total", "Cache lookups by outcome", ["cache", "result"])
+ACTIVE_SESSIONS = _registry.gauge(
+    "osprey_active_sessions", "Conversation threads with a request in progress")
+JUPYTER_KERNELS = _registry.gauge(
+    "osprey_jupyter_kernels", "Jupyter kernel sessions held for Python execution")
+
+_active_sessions: dict[str, int] = {}
+_active_sessions_lock = threading.Lock()
+
+
+@contextmanager
+def track_session(thread_id: str) -> Iterator[None]:
+    """Count ``thread_id`` as active while the enclosed request runs."""
+    with _active_sessions_lock:
+        _active_sessions[thread_id] = _active_sessions.get(thread_id, 0) + 1
+        ACTIVE_SESSIONS.set(len(_active_sessions))
+    try:
+        yield
+    finally:
+        with _active_sessions_lock:
+            remaining = _active_sessions.get(thread_id, 1) - 1
+            if remaining:
+                _active_sessions[thread_id] = remaining
+            else:
+                _active_sessions.pop(thread_id, None)
+            ACTIVE_SESSIONS.set(len(_active_sessions))
+
+
+def timed_node(func: Callable, node_type: str, name: str) -> Callable:
+    """Wrap an async LangGraph node function to record its duration in ``osprey_node_duration_seconds``."""
+
+    @functools.wraps(func)
+    async def wrapper(state, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await func(state, *args, **kwargs)
+        finally:
+            NODE_DURATION.observe(time.perf_counter() - start, node=name, node_type=node_type)
+
+    return wrapper
+
+
+def record_llm_metrics(*, provider: str | None, model_id: str | None, message: str,
+                       system_prompt: str | None, response: Any, latency_sec: float,
+                       error: bool = False) -> None:
+    """Record latency, errors and estimated token usage of one LLM completion."""
+    labels = {"provider": provider or "unknown", "model": model_id or "unknown"}
+    LLM_DURATION.observe(latency_sec, **labels)
+    if error:
+        LLM_ERRORS.inc(**labels)
+        return
+
+    response_text = _serialize_response(response)
+    if not isinstance(response_text, str):
+        response_text = json.dumps(response_text, default=str)
+    LLM_TOKENS.inc(estimate_tokens(message) + estimate_tokens(system_prompt), direction="input", **labels)
+    LLM_TOKENS.inc(estimate_tokens(response_text), direction="output", **labels)
+
+
+# ----------------------------------------------------------------------
+# Export
+# ----------------------------------------------------------------------
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = _registry
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would flood the pipeline logs
+        pass
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0",
+                         registry: MetricsRegistry | None = None) -> ThreadingHTTPServer:
+    """Serve ``/metrics`` from a daemon thread.
+
+    :param port: TCP port (0 picks a free port, see ``server.server_port``)
+    :param host: Interface to bind
+    :param registry: Registry to export (default: the process-wide registry)
+    :return: The running server; call ``shutdown()`` to stop it
+    """
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry or _registry})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="osprey-metrics", daemon=True).start()
+    logger.info(f"Serving Prometheus metrics on http://{host}:{server.server_port}/metrics")
+    return server
+
+
+_SAMPLE_PATTERN = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)$')
+_LABEL_PATTERN = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+_UNESCAPE_PATTERN = re.compile(r'\\(.)')
+
+
+def parse_metrics(text: str) -> list[tuple[str, dict[str, str], float]]:
+    """Parse Prometheus text into ``(name, labels, value)`` samples, skipping comments."""
+    samples = []
+    for line in text.splitlines():
+        match = _SAMPLE_PATTERN.match(line.strip())
+        if not match:
+            continue
+        name, label_text, value = match.groups()
+        labels = {key: _UNESCAPE_PATTERN.sub(lambda m: "\n" if m.group(1) == "n" else m.group(1), raw)
+                  for key, raw in _LABEL_PATTERN.findall(label_text or "")}
+        try:
+            samples.append((name, labels, float(value)))
+        except ValueError:
+            continue
+    return samples
+
+
+_server: ThreadingHTTPServer | None = None
+_server_lock = threading.Lock()
+
+
+def start_configured_metrics_server(port_setting: str = "services.pipelines.metrics_port") -> ThreadingHTTPServer | None:
+    """Start the process-wide metrics server on the port configured at ``port_setting``.
+
+    :return: The running server, or None if no port is configured or it cannot be bound
+    """
+    global _server
+    from osprey.utils.config import get_config_value
+
+    port = get_config_value(port_setting, None)
+    if not port:
+        return None
+    # Pipelines worker mode: each worker process serves its own metrics on the next port
+    port = int(port) + int(os.getenv("OSPREY_WORKER_INDEX", "0"))
+
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = start_metrics_server(int(port))
+            except OSError as e:
+                logger.warning(f"Could not start metrics server on port {port}: {e}")
+        return _server
+
+
+def write_metrics_snapshot(path: str | Path, registry: MetricsRegistry | None = None) -> None:
+    """Write the current metrics to ``path`` in Prometheus text format."""
+    path = Path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text((registry or _registry).render())
+    except OSError as e:
+        logger.warning(f"Could not write metrics snapshot {path}: {e}")
+
+
+def snapshot_metrics_at_exit() -> Path | None:
+    """Write the process metrics to ``_agent_data/metrics.prom`` when the interpreter exits."""
+    try:
+        from osprey.utils.config import get_agent_dir
+        path = Path(get_agent_dir(SNAPSHOT_FILE_NAME))
+    except Exception as e:
+        logger.debug(f"Metrics snapshot disabled: {e}")
+        return None
+    atexit.register(write_metrics_snapshot, path)
+    return path
@@ -0,0 +1,227 @@
+"""
+Per-Request Tracing Spans
+
+Nested timing spans that answer "where did this request spend its time?"
+without an external collector:
+
+- Graph nodes (``@capability_node``, ``@infrastructure_node``), the Python
+  executor's generator, analyzer and executor nodes, LLM completions and data
+  source retrievals open spans automatically.
+- The active span is kept in a :mod:`contextvars` variable, so spans opened in
+  LangGraph tasks, ``asyncio`` tasks and ``asyncio.to_thread`` calls nest under
+  the node that started them.
+- Spans are keyed by the conversation thread id and a per-request id derived
+  from the request's ``execution_start_time``.
+- Finished spans are written by the trace recorder's background thread to
+  ``spans.jsonl.gz`` next to the LLM traces (``development.tracing.spans``).
+
+``osprey trace spans <thread>`` renders the spans of a thread as a timeline and can
+export them in Chrome trace format (``chrome://tracing``, Perfetto).
+
+Examples:
+    Adding a span around custom work::
+
+        >>> from osprey.utils.spans import span
+        >>> with span("load_archive", "capability", channels=len(channels)):
+        ...     data = load(channels)
+"""
+
+import atexit
+import functools
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from osprey.utils.trace_recorder import (
+    TraceConfig,
+    TraceRecorder,
+    _current_session_id,
+    get_trace_recorder,
+    iter_traces,
+)
+
+SPAN_FILE_STEM = "spans"
+
+_current_span: ContextVar["Span | None"] = ContextVar("osprey_current_span", default=None)
+
+
+@dataclass
+class Span:
+    """A timed operation within a request."""
+
+    name: str
+    category: str                          # capability, infrastructure, llm, data_source, ...
+    session_id: str | None = None          # Conversation thread id
+    request_id: str | None = None
+    parent_id: str | None = None
+    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    start: float = field(default_factory=time.time)
+    duration_ms: float | None = None
+    status: str = "ok"                     # ok, error, interrupted or cancelled
+    error: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def current_span() -> Span | None:
+    """Return the innermost open span of the current context."""
+    return _current_span.get()
+
+
+def request_id_from_state(state: Any) -> str | None:
+    """Derive the request id from the ``execution_start_time`` the gateway sets per request."""
+    try:
+        start_time = state.get("execution_start_time")
+    except AttributeError:
+        return None
+    if not start_time:
+        return None
+    return datetime.fromtimestamp(start_time).strftime("%Y%m%d-%H%M%S-%f")
+
+
+def _status_for(exc: BaseException) -> str:
+    names = {cls.__name__ for cls in type(exc).__mro__}
+    if "GraphInterrupt" in names:
+        return "interrupted"
+    if "CancelledError" in names:
+        return "cancelled"
+    return "error"
+
+
+@contextmanager
+def span(name: str, category: str = "internal", *, session_id: str | None = None,
+         request_id: str | None = None, **attributes: Any) -> Iterator[Span | None]:
+    """Time the enclosed block as a span nested under the current span.
+
+    Thread and request ids are inherited from the parent span; root spans look
+    up the thread id from the LangGraph configuration. Yields None (and records
+    nothing) when span recording is disabled.
+
+    :param name: Span name (node, provider or model name)
+    :param category: Span category used for grouping and colors
+    :param session_id: Conversation thread id, if known
+    :param request_id: Request id, if known
+    :param attributes: Additional fields stored with the span
+    """
+    recorder = get_span_recorder()
+    if not recorder.enabled:
+        yield None
+        return
+
+    parent = _current_span.get()
+    if parent is not None:
+        session_id = session_id or parent.session_id
+        request_id = request_id or parent.request_id
+    elif session_id is None:
+        session_id = _current_session_id()
+
+    current = Span(name=name, category=category, session_id=session_id, request_id=request_id,
+                   parent_id=parent.span_id if parent else None, attributes=attributes)
+    token = _current_span.set(current)
+    start = time.perf_counter()
+    try:
+        yield current
+    except BaseException as exc:
+        current.status = _status_for(exc)
+        if current.status == "error":
+            current.error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        current.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+        _current_span.reset(token)
+        recorder.record(current)
+
+
+def traced_node(func: Callable, category: str, name: str) -> Callable:
+    """Wrap an async LangGraph node function in a span keyed by the state's request."""
+
+    @functools.wraps(func)
+    async def wrapper(state, *args, **kwargs):
+        with span(name, category, request_id=request_id_from_state(state)):
+            return await func(state, *args, **kwargs)
+
+    return wrapper
+
+
+def traced(category: str, name: str | None = None) -> Callable:
+    """Decorate an async function or method to run inside a span."""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with span(span_name, category):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# ----------------------------------------------------------------------
+# Reading and export
+# ----------------------------------------------------------------------
+
+def iter_spans(traces_dir: Path, session_id: str | None = None) -> Iterator[dict[str, Any]]:
+    """Read recorded spans from disk, oldest first."""
+    return iter_traces(traces_dir, session_id=session_id, file_stem=SPAN_FILE_STEM)
+
+
+def to_chrome_trace(spans: list[dict[str, Any]]) -> dict[str, Any]:
+    """Convert span dictionaries to the Chrome trace event format.
+
+    Each request becomes one row (thread) so concurrent requests of a
+    conversation do not overlap.
+    """
+    rows: dict[str, int] = {}
+    events: list[dict[str, Any]] = []
+    for record in spans:
+        row_key = record.get("request_id") or record.get("session_id") or "unknown"
+        if row_key not in rows:
+            rows[row_key] = len(rows) + 1
+            events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": rows[row_key],
+                           "args": {"name": row_key}})
+        events.append({
+            "name": record["name"],
+            "cat": record.get("category", ""),
+            "ph": "X",
+            "ts": record["start"] * 1_000_000,
+            "dur": (record.get("duration_ms") or 0) * 1000,
+            "pid": 1,
+            "tid": rows[row_key],
+            "args": {**record.get("attributes", {}), "status": record.get("status"),
+                     "error": record.get("error")},
+        })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+# ----------------------------------------------------------------------
+# Global recorder
+# ----------------------------------------------------------------------
+
+_span_recorder: TraceRecorder | None = None
+_span_recorder_lock = threading.Lock()
+
+
+def get_span_recorder() -> TraceRecorder:
+    """Get the process-wide span recorder (enabled with tracing and ``development.tracing.spans``)."""
+    global _span_recorder
+    if _span_recorder is None:
+        with _span_recorder_lock:
+            if _span_recorder is None:
+                traces = get_trace_recorder()
+                config = TraceConfig(**{**asdict(traces.config),
+                                        "enabled": traces.config.enabled and traces.config.spans})
+                _span_recorder = TraceRecorder(traces.traces_dir, config, file_stem=SPAN_FILE_STEM)
+                atexit.register(_span_recorder.flush)
+    return _span_recorder
@@ -0,0 +1,362 @@
+"""
+Prompt and Completion Trace Recorder
+
+Captures every LLM call made through :func:`osprey.models.get_chat_completion`
+(prompt, system prompt, response, model, latency and token counts) without
+putting file I/O on the request path:
+
+- Traces go into a bounded in-memory ring buffer (recent traces per process)
+  and a bounded pending queue.
+- A daemon thread flushes the pending queue to gzip-compressed JSONL files
+  under ``_agent_data/traces/``, rotating ``traces.jsonl.gz`` once it exceeds
+  ``max_file_mb`` and keeping at most ``max_files`` rotated files.
+- Prompt debug files (``development.prompts.print_all``) are written by the same
+  thread instead of synchronously from the prompt builders.
+- Appends and rotation hold an advisory lock on ``<stem>.lock``, so pipelines
+  workers sharing ``_agent_data`` never interleave gzip members or rotate a
+  file another worker is writing.
+
+Tracing is configured under ``development.tracing``; when disabled, recording a
+call costs a single attribute check. Token counts are estimated from text length
+because provider adapters return only the completion content.
+
+Use ``osprey trace calls`` to dump the traces of a session.
+"""
+
+import atexit
+import gzip
+import json
+import os
+import threading
+import uuid
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from osprey.utils.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows - fall back to in-process locking only
+    fcntl = None
+
+logger = get_logger("osprey")
+
+DEFAULT_FILE_STEM = "traces"
+CURRENT_FILE_NAME = f"{DEFAULT_FILE_STEM}.jsonl.gz"
+ROTATED_FILE_PATTERN = f"{DEFAULT_FILE_STEM}-*.jsonl.gz"
+
+# Rough characters-per-token ratio for English text and code
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str | None) -> int:
+    """Estimate the token count of a text (about four characters per token)."""
+    if not text:
+        return 0
+    return max(1, len(text) // _CHARS_PER_TOKEN)
+
+
+@dataclass
+class LLMTrace:
+    """A single recorded LLM call or generated prompt."""
+
+    kind: str                              # "completion" or "prompt"
+    name: str | None = None                # Prompt name or model role
+    session_id: str | None = None
+    provider: str | None = None
+    model_id: str | None = None
+    prompt: str | None = None
+    system_prompt: str | None = None
+    response: Any = None
+    latency_sec: float | None = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    error: str | None = None
+    trace_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat(timespec="milliseconds"))
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["response"] = _serialize_response(self.response)
+        return data
+
+
+@dataclass
+class TraceConfig:
+    """Trace settings from ``development.tracing`` configuration."""
+
+    enabled: bool = False
+    buffer_size: int = 1000
+    flush_interval_seconds: float = 2.0
+    max_file_mb: float = 20.0
+    max_files: int = 10
+    spans: bool = True
+
+    @classmethod
+    def from_config(cls) -> "TraceConfig":
+        """Load trace settings from the active configuration."""
+        from osprey.utils.config import get_config_value
+
+        tracing = get_config_value("development.tracing", {}) or {}
+        return cls(
+            enabled=tracing.get("enabled", False),
+            buffer_size=tracing.get("buffer_size", 1000),
+            flush_interval_seconds=tracing.get("flush_interval_seconds", 2.0),
+            max_file_mb=tracing.get("max_file_mb", 20.0),
+            max_files=tracing.get("max_files", 10),
+            spans=tracing.get("spans", True),
+        )
+
+
+class TraceRecorder:
+    """Ring-buffered trace recorder with a background JSONL flusher.
+
+    :param traces_dir: Directory for trace files
+    :param config: Trace settings
+    :param file_stem: File name stem (``<stem>.jsonl.gz``, rotated to ``<stem>-<ts>.jsonl.gz``).
+        Any record with a ``to_dict()`` method and a ``session_id`` attribute can be recorded.
+
+    Examples:
+        Inspecting recent traces in-process::
+
+            >>> recorder = get_trace_recorder()
+            >>> for trace in recorder.recent(session_id="abc123"):
+            ...     print(trace.model_id, trace.latency_sec)
+    """
+
+    def __init__(self, traces_dir: Path, config: TraceConfig, file_stem: str = DEFAULT_FILE_STEM):
+        self.traces_dir = Path(traces_dir)
+        self.config = config
+        self.file_stem = file_stem
+        self.enabled = config.enabled
+
+        self._buffer: deque[LLMTrace] = deque(maxlen=config.buffer_size)
+        self._pending: deque[LLMTrace] = deque(maxlen=config.buffer_size)
+        # Keyed by path so repeated writes of a "latest" file collapse into one
+        self._file_writes: dict[Path, str] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.dropped = 0
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(self, trace: LLMTrace) -> None:
+        """Add a trace to the ring buffer and schedule it for flushing."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen:
+                self.dropped += 1
+            self._buffer.append(trace)
+            self._pending.append(trace)
+        self._ensure_thread()
+
+    def write_file_async(self, path: Path, content: str) -> None:
+        """Write a text file from the background thread."""
+        with self._lock:
+            self._file_writes.pop(Path(path), None)
+            self._file_writes[Path(path)] = content
+        self._ensure_thread()
+        self._wakeup.set()
+
+    def recent(self, session_id: str | None = None, limit: int | None = None) -> list[LLMTrace]:
+        """Return traces from the in-memory ring buffer, oldest first."""
+        with self._lock:
+            traces = [t for t in self._buffer if session_id is None or t.session_id == session_id]
+        return traces[-limit:] if limit else traces
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="trace-recorder", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.config.flush_interval_seconds)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Failed to flush LLM traces: {e}")
+
+    def flush(self) -> int:
+        """Write pending traces and file writes to disk.
+
+        :return: Number of traces written
+        """
+        with self._lock:
+            traces = list(self._pending)
+            self._pending.clear()
+            file_writes = list(self._file_writes.items())
+            self._file_writes.clear()
+
+        for path, content in file_writes:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(content)
+            except OSError as e:
+                logger.warning(f"Failed to write {path}: {e}")
+
+        if not traces:
+            return 0
+
+        self.traces_dir.mkdir(parents=True, exist_ok=True)
+        current = self.traces_dir / f"{self.file_stem}.jsonl.gz"
+        lines = "".join(json.dumps(t.to_dict(), default=str) + "\n" for t in traces)
+
+        with self._file_lock():
+            # Each flush appends a gzip member; multi-member files read back as one stream
+            with gzip.open(current, "at", encoding="utf-8") as f:
+                f.write(lines)
+
+            if current.stat().st_size > self.config.max_file_mb * 1024 * 1024:
+                self._rotate(current)
+        return len(traces)
+
+    @contextmanager
+    def _file_lock(self):
+        """Hold an advisory lock shared by every process writing this file stem."""
+        if fcntl is None:
+            yield
+            return
+        with open(self.traces_dir / f"{self.file_stem}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _rotate(self, current: Path) -> None:
+        rotated = self.traces_dir / f"{self.file_stem}-{datetime.now():%Y%m%d-%H%M%S-%f}.jsonl.gz"
+        os.replace(current, rotated)
+
+        rotated_files = sorted(self.traces_dir.glob(f"{self.file_stem}-*.jsonl.gz"))
+        for old in rotated_files[:max(0, len(rotated_files) - self.config.max_files)]:
+            old.unlink(missing_ok=True)
+
+
+def iter_traces(traces_dir: Path, session_id: str | None = None,
+                file_stem: str = DEFAULT_FILE_STEM) -> Iterator[dict[str, Any]]:
+    """Read traces from disk, oldest first.
+
+    :param traces_dir: Directory containing trace files
+    :param session_id: Only yield traces of this session
+    :param file_stem: File name stem of the recorder that wrote the files
+    :return: Iterator over trace dictionaries
+    """
+    traces_dir = Path(traces_dir)
+    files = sorted(traces_dir.glob(f"{file_stem}-*.jsonl.gz"))
+    current = traces_dir / f"{file_stem}.jsonl.gz"
+    if current.exists():
+        files.append(current)
+
+    for path in files:
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        trace = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if session_id is None or trace.get("session_id") == session_id:
+                        yield trace
+        except (OSError, EOFError) as e:
+            # A file being rotated or a torn final member should not hide the rest
+            logger.warning(f"Failed to read trace file {path}: {e}")
+
+
+# ----------------------------------------------------------------------
+# Global recorder
+# ----------------------------------------------------------------------
+
+_recorder: TraceRecorder | None = None
+_recorder_lock = threading.Lock()
+
+
+def get_trace_recorder() -> TraceRecorder:
+    """Get the process-wide trace recorder, creating it from configuration on first use."""
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                try:
+                    from osprey.utils.config import get_agent_dir
+                    traces_dir = Path(get_agent_dir("traces_dir"))
+                    config = TraceConfig.from_config()
+                except Exception as e:
+                    logger.debug(f"Trace recorder using defaults: {e}")
+                    traces_dir, config = Path("_agent_data") / "traces", TraceConfig()
+                _recorder = TraceRecorder(traces_dir, config)
+                atexit.register(_recorder.flush)
+    return _recorder
+
+
+def record_llm_call(
+    *,
+    provider: str | None,
+    model_id: str | None,
+    message: str,
+    system_prompt: str | None,
+    response: Any,
+    latency_sec: float,
+    error: str | None = None,
+) -> None:
+    """Record a completed LLM call if tracing is enabled."""
+    recorder = get_trace_recorder()
+    if not recorder.enabled:
+        return
+
+    response_text = _serialize_response(response)
+    if not isinstance(response_text, str):
+        response_text = json.dumps(response_text, default=str)
+
+    recorder.record(LLMTrace(
+        kind="completion",
+        session_id=_current_session_id(),
+        provider=provider,
+        model_id=model_id,
+        prompt=message,
+        system_prompt=system_prompt,
+        response=response,
+        latency_sec=round(latency_sec, 4),
+        input_tokens=estimate_tokens(message) + estimate_tokens(system_prompt),
+        output_tokens=estimate_tokens(response_text),
+        error=error,
+    ))
+
+
+def _current_session_id() -> str | None:
+    try:
+        from osprey.utils.config import get_session_info
+        info = get_session_info()
+    except Exception:
+        return None
+    return info.get("thread_id") or info.get("session_id") or info.get("chat_id")
+
+
+def _serialize_response(response: Any) -> Any:
+    if response is None or isinstance(response, (str, int, float, bool)):
+        return response
+    if hasattr(response, "model_dump"):
+        return response.model_dump()
+    if isinstance(response, dict):
+        return response
+    if isinstance(response, (list, tuple)):
+        return [_serialize_response(item) for item in response]
+    return str(response)
@@ -0,0 +1,138 @@
+"""Tests for configuration hot reload.
+
+These tests verify that a changed config.yml is swapped in as the default
+snapshot, that invalid changes leave the active snapshot in place, that
+snapshots taken before a reload are unaffected, that structurally broken
+files are rejected before the swap and that reload events are written for
+``osprey health``.
+"""
+
+import os
+
+import pytest
+
+from osprey.utils import config as config_module
+from osprey.utils.config import ConfigBuilder, get_config_value
+from osprey.utils.config_reload import ConfigReloader, read_reload_status, validate_reloaded_config
+
+CONFIG_TEMPLATE = """
+project_root: /test/project
+execution_control:
+  limits:
+    max_concurrent_classifications: {limit}
+"""
+
+
+@pytest.fixture
+def reloader(tmp_path, monkeypatch):
+    """Create a reloader for a temporary config, isolated from the global default."""
+    config_file = tmp_path / "config.yml"
+    config_file.write_text(CONFIG_TEMPLATE.format(limit=5))
+    config = ConfigBuilder(str(config_file))
+
+    monkeypatch.setattr(config_module, "_config_cache", {})
+    monkeypatch.setattr(config_module, "_default_config", config)
+    monkeypatch.setattr(config_module, "_default_configurable", config.configurable.copy())
+    return ConfigReloader(config, status_path=tmp_path / "status.json")
+
+
+STRUCTURED_CONFIG = """
+models:
+  orchestrator: {provider: cborg, model_id: anthropic/claude-haiku}
+execution_control:
+  limits:
+    graph_recursion_limit: 100
+file_paths:
+  agent_data_dir: _agent_data
+"""
+
+
+def _rewrite(path, content):
+    """Write new content and bump the mtime so the change is seen within one clock tick."""
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestConfigReloader:
+    """Test detecting and applying configuration changes."""
+
+    def test_unchanged_file_is_not_reloaded(self, reloader):
+        """Test that no event is produced while the file is unchanged."""
+        assert reloader.check_now() is None
+
+    def test_change_swaps_default_snapshot(self, reloader):
+        """Test that new lookups see the changed value and old snapshots do not."""
+        before = config_module._get_configurable()
+        generation = config_module.get_config_generation()
+
+        _rewrite(reloader.config_path, CONFIG_TEMPLATE.format(limit=9))
+        event = reloader.check_now()
+
+        assert event.status == "ok"
+        assert event.generation == generation + 1
+        assert event.changed_keys == ["execution_control.limits"]
+        assert get_config_value("execution_limits.max_concurrent_classifications") == 9
+        assert before["execution_limits"]["max_concurrent_classifications"] == 5
+
+    def test_invalid_change_keeps_snapshot(self, reloader):
+        """Test that a YAML error is reported and the previous config stays active."""
+        _rewrite(reloader.config_path, "execution_control: [unclosed")
+
+        event = reloader.check_now()
+
+        assert event.status == "error"
+        assert get_config_value("execution_limits.max_concurrent_classifications") == 5
+
+    def test_empty_file_is_rejected(self, reloader):
+        """Test that a truncated file is not swapped in."""
+        _rewrite(reloader.config_path, "")
+
+        assert reloader.check_now().status == "error"
+
+    def test_status_file_records_last_event(self, reloader, tmp_path):
+        """Test that the last reload is written for the health check."""
+        _rewrite(reloader.config_path, CONFIG_TEMPLATE.format(limit=7))
+        reloader.check_now()
+
+        status = read_reload_status(tmp_path / "status.json")
+
+        assert status["status"] == "ok"
+        assert status["changed_keys"] == ["execution_control.limits"]
+        assert read_reload_status(tmp_path / "missing.json") is None
+
+
+class TestValidation:
+    """Test structural validation of reloaded configuration."""
+
+    def test_structural_breakage_is_rejected(self, tmp_path, monkeypatch):
+        """Test that dropped sections, renamed keys, type changes and unknown providers are reported."""
+        monkeypatch.setattr("osprey.utils.config_reload._is_registered_provider",
+                            lambda name: name in {"cborg", "ollama"})
+        current_file, new_file = tmp_path / "current.yml", tmp_path / "new.yml"
+        current_file.write_text(STRUCTURED_CONFIG)
+        current = ConfigBuilder(str(current_file))
+
+        def problems(content):
+            new_file.write_text(content)
+            return validate_reloaded_config(ConfigBuilder(str(new_file)), current)
+
+        assert problems(STRUCTURED_CONFIG.replace("claude-haiku", "claude-sonnet")) == []
+        assert problems(STRUCTURED_CONFIG.replace("provider: cborg", "provider: cbrog")) == [
+            "'models.orchestrator.provider' names unknown provider 'cbrog'"]
+        assert problems(STRUCTURED_CONFIG.replace("graph_recursion_limit", "graph_recursion_limt")) == [
+            "'execution_control.limits.graph_recursion_limit' was removed"]
+        assert problems(STRUCTURED_CONFIG.replace(": 100", ": lots")) == [
+            "'execution_control.limits.graph_recursion_limit' changed type from int to str"]
+        assert problems(STRUCTURED_CONFIG.split("execution_control")[0]) == [
+            "'execution_control' section is missing", "'file_paths' section is missing"]
+
+    def test_rejected_change_keeps_snapshot(self, reloader):
+        """Test that a reload dropping a structural key is not swapped in."""
+        _rewrite(reloader.config_path, "project_root: /test/project\nexecution_control: {limits: {}}\n")
+
+        event = reloader.check_now()
+
+        assert event.status == "error"
+        assert "max_concurrent_classifications" in event.error
+        assert get_config_value("execution_limits.max_concurrent_classifications") == 5
@@ -0,0 +1,293 @@
+"""Tests for DataSourceManager retrieval deadlines, caching and circuit breaking.
+
+These tests verify that finished results survive slow providers, that
+per-provider timeouts apply, that late results can be attached to the
+next request, that TTL-cached results are reused, and that failing
+providers are skipped until a health check succeeds.
+"""
+
+import asyncio
+
+from osprey.data_management.manager import DataSourceManager
+from osprey.data_management.providers import DataSourceContext, DataSourceProvider
+from osprey.data_management.request import DataSourceRequest, DataSourceRequester
+
+
+class _DelayedProvider(DataSourceProvider):
+    """Provider that answers after a fixed delay."""
+
+    def __init__(self, name: str, delay: float, timeout: float | None = None,
+                 cache_ttl: float | None = None, fail: bool = False):
+        self._name = name
+        self._delay = delay
+        self._timeout = timeout
+        self._cache_ttl = cache_ttl
+        self.fail = fail
+        self.healthy = True
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def context_type(self) -> str:
+        return "TEST"
+
+    @property
+    def timeout_seconds(self) -> float | None:
+        return self._timeout
+
+    @property
+    def cache_ttl_seconds(self) -> float | None:
+        return self._cache_ttl
+
+    async def health_check(self) -> bool:
+        return self.healthy
+
+    async def retrieve_data(self, request):
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        if self.fail:
+            raise ConnectionError("source unavailable")
+        return DataSourceContext(source_name=self._name, context_type="TEST", data=f"{self._name} data")
+
+    def should_respond(self, request) -> bool:
+        return True
+
+
+def _request(message: str = "show beam current") -> DataSourceRequest:
+    return DataSourceRequest(
+        user_id="user1",
+        requester=DataSourceRequester("task_extraction", "task_extraction"),
+        metadata={"message_window": [message]},
+    )
+
+
+def _manager(*providers, **kwargs) -> DataSourceManager:
+    manager = DataSourceManager(**kwargs)
+    for provider in providers:
+        manager.register_provider(provider)
+    return manager
+
+
+class TestPartialResults:
+    """Test that slow providers do not discard finished results."""
+
+    def test_finished_results_survive_hard_timeout(self):
+        """Test that a provider exceeding the deadline only loses its own result."""
+        manager = _manager(_DelayedProvider("fast", 0.0), _DelayedProvider("slow", 5.0))
+
+        result = asyncio.run(manager.retrieve_all_context(_request(), timeout_seconds=0.2))
+
+        assert list(result.context_data) == ["fast"]
+        assert result.timed_out_sources == ["slow"]
+        assert result.failed_sources == []
+
+    def test_provider_timeout_is_applied(self):
+        """Test that a provider's own timeout ends its retrieval early."""
+        manager = _manager(_DelayedProvider("fast", 0.0), _DelayedProvider("slow", 5.0, timeout=0.05))
+
+        result = asyncio.run(manager.retrieve_all_context(_request(), timeout_seconds=5.0))
+
+        assert list(result.context_data) == ["fast"]
+        assert result.failed_sources == ["slow"]
+        assert result.retrieval_time_sec < 1.0
+
+    def test_configured_override_wins(self):
+        """Test that configured provider timeouts override the provider default."""
+        provider = _DelayedProvider("slow", 0.0, timeout=10.0)
+        manager = _manager(provider, provider_timeouts={"slow": 2.0})
+
+        assert manager.get_provider_timeout(provider, hard_timeout=30.0) == 2.0
+        assert manager.get_provider_timeout(provider, hard_timeout=1.0) == 1.0
+
+    def test_soft_deadline_returns_early(self):
+        """Test that the soft deadline returns with what has arrived."""
+        manager = _manager(_DelayedProvider("fast", 0.0), _DelayedProvider("slow", 5.0),
+                           soft_deadline_seconds=0.1)
+
+        result = asyncio.run(manager.retrieve_all_context(_request(), timeout_seconds=30.0))
+
+        assert list(result.context_data) == ["fast"]
+        assert result.timed_out_sources == ["slow"]
+        assert result.retrieval_time_sec < 1.0
+
+
+class TestLateResults:
+    """Test attaching late results to the next request."""
+
+    def test_late_result_is_attached_to_next_request(self):
+        """Test that a provider missing the deadline delivers on the next turn."""
+        slow = _DelayedProvider("slow", 0.2)
+        manager = _manager(_DelayedProvider("fast", 0.0), slow,
+                           soft_deadline_seconds=0.05, attach_late_results=True)
+
+        async def two_turns():
+            first = await manager.retrieve_all_context(_request())
+            await asyncio.sleep(0.3)
+            second = await manager.retrieve_all_context(_request())
+            return first, second
+
+        first, second = asyncio.run(two_turns())
+
+        assert first.timed_out_sources == ["slow"]
+        assert second.late_sources == ["slow"]
+        assert second.context_data["slow"].metadata["late_result"] is True
+        assert slow.calls == 1
+
+    def test_unclaimed_late_results_expire(self):
+        """Test that late retrievals of a requester who never returns are cancelled after the TTL."""
+        slow = _DelayedProvider("slow", 5.0)
+        manager = _manager(slow, soft_deadline_seconds=0.05, attach_late_results=True,
+                           late_result_ttl_seconds=0.1)
+        other_user = _request()
+        other_user.user_id = "user2"
+
+        async def turns():
+            await manager.retrieve_all_context(_request())
+            (task,) = manager._late_tasks[("user1", "task_extraction")][1].values()
+            await asyncio.sleep(0.15)
+            await manager.retrieve_all_context(other_user)
+            await asyncio.sleep(0)
+            return task
+
+        task = asyncio.run(turns())
+
+        assert task.cancelled()
+        assert ("user1", "task_extraction") not in manager._late_tasks
+
+    def test_late_marker_does_not_touch_cached_context(self):
+        """Test that marking a late result leaves the context shared through the cache unchanged."""
+        slow = _DelayedProvider("slow", 0.2, cache_ttl=60.0)
+        manager = _manager(slow, soft_deadline_seconds=0.05, attach_late_results=True)
+
+        async def turns():
+            await manager.retrieve_all_context(_request())
+            await asyncio.sleep(0.3)
+            late = await manager.retrieve_all_context(_request())
+            cached = await manager.retrieve_all_context(_request())
+            return late, cached
+
+        late, cached = asyncio.run(turns())
+
+        assert late.context_data["slow"].metadata["late_result"] is True
+        assert cached.cached_sources == ["slow"]
+        assert "late_result" not in cached.context_data["slow"].metadata
+
+
+class TestResultCache:
+    """Test TTL caching of provider results."""
+
+    def test_identical_requests_hit_the_cache(self):
+        """Test that a repeated request reuses the cached result."""
+        provider = _DelayedProvider("memory", 0.0, cache_ttl=60.0)
+        manager = _manager(provider)
+
+        async def two_turns():
+            await manager.retrieve_all_context(_request())
+            return await manager.retrieve_all_context(_request())
+
+        second = asyncio.run(two_turns())
+
+        assert provider.calls == 1
+        assert second.cached_sources == ["memory"]
+        assert second.context_data["memory"].metadata["cached"] is True
+        assert second.get_summary()["cache_hit_rate"] == 1.0
+
+    def test_changed_message_window_misses(self):
+        """Test that a different conversation window is not served from cache."""
+        provider = _DelayedProvider("memory", 0.0, cache_ttl=60.0)
+        manager = _manager(provider)
+
+        async def two_turns():
+            await manager.retrieve_all_context(_request("show beam current"))
+            return await manager.retrieve_all_context(_request("plot vacuum pressure"))
+
+        second = asyncio.run(two_turns())
+
+        assert provider.calls == 2
+        assert second.cached_sources == []
+
+    def test_uncached_providers_are_always_called(self):
+        """Test that providers without a TTL are not cached."""
+        provider = _DelayedProvider("live", 0.0)
+        manager = _manager(provider)
+
+        async def two_turns():
+            await manager.retrieve_all_context(_request())
+            await manager.retrieve_all_context(_request())
+
+        asyncio.run(two_turns())
+
+        assert provider.calls == 2
+
+
+class TestCircuitBreaker:
+    """Test skipping and probing of failing providers."""
+
+    def test_breaker_opens_after_consecutive_failures(self):
+        """Test that a failing provider is skipped once the threshold is reached."""
+        provider = _DelayedProvider("archiver", 0.0, fail=True)
+        manager = _manager(provider, failure_threshold=2, recovery_seconds=60.0)
+
+        async def turns():
+            return [await manager.retrieve_all_context(_request()) for _ in range(3)]
+
+        results = asyncio.run(turns())
+
+        assert provider.calls == 2
+        assert results[2].circuit_open_sources == ["archiver"]
+        assert results[2].get_summary()["breaker_states"] == {"archiver": "open"}
+
+    def test_healthy_probe_lets_traffic_back(self):
+        """Test that a successful health check and retrieval close the breaker."""
+        provider = _DelayedProvider("archiver", 0.0, fail=True)
+        manager = _manager(provider, failure_threshold=1, recovery_seconds=0.0)
+
+        async def turns():
+            await manager.retrieve_all_context(_request())
+            provider.fail = False
+            return await manager.retrieve_all_context(_request())
+
+        second = asyncio.run(turns())
+
+        assert list(second.context_data) == ["archiver"]
+        assert second.breaker_states == {"archiver": "closed"}
+
+    def test_unhealthy_probe_keeps_breaker_open(self):
+        """Test that a failing health check keeps skipping the provider."""
+        provider = _DelayedProvider("archiver", 0.0, fail=True)
+        manager = _manager(provider, failure_threshold=1, recovery_seconds=0.0)
+
+        async def turns():
+            await manager.retrieve_all_context(_request())
+            provider.healthy = False
+            return await manager.retrieve_all_context(_request())
+
+        second = asyncio.run(turns())
+
+        assert provider.calls == 1
+        assert second.circuit_open_sources == ["archiver"]
+
+    def test_half_open_admits_one_trial_at_a_time(self):
+        """Test that concurrent requests after a healthy probe send only one trial retrieval."""
+        provider = _DelayedProvider("archiver", 0.0, fail=True)
+        manager = _manager(provider, failure_threshold=1, recovery_seconds=0.0)
+
+        async def turns():
+            await manager.retrieve_all_context(_request())
+            provider.fail = False
+            provider._delay = 0.05
+            concurrent = await asyncio.gather(
+                *(manager.retrieve_all_context(_request(f"message {i}")) for i in range(5)))
+            trial_calls = provider.calls
+            return concurrent, trial_calls, await manager.retrieve_all_context(_request())
+
+        concurrent, trial_calls, after = asyncio.run(turns())
+
+        assert trial_calls == 2
+        assert sum("archiver" in result.context_data for result in concurrent) == 1
+        assert sum(result.circuit_open_sources == ["archiver"] for result in concurrent) == 4
+        assert after.breaker_states == {"archiver": "closed"}
+        assert provider.calls == 3
@@ -0,0 +1,140 @@
+"""Tests for the pipelines worker router.
+
+These tests verify sticky chat routing with failover, broadcasting of
+configuration requests (and only those) to all workers, and relaying of
+streamed responses,
+using small HTTP servers in place of pipelines workers.
+"""
+
+import http.client
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from osprey.deployment.worker_router import (
+    create_router,
+    extract_chat_id,
+    extract_user_id,
+    is_broadcast_path,
+    rank_workers,
+)
+
+
+def _start_worker(index: int, received: list):
+    """Start a fake worker that records requests and answers with its index."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            received.append((index, self.path, body))
+            if self.path == "/stream":
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                for part in (b"data: one\n\n", b"data: two\n\n"):
+                    self.wfile.write(part)
+                    self.wfile.flush()
+                self.close_connection = True
+                return
+            payload = json.dumps({"worker": index}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def cluster():
+    """Run a router in front of three fake workers."""
+    received = []
+    workers = {i: _start_worker(i, received) for i in range(3)}
+    router = create_router(0, {i: s.server_port for i, s in workers.items()}, host="127.0.0.1")
+    threading.Thread(target=router.serve_forever, daemon=True).start()
+    yield router, workers, received
+    router.shutdown()
+    for server in workers.values():
+        server.shutdown()
+
+
+def _post(router, path, payload):
+    conn = http.client.HTTPConnection("127.0.0.1", router.server_port, timeout=10)
+    conn.request("POST", path, body=json.dumps(payload), headers={"Content-Type": "application/json"})
+    response = conn.getresponse()
+    data = response.read()
+    conn.close()
+    return response.status, data
+
+
+class TestRouting:
+    """Test request routing decisions."""
+
+    def test_ranking_is_stable_and_minimal(self):
+        """Test that a chat keeps its worker and removing another worker does not move it."""
+        ranking = rank_workers("chat-42", [0, 1, 2, 3])
+        remaining = [w for w in [0, 1, 2, 3] if w != ranking[-1]]
+
+        assert rank_workers("chat-42", [0, 1, 2, 3]) == ranking
+        assert rank_workers("chat-42", remaining)[0] == ranking[0]
+        assert extract_chat_id(b'{"metadata": {"chat_id": "c1"}}') == "c1"
+        assert extract_chat_id(b"not json") is None
+        assert extract_user_id(b'{"user": {"id": "u1"}}') == "u1"
+        assert is_broadcast_path("POST", "/v1/osprey/valves/update?x=1")
+        assert is_broadcast_path("DELETE", "/pipelines/delete")
+        assert not is_broadcast_path("POST", "/v1/chat/completions")
+        assert not is_broadcast_path("GET", "/osprey/valves/update")
+
+    def test_chat_is_sticky_and_fails_over(self, cluster):
+        """Test that a chat always reaches its worker and moves to the next one when it is down."""
+        router, workers, _ = cluster
+        ranking = rank_workers("chat-7", [0, 1, 2])
+
+        answers = {json.loads(_post(router, "/chat", {"chat_id": "chat-7"})[1])["worker"] for _ in range(3)}
+        workers[ranking[0]].shutdown()
+        workers[ranking[0]].server_close()
+        status, data = _post(router, "/chat", {"chat_id": "chat-7"})
+
+        assert answers == {ranking[0]}
+        assert status == 200 and json.loads(data)["worker"] == ranking[1]
+
+    def test_configuration_requests_reach_all_workers(self, cluster):
+        """Test that POSTs without a chat are broadcast, e.g. valve updates."""
+        router, _, received = cluster
+
+        status, _ = _post(router, "/osprey/valves/update", {"debug_mode": True})
+
+        assert status == 200
+        assert sorted(index for index, path, _ in received if path == "/osprey/valves/update") == [0, 1, 2]
+
+    def test_completion_without_chat_reaches_one_worker(self, cluster):
+        """Test that a completion without a chat ID runs on exactly one worker."""
+        router, _, received = cluster
+
+        status, _ = _post(router, "/v1/chat/completions", {"messages": [{"role": "user", "content": "hi"}]})
+        _post(router, "/v1/chat/completions", {"user": {"id": "u1"}})
+
+        assert status == 200
+        assert len([index for index, path, _ in received if path == "/v1/chat/completions"]) == 2
+        assert received[-1][0] == rank_workers("u1", [0, 1, 2])[0]
+
+    def test_streamed_response_is_relayed(self, cluster):
+        """Test that a response without Content-Length is streamed through intact."""
+        router, _, _ = cluster
+
+        status, data = _post(router, "/stream", {"chat_id": "chat-9"})
+
+        assert status == 200
+        assert data == b"data: one\n\ndata: two\n\n"
@@ -0,0 +1,111 @@
+"""Tests for pipeline admission control.
+
+These tests verify that the admission controller bounds concurrency,
+serializes requests of one thread, prefers users with fewer running requests,
+reports queue positions, and cleans up cancelled or rejected requests.
+"""
+
+import asyncio
+
+import pytest
+
+from osprey.infrastructure.admission import AdmissionController, AdmissionRejectedError
+
+
+async def _admit(controller, ticket, positions=None):
+    async for position in controller.wait(ticket):
+        if positions is not None:
+            positions.append(position)
+
+
+class TestAdmissionController:
+    """Test scheduling decisions of the admission controller."""
+
+    def test_bounds_concurrency_and_reports_positions(self):
+        """Test that requests beyond max_concurrent wait and see their position."""
+        async def scenario():
+            controller = AdmissionController(max_concurrent=1)
+            first = controller.ticket("alice", "alice_1")
+            second = controller.ticket("bob", "bob_1")
+            positions = []
+
+            await _admit(controller, first)
+            waiter = asyncio.create_task(_admit(controller, second, positions))
+            await asyncio.sleep(0)
+            assert not second.admitted and controller.waiting == 1
+
+            controller.release(first)
+            await waiter
+            return second, positions
+
+        second, positions = asyncio.run(scenario())
+
+        assert second.admitted
+        assert positions == [1]
+
+    def test_same_thread_is_serialized(self):
+        """Test that a second message in a running thread waits despite free slots."""
+        async def scenario():
+            controller = AdmissionController(max_concurrent=4)
+            first = controller.ticket("alice", "alice_1")
+            again = controller.ticket("alice", "alice_1")
+            other = controller.ticket("alice", "alice_2")
+
+            await _admit(controller, first)
+            waiter = asyncio.create_task(_admit(controller, again))
+            await _admit(controller, other)
+            await asyncio.sleep(0)
+            admitted_while_running = again.admitted
+
+            controller.release(first)
+            await waiter
+            return admitted_while_running, other.admitted
+
+        admitted_while_running, other_admitted = asyncio.run(scenario())
+
+        assert admitted_while_running is False
+        assert other_admitted is True
+
+    def test_prefers_users_with_fewer_running_requests(self):
+        """Test that a busy user's queued request yields to another user's later request."""
+        async def scenario():
+            controller = AdmissionController(max_concurrent=2)
+            busy = controller.ticket("alice", "alice_1")
+            blocker = controller.ticket("bob", "bob_1")
+            await _admit(controller, busy)
+            await _admit(controller, blocker)
+
+            alice_next = controller.ticket("alice", "alice_2")
+            carol = controller.ticket("carol", "carol_1")
+            tasks = [asyncio.create_task(_admit(controller, t)) for t in (alice_next, carol)]
+            await asyncio.sleep(0)
+
+            controller.release(blocker)
+            await asyncio.sleep(0)
+            result = (carol.admitted, alice_next.admitted)
+            controller.release(busy)
+            await asyncio.gather(*tasks)
+            return result
+
+        carol_admitted, alice_admitted = asyncio.run(scenario())
+
+        assert carol_admitted is True
+        assert alice_admitted is False
+
+    def test_cancelled_and_rejected_requests_leave_no_trace(self):
+        """Test that cancelling a wait dequeues it and a full queue rejects new requests."""
+        async def scenario():
+            controller = AdmissionController(max_concurrent=1, max_queued=1)
+            running = controller.ticket("alice", "alice_1")
+            await _admit(controller, running)
+
+            waiter = asyncio.create_task(_admit(controller, controller.ticket("bob", "bob_1")))
+            await asyncio.sleep(0)
+            with pytest.raises(AdmissionRejectedError):
+                await _admit(controller, controller.ticket("carol", "carol_1"))
+
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+            return controller.waiting, controller.running
+
+        assert asyncio.run(scenario()) == (0, 1)
@@ -0,0 +1,83 @@
+"""Tests for the model cascade.
+
+These tests verify that a confident answer from the cascade model is used
+as is, and that low confidence or a failing cascade model escalates to the
+role's model and is counted.
+"""
+
+from typing import TypedDict
+
+from pydantic import BaseModel
+
+from osprey.models.cascade import run_cascade
+from osprey.utils.metrics import CASCADE_REQUESTS
+
+ROLE = {
+    "provider": "cborg", "model_id": "large",
+    "cascade": {"provider": "ollama", "model_id": "small", "min_confidence": 0.8},
+}
+
+
+class Decision(BaseModel):
+    is_match: bool
+
+
+class DecisionDict(TypedDict):
+    is_match: bool
+
+
+def _fake_completion(small_confidence=None, small_error=None):
+    """Build a completion function that answers per model and records the calls."""
+    calls = []
+
+    def complete(model_config, message, output_model, **kwargs):
+        calls.append((model_config, kwargs))
+        if model_config["model_id"] == "small":
+            if small_error:
+                raise small_error
+            return output_model(is_match=True, confidence=small_confidence)
+        return Decision(is_match=False)
+
+    return complete, calls
+
+
+class TestRunCascade:
+    """Test acceptance and escalation decisions."""
+
+    def test_confident_answer_is_accepted(self):
+        """Test that a confident small model answer is returned without the confidence field."""
+        complete, calls = _fake_completion(small_confidence=0.9)
+        before = CASCADE_REQUESTS.get(task="Decision", outcome="accepted")
+
+        result = run_cascade(complete, ROLE, Decision, "Is this a match?",
+                             provider_config={"base_url": "http://large"})
+
+        assert result == Decision(is_match=True)
+        assert len(calls) == 1
+        assert "provider_config" not in calls[0][1]
+        assert CASCADE_REQUESTS.get(task="Decision", outcome="accepted") == before + 1
+
+    def test_low_confidence_escalates(self):
+        """Test that an unsure answer escalates to the role's model without the cascade entry."""
+        complete, calls = _fake_completion(small_confidence=0.5)
+        before = CASCADE_REQUESTS.get(task="Decision", outcome="low_confidence")
+
+        result = run_cascade(complete, ROLE, Decision, "Is this a match?")
+
+        assert result == Decision(is_match=False)
+        assert [config["model_id"] for config, _ in calls] == ["small", "large"]
+        assert "cascade" not in calls[1][0]
+        assert CASCADE_REQUESTS.get(task="Decision", outcome="low_confidence") == before + 1
+
+    def test_failure_escalates_and_typed_dicts_round_trip(self):
+        """Test that a failing cascade model escalates and accepted TypedDict answers are dicts."""
+        failing, failing_calls = _fake_completion(small_error=ValueError("invalid JSON"))
+        confident, _ = _fake_completion(small_confidence=1.0)
+        pydantic_form = type("DecisionDictPydantic", (BaseModel,), {"__annotations__": {"is_match": bool}})
+
+        escalated = run_cascade(failing, ROLE, Decision, "Is this a match?")
+        accepted = run_cascade(confident, ROLE, DecisionDict, "Is this a match?",
+                               response_model=pydantic_form)
+
+        assert escalated == Decision(is_match=False) and len(failing_calls) == 2
+        assert accepted == {"is_match": True}
@@ -0,0 +1,62 @@
+"""Tests for the fake provider.
+
+These tests verify that the fake provider answers text and structured
+completions with the smallest valid output, applies configured overrides and
+waits for its simulated latency.
+"""
+
+import time
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from osprey.models.providers.fake import FakeProviderAdapter
+
+
+class Step(BaseModel):
+    """Nested model used in the tests."""
+
+    name: str
+    weight: float = Field(gt=0)
+
+
+class Plan(BaseModel):
+    """Structured output used in the tests."""
+
+    approved: bool
+    mode: Literal["fast", "safe"]
+    steps: list[Step] = Field(min_length=1)
+    note: str | None
+    retries: int = 3
+
+
+def _adapter(monkeypatch, settings):
+    monkeypatch.setattr(FakeProviderAdapter, "_settings", staticmethod(lambda: settings))
+    return FakeProviderAdapter()
+
+
+class TestFakeProvider:
+    """Test placeholder output and simulated latency."""
+
+    def test_minimal_valid_output_and_overrides(self, monkeypatch):
+        """Test that structured output satisfies constraints and responses override fields."""
+        adapter = _adapter(monkeypatch, {"text": "Simulated", "responses": {"Plan": {"approved": True}}})
+
+        plan = adapter.execute_completion("plan it", "fake", None, None, output_format=Plan)
+
+        assert plan == Plan(approved=True, mode="fast", steps=[Step(name="Simulated", weight=1)],
+                            note=None, retries=3)
+        assert adapter.execute_completion("hi", "fake", None, None) == "Simulated"
+        as_dict = adapter.execute_completion("plan it", "fake", None, None, output_format=Plan,
+                                             is_typed_dict_output=True)
+        assert as_dict["mode"] == "fast"
+
+    def test_constant_latency(self, monkeypatch):
+        """Test that completions wait for the configured latency."""
+        adapter = _adapter(monkeypatch, {"latency": {"distribution": "constant", "seconds": 0.05}})
+
+        start = time.perf_counter()
+        adapter.execute_completion("hi", "fake", None, None)
+
+        assert time.perf_counter() - start >= 0.05
+        assert adapter.check_health(None, None) == (True, "Simulated provider (no network)")
@@ -0,0 +1,144 @@
+"""Tests for hedged requests and endpoint failover.
+
+These tests verify that calls fail over to the next healthy endpoint, that
+slow calls are hedged once enough latencies have been observed, and that the
+deadline bounds a call.
+"""
+
+import threading
+import time
+
+import pytest
+
+from osprey.models.hedging import EndpointRouter, HedgingSettings, configured_endpoints
+from osprey.utils.metrics import LLM_HEDGES
+
+
+class TestEndpointRouter:
+    """Test failover, hedging and deadlines of the endpoint router."""
+
+    def test_fails_over_and_demotes_failed_endpoint(self):
+        """Test that a connection error moves the call on and the endpoint is tried last afterwards."""
+        router = EndpointRouter("test", ["http://a", "http://b"], HedgingSettings())
+        calls = []
+
+        def call(endpoint):
+            calls.append(endpoint)
+            if endpoint == "http://a":
+                raise ConnectionError("refused")
+            return endpoint
+
+        result = router.execute(call, "model")
+
+        assert result == "http://b"
+        assert calls == ["http://a", "http://b"]
+        assert router.ordered_endpoints() == ["http://b", "http://a"]
+
+    def test_request_errors_are_not_failed_over(self):
+        """Test that errors every endpoint would repeat are raised without trying others."""
+        router = EndpointRouter("test", ["http://a", "http://b"], HedgingSettings())
+        calls = []
+
+        def call(endpoint):
+            calls.append(endpoint)
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            router.execute(call, "model")
+        assert calls == ["http://a"]
+
+    def test_slow_call_is_hedged_on_alternate_endpoint(self):
+        """Test that a call slower than the observed percentile is duplicated and the first answer wins."""
+        settings = HedgingSettings(enabled=True, min_samples=3, min_delay_seconds=0.01)
+        router = EndpointRouter("test", ["http://slow", "http://fast"], settings)
+        for _ in range(3):
+            router.record_success("http://slow", "model", 0.02)
+        release = threading.Event()
+
+        def call(endpoint):
+            if endpoint == "http://slow":
+                release.wait(5)
+            return endpoint
+
+        before = LLM_HEDGES.get(provider="test", model="model")
+        started = time.monotonic()
+        result = router.execute(call, "model")
+        elapsed = time.monotonic() - started
+        release.set()
+
+        assert result == "http://fast"
+        assert elapsed < 1.0
+        assert LLM_HEDGES.get(provider="test", model="model") == before + 1
+
+    def test_hedge_latency_is_not_recorded(self):
+        """Test that only the original attempt's latency feeds the percentile, even when it loses."""
+        settings = HedgingSettings(enabled=True, min_samples=3, min_delay_seconds=0.01)
+        router = EndpointRouter("test", ["http://slow", "http://fast"], settings)
+        for _ in range(3):
+            router.record_success("http://slow", "model", 0.02)
+        release = threading.Event()
+        loser_done = threading.Event()
+
+        def call(endpoint):
+            if endpoint == "http://slow":
+                release.wait(5)
+                loser_done.set()
+            return endpoint
+
+        assert router.execute(call, "model") == "http://fast"
+        after_hedge = router.hedge_delay("model")
+        time.sleep(0.1)
+        release.set()
+        loser_done.wait(5)
+        deadline = time.monotonic() + 5
+        while router.hedge_delay("model") == after_hedge and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert after_hedge == 0.02
+        assert router.hedge_delay("model") >= 0.1
+
+    def test_extra_attempts_reserve_budget(self):
+        """Test that hedges and failovers ask for budget and a declined hedge is not sent."""
+        settings = HedgingSettings(enabled=True, min_samples=3, min_delay_seconds=0.01,
+                                   deadline_seconds=5)
+        router = EndpointRouter("test", ["http://a", "http://b"], settings)
+        for _ in range(3):
+            router.record_success("http://a", "model", 0.02)
+        reservations, calls = [], []
+
+        def call(endpoint):
+            calls.append(endpoint)
+            time.sleep(0.1)
+            if endpoint == "http://a":
+                raise ConnectionError("refused")
+            return endpoint
+
+        def reserve_attempt(hedge):
+            reservations.append(hedge)
+            return not hedge
+
+        result = router.execute(call, "model", reserve_attempt=reserve_attempt)
+
+        assert result == "http://b"
+        assert calls == ["http://a", "http://b"]
+        assert reservations == [True, False]
+
+    def test_deadline_bounds_the_call(self):
+        """Test that a call without an answer before the deadline raises TimeoutError."""
+        router = EndpointRouter("test", ["http://a"], HedgingSettings(deadline_seconds=0.05))
+        release = threading.Event()
+
+        with pytest.raises(TimeoutError):
+            router.execute(lambda endpoint: release.wait(5), "model")
+        release.set()
+
+    def test_endpoint_list_order_and_deduplication(self):
+        """Test that base_url comes first, then configured endpoints, then provider fallbacks."""
+        endpoints = configured_endpoints(
+            "http://localhost:11434",
+            {"endpoints": ["http://gpu-node:11434", "http://localhost:11434/"]},
+            ["http://host.containers.internal:11434"],
+        )
+
+        assert endpoints == ["http://localhost:11434", "http://gpu-node:11434",
+                             "http://host.containers.internal:11434"]
@@ -0,0 +1,89 @@
+"""Tests for Ollama endpoint caching.
+
+These tests verify that the Ollama adapter reuses a verified client instead
+of probing the server before every request, and re-resolves the endpoint
+after a connection failure.
+"""
+
+import pytest
+
+from osprey.models.providers import ollama as ollama_provider
+from osprey.models.providers.ollama import OllamaProviderAdapter
+
+
+class FakeClient:
+    """Records probes and chat requests instead of talking to Ollama."""
+
+    instances = []
+
+    def __init__(self, host):
+        self.host = host
+        self.probes = 0
+        self.chats = 0
+        self.fail_chat = False
+        FakeClient.instances.append(self)
+
+    def list(self):
+        self.probes += 1
+        return {"models": []}
+
+    def chat(self, **kwargs):
+        self.chats += 1
+        if self.fail_chat:
+            raise ConnectionError("connection reset")
+        return {"message": {"content": "ok"}}
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    """Replace the Ollama client and start with an empty endpoint cache."""
+    FakeClient.instances = []
+    monkeypatch.setattr(ollama_provider.ollama, "Client", FakeClient)
+    ollama_provider._endpoint_cache.clear()
+    yield FakeClient
+    ollama_provider._endpoint_cache.clear()
+
+
+class TestOllamaEndpointCache:
+    """Test client reuse and re-resolution after failures."""
+
+    def test_client_is_probed_once_and_reused(self, fake_ollama):
+        """Test that consecutive requests share one verified client."""
+        adapter = OllamaProviderAdapter()
+
+        results = [adapter.execute_completion("hi", "mistral:7b", None, "http://ollama:11434")
+                   for _ in range(3)]
+
+        assert results == ["ok"] * 3
+        assert len(fake_ollama.instances) == 1
+        assert fake_ollama.instances[0].probes == 1
+        assert fake_ollama.instances[0].chats == 3
+
+    def test_connection_failure_forces_reresolution(self, fake_ollama):
+        """Test that a failed request drops the cached client so the next one probes again."""
+        adapter = OllamaProviderAdapter()
+        adapter.execute_completion("hi", "mistral:7b", None, "http://ollama:11434")
+        fake_ollama.instances[0].fail_chat = True
+
+        with pytest.raises(ConnectionError):
+            adapter.execute_completion("hi", "mistral:7b", None, "http://ollama:11434")
+        adapter.execute_completion("hi", "mistral:7b", None, "http://ollama:11434")
+
+        assert len(fake_ollama.instances) == 2
+        assert fake_ollama.instances[1].probes == 1
+
+    def test_model_creation_resolves_fallback_once(self, fake_ollama, monkeypatch):
+        """Test that creating agent models reuses the resolved fallback URL."""
+        probed = []
+
+        def probe(url):
+            probed.append(url)
+            return "host.containers.internal" in url
+
+        monkeypatch.setattr(OllamaProviderAdapter, "_test_connection", staticmethod(probe))
+        adapter = OllamaProviderAdapter()
+
+        for _ in range(3):
+            adapter.create_model("mistral:7b", None, "http://localhost:11434", None, None)
+
+        assert probed == ["http://localhost:11434", "http://host.containers.internal:11434"]
@@ -0,0 +1,68 @@
+"""Tests for endpoint selection of the hosted provider adapters.
+
+These tests verify that the Anthropic and Google adapters send each attempt
+to the endpoint the router picked instead of the SDK default host.
+"""
+
+from types import SimpleNamespace
+
+import anthropic
+
+from osprey.models.providers import anthropic as anthropic_provider
+from osprey.models.providers import google as google_provider
+from osprey.models.providers.anthropic import AnthropicProviderAdapter
+from osprey.models.providers.google import GoogleProviderAdapter
+
+
+class TestAnthropicEndpoint:
+    """Test the Anthropic client endpoint."""
+
+    def test_completion_uses_router_endpoint(self, monkeypatch):
+        """Test that base_url reaches the Anthropic client."""
+        clients = []
+
+        class FakeAnthropic:
+            def __init__(self, **kwargs):
+                clients.append(kwargs)
+                self.messages = SimpleNamespace(create=lambda **_: SimpleNamespace(content=[
+                    anthropic.types.TextBlock(type="text", text="ok")]))
+
+        monkeypatch.setattr(anthropic_provider.anthropic, "Anthropic", FakeAnthropic)
+
+        result = AnthropicProviderAdapter().execute_completion(
+            message="hi", model_id="claude", api_key="key", base_url="https://gateway.example")
+
+        assert result == "ok"
+        assert clients[0]["base_url"] == "https://gateway.example"
+
+
+class TestGoogleEndpoint:
+    """Test the genai client endpoint."""
+
+    def test_configured_url_is_split_into_base_and_version(self):
+        """Test that a trailing API version becomes the SDK's api_version."""
+        versioned = google_provider._create_client(
+            "key", "https://generativelanguage.googleapis.com/v1beta")._api_client._http_options
+        gateway = google_provider._create_client(
+            "key", "https://gateway.example/google")._api_client._http_options
+
+        assert (versioned.base_url, versioned.api_version) == (
+            "https://generativelanguage.googleapis.com/", "v1beta")
+        assert gateway.base_url == "https://gateway.example/google/"
+
+    def test_completion_uses_router_endpoint(self, monkeypatch):
+        """Test that base_url reaches the genai client."""
+        endpoints = []
+
+        def create_client(api_key, base_url):
+            endpoints.append(base_url)
+            return SimpleNamespace(models=SimpleNamespace(
+                generate_content=lambda **_: SimpleNamespace(text="ok")))
+
+        monkeypatch.setattr(google_provider, "_create_client", create_client)
+
+        result = GoogleProviderAdapter().execute_completion(
+            message="hi", model_id="gemini", api_key="key", base_url="https://gateway.example")
+
+        assert result == "ok"
+        assert endpoints == ["https://gateway.example"]
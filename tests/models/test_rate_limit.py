@@ -0,0 +1,177 @@
+"""Tests for the provider rate limiter.
+
+These tests verify token bucket reservations, reading limits from provider
+configuration, bounding of concurrent calls, and adaptation of the
+concurrency limit to 429 responses and slow calls.
+"""
+
+import threading
+import time
+
+import pytest
+
+from osprey.models.rate_limit import (
+    BURST_SECONDS,
+    ProviderRateLimiter,
+    RateLimitSettings,
+    TokenBucket,
+)
+from osprey.utils.metrics import LLM_RATE_LIMITED
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class RateLimitError(Exception):
+    """Stand-in for an SDK error carrying HTTP 429."""
+
+    status_code = 429
+
+    def __init__(self, retry_after=None):
+        super().__init__("rate limited")
+        self.response = type("Response", (), {"headers": {"retry-after": retry_after}})()
+
+
+class TestTokenBucket:
+    """Test token bucket reservations."""
+
+    def test_reservations_queue_behind_each_other(self):
+        """Test that reservations beyond the level return growing waits and refill over time."""
+        clock = FakeClock()
+        bucket = TokenBucket(60, burst=2, clock=clock)
+
+        waits = [bucket.reserve(1) for _ in range(4)]
+        clock.now += 2
+        after_refill = bucket.reserve(1)
+
+        assert waits == [0.0, 0.0, 1.0, 2.0]
+        assert after_refill == 1.0
+
+
+class TestRateLimitSettings:
+    """Test reading limits from provider configuration."""
+
+    def test_model_overrides_provider_limits(self):
+        """Test that a per-model entry overrides the provider-wide values."""
+        config = {"api_key": "x", "rate_limits": {
+            "requests_per_minute": 50, "max_concurrency": 4,
+            "models": {"fast": {"requests_per_minute": 200}},
+        }}
+
+        fast = RateLimitSettings.from_provider_config(config, "fast")
+        other = RateLimitSettings.from_provider_config(config, "other")
+
+        assert (fast.requests_per_minute, fast.max_concurrency) == (200, 4)
+        assert other.requests_per_minute == 50
+        assert RateLimitSettings.from_provider_config({}, "fast") == RateLimitSettings()
+        with pytest.raises(ValueError):
+            RateLimitSettings.from_provider_config({"rate_limits": {"max_concurrency": 0}}, "m")
+
+
+class TestProviderRateLimiter:
+    """Test concurrency limiting and AIMD adaptation."""
+
+    def test_concurrent_calls_wait_for_a_slot(self):
+        """Test that no more than the limit run at once and every call completes."""
+        limiter = ProviderRateLimiter("test/bounded", RateLimitSettings(max_concurrency=2))
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def call():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return "ok"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(limiter.call(call)))
+                   for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert results == ["ok"] * 6
+        assert peak[0] == 2
+        assert limiter.in_flight == 0 and limiter.waiting == 0
+
+    def test_rate_limit_halves_limit_and_retries(self):
+        """Test that a 429 halves the limit, waits Retry-After and retries the call."""
+        clock = FakeClock()
+        limiter = ProviderRateLimiter("test/throttled", RateLimitSettings(max_concurrency=8),
+                                      clock=clock, sleep=clock.sleep)
+        attempts = []
+
+        def call():
+            attempts.append(clock.now)
+            if len(attempts) == 1:
+                raise RateLimitError(retry_after="3")
+            return "ok"
+
+        before = LLM_RATE_LIMITED.get(provider="test", model="throttled")
+        result = limiter.call(call)
+
+        assert result == "ok"
+        assert limiter.limit == 4
+        assert attempts[1] - attempts[0] == pytest.approx(3.0)
+        assert LLM_RATE_LIMITED.get(provider="test", model="throttled") == before + 1
+
+    def test_errors_and_latency_adjust_limit(self):
+        """Test that other errors are not retried, successes grow the limit and slow calls shrink it."""
+        clock = FakeClock()
+        settings = RateLimitSettings(max_concurrency=4, max_rate_limit_retries=0,
+                                     target_latency_seconds=5.0)
+        limiter = ProviderRateLimiter("test/adaptive", settings, clock=clock, sleep=clock.sleep)
+
+        def failing():
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            limiter.call(failing)
+        with pytest.raises(RateLimitError):
+            limiter.call(lambda: (_ for _ in ()).throw(RateLimitError()))
+        after_429 = limiter.limit
+        clock.now += 10
+        for _ in range(8):
+            limiter.call(lambda: "ok")
+        recovered = limiter.limit
+
+        def slow():
+            clock.now += 6
+            return "ok"
+
+        limiter.call(slow)
+
+        assert after_429 == 2
+        assert recovered == 4
+        assert limiter.limit == 3
+
+    def test_extra_attempts_reserve_request_budget(self):
+        """Test that extra attempts count against requests_per_minute and may decline to wait."""
+        clock = FakeClock()
+        settings = RateLimitSettings(requests_per_minute=60)
+        limiter = ProviderRateLimiter("test/extra", settings, clock=clock, sleep=clock.sleep)
+        granted = []
+
+        def call():
+            while limiter.reserve_extra(wait=False):
+                granted.append(clock.now)
+            return limiter.reserve_extra()
+
+        assert limiter.call(call) is True
+        assert len(granted) == BURST_SECONDS - 1
+        assert clock.slept == [1.0]
@@ -0,0 +1,107 @@
+"""Tests for the record/replay provider.
+
+These tests verify that completions of an upstream provider are recorded to a
+cassette and served again offline, matched by request hash or by recorded
+order, with reproducible synthetic latency.
+"""
+
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from osprey.models.providers import replay as replay_provider
+from osprey.models.providers.replay import LatencyModel, ReplayMissError, ReplayProviderAdapter
+
+
+class Decision(BaseModel):
+    """Structured output used in the tests."""
+
+    is_match: bool
+
+
+class FakeUpstream:
+    """Answers with a counter instead of calling a real model."""
+
+    name = "fake"
+
+    def __init__(self):
+        self.calls = 0
+
+    def execute_completion(self, message, model_id, api_key, base_url, output_format=None, **kwargs):
+        self.calls += 1
+        if output_format is not None:
+            return output_format(is_match=True)
+        return f"answer {self.calls} to {message}"
+
+
+@pytest.fixture
+def replay_settings(monkeypatch, tmp_path):
+    """Configure the replay provider with a temporary cassette and a fake upstream."""
+    settings = {"cassette": str(tmp_path / "session.jsonl"), "mode": "record"}
+    upstream = FakeUpstream()
+    monkeypatch.setattr(ReplayProviderAdapter, "_settings", staticmethod(lambda: settings))
+    monkeypatch.setattr(ReplayProviderAdapter, "_upstream", staticmethod(lambda s: (upstream, {})))
+    replay_provider._cassettes.clear()
+    yield settings, upstream
+    replay_provider._cassettes.clear()
+
+
+def _replay(settings):
+    settings["mode"] = "replay"
+    replay_provider._cassettes.clear()
+
+
+class TestRecordReplay:
+    """Test recording a session and replaying it offline."""
+
+    def test_recorded_responses_are_replayed_by_request(self, replay_settings):
+        """Test that replay returns the recorded answer of each request without the upstream."""
+        settings, upstream = replay_settings
+        adapter = ReplayProviderAdapter()
+        recorded = [adapter.execute_completion(q, "model-a", None, None) for q in ("first", "second")]
+        decision = adapter.execute_completion("classify", "model-a", None, None, output_format=Decision)
+
+        with open(settings["cassette"], encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[2])["response"] == {"type": "model", "data": {"is_match": True}}
+
+        _replay(settings)
+        assert adapter.execute_completion("second", "model-a", None, None) == recorded[1]
+        assert adapter.execute_completion("first", "model-a", None, None) == recorded[0]
+        replayed = adapter.execute_completion("classify", "model-a", None, None, output_format=Decision)
+        assert replayed == decision
+        assert adapter.execute_completion("classify", "model-a", None, None, output_format=Decision,
+                                          is_typed_dict_output=True) == {"is_match": True}
+        assert upstream.calls == 3
+
+    def test_changed_prompts_fall_back_to_recorded_order(self, replay_settings):
+        """Test that unmatched prompts get the recorded answers of the same model in order."""
+        settings, _ = replay_settings
+        adapter = ReplayProviderAdapter()
+        recorded = [adapter.execute_completion(q, "model-a", None, None) for q in ("one", "two")]
+
+        _replay(settings)
+        replayed = [adapter.execute_completion(f"changed {i}", "model-a", None, None) for i in range(3)]
+
+        assert replayed == [recorded[0], recorded[1], recorded[0]]
+        with pytest.raises(ReplayMissError):
+            adapter.execute_completion("one", "model-b", None, None)
+
+
+class TestLatencyModel:
+    """Test synthetic latency distributions."""
+
+    def test_seeded_distributions_are_reproducible(self):
+        """Test that draws repeat for a seed and respect the configured distribution."""
+        lognormal = {"distribution": "lognormal", "median_seconds": 1.0, "sigma": 0.5}
+        first, second = LatencyModel(lognormal, seed=7), LatencyModel(lognormal, seed=7)
+        assert [first.sample() for _ in range(3)] == [second.sample() for _ in range(3)]
+
+        uniform = LatencyModel({"distribution": "uniform", "min_seconds": 0.1, "max_seconds": 0.2}, seed=1)
+        assert all(0.1 <= uniform.sample() <= 0.2 for _ in range(50))
+        assert LatencyModel({"distribution": "recorded", "scale": 0.5}).sample(2.0) == 1.0
+        assert LatencyModel().sample() == 0.0
+        with pytest.raises(ValueError):
+            LatencyModel({"distribution": "pareto"})
@@ -0,0 +1,123 @@
+"""Tests for local structured-output repair.
+
+These tests verify that typical defects of model output (fences, trailing
+prose, truncation, lenient syntax, wrong enum case) are repaired without
+another LLM call, that repairs are counted per strategy, and that output
+beyond repair raises the original validation error.
+"""
+
+from enum import StrEnum
+from typing import Literal
+
+import httpx
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from osprey.models.providers.cborg import CBorgProviderAdapter
+from osprey.models.providers.openai import OpenAIProviderAdapter
+from osprey.models.structured_output import parse_structured_output
+from osprey.utils.metrics import STRUCTURED_OUTPUT_REPAIRS
+
+
+class Operation(StrEnum):
+    SAVE = "save"
+    RETRIEVE = "retrieve"
+
+
+class Classification(BaseModel):
+    operation: Operation
+    reasoning: str
+
+
+class Step(BaseModel):
+    capability: str
+    expected_output: str | None = None
+
+
+class Plan(BaseModel):
+    steps: list[Step]
+    mode: Literal["fast", "thorough"] = "fast"
+    is_match: bool = False
+
+
+class TestParseStructuredOutput:
+    """Test repair strategies and their accounting."""
+
+    @pytest.mark.parametrize("text, strategies", [
+        ('```json\n{"operation": "save", "reasoning": "asked to"}\n```', ["strip_fences"]),
+        ('Here you go: {"operation": "save", "reasoning": "asked to"} Hope it helps!', ["extract_json"]),
+        ('{"operation": "save", "reasoning": "asked to', ["balance_brackets"]),
+        ("{'operation': 'save', reasoning: 'asked to',}", ["lenient_parse"]),
+        ('{"Operation": "SAVE", "reasoning": "asked to"}', ["schema_coercion"]),
+    ])
+    def test_repairs_common_defects(self, text, strategies):
+        """Test that each typical defect is repaired and its strategy counted."""
+        before = {s: STRUCTURED_OUTPUT_REPAIRS.get(strategy=s) for s in strategies}
+
+        result = parse_structured_output(text, Classification)
+
+        assert result.operation is Operation.SAVE
+        assert result.reasoning == "asked to"
+        for strategy in strategies:
+            assert STRUCTURED_OUTPUT_REPAIRS.get(strategy=strategy) == before[strategy] + 1
+
+    def test_coerces_nested_values(self):
+        """Test that nested models, single list items, literals and booleans are coerced."""
+        text = ('```\n{"steps": {"capability": "respond", "expected_output": 3}, '
+                '"mode": "Thorough", "is_match": "yes"}')
+
+        result = parse_structured_output(text, Plan)
+
+        assert result.steps == [Step(capability="respond", expected_output="3")]
+        assert result.mode == "thorough"
+        assert result.is_match is True
+
+    def test_valid_output_is_not_counted_and_garbage_raises(self):
+        """Test that valid JSON needs no repair and unrepairable text raises the strict error."""
+        before = STRUCTURED_OUTPUT_REPAIRS.get(strategy="failed")
+
+        valid = parse_structured_output('{"steps": []}', Plan)
+        with pytest.raises(ValidationError):
+            parse_structured_output("I cannot answer that.", Classification)
+
+        assert valid == Plan(steps=[])
+        assert STRUCTURED_OUTPUT_REPAIRS.get(strategy="failed") == before + 1
+
+
+class TestSdkParsedProviders:
+    """Test that OpenAI-compatible adapters hand unparseable output to the repair."""
+
+    @staticmethod
+    def _http_client(content, finish_reason="stop"):
+        def handler(request):
+            return httpx.Response(200, json={
+                "id": "chatcmpl-1", "object": "chat.completion", "created": 0, "model": "model",
+                "choices": [{"index": 0, "finish_reason": finish_reason,
+                             "message": {"role": "assistant", "content": content}}],
+            })
+
+        return httpx.Client(transport=httpx.MockTransport(handler))
+
+    @pytest.mark.parametrize("adapter", [OpenAIProviderAdapter, CBorgProviderAdapter])
+    @pytest.mark.parametrize("content, finish_reason", [
+        ('```json\n{"operation": "Save", "reasoning": "asked to remember"}\n```', "stop"),
+        ('{"operation": "save", "reasoning": "asked to rem', "length"),
+    ])
+    def test_almost_valid_json_is_returned_as_text(self, adapter, content, finish_reason):
+        """Test that the raw content comes back instead of an SDK parse error."""
+        result = adapter().execute_completion(
+            message="classify", model_id="model", api_key="key", base_url="https://llm.example/v1",
+            output_format=Classification, http_client=self._http_client(content, finish_reason))
+
+        assert result == content
+        assert parse_structured_output(result, Classification).operation == Operation.SAVE
+
+    @pytest.mark.parametrize("adapter", [OpenAIProviderAdapter, CBorgProviderAdapter])
+    def test_valid_json_is_parsed_by_the_sdk(self, adapter):
+        """Test that valid structured output still comes back as the model."""
+        result = adapter().execute_completion(
+            message="classify", model_id="model", api_key="key", base_url="https://llm.example/v1",
+            output_format=Classification,
+            http_client=self._http_client('{"operation": "retrieve", "reasoning": "lookup"}'))
+
+        assert result == Classification(operation=Operation.RETRIEVE, reasoning="lookup")
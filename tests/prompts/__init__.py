@@ -0,0 +1 @@
+"""Prompt system tests."""
@@ -0,0 +1,96 @@
+"""Tests for compiled prompt sections in FrameworkPromptBuilder.
+
+These tests verify that static sections are built once per builder, that
+orchestrator capability sections are compiled per capability set, and that
+invalidation forces a rebuild.
+"""
+
+from osprey.base import OrchestratorGuide
+from osprey.prompts import FrameworkPromptBuilder, invalidate_prompt_cache
+from osprey.prompts.defaults.orchestrator import DefaultOrchestratorPromptBuilder
+
+
+class _CountingBuilder(FrameworkPromptBuilder):
+    """Builder that counts how often its sections are built."""
+
+    PROMPT_TYPE = "counting"
+
+    def __init__(self):
+        self.role_calls = 0
+
+    def get_role_definition(self) -> str:
+        self.role_calls += 1
+        return "You are a test assistant."
+
+    def get_instructions(self) -> str:
+        return "Answer briefly."
+
+    def _get_dynamic_context(self, request: str = "", **kwargs):
+        return f"Request: {request}"
+
+
+class _GuideCapability:
+    """Capability stand-in exposing an orchestrator guide."""
+
+    def __init__(self, name: str, counter: list):
+        self.name = name
+        self._counter = counter
+
+    @property
+    def orchestrator_guide(self):
+        self._counter.append(self.name)
+        return OrchestratorGuide(instructions=f"Use {self.name} when needed.", examples=[], priority=1)
+
+
+class TestCompiledSections:
+    """Test caching of static prompt sections."""
+
+    def test_static_sections_are_built_once(self):
+        """Test that only the dynamic context is rebuilt per call."""
+        builder = _CountingBuilder()
+
+        first = builder.get_system_instructions(request="first")
+        second = builder.get_system_instructions(request="second")
+
+        assert builder.role_calls == 1
+        assert first.startswith("You are a test assistant.\n\nAnswer briefly.")
+        assert second.endswith("Request: second")
+
+    def test_invalidation_rebuilds_sections(self):
+        """Test that invalidate_prompt_cache() forces recompilation."""
+        builder = _CountingBuilder()
+        builder.get_system_instructions()
+
+        invalidate_prompt_cache()
+        builder.get_system_instructions()
+
+        assert builder.role_calls == 2
+
+
+class TestOrchestratorCompilation:
+    """Test compilation of orchestrator capability sections."""
+
+    def test_capability_sections_cached_per_capability_set(self):
+        """Test that guides are formatted once per capability set."""
+        builder = DefaultOrchestratorPromptBuilder()
+        calls = []
+        capabilities = [_GuideCapability("alpha", calls), _GuideCapability("beta", calls)]
+
+        first = builder.get_system_instructions(active_capabilities=capabilities)
+        calls_after_first = len(calls)
+        builder.get_system_instructions(active_capabilities=capabilities)
+        assert len(calls) == calls_after_first
+        assert "Use alpha when needed." in first
+
+        reduced = builder.get_system_instructions(active_capabilities=capabilities[:1])
+        assert len(calls) > calls_after_first
+        assert "Use beta when needed." not in reduced
+
+    def test_dynamic_sections_are_not_cached(self):
+        """Test that error context still changes between calls."""
+        builder = DefaultOrchestratorPromptBuilder()
+
+        prompt = builder.get_system_instructions(active_capabilities=[], error_context="Step failed: timeout")
+
+        assert "Step failed: timeout" in prompt
+        assert "Step failed" not in builder.get_system_instructions(active_capabilities=[])
@@ -0,0 +1,161 @@
+"""Tests for lazy component loading and load profiling in RegistryManager.
+
+These tests verify that lazy initialization registers components without
+importing their modules, that first access imports them, that graph nodes
+are represented by stubs until executed, and that load costs are recorded.
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+from osprey.base.errors import RegistryError
+from osprey.registry.manager import RegistryManager
+from osprey.registry.profiling import measure_component_load
+
+APP_MODULE = "lazy_test_app.components"
+
+REGISTRY_SOURCE = f"""
+from osprey.registry import (
+    CapabilityRegistration,
+    NodeRegistration,
+    RegistryConfigProvider,
+    extend_framework_registry,
+)
+
+class LazyTestRegistryProvider(RegistryConfigProvider):
+    def get_registry_config(self):
+        return extend_framework_registry(
+            capabilities=[
+                CapabilityRegistration(
+                    name="lazy_capability",
+                    module_path="{APP_MODULE}",
+                    class_name="LazyCapability",
+                    description="Capability used by lazy loading tests",
+                    provides=[],
+                    requires=[],
+                )
+            ],
+            core_nodes=[
+                NodeRegistration(
+                    name="lazy_node",
+                    module_path="{APP_MODULE}",
+                    function_name="LazyNode",
+                    description="Node used by lazy loading tests",
+                )
+            ],
+        )
+"""
+
+COMPONENTS_SOURCE = """
+class LazyCapability:
+    name = "lazy_capability"
+
+    @staticmethod
+    async def langgraph_node(state, **kwargs):
+        return {"handled_by": "lazy_capability", "state": state}
+
+
+class LazyNode:
+    @staticmethod
+    async def langgraph_node(state, **kwargs):
+        return {"handled_by": "lazy_node"}
+"""
+
+
+@pytest.fixture
+def app_registry(tmp_path, monkeypatch):
+    """Create an application registry whose components live in an unimported module."""
+    package = tmp_path / "lazy_test_app"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "components.py").write_text(COMPONENTS_SOURCE)
+    registry_file = tmp_path / "registry.py"
+    registry_file.write_text(REGISTRY_SOURCE)
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    sys.modules.pop(APP_MODULE, None)
+    yield str(registry_file)
+    sys.modules.pop(APP_MODULE, None)
+
+
+def _lazy_manager(registry_path: str) -> RegistryManager:
+    manager = RegistryManager(registry_path=registry_path, lazy_loading=True)
+    manager.initialize()
+    return manager
+
+
+class TestLazyLoading:
+    """Test deferring component imports until first access."""
+
+    def test_initialize_does_not_import_components(self, app_registry):
+        """Test that lazy initialization only records registrations."""
+        manager = _lazy_manager(app_registry)
+
+        assert APP_MODULE not in sys.modules
+        stats = manager.get_stats()
+        assert "lazy_capability" in stats["capability_names"]
+        assert stats["pending_components"] > 0
+
+    def test_first_access_imports_component(self, app_registry):
+        """Test that get_capability imports the module and registers the node."""
+        manager = _lazy_manager(app_registry)
+
+        capability = manager.get_capability("lazy_capability")
+
+        assert type(capability).__name__ == "LazyCapability"
+        assert APP_MODULE in sys.modules
+        assert manager.get_node("lazy_capability") is type(capability).langgraph_node
+        record = next(r for r in manager.load_profile if r.name == "lazy_capability")
+        assert record.lazy is True
+        assert record.module_path == APP_MODULE
+
+    def test_graph_nodes_are_stubs_until_executed(self, app_registry):
+        """Test that get_all_nodes does not import and stubs delegate on execution."""
+        manager = _lazy_manager(app_registry)
+
+        stub = manager.get_all_nodes()["lazy_node"]
+        assert APP_MODULE not in sys.modules
+
+        result = asyncio.run(stub({"messages": []}))
+
+        assert result == {"handled_by": "lazy_node"}
+        assert manager.get_all_nodes()["lazy_node"] is not stub
+
+    def test_capabilities_keep_registration_order(self, app_registry):
+        """Test that accessing one capability first does not reorder the list."""
+        manager = _lazy_manager(app_registry)
+        manager.get_capability("lazy_capability")
+
+        names = [c.name for c in manager.get_all_capabilities()]
+
+        assert names == [reg.name for reg in manager.config.capabilities if reg.name in names]
+        assert names[-1] == "lazy_capability"
+
+    def test_load_failure_drops_stub(self, app_registry, monkeypatch):
+        """Test that a node whose module cannot be imported is removed, like in eager mode."""
+        manager = _lazy_manager(app_registry)
+        monkeypatch.setitem(sys.modules, APP_MODULE, None)
+
+        with pytest.raises(RegistryError):
+            manager.get_node("lazy_node")
+
+        assert "lazy_node" not in manager.get_all_nodes()
+
+
+class TestLoadProfiling:
+    """Test per-component load measurements."""
+
+    def test_records_time_and_new_modules(self):
+        """Test that a measured load records its duration and imported modules."""
+        records = []
+
+        with measure_component_load(records, "capabilities", "demo", "demo.module"):
+            sys.modules["lazy_test_profile_marker"] = object()
+        del sys.modules["lazy_test_profile_marker"]
+
+        assert records[0].name == "demo"
+        assert records[0].modules_imported == 1
+        assert records[0].seconds >= 0
+        assert records[0].memory_kb is None
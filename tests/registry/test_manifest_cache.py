@@ -0,0 +1,113 @@
+"""Tests for the on-disk registry manifest cache.
+
+These tests verify that the merged registry configuration is reused while the
+registry files and configuration are unchanged, rebuilt when they change, and
+that the registry export is skipped when it is already current.
+"""
+
+import pickle
+
+import pytest
+
+from osprey.registry import manager as manager_module
+from osprey.registry.manager import RegistryManager
+from osprey.registry.manifest import RegistryManifestCache, compute_manifest_key
+
+REGISTRY_SOURCE = """
+from osprey.registry import RegistryConfigProvider, extend_framework_registry
+
+class ManifestTestRegistryProvider(RegistryConfigProvider):
+    def get_registry_config(self):
+        return extend_framework_registry(capabilities=[])
+"""
+
+
+@pytest.fixture
+def registry_file(tmp_path):
+    """Write a minimal application registry."""
+    path = tmp_path / "registry.py"
+    path.write_text(REGISTRY_SOURCE)
+    return path
+
+
+class TestManifestKey:
+    """Test cache key derivation."""
+
+    def test_key_changes_with_registry_source(self, registry_file):
+        """Test that editing the registry file changes the key."""
+        before = compute_manifest_key(str(registry_file), {"a": 1})
+        registry_file.write_text(REGISTRY_SOURCE + "\n# edited\n")
+
+        assert compute_manifest_key(str(registry_file), {"a": 1}) != before
+
+    def test_key_changes_with_config(self, registry_file):
+        """Test that configuration changes produce a different key regardless of key order."""
+        key = compute_manifest_key(str(registry_file), {"a": 1, "b": 2})
+
+        assert compute_manifest_key(str(registry_file), {"b": 2, "a": 1}) == key
+        assert compute_manifest_key(str(registry_file), {"a": 2, "b": 2}) != key
+
+
+class TestRegistryManifestCache:
+    """Test the cache file itself."""
+
+    def test_round_trip_and_update(self, tmp_path):
+        """Test that a payload is returned for its key only and can be extended."""
+        cache = RegistryManifestCache(tmp_path)
+        cache.save("k1", config="merged")
+        cache.update("k1", export_dir="/exports")
+
+        assert cache.load("k1") == {"key": "k1", "config": "merged", "export_dir": "/exports"}
+        assert cache.load("k2") is None
+
+    def test_unreadable_file_is_a_miss(self, tmp_path):
+        """Test that a corrupt cache file is ignored."""
+        cache = RegistryManifestCache(tmp_path)
+        cache.path.write_bytes(b"not a pickle")
+
+        assert cache.load("k1") is None
+
+
+class TestManagerManifestCache:
+    """Test RegistryManager reuse of cached configurations."""
+
+    def test_second_manager_reuses_merged_config(self, tmp_path, registry_file, monkeypatch):
+        """Test that an unchanged registry is not merged again."""
+        cache_dir = tmp_path / "cache"
+        first = RegistryManager(str(registry_file), manifest_cache_dir=str(cache_dir))
+        assert first.config_from_cache is False
+
+        def fail_build(self):
+            raise AssertionError("configuration should come from the manifest cache")
+
+        monkeypatch.setattr(RegistryManager, "_build_merged_configuration", fail_build)
+        second = RegistryManager(str(registry_file), manifest_cache_dir=str(cache_dir))
+
+        assert second.config_from_cache is True
+        assert [c.name for c in second.config.capabilities] == [c.name for c in first.config.capabilities]
+
+    def test_changed_registry_rebuilds(self, tmp_path, registry_file):
+        """Test that editing registry.py invalidates the cached configuration."""
+        cache_dir = tmp_path / "cache"
+        RegistryManager(str(registry_file), manifest_cache_dir=str(cache_dir))
+        registry_file.write_text(REGISTRY_SOURCE + "\n# edited\n")
+
+        manager = RegistryManager(str(registry_file), manifest_cache_dir=str(cache_dir))
+
+        assert manager.config_from_cache is False
+        with open(cache_dir / "registry_manifest.pickle", "rb") as f:
+            assert pickle.load(f)["key"] == manager.manifest_key
+
+    def test_export_is_current_after_export(self, tmp_path, registry_file, monkeypatch):
+        """Test that an export is only reported current for the directory it was written to."""
+        cache_dir = tmp_path / "cache"
+        manager = RegistryManager(str(registry_file), manifest_cache_dir=str(cache_dir))
+        monkeypatch.setattr(manager, "_save_export_data",
+                            lambda data, output_dir: (tmp_path / "registry_export.json").write_text("{}"))
+        monkeypatch.setattr(manager_module, "get_config_value", lambda path, default=None: default)
+        assert manager.export_is_current(str(tmp_path)) is False
+
+        manager.export_registry_to_json(str(tmp_path))
+
+        assert manager.export_is_current(str(tmp_path)) is True
+        assert manager.export_is_current(str(tmp_path / "other")) is False
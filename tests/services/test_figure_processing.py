@@ -0,0 +1,161 @@
+"""Tests for figure post-processing in the Python executor.
+
+These tests verify line data decimation (LTTB and min/max) used when
+serializing matplotlib figures, the configuration of that decimation, and
+the thumbnail naming helpers used by figure collection and the OpenWebUI
+pipeline.
+"""
+
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from osprey.services.python_executor.config import PythonExecutorConfig
+from osprey.services.python_executor.execution_wrapper import ExecutionWrapper
+from osprey.services.python_executor.figure_processing import (
+    create_thumbnail,
+    downsample_line,
+    find_thumbnail,
+    is_thumbnail,
+    lttb_indices,
+    minmax_indices,
+    thumbnail_path_for,
+)
+from osprey.services.python_executor.services import FileManager
+
+
+class TestLineDecimation:
+    """Test LTTB and min/max decimation of line data."""
+
+    def test_short_lines_are_unchanged(self):
+        """Test that lines below the limit are returned as-is."""
+        x, y = downsample_line([1, 2, 3], [4, 5, 6], max_points=10)
+        assert x == [1, 2, 3]
+        assert y == [4, 5, 6]
+
+    def test_lttb_respects_limit_and_keeps_endpoints(self):
+        """Test that LTTB keeps first/last points and the point budget."""
+        n = 10_000
+        x = list(range(n))
+        y = [math.sin(i / 100) for i in x]
+
+        indices = lttb_indices(x, y, 500)
+
+        assert len(indices) == 500
+        assert indices[0] == 0
+        assert indices[-1] == n - 1
+        assert indices == sorted(indices)
+
+    def test_lttb_preserves_spike(self):
+        """Test that an isolated spike survives decimation."""
+        n = 5_000
+        x = list(range(n))
+        y = [0.0] * n
+        y[2_345] = 100.0
+
+        _, ds_y = downsample_line(x, y, max_points=200, method="lttb")
+
+        assert max(ds_y) == 100.0
+
+    def test_minmax_keeps_extremes(self):
+        """Test that min/max decimation keeps global minimum and maximum."""
+        n = 8_000
+        y = [math.sin(i / 50) for i in range(n)]
+        y[1_000] = -5.0
+        y[7_000] = 5.0
+
+        indices = minmax_indices(y, 400)
+
+        assert len(indices) <= 400
+        assert 1_000 in indices
+        assert 7_000 in indices
+
+    def test_non_numeric_data_falls_back_to_striding(self):
+        """Test that categorical x data is decimated without errors."""
+        n = 1_000
+        x = [f"label_{i}" for i in range(n)]
+        y = list(range(n))
+
+        ds_x, ds_y = downsample_line(x, y, max_points=100)
+
+        assert len(ds_x) == len(ds_y)
+        assert len(ds_x) <= 101
+        assert ds_x[-1] == "label_999"
+
+    def test_nan_data_falls_back_to_striding(self):
+        """Test that NaN gaps do not break decimation."""
+        n = 1_000
+        x = list(range(n))
+        y = [float("nan") if i % 10 == 0 else float(i) for i in x]
+
+        ds_x, ds_y = downsample_line(x, y, max_points=100)
+
+        assert len(ds_x) == len(ds_y) <= 101
+
+
+class TestFigureSerialization:
+    """Test configured decimation of serialized matplotlib figures."""
+
+    def test_configured_method_and_budget_apply_to_real_figure(self, tmp_path):
+        """Test that a figure above the point budget is saved decimated with the configured method."""
+        matplotlib = pytest.importorskip("matplotlib")
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        n = 10_000
+        y = [math.sin(i / 500) for i in range(n)]
+        y[4321] = 50.0
+        fig, ax = plt.subplots()
+        ax.plot(range(n), y, label="signal")
+        configurable = {"agent_data_dir": str(tmp_path), "python_executor": {
+            "figure_line_max_points": 200, "figure_line_downsample_method": "minmax"}}
+
+        results_file = FileManager(configurable).save_results({"figure": fig}, tmp_path)
+        plt.close(fig)
+        line = json.loads(results_file.read_text())["figure"]["axes"][0]["lines"][0]
+
+        assert len(line["ydata"]) <= 200
+        assert line["original_points"] == n and line["downsampled"] is True
+        assert max(line["ydata"]) == 50.0
+        assert line["xdata"] == sorted(line["xdata"])
+
+    def test_wrapper_passes_settings_to_results_export(self):
+        """Test that executed code serializes results with the configured settings."""
+        config = PythonExecutorConfig({"python_executor": {
+            "figure_line_max_points": 500, "figure_line_downsample_method": "minmax"}})
+        script = ExecutionWrapper("local", config.figure_line_max_points,
+                                  config.figure_line_downsample_method).create_wrapper("results = {}")
+
+        assert "max_line_points=500" in script
+        assert "line_downsample_method='minmax'" in script
+        with pytest.raises(ValueError):
+            PythonExecutorConfig({"python_executor": {"figure_line_downsample_method": "mean"}})
+
+
+class TestThumbnailPaths:
+    """Test thumbnail naming and discovery."""
+
+    def test_thumbnail_path_is_next_to_original(self):
+        """Test thumbnail naming convention."""
+        path = thumbnail_path_for(Path("/data/figures/figure_01.png"))
+        assert path == Path("/data/figures/figure_01.thumb.webp")
+        assert is_thumbnail(path)
+        assert not is_thumbnail(Path("/data/figures/figure_01.png"))
+
+    def test_find_thumbnail(self, tmp_path):
+        """Test discovery of existing thumbnails."""
+        figure = tmp_path / "figure_01.png"
+        figure.write_bytes(b"png")
+        assert find_thumbnail(figure) is None
+
+        thumbnail = tmp_path / "figure_01.thumb.webp"
+        thumbnail.write_bytes(b"webp")
+        assert find_thumbnail(figure) == thumbnail
+
+    def test_vector_figures_are_skipped(self, tmp_path):
+        """Test that SVG figures never get thumbnails."""
+        figure = tmp_path / "figure_01.svg"
+        figure.write_text("<svg/>")
+        assert create_thumbnail(figure) is None
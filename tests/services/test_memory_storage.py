@@ -0,0 +1,219 @@
+"""Tests for the append-only user memory store.
+
+These tests verify JSONL appends, compaction into the JSON snapshot,
+concurrent writers, the mtime-validated load cache, SQLite FTS5 search and
+the OpenWebUI memory editor saving alongside the agent.
+"""
+
+import importlib.util
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import osprey
+from osprey.services.memory_storage import MemoryContent, MemoryStorageManager
+
+MEMORY_BUTTON = (Path(osprey.__file__).parent / "templates" / "services" / "open-webui"
+                 / "functions" / "memory_button.py")
+
+
+def _entry(text: str) -> MemoryContent:
+    return MemoryContent(timestamp=datetime(2025, 1, 15, 14, 30), content=text)
+
+
+class TestAppendOnlyStore:
+    """Test appends, compaction and legacy snapshots."""
+
+    def test_append_writes_jsonl_log(self, tmp_path):
+        """Test that new entries are appended, not rewritten."""
+        manager = MemoryStorageManager(str(tmp_path))
+
+        assert manager.add_memory_entry("user1", _entry("first"))
+        assert manager.add_memory_entry("user1", _entry("second"))
+
+        log_lines = (tmp_path / "user1.jsonl").read_text().splitlines()
+        assert [json.loads(line)["content"] for line in log_lines] == ["first", "second"]
+        assert not (tmp_path / "user1.json").exists()
+        assert [e.content for e in manager.get_all_memory_entries("user1")] == ["first", "second"]
+
+    def test_compaction_merges_log_into_snapshot(self, tmp_path):
+        """Test that reaching the threshold compacts the log."""
+        manager = MemoryStorageManager(str(tmp_path), compaction_threshold=3)
+
+        for i in range(4):
+            manager.add_memory_entry("user1", _entry(f"entry {i}"))
+
+        snapshot = json.loads((tmp_path / "user1.json").read_text())
+        assert [e["content"] for e in snapshot["entries"]] == ["entry 0", "entry 1", "entry 2"]
+        assert len((tmp_path / "user1.jsonl").read_text().splitlines()) == 1
+        assert len(manager.get_all_memory_entries("user1")) == 4
+
+    def test_legacy_snapshot_is_read(self, tmp_path):
+        """Test that existing JSON memory files keep working."""
+        (tmp_path / "user1.json").write_text(json.dumps({
+            "user_id": "user1",
+            "entries": [{"timestamp": "2025-01-01 10:00", "content": "legacy"}],
+        }))
+        manager = MemoryStorageManager(str(tmp_path))
+        manager.add_memory_entry("user1", _entry("new"))
+
+        assert manager.get_user_memory("user1").splitlines() == [
+            "[2025-01-01 10:00] legacy",
+            "[2025-01-15 14:30] new",
+        ]
+
+    def test_corrupt_log_line_is_skipped(self, tmp_path):
+        """Test that a torn log line does not hide other entries."""
+        manager = MemoryStorageManager(str(tmp_path))
+        manager.add_memory_entry("user1", _entry("kept"))
+        with open(tmp_path / "user1.jsonl", "a") as f:
+            f.write('{"timestamp": "2025-01')
+
+        assert [e.content for e in manager.get_all_memory_entries("user1")] == ["kept"]
+
+    def test_concurrent_writers_lose_nothing(self, tmp_path):
+        """Test that two managers writing in parallel keep every entry."""
+        managers = [
+            MemoryStorageManager(str(tmp_path), compaction_threshold=7),
+            MemoryStorageManager(str(tmp_path), compaction_threshold=7),
+        ]
+
+        def write(manager, prefix):
+            for i in range(25):
+                manager.add_memory_entry("user1", _entry(f"{prefix}-{i}"))
+
+        threads = [threading.Thread(target=write, args=(m, f"w{n}")) for n, m in enumerate(managers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        contents = {e.content for e in MemoryStorageManager(str(tmp_path)).get_all_memory_entries("user1")}
+        assert len(contents) == 50
+
+
+class TestMemoryEditor:
+    """Test the OpenWebUI memory editor against concurrent agent writes."""
+
+    def test_save_keeps_entries_compacted_while_editing(self, tmp_path):
+        """Test that entries compacted into the snapshot during an edit are not dropped."""
+        spec = importlib.util.spec_from_file_location("memory_button", MEMORY_BUTTON)
+        memory_button = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(memory_button)
+        action = memory_button.Action()
+        action.valves.memory_base_path = str(tmp_path)
+        manager = MemoryStorageManager(str(tmp_path))
+        manager.add_memory_entry("user1", _entry("first"))
+        manager.compact("user1")
+        manager.add_memory_entry("user1", _entry("second"))
+
+        data = action._load_memory_data("user1")
+        manager.add_memory_entry("user1", _entry("third"))
+        manager.compact("user1")
+        data["entries"] = [entry for entry in data["entries"] if entry["content"] != "first"]
+
+        assert action._save_memory_data("user1", data)
+        assert [e.content for e in manager.get_all_memory_entries("user1")] == ["second", "third"]
+        assert not (tmp_path / "user1.jsonl").exists()
+
+    def test_restore_does_not_replay_entries_logged_after_backup(self, tmp_path):
+        """Test that a restore brings back the snapshot and log exactly as backed up."""
+        spec = importlib.util.spec_from_file_location("memory_button", MEMORY_BUTTON)
+        memory_button = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(memory_button)
+        action = memory_button.Action()
+        action.valves.memory_base_path = str(tmp_path)
+        manager = MemoryStorageManager(str(tmp_path))
+        manager.add_memory_entry("user1", _entry("first"))
+        manager.compact("user1")
+        manager.add_memory_entry("user1", _entry("second"))
+
+        assert action._create_backup("user1")
+        manager.add_memory_entry("user1", _entry("after backup"))
+        assert action._restore_from_backup("user1")
+        assert [e.content for e in manager.get_all_memory_entries("user1")] == ["first", "second"]
+
+        manager.compact("user1")
+        assert action._create_backup("user1")
+        assert not (tmp_path / ".backups" / "user1.jsonl").exists()
+        manager.add_memory_entry("user1", _entry("after second backup"))
+        assert action._restore_from_backup("user1")
+        assert [e.content for e in manager.get_all_memory_entries("user1")] == ["first", "second"]
+        assert not (tmp_path / "user1.jsonl").exists()
+
+
+class TestLoadCache:
+    """Test the mtime-validated in-process cache."""
+
+    def test_unchanged_files_are_not_reparsed(self, tmp_path, monkeypatch):
+        """Test that repeated loads hit the cache."""
+        manager = MemoryStorageManager(str(tmp_path))
+        manager.add_memory_entry("user1", _entry("cached"))
+        manager.get_all_memory_entries("user1")
+
+        calls = []
+        original = MemoryStorageManager._read_log
+        monkeypatch.setattr(MemoryStorageManager, "_read_log", staticmethod(lambda p: calls.append(p) or original(p)))
+
+        manager.get_all_memory_entries("user1")
+        assert calls == []
+
+        manager.add_memory_entry("user1", _entry("fresh"))
+        assert len(manager.get_all_memory_entries("user1")) == 2
+        assert calls
+
+
+class TestMemorySearch:
+    """Test SQLite FTS5 top-k memory retrieval."""
+
+    def _manager(self, tmp_path):
+        from osprey.services.memory_storage import SQLiteMemoryIndex
+
+        index = SQLiteMemoryIndex(tmp_path / "memory_index.sqlite3")
+        manager = MemoryStorageManager(str(tmp_path), search_index=index)
+        for text in [
+            "User prefers plots with a dark background",
+            "Beam current archiver PV is SR:DCCT",
+            "User is on vacation next week",
+            "Vacuum pressure PVs are in sector 7",
+        ]:
+            manager.add_memory_entry("user1", _entry(text))
+        return manager
+
+    def test_relevant_entries_are_returned(self, tmp_path):
+        """Test that BM25 picks entries sharing terms with the query."""
+        manager = self._manager(tmp_path)
+
+        results = manager.search_memory_entries("user1", "plot the beam current", top_k=2)
+
+        contents = [r.content for r in results]
+        assert "Beam current archiver PV is SR:DCCT" in contents
+        assert len(contents) <= 2
+
+    def test_character_budget(self, tmp_path):
+        """Test that results fit the character budget."""
+        manager = self._manager(tmp_path)
+
+        results = manager.search_memory_entries("user1", "user plots vacation", top_k=10, max_chars=45)
+
+        assert sum(len(r.content) for r in results) <= 45
+        assert results
+
+    def test_no_match_falls_back_to_recent_entries(self, tmp_path):
+        """Test fallback when no entry matches the query."""
+        manager = self._manager(tmp_path)
+
+        results = manager.search_memory_entries("user1", "xyzzy", top_k=1)
+
+        assert [r.content for r in results] == ["Vacuum pressure PVs are in sector 7"]
+
+    def test_index_follows_file_changes(self, tmp_path):
+        """Test that new entries become searchable."""
+        manager = self._manager(tmp_path)
+        manager.search_memory_entries("user1", "beam", top_k=5)
+
+        manager.add_memory_entry("user1", _entry("Injector klystron tripped yesterday"))
+
+        results = manager.search_memory_entries("user1", "klystron", top_k=5)
+        assert [r.content for r in results] == ["Injector klystron tripped yesterday"]
@@ -0,0 +1,159 @@
+"""Tests for execution folder retention.
+
+These tests verify archiving of old execution folders into daily tarballs,
+disk budget enforcement, and on-demand restoration through the archive index.
+"""
+
+import fcntl
+import json
+import os
+import tarfile
+from datetime import datetime
+
+from osprey.services.python_executor.retention import (
+    ExecutionRetentionManager,
+    RetentionConfig,
+    execution_folder_of,
+)
+from osprey.services.python_executor.services import FileManager
+
+
+def _make_execution_folder(base_dir, timestamp: str, completed: bool = True, payload: bytes = b"x"):
+    """Create an execution folder the way FileManager lays them out."""
+    month = f"{timestamp[:4]}-{timestamp[4:6]}"
+    folder = base_dir / month / f"execution_{timestamp}_python_executor_abcd1234"
+    (folder / "attempts").mkdir(parents=True)
+    (folder / "results.json").write_bytes(payload)
+    if completed:
+        (folder / "execution_metadata.json").write_text(json.dumps({"success": True}))
+    return folder
+
+
+class TestArchiving:
+    """Test archiving of completed execution folders."""
+
+    def test_old_folders_are_archived_per_day(self, tmp_path):
+        """Test that old folders end up in one tarball per day."""
+        old_a = _make_execution_folder(tmp_path, "20250101_100000")
+        old_b = _make_execution_folder(tmp_path, "20250101_120000")
+        old_c = _make_execution_folder(tmp_path, "20250102_090000")
+        recent = _make_execution_folder(tmp_path, "20250301_090000")
+
+        manager = ExecutionRetentionManager(tmp_path, RetentionConfig(enabled=True, archive_after_days=14))
+        report = manager.run(now=datetime(2025, 3, 5))
+
+        assert report.archived_folders == 3
+        assert sorted(p.name for p in report.archives_written) == ["2025-01-01.tar.gz", "2025-01-02.tar.gz"]
+        assert not old_a.exists() and not old_b.exists() and not old_c.exists()
+        assert recent.exists()
+
+        index = manager.load_index()
+        assert index[old_a.relative_to(tmp_path).as_posix()] == "2025-01-01.tar.gz"
+        assert index[old_c.relative_to(tmp_path).as_posix()] == "2025-01-02.tar.gz"
+
+    def test_existing_day_archive_is_extended(self, tmp_path):
+        """Test that a second run for the same day keeps earlier members."""
+        first = _make_execution_folder(tmp_path, "20250101_100000")
+        manager = ExecutionRetentionManager(tmp_path, RetentionConfig(enabled=True, archive_after_days=1))
+        manager.run(now=datetime(2025, 1, 10))
+
+        second = _make_execution_folder(tmp_path, "20250101_180000")
+        manager.run(now=datetime(2025, 1, 10))
+
+        assert manager.restore_execution_folder(first) == first
+        assert manager.restore_execution_folder(second) == second
+        assert (first / "results.json").read_bytes() == b"x"
+
+    def test_restored_folder_replaces_its_archived_copy(self, tmp_path):
+        """Test that archiving a restored folder again does not duplicate its members."""
+        folder = _make_execution_folder(tmp_path, "20250101_100000")
+        manager = ExecutionRetentionManager(tmp_path, RetentionConfig(enabled=True, archive_after_days=1))
+        manager.run(now=datetime(2025, 1, 10))
+        manager.restore_execution_folder(folder)
+        (folder / "results.json").write_bytes(b"updated")
+
+        manager.run(now=datetime(2025, 1, 10))
+
+        with tarfile.open(manager.archive_dir / "2025-01-01.tar.gz", "r:gz") as archive:
+            names = archive.getnames()
+        assert len(names) == len(set(names))
+        assert manager.restore_execution_folder(folder) == folder
+        assert (folder / "results.json").read_bytes() == b"updated"
+
+    def test_incomplete_recent_folders_are_kept(self, tmp_path):
+        """Test that folders still being written are not archived."""
+        folder = _make_execution_folder(tmp_path, "20250101_100000", completed=False)
+
+        manager = ExecutionRetentionManager(tmp_path, RetentionConfig(enabled=True, archive_after_days=1))
+        # Folder mtime is "now", so it is considered in progress
+        report = manager.archive_old_folders(now=datetime(2025, 1, 10))
+
+        assert report.archived_folders == 0
+        assert folder.exists()
+
+
+class TestRestoreAndBudget:
+    """Test restoration from the index and disk budget enforcement."""
+
+    def test_restore_unknown_folder_returns_none(self, tmp_path):
+        """Test that unknown folders cannot be restored."""
+        manager = ExecutionRetentionManager(tmp_path, RetentionConfig(enabled=True))
+        assert manager.restore_execution_folder("2025-01/execution_unknown") is None
+
+    def test_run_in_another_process_is_skipped(self, tmp_path):
+        """Test that a run backs off while another worker holds the retention lock."""
+        folder = _make_execution_folder(tmp_path, "20250101_100000")
+        manager = ExecutionRetentionManager(tmp_path, RetentionConfig(enabled=True))
+        manager.archive_dir.mkdir()
+
+        with open(manager.archive_dir / ".retention.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            skipped = manager.run(now=datetime(2025, 3, 5))
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+        assert skipped.archived_folders == 0
+        assert folder.exists()
+        assert manager.run(now=datetime(2025, 3, 5)).archived_folders == 1
+        # Temporary tarball and index files are unique per writer and never left behind
+        assert sorted(p.name for p in manager.archive_dir.iterdir()) == [
+            ".last_retention_run", ".retention.lock", "2025-01-01.tar.gz", "index.json"]
+
+    def test_links_restore_archived_folder(self, tmp_path):
+        """Test that figure paths and Jupyter links resolve to their archived execution folder."""
+        folder = _make_execution_folder(tmp_path / "executed_scripts", "20250101_100000")
+        relative = folder.relative_to(tmp_path / "executed_scripts")
+        link = f"http://localhost:8088/lab/tree/executed_scripts/{relative.as_posix()}/notebook.ipynb"
+        file_manager = FileManager({"agent_data_dir": str(tmp_path),
+                                    "python_executor": {"retention": {"enabled": True}}})
+        ExecutionRetentionManager(file_manager.base_dir, RetentionConfig(enabled=True)).run(
+            now=datetime(2025, 3, 5))
+
+        assert not folder.exists()
+        assert execution_folder_of(f"/app/_agent_data/executed_scripts/{relative}/figures/a.png") == relative
+        assert execution_folder_of("http://localhost:8088/lab/tree/notebook.ipynb") is None
+        assert FileManager({"agent_data_dir": str(tmp_path)}).resolve_execution_folder(link) is None
+        assert not folder.exists()
+        assert file_manager.resolve_execution_folder(link) == folder.resolve()
+        assert (folder / "results.json").exists()
+
+    def test_disk_budget_deletes_oldest_archives_first(self, tmp_path):
+        """Test that the oldest archive is removed to meet the budget."""
+        _make_execution_folder(tmp_path, "20250101_100000", payload=os.urandom(1024 * 1024))
+        second = _make_execution_folder(tmp_path, "20250102_100000", payload=os.urandom(1024 * 1024))
+        recent = _make_execution_folder(tmp_path, "20250301_100000", payload=b"small")
+
+        manager = ExecutionRetentionManager(
+            tmp_path, RetentionConfig(enabled=True, archive_after_days=14, max_disk_mb=1.5)
+        )
+        report = manager.run(now=datetime(2025, 3, 5))
+
+        assert [p.name for p in report.deleted_archives] == ["2025-01-01.tar.gz"]
+        assert list(manager.load_index()) == [second.relative_to(tmp_path).as_posix()]
+        assert recent.exists()
+
+    def test_throttling(self, tmp_path):
+        """Test that retention is not due right after a run."""
+        manager = ExecutionRetentionManager(tmp_path, RetentionConfig(enabled=True, check_interval_hours=24))
+        assert manager.is_due()
+        manager.run()
+        assert not manager.is_due()
@@ -0,0 +1,91 @@
+"""Tests for the background event loop.
+
+These tests verify that coroutines submitted from several threads share one
+loop, that async iterators are bridged to sync iterators with bounded
+buffering and error propagation, and that closing the bridge cancels the
+producer.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from osprey.utils.event_loop import BackgroundEventLoop
+
+
+@pytest.fixture
+def background_loop():
+    """Provide a started loop that is stopped after the test."""
+    loop = BackgroundEventLoop(name="test-event-loop", max_workers=4)
+    loop.start()
+    yield loop
+    loop.stop()
+
+
+class TestBackgroundEventLoop:
+    """Test running coroutines and async iterators from sync code."""
+
+    def test_requests_share_one_loop(self, background_loop):
+        """Test that coroutines from different threads run on the same persistent loop."""
+        async def current_loop():
+            await asyncio.sleep(0)
+            return asyncio.get_running_loop()
+
+        loops = []
+        threads = [threading.Thread(target=lambda: loops.append(background_loop.run(current_loop())))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert set(loops) == {background_loop.loop}
+
+    def test_run_from_own_loop_raises(self, background_loop):
+        """Test that blocking on the loop from inside it fails instead of deadlocking."""
+        async def nested():
+            return background_loop.run(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError):
+            background_loop.run(nested())
+
+    def test_iterate_applies_backpressure_and_propagates_errors(self, background_loop):
+        """Test that the producer waits on a full buffer and its exception reaches the consumer."""
+        produced = []
+
+        async def source():
+            for i in range(5):
+                produced.append(i)
+                yield i
+            raise ValueError("boom")
+
+        iterator = background_loop.iterate(source(), buffer_size=1)
+        assert next(iterator) == 0
+        time.sleep(0.05)
+        assert len(produced) <= 3
+
+        received = []
+        with pytest.raises(ValueError, match="boom"):
+            for item in iterator:
+                received.append(item)
+        assert received == [1, 2, 3, 4]
+
+    def test_closing_iterator_cancels_producer(self, background_loop):
+        """Test that abandoning the sync iterator cancels the async producer."""
+        cancelled = threading.Event()
+
+        async def source():
+            try:
+                while True:
+                    yield "tick"
+                    await asyncio.sleep(0.01)
+            finally:
+                cancelled.set()
+
+        iterator = background_loop.iterate(source(), buffer_size=2)
+        assert next(iterator) == "tick"
+        iterator.close()
+
+        assert cancelled.wait(timeout=2)
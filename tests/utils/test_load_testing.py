@@ -0,0 +1,117 @@
+"""Tests for offline load testing.
+
+These tests verify that simulated users drive the gateway and graph
+concurrently, that turns, errors, interrupts, node latencies and resource
+samples are reported, and that model roles are pointed at the fake provider.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from osprey.utils.config import ConfigBuilder
+from osprey.utils.load_testing import (
+    SIMULATED_RESPONSES,
+    load_corpus,
+    percentile,
+    run_sessions,
+    use_simulated_models,
+)
+from osprey.utils.metrics import NODE_DURATION
+
+
+class FakeGateway:
+    """Returns the query as agent state, or an error for queries starting with 'fail'."""
+
+    def __init__(self):
+        self.threads = set()
+
+    async def process_message(self, user_input, compiled_graph, config):
+        self.threads.add(config["configurable"]["thread_id"])
+        if user_input.startswith("fail"):
+            return SimpleNamespace(error="gateway failure", resume_command=None, agent_state=None)
+        return SimpleNamespace(error=None, resume_command=None, agent_state={"query": user_input})
+
+
+class FakeGraph:
+    """Streams one event per turn, records a node duration and grows the checkpoint storage."""
+
+    def __init__(self, checkpointer):
+        self.checkpointer = checkpointer
+        self.active = 0
+        self.max_active = 0
+
+    async def astream(self, input_data, config, stream_mode):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        NODE_DURATION.observe(0.02, node="load_test_node", node_type="capability")
+        self.checkpointer.storage[config["configurable"]["thread_id"]] = b"x" * 100
+        self.active -= 1
+        yield {"event": "done"}
+
+    async def aget_state(self, config):
+        interrupted = config["configurable"]["user_id"] == "loadtest_user_0"
+        return SimpleNamespace(interrupts=[object()] if interrupted else [])
+
+
+class TestRunSessions:
+    """Test concurrent simulated sessions."""
+
+    def test_users_run_concurrently_and_report_outcomes(self):
+        """Test that users run in parallel and errors, interrupts and samples are reported."""
+        checkpointer = SimpleNamespace(storage={}, writes={})
+        graph, gateway = FakeGraph(checkpointer), FakeGateway()
+        queries = ["hello", "status", "fail please"]
+
+        report = asyncio.run(run_sessions(
+            graph, gateway, {"configurable": {"model_configs": {}}, "recursion_limit": 50}, queries,
+            users=4, turns=2, sample_interval=0.005, checkpointer=checkpointer,
+        ))
+
+        # User 0 stops after its interrupted first turn; users 1 and 2 each send one failing query
+        assert len(gateway.threads) == 4
+        assert report.interrupts == 1
+        assert report.errors == 2
+        assert report.turns_completed == 5
+        assert graph.max_active > 1
+        assert report.throughput > 0
+        assert report.checkpoint_bytes == 400
+        assert report.samples[0].turns_completed == 0
+        assert report.samples[-1].turns_completed == 5
+        node = next(node for node in report.nodes if node.node == "load_test_node")
+        assert node.count == 5
+        assert 0.01 <= node.p50 <= 0.025
+        assert report.to_dict()["turns_completed"] == 5
+
+
+class TestSetup:
+    """Test corpus loading and fake model configuration."""
+
+    def test_simulated_models_and_corpus(self, tmp_path):
+        """Test that every role uses the fake provider and corpora skip comments."""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text(
+            "models:\n"
+            "  orchestrator: {provider: cborg, model_id: anthropic/claude-haiku, max_tokens: 4096}\n"
+            "  classifier:\n"
+            "    provider: cborg\n"
+            "    model_id: anthropic/claude-haiku\n"
+            "    cascade: {provider: ollama, model_id: mistral:7b}\n"
+            "api:\n"
+            "  providers:\n"
+            "    fake: {text: Hello}\n"
+        )
+        corpus = tmp_path / "queries.txt"
+        corpus.write_text("# greetings\nhello\n\nstatus\n")
+
+        config = use_simulated_models(ConfigBuilder(str(config_file)), {"seed": 3})
+        models = config.configurable["model_configs"]
+
+        assert models["orchestrator"] == {"provider": "fake", "model_id": "anthropic/claude-haiku",
+                                          "max_tokens": 4096}
+        assert models["classifier"] == {"provider": "fake", "model_id": "anthropic/claude-haiku"}
+        assert config.configurable["provider_configs"]["fake"] == {
+            "responses": SIMULATED_RESPONSES, "text": "Hello", "seed": 3}
+        assert load_corpus(corpus) == ["hello", "status"]
+        assert percentile([3.0, 1.0, 2.0, 4.0], 0.5) == 2.0
+        assert percentile([], 0.5) is None
@@ -0,0 +1,93 @@
+"""Tests for the component logger.
+
+These tests verify that disabled levels skip message formatting, that lazy
+and %-style messages are rendered when enabled, that JSON output carries
+structured fields and that queued records keep their exception info.
+"""
+
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+
+from osprey.utils import logger as logger_module
+from osprey.utils.logger import ComponentLogger, JSONFormatter, _RecordQueueHandler
+
+
+def _component_logger(name: str, level: int) -> ComponentLogger:
+    base_logger = logging.getLogger(name)
+    base_logger.setLevel(level)
+    return ComponentLogger(base_logger, "demo", "cyan")
+
+
+class TestLazyMessages:
+    """Test level checks before formatting."""
+
+    def test_disabled_level_does_not_evaluate_callable(self):
+        """Test that a callable message is not called when DEBUG is disabled."""
+        logger = _component_logger("TEST_LAZY_DISABLED", logging.INFO)
+        calls = []
+
+        logger.debug(lambda: calls.append("called") or "expensive")
+
+        assert calls == []
+
+    def test_enabled_level_renders_callable_and_args(self, caplog):
+        """Test that callables and %-style arguments are rendered with the component prefix."""
+        logger = _component_logger("TEST_LAZY_ENABLED", logging.DEBUG)
+
+        with caplog.at_level(logging.DEBUG, logger="TEST_LAZY_ENABLED"):
+            logger.debug(lambda: "built lazily")
+            logger.info("Loaded %d capabilities", 3)
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert "Demo: built lazily" in messages[0]
+        assert "Demo: Loaded 3 capabilities" in messages[1]
+        assert caplog.records[1].component == "demo"
+        assert caplog.records[1].funcName == "test_enabled_level_renders_callable_and_args"
+
+    def test_json_mode_emits_plain_messages(self, caplog, monkeypatch):
+        """Test that no Rich markup is added when structured output is active."""
+        monkeypatch.setattr(logger_module, "_rich_markup", False)
+        logger = _component_logger("TEST_LAZY_JSON", logging.INFO)
+
+        with caplog.at_level(logging.INFO, logger="TEST_LAZY_JSON"):
+            logger.success("done")
+
+        assert caplog.records[0].getMessage() == "done"
+
+
+class TestOutputPipeline:
+    """Test JSON formatting and the background queue sink."""
+
+    def test_json_formatter_includes_extra_fields(self):
+        """Test that component and extra fields become JSON keys."""
+        record = logging.LogRecord("orchestrator", logging.INFO, __file__, 1, "planned %d steps", (4,), None)
+        record.component = "orchestrator"
+
+        entry = json.loads(JSONFormatter().format(record))
+
+        assert entry["message"] == "planned 4 steps"
+        assert entry["component"] == "orchestrator"
+        assert entry["level"] == "INFO"
+
+    def test_queued_records_keep_exception_info(self):
+        """Test that records reach the listener with exc_info for tracebacks."""
+        log_queue = queue.SimpleQueue()
+        received = []
+        sink = logging.Handler()
+        sink.emit = received.append
+        listener = logging.handlers.QueueListener(log_queue, sink)
+        listener.start()
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord("TEST_QUEUE", logging.ERROR, __file__, 1, "failed %s", ("x",),
+                                       exc_info=sys.exc_info())
+        _RecordQueueHandler(log_queue).handle(record)
+        listener.stop()
+
+        assert received[0].getMessage() == "failed x"
+        assert received[0].exc_info[0] is ValueError
@@ -0,0 +1,118 @@
+"""Tests for the in-process metrics registry.
+
+These tests verify Prometheus text rendering of counters, gauges and
+histograms, session tracking, the HTTP endpoint and the summary shown by
+``osprey metrics``.
+"""
+
+import asyncio
+import urllib.request
+
+import pytest
+
+from osprey.cli.metrics_cmd import summarize
+from osprey.utils.metrics import (
+    ACTIVE_SESSIONS,
+    NODE_DURATION,
+    MetricsRegistry,
+    histogram_quantile,
+    parse_metrics,
+    start_metrics_server,
+    timed_node,
+    track_session,
+)
+
+
+class TestRendering:
+    """Test the Prometheus text exposition format."""
+
+    def test_counter_and_gauge(self):
+        """Test that labelled counters and gauges render HELP, TYPE and escaped samples."""
+        registry = MetricsRegistry()
+        counter = registry.counter("demo_requests_total", "Requests", ["path"])
+        counter.inc(path='/a"b')
+        counter.inc(2, path='/a"b')
+        registry.gauge("demo_workers", "Workers").set_function(lambda: 4)
+
+        text = registry.render()
+
+        assert "# HELP demo_requests_total Requests\n# TYPE demo_requests_total counter\n" in text
+        assert 'demo_requests_total{path="/a\\"b"} 3\n' in text
+        assert "demo_workers 4\n" in text
+        assert ("demo_requests_total", {"path": '/a"b'}, 3.0) in parse_metrics(text)
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test that histogram buckets accumulate and end with +Inf, _sum and _count."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("demo_seconds", "Latency", ["node"], buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value, node="n")
+
+        samples = {(name, labels.get("le")): value for name, labels, value in parse_metrics(registry.render())}
+
+        assert samples[("demo_seconds_bucket", "0.1")] == 1
+        assert samples[("demo_seconds_bucket", "1")] == 2
+        assert samples[("demo_seconds_bucket", "+Inf")] == 3
+        assert samples[("demo_seconds_count", None)] == 3
+        assert samples[("demo_seconds_sum", None)] == pytest.approx(5.55)
+
+    def test_histogram_quantile_interpolates_within_buckets(self):
+        """Test that quantiles are estimated from a snapshot like Prometheus' histogram_quantile."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("demo_seconds", "Latency", ["node"], buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value, node="n")
+
+        counts, total = histogram.snapshot()[("n",)]
+
+        assert counts == [1, 2, 1] and total == pytest.approx(6.05)
+        assert histogram_quantile(0.25, histogram.buckets, counts) == pytest.approx(0.1)
+        assert histogram_quantile(0.5, histogram.buckets, counts) == pytest.approx(0.55)
+        assert histogram_quantile(0.99, histogram.buckets, counts) == 1.0
+        assert histogram_quantile(0.5, histogram.buckets, [0, 0, 0]) is None
+
+    def test_rejects_mismatched_labels_and_redefinition(self):
+        """Test that wrong label sets and conflicting re-registrations raise ValueError."""
+        registry = MetricsRegistry()
+        counter = registry.counter("demo_total", "Demo", ["kind"])
+
+        with pytest.raises(ValueError):
+            counter.inc(other="x")
+        with pytest.raises(ValueError):
+            registry.gauge("demo_total", "Demo", ["kind"])
+        assert registry.counter("demo_total", "Demo", ["kind"]) is counter
+
+
+class TestFrameworkMetrics:
+    """Test the framework instrumentation helpers."""
+
+    def test_timed_node_and_session_tracking(self):
+        """Test that timed nodes observe their duration and sessions count while active."""
+        async def node(state):
+            with track_session("thread-1"), track_session("thread-1"):
+                return {"active": ACTIVE_SESSIONS.get()}
+
+        before = NODE_DURATION.count(node="metrics_test", node_type="capability")
+        result = asyncio.run(timed_node(node, "capability", "metrics_test")({}))
+
+        assert result == {"active": 1}
+        assert NODE_DURATION.count(node="metrics_test", node_type="capability") == before + 1
+        assert ACTIVE_SESSIONS.get() == 0
+
+    def test_http_endpoint_and_summary(self):
+        """Test that the server exports the registry and the CLI summary condenses histograms."""
+        registry = MetricsRegistry()
+        registry.histogram("demo_seconds", "Latency", ["node"]).observe(0.25, node="n")
+        registry.counter("demo_total", "Demo").inc()
+        server = start_metrics_server(0, host="127.0.0.1", registry=registry)
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/metrics") as response:
+                assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+                text = response.read().decode()
+        finally:
+            server.shutdown()
+
+        rows = summarize(parse_metrics(text))
+
+        assert ("demo_seconds", "node=n", "1 obs, mean 250.0 ms") in rows
+        assert ("demo_total", "", "1") in rows
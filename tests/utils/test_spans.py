@@ -0,0 +1,113 @@
+"""Tests for per-request tracing spans.
+
+These tests verify span nesting across coroutines and worker threads,
+request keying from the agent state, recording to disk, Chrome trace export
+and the ``osprey trace spans`` command.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from osprey.cli.trace_cmd import trace
+from osprey.utils import spans as spans_module
+from osprey.utils.spans import iter_spans, request_id_from_state, span, to_chrome_trace, traced_node
+from osprey.utils.trace_recorder import TraceConfig, TraceRecorder
+
+
+@pytest.fixture
+def recorder(tmp_path, monkeypatch):
+    """Install an enabled span recorder writing to a temporary directory."""
+    span_recorder = TraceRecorder(tmp_path, TraceConfig(enabled=True), file_stem=spans_module.SPAN_FILE_STEM)
+    monkeypatch.setattr(spans_module, "_span_recorder", span_recorder)
+    return span_recorder
+
+
+def _node_run(state):
+    """Run a traced node that makes a threaded 'LLM call' inside it."""
+
+    async def node(state):
+        def llm_call():
+            with span("anthropic/claude", "llm"):
+                time.sleep(0.01)
+
+        await asyncio.to_thread(llm_call)
+        return {}
+
+    asyncio.run(traced_node(node, "infrastructure", "orchestrator")(state))
+
+
+class TestSpans:
+    """Test span creation and nesting."""
+
+    def test_threaded_call_nests_under_node(self, recorder):
+        """Test that a span in asyncio.to_thread inherits parent, thread and request ids."""
+        state = {"execution_start_time": 1_700_000_000.5}
+
+        with span("request", "request", session_id="thread-1"):
+            _node_run(state)
+
+        by_name = {s.name: s for s in recorder.recent()}
+        assert by_name["anthropic/claude"].parent_id == by_name["orchestrator"].span_id
+        assert by_name["orchestrator"].parent_id == by_name["request"].span_id
+        assert by_name["anthropic/claude"].session_id == "thread-1"
+        assert by_name["anthropic/claude"].request_id == request_id_from_state(state)
+        assert by_name["orchestrator"].duration_ms >= by_name["anthropic/claude"].duration_ms
+
+    def test_error_status_is_recorded(self, recorder):
+        """Test that a failing block records its error and re-raises."""
+        with pytest.raises(ValueError):
+            with span("broken", "capability", session_id="t"):
+                raise ValueError("bad input")
+
+        recorded = recorder.recent()[0]
+        assert recorded.status == "error"
+        assert recorded.error == "ValueError: bad input"
+
+    def test_disabled_recorder_yields_none(self, tmp_path, monkeypatch):
+        """Test that spans are not created when recording is disabled."""
+        monkeypatch.setattr(spans_module, "_span_recorder", TraceRecorder(tmp_path, TraceConfig(enabled=False)))
+
+        with span("ignored") as current:
+            assert current is None
+
+
+class TestExport:
+    """Test reading spans back and exporting them."""
+
+    def test_spans_round_trip_and_chrome_export(self, recorder, tmp_path):
+        """Test that flushed spans are read per thread and converted to trace events."""
+        with span("request", "request", session_id="thread-1", request_id="r1"):
+            pass
+        with span("other", "request", session_id="thread-2"):
+            pass
+        recorder.flush()
+
+        records = list(iter_spans(tmp_path, session_id="thread-1"))
+        events = to_chrome_trace(records)["traceEvents"]
+
+        assert [r["name"] for r in records] == ["request"]
+        assert events[0]["ph"] == "M" and events[0]["args"]["name"] == "r1"
+        assert events[1]["ph"] == "X" and events[1]["dur"] == records[0]["duration_ms"] * 1000
+
+    def test_trace_command_renders_latest_request(self, recorder, tmp_path):
+        """Test that osprey trace spans shows the latest request and writes Chrome traces."""
+        for request_id in ("r1", "r2"):
+            with span("orchestrator", "infrastructure", session_id="thread-1", request_id=request_id):
+                with span("anthropic/claude", "llm"):
+                    pass
+        recorder.flush()
+
+        result = CliRunner().invoke(trace, ["spans", "thread-1", "--traces-dir", str(tmp_path)])
+        chrome_file = tmp_path / "trace.json"
+        exported = CliRunner().invoke(trace, ["spans", "thread-1", "--all", "--traces-dir", str(tmp_path),
+                                              "--chrome", str(chrome_file)])
+
+        assert result.exit_code == 0
+        assert "Request r2" in result.output and "Request r1" not in result.output
+        assert "anthropic/claude" in result.output
+        assert exported.exit_code == 0
+        assert len(json.loads(chrome_file.read_text())["traceEvents"]) == 6
@@ -0,0 +1,122 @@
+"""Tests for the LLM trace recorder.
+
+These tests verify ring buffering, background-style flushing to compressed
+JSONL files, rotation, writers sharing one file, asynchronous prompt file
+writes and the ``osprey trace calls`` command.
+"""
+
+import json
+import threading
+
+from click.testing import CliRunner
+
+from osprey.cli.trace_cmd import trace
+from osprey.utils import trace_recorder
+from osprey.utils.trace_recorder import LLMTrace, TraceConfig, TraceRecorder, iter_traces
+
+
+def _trace(session_id: str = "s1", prompt: str = "hello") -> LLMTrace:
+    return LLMTrace(kind="completion", session_id=session_id, provider="anthropic",
+                    model_id="claude-haiku", prompt=prompt, response="hi", latency_sec=0.5)
+
+
+class TestTraceRecorder:
+    """Test recording and flushing of traces."""
+
+    def test_flush_writes_compressed_jsonl(self, tmp_path):
+        """Test that flushed traces can be read back per session."""
+        recorder = TraceRecorder(tmp_path, TraceConfig(enabled=True))
+        recorder.record(_trace("s1", "first"))
+        recorder.record(_trace("s2", "other"))
+        recorder.flush()
+        recorder.record(_trace("s1", "second"))
+        recorder.flush()
+
+        assert (tmp_path / "traces.jsonl.gz").exists()
+        assert [t["prompt"] for t in iter_traces(tmp_path, session_id="s1")] == ["first", "second"]
+
+    def test_ring_buffer_is_bounded(self, tmp_path):
+        """Test that the in-memory buffer keeps only the newest traces."""
+        recorder = TraceRecorder(tmp_path, TraceConfig(enabled=True, buffer_size=3))
+        for i in range(5):
+            recorder.record(_trace(prompt=f"p{i}"))
+
+        assert [t.prompt for t in recorder.recent()] == ["p2", "p3", "p4"]
+        assert recorder.dropped == 2
+
+    def test_disabled_recorder_records_nothing(self, tmp_path):
+        """Test that recording is a no-op when tracing is disabled."""
+        recorder = TraceRecorder(tmp_path, TraceConfig(enabled=False))
+        recorder.record(_trace())
+
+        assert recorder.flush() == 0
+        assert recorder.recent() == []
+
+    def test_rotation_prunes_old_files(self, tmp_path):
+        """Test that large files are rotated and old files removed."""
+        recorder = TraceRecorder(tmp_path, TraceConfig(enabled=True, max_file_mb=0, max_files=2))
+        for i in range(4):
+            recorder.record(_trace(prompt=f"p{i}"))
+            recorder.flush()
+
+        assert len(list(tmp_path.glob("traces-*.jsonl.gz"))) == 2
+        assert [t["prompt"] for t in iter_traces(tmp_path)] == ["p2", "p3"]
+
+    def test_writers_sharing_a_file_lose_nothing(self, tmp_path):
+        """Test that recorders of different workers append and rotate one file stem safely."""
+        config = TraceConfig(enabled=True, max_file_mb=0.002, max_files=1000)
+        recorders = [TraceRecorder(tmp_path, config) for _ in range(4)]
+
+        def write(index, recorder):
+            for i in range(50):
+                recorder.record(_trace(f"w{index}", "x" * 200 + str(i)))
+                recorder.flush()
+
+        threads = [threading.Thread(target=write, args=item) for item in enumerate(recorders)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(list(iter_traces(tmp_path))) == 200
+        assert list(tmp_path.glob("traces-*.jsonl.gz"))
+
+    def test_file_writes_collapse_per_path(self, tmp_path):
+        """Test that queued writes to one file keep only the latest content."""
+        recorder = TraceRecorder(tmp_path, TraceConfig(enabled=False))
+        target = tmp_path / "prompts" / "classifier_latest.md"
+        recorder.write_file_async(target, "old")
+        recorder.write_file_async(target, "new")
+        recorder.flush()
+
+        assert target.read_text() == "new"
+
+    def test_record_llm_call_estimates_tokens(self, tmp_path, monkeypatch):
+        """Test that completions are recorded with latency and token estimates."""
+        recorder = TraceRecorder(tmp_path, TraceConfig(enabled=True))
+        monkeypatch.setattr(trace_recorder, "_recorder", recorder)
+
+        trace_recorder.record_llm_call(provider="openai", model_id="gpt-4o", message="x" * 400,
+                                       system_prompt="y" * 40, response={"answer": 42},
+                                       latency_sec=1.23456)
+
+        trace = recorder.recent()[0]
+        assert trace.input_tokens == 110
+        assert trace.latency_sec == 1.2346
+        assert trace.to_dict()["response"] == {"answer": 42}
+
+
+class TestTraceCallsCommand:
+    """Test the ``osprey trace calls`` command."""
+
+    def test_full_output_dumps_session(self, tmp_path):
+        """Test that --full prints the session's traces as JSONL."""
+        recorder = TraceRecorder(tmp_path, TraceConfig(enabled=True))
+        recorder.record(_trace("s1", "wanted"))
+        recorder.record(_trace("s2", "other"))
+        recorder.flush()
+
+        result = CliRunner().invoke(trace, ["calls", "--traces-dir", str(tmp_path), "--session", "s1", "--full"])
+
+        assert result.exit_code == 0
+        assert [json.loads(line)["prompt"] for line in result.output.splitlines()] == ["wanted"]